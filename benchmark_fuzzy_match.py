@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark batched fuzzy matching against per-name edit distance.
+
+Compares the old loop (fuzzy_match per name, with a dynamic-programming
+edit distance per word) against fuzzy_scores, which computes every
+candidate word's bit-parallel edit distance in one batch_edit_distance call.
+The batch uses fast_ops when compiled, else NumPy, else pure Python.
+"""
+
+import random
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, "src")
+
+from dbutils import utils
+from dbutils.utils import batch_edit_distance, edit_distance, fuzzy_match, fuzzy_scores
+
+WORDS = ["customer", "order", "id", "name", "date", "status", "amount", "user", "ship", "address", "created"]
+
+
+def create_names(count, seed=42):
+    """Create column-like names such as CUSTOMER_ORDER_ID."""
+    rng = random.Random(seed)
+    return ["_".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))).upper() for _ in range(count)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print("=" * 60)
+    print("FUZZY MATCH BENCHMARK")
+    print("=" * 60)
+    if utils._fast_batch_edit_distance is not None:
+        backend = "fast_ops"
+    elif utils.np is not None:
+        backend = "numpy"
+    else:
+        backend = "python"
+    print(f"batch_edit_distance backend: {backend}")
+
+    words = [w for n in create_names(50000) for w in n.lower().split("_")]
+    _, dp_time = timed(lambda: [edit_distance(w, "custmer") for w in words])
+    _, batch_time = timed(batch_edit_distance, words, "custmer", 2)
+    print(f"\nedit distance over {len(words)} words: dp {dp_time:.3f}s, batched {batch_time:.3f}s")
+
+    print(f"\n{'names':>8} {'query':>9} {'per-name (s)':>13} {'batched (s)':>12} {'matches':>8}")
+    for count in (10000, 50000, 200000):
+        names = create_names(count)
+        for query in ("custmer", "stat", "adress"):
+            loop_matches, loop_time = timed(lambda ns, q: [fuzzy_match(n, q) for n in ns], names, query)
+            scores, batch_time = timed(fuzzy_scores, names, query)
+            assert [s > 0 for s in scores] == loop_matches
+            print(f"{count:>8} {query:>9} {loop_time:13.3f} {batch_time:12.3f} {sum(loop_matches):>8}")
+
+
+if __name__ == "__main__":
+    main()
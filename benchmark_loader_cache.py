@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark cache streaming in the data loader subprocess.
+
+Compares the old per-chunk scan of every cached column against the
+per-table column index used by data_loader_process.main. With the index,
+streaming time should grow roughly linearly with catalog size.
+"""
+
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, "src")
+
+from dbutils.gui.data_loader_process import columns_for_tables, index_columns_by_table
+
+
+def create_test_data(num_tables, num_columns_per_table=20):
+    """Create cached table/column dicts like data_loader_process writes."""
+    tables = []
+    columns = []
+    for i in range(num_tables):
+        schema = f"SCHEMA_{i // 100}"
+        name = f"TABLE_{i:06d}"
+        tables.append({"schema": schema, "name": name, "remarks": ""})
+        for j in range(num_columns_per_table):
+            columns.append(
+                {
+                    "schema": schema,
+                    "table": name,
+                    "name": f"COLUMN_{j:02d}",
+                    "typename": "VARCHAR",
+                    "length": 100,
+                    "scale": 0,
+                    "nulls": "Y",
+                    "remarks": "",
+                }
+            )
+    return tables, columns
+
+
+def stream_scan(tables, columns, batch_size):
+    """Previous behaviour: rescan every column for each chunk."""
+    sent = 0
+    for start in range(0, len(tables), batch_size):
+        batch_tables = tables[start : start + batch_size]
+        batch_keys = {f"{t['schema']}.{t['name']}" for t in batch_tables}
+        batch_columns = [c for c in columns if f"{c.get('schema')}.{c.get('table')}" in batch_keys]
+        sent += len(batch_columns)
+    return sent
+
+
+def stream_indexed(tables, columns, batch_size):
+    """Current behaviour: build the index once, then look up each chunk's tables."""
+    columns_by_table = index_columns_by_table(columns)
+    sent = 0
+    for start in range(0, len(tables), batch_size):
+        sent += len(columns_for_tables(tables[start : start + batch_size], columns_by_table))
+    return sent
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print("=" * 60)
+    print("DATA LOADER CACHE STREAMING BENCHMARK")
+    print("=" * 60)
+    batch_size = 500
+    print(f"{'tables':>8} {'columns':>9} {'scan (s)':>10} {'indexed (s)':>12} {'indexed us/col':>15}")
+    for num_tables in (1000, 2000, 4000, 8000, 16000):
+        tables, columns = create_test_data(num_tables)
+        indexed_sent, indexed_time = timed(stream_indexed, tables, columns, batch_size)
+        # The quadratic scan gets slow quickly; only run it on smaller catalogs
+        if num_tables <= 4000:
+            scan_sent, scan_time = timed(stream_scan, tables, columns, batch_size)
+            assert scan_sent == indexed_sent
+            scan_text = f"{scan_time:10.3f}"
+        else:
+            scan_text = f"{'skipped':>10}"
+        per_col = indexed_time / len(columns) * 1e6
+        print(f"{num_tables:>8} {len(columns):>9} {scan_text} {indexed_time:12.3f} {per_col:15.3f}")
+
+
+if __name__ == "__main__":
+    main()
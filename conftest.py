@@ -273,6 +273,16 @@ def setup_multi_database_providers_for_tests():
             pass
 
 
+@pytest.fixture(autouse=True)
+def clear_contents_cache():
+    """Keep cached table-contents pages from leaking between tests."""
+    from dbutils.contents_cache import get_contents_cache
+
+    get_contents_cache().clear()
+    yield
+    get_contents_cache().clear()
+
+
 @pytest.fixture(autouse=True)
 def disable_qt_message_boxes(monkeypatch):
     """Patch QMessageBox functions to avoid UI popups during tests.
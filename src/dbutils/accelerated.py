@@ -82,6 +82,22 @@ class AcceleratedSearchIndex:
         """Build the search index from tables and columns."""
         self._index.build_index(tables, columns)
 
+    def add_tables(self, tables: List) -> None:
+        """Index additional tables without rebuilding."""
+        self._index.add_tables(tables)
+
+    def add_columns(self, columns: List) -> None:
+        """Index additional columns without rebuilding."""
+        self._index.add_columns(columns)
+
+    def remove_schema(self, schema: str) -> int:
+        """Remove a schema's tables and columns from the index."""
+        return self._index.remove_schema(schema)
+
+    def remove_tables(self, keys) -> int:
+        """Remove tables, given as (schema, table) pairs, and their columns from the index."""
+        return self._index.remove_tables(keys)
+
     def search_tables(self, query: str) -> List:
         """Search for tables matching the query."""
         return self._index.search_tables(query)
@@ -90,6 +106,14 @@ class AcceleratedSearchIndex:
         """Search for columns matching the query."""
         return self._index.search_columns(query)
 
+    def substring_tables(self, query: str) -> List:
+        """Tables containing the query as a substring, as (table, field_mask) pairs."""
+        return self._index.substring_tables(query)
+
+    def substring_columns(self, query: str) -> List:
+        """Columns containing the query as a substring, as (column, field_mask) pairs."""
+        return self._index.substring_columns(query)
+
 
 # Convenience functions
 def create_accelerated_search_index():
@@ -0,0 +1,143 @@
+"""Per-key persistent cache store backed by SQLite.
+
+The schema cache used to be one gzip-compressed pickle of a dict holding
+every schema and every LIMIT/OFFSET page. Saving a page meant loading the
+whole file, adding one key and re-compressing everything; reading a page
+meant unpickling all of it. With paginated loading that is quadratic in
+cache I/O.
+
+``CacheStore`` keeps each key as its own row (compressed pickle payload plus
+timestamp) in a small SQLite database, so a lookup reads one row through the
+primary-key index and never deserializes unrelated entries. Reads go through
+SQLite's memory-mapped I/O, and WAL mode lets the GUI and the loader
+subprocess read while the other writes.
+"""
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Upper bound for SQLite's memory-mapped reads (it maps at most the file size)
+MMAP_SIZE = 256 * 1024 * 1024
+COMPRESS_LEVEL = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    payload BLOB NOT NULL
+)
+"""
+
+
+class CacheStore:
+    """Key/value store with one compressed pickle per key and a write timestamp."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+                conn.execute(_SCHEMA)
+            except Exception:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return ``(timestamp, value)`` for key, or None if it is not stored."""
+        with self._lock:
+            row = self._connect().execute("SELECT timestamp, payload FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        timestamp, payload = row
+        return timestamp, pickle.loads(zlib.decompress(payload))
+
+    def put(self, key: str, value: Any, timestamp: Optional[float] = None) -> None:
+        """Store value under key, replacing any previous entry."""
+        payload = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), COMPRESS_LEVEL)
+        ts = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO entries (key, timestamp, payload) VALUES (?, ?, ?)", (key, ts, payload)
+            )
+
+    def put_many(self, items: Dict[str, Tuple[float, Any]]) -> None:
+        """Store several ``key -> (timestamp, value)`` entries in one transaction."""
+        rows = [
+            (key, ts, zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), COMPRESS_LEVEL))
+            for key, (ts, value) in items.items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany("INSERT OR REPLACE INTO entries (key, timestamp, payload) VALUES (?, ?, ?)", rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: str) -> bool:
+        """Remove key. Returns True if it was stored."""
+        with self._lock:
+            cur = self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+        return cur.rowcount > 0
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._connect().execute("SELECT key FROM entries ORDER BY key")]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return self._connect().execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
+
+
+_stores: Dict[str, CacheStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path: Union[str, Path]) -> CacheStore:
+    """Return the process-wide CacheStore for path, opening it on first use."""
+    key = str(Path(path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = CacheStore(key)
+            _stores[key] = store
+        return store
@@ -4,10 +4,14 @@ All queries return normalized dictionaries with consistent field names:
 - TABSCHEMA, TABNAME for tables
 - COLNAME, DATA_TYPE, LENGTH, SCALE for columns
 - etc.
+
+``load_catalog_async`` fetches several of these views concurrently and
+merges them per table into a ``CatalogMetadata`` as each one arrives.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .utils import query_runner
 
@@ -221,7 +225,7 @@ def get_primary_keys(schema: Optional[str] = None, mock: bool = False) -> List[D
             {"TABSCHEMA": "TEST", "TABNAME": "PRODUCTS", "COLNAME": "ID", "CONSTRAINT_NAME": "PK_PRODUCTS"},
         ]
 
-    where_clause = f"WHERE cst.CONSTRAINT_SCHEMA = '{schema}'" if schema else ""
+    schema_clause = f"AND cst.CONSTRAINT_SCHEMA = '{schema}'" if schema else ""
 
     sql = f"""
         SELECT
@@ -233,8 +237,8 @@ def get_primary_keys(schema: Optional[str] = None, mock: bool = False) -> List[D
         JOIN QSYS2.SYSCSTCOL col
             ON cst.CONSTRAINT_SCHEMA = col.CONSTRAINT_SCHEMA
             AND cst.CONSTRAINT_NAME = col.CONSTRAINT_NAME
-        {where_clause}
-        AND cst.CONSTRAINT_TYPE = 'PRIMARY KEY'
+        WHERE cst.CONSTRAINT_TYPE = 'PRIMARY KEY'
+        {schema_clause}
         ORDER BY TABSCHEMA, TABNAME, COLNAME
     """
 
@@ -399,3 +403,115 @@ def get_foreign_keys(schema: Optional[str] = None, mock: bool = False) -> List[D
         return []
 
     return result
+
+
+# Catalog views load_catalog_async can fetch; part "x" is fetched by get_x()
+CATALOG_PARTS: Tuple[str, ...] = ("tables", "columns", "primary_keys", "indexes", "table_sizes")
+
+
+class CatalogMetadata:
+    """Per-table catalog metadata merged from independently fetched parts.
+
+    ``tables`` maps (schema, table) to a dict with the table's REMARKS and
+    TYPE, its ``columns`` in ordinal order, ``primary_key`` column names,
+    ``indexes`` (index name -> key columns), ``row_count`` and ``data_size``.
+    Parts may be added in any order; a table seen first in, say, the index
+    list is filled in when the tables part arrives.
+    """
+
+    def __init__(self):
+        self.tables: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.parts_loaded: List[str] = []
+
+    def _entry(self, schema: str, table: str) -> Dict[str, Any]:
+        key = (schema or "", table or "")
+        entry = self.tables.get(key)
+        if entry is None:
+            entry = {
+                "TABSCHEMA": key[0],
+                "TABNAME": key[1],
+                "TYPE": None,
+                "REMARKS": "",
+                "columns": [],
+                "primary_key": [],
+                "indexes": {},
+                "row_count": None,
+                "data_size": None,
+            }
+            self.tables[key] = entry
+        return entry
+
+    def add(self, part: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """Merge the rows of one catalog part."""
+        for row in rows or ():
+            entry = self._entry(row.get("TABSCHEMA"), row.get("TABNAME"))
+            if part == "tables":
+                entry["TYPE"] = row.get("TYPE")
+                entry["REMARKS"] = row.get("REMARKS") or ""
+            elif part == "columns":
+                entry["columns"].append(row)
+            elif part == "primary_keys":
+                entry["primary_key"].append(row.get("COLNAME"))
+            elif part == "indexes":
+                entry["indexes"].setdefault(row.get("INDEX_NAME"), []).append(row.get("COLUMN_NAME"))
+            elif part == "table_sizes":
+                entry["row_count"] = row.get("ROWCOUNT")
+                entry["data_size"] = row.get("DATA_SIZE")
+        self.parts_loaded.append(part)
+
+
+async def load_catalog_async(
+    schema: Optional[str] = None,
+    parts: Optional[Iterable[str]] = None,
+    mock: bool = False,
+    max_concurrency: Optional[int] = None,
+    on_part: Optional[Callable[[str, CatalogMetadata], None]] = None,
+) -> CatalogMetadata:
+    """Fetch catalog parts concurrently and merge them as they complete.
+
+    Each part (default: all of CATALOG_PARTS) runs on the shared query
+    executor, so with pooling enabled every statement holds its own pooled
+    connection and the whole load takes about as long as the slowest one.
+    At most ``max_concurrency`` statements (default: query_concurrency())
+    run at once. ``on_part(name, metadata)`` is called after each part is
+    merged. A part that fails is logged and merged as empty.
+
+    Args:
+        schema: Optional schema filter
+        parts: Names from CATALOG_PARTS to fetch, in any order
+        mock: Return mock data if True
+        max_concurrency: Optional limit on statements run at once
+        on_part: Optional callback after each part is merged
+
+    Returns:
+        CatalogMetadata holding every fetched part
+
+    """
+    from .connection_pool import query_concurrency, query_executor
+
+    names = list(parts) if parts is not None else list(CATALOG_PARTS)
+    unknown = [n for n in names if n not in CATALOG_PARTS]
+    if unknown:
+        raise ValueError(f"Unknown catalog parts: {', '.join(unknown)}")
+
+    loop = asyncio.get_running_loop()
+    executor = query_executor()
+    limit = asyncio.Semaphore(max_concurrency or query_concurrency())
+
+    async def fetch(name: str) -> Tuple[str, List[Dict[str, Any]]]:
+        query = globals()[f"get_{name}"]
+        async with limit:
+            try:
+                rows = await loop.run_in_executor(executor, lambda: query(schema=schema, mock=mock))
+            except Exception as e:
+                logger.warning(f"Could not fetch {name}: {e}")
+                rows = []
+        return name, rows
+
+    metadata = CatalogMetadata()
+    for done in asyncio.as_completed([fetch(name) for name in names]):
+        name, rows = await done
+        metadata.add(name, rows)
+        if on_part is not None:
+            on_part(name, metadata)
+    return metadata
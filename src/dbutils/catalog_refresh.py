@@ -0,0 +1,285 @@
+"""Delta refresh of a cached catalog.
+
+Once a cached catalog expires, reloading it means scanning all of SYSTABLES
+and SYSCOLUMNS again, although usually only a handful of tables changed.
+Instead, every cached catalog keeps a fingerprint per table, taken from
+QSYS2.SYSTABLES (LAST_ALTERED_TIMESTAMP and COLUMN_COUNT). A refresh:
+- reads the current fingerprints, one narrow SYSTABLES query
+- compares them with the cached ones to find added, changed and removed tables
+- loads only the added and changed tables, scanning the catalog from the
+  oldest of their timestamps onwards
+- patches the cached tables and columns, and optionally a search index,
+  in place of a full reload
+
+diff_catalogs compares two loaded catalogs directly, for callers that hold
+a stale copy but no fingerprints.
+
+Both the db_browser cache and the GUI loader's data cache refresh this way.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from dbutils import db_browser
+from dbutils.db_browser import CatalogScan, ColumnInfo, TableInfo
+
+logger = logging.getLogger(__name__)
+
+TableKey = Tuple[str, str]
+
+
+class TableFingerprint(NamedTuple):
+    """What a table looked like at the last sync."""
+
+    altered: str  # LAST_ALTERED_TIMESTAMP as text; "" when unknown
+    columns: int
+
+
+Fingerprints = Dict[TableKey, TableFingerprint]
+
+
+@dataclass
+class CatalogDelta:
+    """Tables that differ between two sets of fingerprints, in catalog order."""
+
+    added: List[TableKey] = field(default_factory=list)
+    changed: List[TableKey] = field(default_factory=list)
+    removed: List[TableKey] = field(default_factory=list)
+
+    @property
+    def stale(self) -> List[TableKey]:
+        """Tables that have to be loaded again."""
+        return self.added + self.changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+class CatalogRefresh(NamedTuple):
+    """Result of refresh_catalog."""
+
+    tables: List[Any]
+    columns: List[Any]
+    fingerprints: Fingerprints
+    delta: CatalogDelta
+
+
+def fingerprints_sql(schema_filter: Optional[str] = None) -> str:
+    """Build the SYSTABLES query that reads one fingerprint per table."""
+    from dbutils.pagination import sql_literal
+
+    schema_clause = ""
+    if schema_filter:
+        schema_clause = f"AND TABLE_SCHEMA = {sql_literal(schema_filter.upper())}"
+    return f"""
+        SELECT
+            TABLE_SCHEMA,
+            TABLE_NAME,
+            LAST_ALTERED_TIMESTAMP,
+            COLUMN_COUNT
+        FROM QSYS2.SYSTABLES
+        WHERE TABLE_TYPE IN ('T', 'P')
+        AND SYSTEM_TABLE = 'N'
+        {schema_clause}
+        ORDER BY TABLE_SCHEMA, TABLE_NAME
+    """
+
+
+def fetch_fingerprints(schema_filter: Optional[str] = None, use_mock: bool = False) -> Fingerprints:
+    """Read the current fingerprint of every table the catalog loaders list."""
+    if use_mock:
+        tables = db_browser.mock_get_tables()
+        if schema_filter:
+            tables = [t for t in tables if t.schema.upper() == schema_filter.upper()]
+        counts: Dict[TableKey, int] = {}
+        for col in db_browser.mock_get_columns():
+            counts[(col.schema, col.table)] = counts.get((col.schema, col.table), 0) + 1
+        return {(t.schema, t.name): TableFingerprint("", counts.get((t.schema, t.name), 0)) for t in tables}
+
+    fingerprints: Fingerprints = {}
+    for schema, name, altered, columns in db_browser.iter_query_runner(fingerprints_sql(schema_filter)):
+        fingerprints[(schema or "", name or "")] = TableFingerprint(
+            str(altered) if altered is not None else "", int(columns or 0)
+        )
+    return fingerprints
+
+
+def fingerprints_to_rows(fingerprints: Fingerprints) -> List[list]:
+    """Flatten fingerprints into JSON-friendly [schema, table, altered, columns] rows."""
+    return [[schema, name, fp.altered, fp.columns] for (schema, name), fp in fingerprints.items()]
+
+
+def fingerprints_from_rows(rows: Iterable[Iterable[Any]]) -> Fingerprints:
+    """Rebuild fingerprints from fingerprints_to_rows output."""
+    return {(schema, name): TableFingerprint(altered, columns) for schema, name, altered, columns in rows}
+
+
+def diff_fingerprints(old: Fingerprints, new: Fingerprints) -> CatalogDelta:
+    """Compare the fingerprints of the last sync with the current ones."""
+    delta = CatalogDelta()
+    for key, fp in new.items():
+        before = old.get(key)
+        if before is None:
+            delta.added.append(key)
+        elif before != fp:
+            delta.changed.append(key)
+    delta.removed = [key for key in old if key not in new]
+    return delta
+
+
+def diff_catalogs(
+    old_tables: List[Any], old_columns: List[Any], new_tables: List[Any], new_columns: List[Any]
+) -> CatalogDelta:
+    """Compare two loaded catalogs table by table, columns included.
+
+    For catalogs without fingerprints, such as a stale copy shown while the
+    catalog is reloaded. Tables and columns may be dataclasses or dicts.
+    """
+    old = {_table_key(t): t for t in old_tables}
+    old_by_table = _group_columns(old_columns)
+    new_by_table = _group_columns(new_columns)
+    delta = CatalogDelta()
+    seen = set()
+    for table in new_tables:
+        key = _table_key(table)
+        seen.add(key)
+        before = old.get(key)
+        if before is None:
+            delta.added.append(key)
+        elif before != table or old_by_table.get(key, []) != new_by_table.get(key, []):
+            delta.changed.append(key)
+    delta.removed = [key for key in old if key not in seen]
+    return delta
+
+
+def load_changed_tables(
+    delta: CatalogDelta,
+    fingerprints: Fingerprints,
+    schema_filter: Optional[str] = None,
+    use_mock: bool = False,
+) -> Tuple[List[TableInfo], List[ColumnInfo]]:
+    """Load the added and changed tables of ``delta`` with their columns.
+
+    The catalog is scanned from the oldest LAST_ALTERED_TIMESTAMP among them
+    (the whole catalog when one is unknown) and the rows are filtered to the
+    stale tables client-side.
+    """
+    stale = set(delta.stale)
+    if not stale:
+        return [], []
+    stamps = [fingerprints[key].altered for key in stale if key in fingerprints]
+    since = min(stamps) if stamps and all(stamps) else None
+
+    tables: List[TableInfo] = []
+    columns: List[ColumnInfo] = []
+    for chunk_tables, chunk_columns in CatalogScan(schema_filter, use_mock=use_mock, altered_since=since):
+        tables.extend(t for t in chunk_tables if (t.schema, t.name) in stale)
+        columns.extend(c for c in chunk_columns if (c.schema, c.table) in stale)
+    return tables, columns
+
+
+def _table_key(table) -> TableKey:
+    if hasattr(table, "schema"):
+        return table.schema, table.name
+    return table.get("schema"), table.get("name")
+
+
+def _column_key(col) -> TableKey:
+    if hasattr(col, "schema"):
+        return col.schema, col.table
+    return col.get("schema"), col.get("table")
+
+
+def _group_columns(columns: Iterable[Any]) -> Dict[TableKey, List[Any]]:
+    grouped: Dict[TableKey, List[Any]] = {}
+    for col in columns:
+        grouped.setdefault(_column_key(col), []).append(col)
+    return grouped
+
+
+def apply_delta(
+    tables: List[Any],
+    columns: List[Any],
+    delta: CatalogDelta,
+    fresh_tables: List[Any],
+    fresh_columns: List[Any],
+) -> Tuple[List[Any], List[Any]]:
+    """Patch cached tables and columns with freshly loaded ones.
+
+    Changed tables are replaced where they stand, removed tables are dropped
+    and added tables are appended; the columns follow their tables. Tables
+    and columns may be dataclasses or the GUI loader's dicts.
+    """
+    removed = set(delta.removed)
+    stale = set(delta.stale)
+    fresh = {_table_key(t): t for t in fresh_tables}
+
+    out_tables = []
+    seen = set()
+    for table in tables:
+        key = _table_key(table)
+        if key in removed or key in seen:
+            continue
+        if key in stale:
+            # A changed table dropped again before it could be reloaded stays out
+            table = fresh.get(key)
+            if table is None:
+                continue
+        seen.add(key)
+        out_tables.append(table)
+    out_tables.extend(fresh[key] for key in delta.added if key in fresh and key not in seen)
+
+    old_columns = _group_columns(columns)
+    new_columns = _group_columns(fresh_columns)
+    out_columns = []
+    for table in out_tables:
+        key = _table_key(table)
+        out_columns.extend((new_columns if key in fresh else old_columns).get(key, ()))
+    return out_tables, out_columns
+
+
+def refresh_catalog(
+    tables: List[Any],
+    columns: List[Any],
+    fingerprints: Fingerprints,
+    schema_filter: Optional[str] = None,
+    use_mock: bool = False,
+    index=None,
+) -> CatalogRefresh:
+    """Bring a cached catalog up to date by reloading only the tables that changed.
+
+    ``fingerprints`` are the ones recorded when the catalog was cached. When
+    ``index`` (a SearchIndex) is given, its entries for changed and removed
+    tables are replaced as well.
+    """
+    current = fetch_fingerprints(schema_filter, use_mock)
+    delta = diff_fingerprints(fingerprints, current)
+    if delta:
+        fresh_tables, fresh_columns = load_changed_tables(delta, current, schema_filter, use_mock)
+        tables, columns = apply_delta(tables, columns, delta, fresh_tables, fresh_columns)
+        if index is not None:
+            index.remove_tables(delta.changed + delta.removed)
+            index.add_tables(fresh_tables)
+            index.add_columns(fresh_columns)
+    logger.info(
+        f"Catalog refresh: {len(delta.added)} added, {len(delta.changed)} changed, {len(delta.removed)} removed"
+    )
+    return CatalogRefresh(tables, columns, current, delta)
+
+
+def refresh_cached_catalog(schema_filter: Optional[str] = None, index=None) -> Optional[CatalogRefresh]:
+    """Delta-refresh the db_browser cache entry for a full catalog load.
+
+    Returns None when there is no cached catalog with fingerprints to start
+    from; otherwise the refreshed catalog, which is also written back.
+    """
+    cached = db_browser.load_from_cache(schema_filter, allow_expired=True)
+    fingerprints = db_browser.load_cached_fingerprints(schema_filter)
+    if cached is None or not fingerprints:
+        return None
+    result = refresh_catalog(cached[0], cached[1], fingerprints, schema_filter, index=index)
+    db_browser.save_to_cache(schema_filter, result.tables, result.columns, fingerprints=result.fingerprints)
+    return result
@@ -0,0 +1,170 @@
+"""Catalog chunks handed between processes as memory-mapped files.
+
+Sending a catalog from the loader subprocess as JSON means encoding every
+table and column once, decoding it again in the GUI and keeping it in both
+heaps. Instead the loader can write a chunk into a segment file:
+
+  header | length[i64] scale[i64] | string offsets[u32] |
+  table schema/name/remarks ids[u32] | column schema/table/name/typename/remarks ids[u32] |
+  column nulls[u8] | utf-8 string blob
+
+(the arrays are in the order of CatalogStore; integers use the native byte
+order, since segments never leave the machine). The reader maps the file
+read-only and reads the rows through the same TableRow/ColumnRow views a
+CatalogStore hands out, so nothing is decoded until it is looked at.
+
+Files are written under a temporary name and renamed into place, so a
+reader never sees a partial segment. ``open_segment`` removes the file once
+it is mapped; the mapping stays valid until the last view is dropped.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Union
+
+from dbutils.catalog_store import CatalogStore, RowList
+
+MAGIC = b"DBCS"
+VERSION = 1
+
+# magic, version, strings, tables, columns, blob bytes
+_HEADER = struct.Struct("=4sIIIII")
+# Pad the header so the 64-bit arrays start aligned
+_HEADER_SIZE = 24
+
+
+def write_segment(path: Union[str, Path], tables: Iterable[Any], columns: Iterable[Any]) -> int:
+    """Write tables and columns (dataclasses, row views or loader dicts) to a segment file.
+
+    Returns the number of bytes written.
+    """
+    store = CatalogStore(tables, columns)
+    encoded = [s.encode("utf-8") for s in store.strings._strings]
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    blob = b"".join(encoded)
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, len(encoded), len(store._t_schema), len(store._c_schema), len(blob)).ljust(
+            _HEADER_SIZE, b"\0"
+        ),
+        store._c_length.tobytes(),
+        store._c_scale.tobytes(),
+        offsets.tobytes(),
+        store._t_schema.tobytes(),
+        store._t_name.tobytes(),
+        store._t_remarks.tobytes(),
+        store._c_schema.tobytes(),
+        store._c_table.tobytes(),
+        store._c_name.tobytes(),
+        store._c_typename.tobytes(),
+        store._c_remarks.tobytes(),
+        store._c_nulls.tobytes(),
+        blob,
+    ]
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        for part in parts:
+            f.write(part)
+    os.replace(tmp, path)
+    return sum(len(part) for part in parts)
+
+
+class SegmentStrings:
+    """The string table of a mapped segment, decoded on first use."""
+
+    __slots__ = ("_offsets", "_blob", "_decoded")
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+        self._decoded: List[Optional[str]] = [None] * (len(offsets) - 1)
+
+    def __getitem__(self, sid: int) -> str:
+        s = self._decoded[sid]
+        if s is None:
+            s = str(self._blob[self._offsets[sid] : self._offsets[sid + 1]], "utf-8")
+            self._decoded[sid] = s
+        return s
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+    def decode_all(self) -> None:
+        """Decode every string now, e.g. on a worker thread before the rows are handed on."""
+        for sid in range(len(self._decoded)):
+            self[sid]
+
+
+class CatalogSegment:
+    """A read-only catalog chunk mapped from a segment file.
+
+    ``tables`` and ``columns`` are sequences of TableRow/ColumnRow views, as
+    on a CatalogStore; ``CatalogStore.adopt`` copies the whole segment into a
+    store array by array, without going through row views.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, n_strings, n_tables, n_columns, blob_len = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a catalog segment: {path}")
+
+        pos = _HEADER_SIZE
+
+        def take(fmt: str, count: int) -> memoryview:
+            nonlocal pos
+            size = struct.calcsize(fmt) * count
+            out = view[pos : pos + size].cast(fmt)
+            pos += size
+            return out
+
+        self._c_length = take("q", n_columns)
+        self._c_scale = take("q", n_columns)
+        offsets = take("I", n_strings + 1)
+        self._t_schema = take("I", n_tables)
+        self._t_name = take("I", n_tables)
+        self._t_remarks = take("I", n_tables)
+        self._c_schema = take("I", n_columns)
+        self._c_table = take("I", n_columns)
+        self._c_name = take("I", n_columns)
+        self._c_typename = take("I", n_columns)
+        self._c_remarks = take("I", n_columns)
+        self._c_nulls = take("b", n_columns)
+        self.strings = SegmentStrings(offsets, view[pos : pos + blob_len])
+        self._t_live = range(n_tables)
+        self._c_live = range(n_columns)
+        self.tables = RowList(self, "tables")
+        self.columns = RowList(self, "columns")
+
+    def add_tables(self, tables):
+        raise TypeError("catalog segments are read-only")
+
+    add_columns = add_tables
+
+    def __len__(self) -> int:
+        return self._mmap.size()
+
+
+def open_segment(path: Union[str, Path], unlink: bool = True) -> CatalogSegment:
+    """Map a segment file, removing the file afterwards unless ``unlink`` is False.
+
+    Where a mapped file cannot be removed (Windows), it is left for whoever
+    owns the segment directory to clean up.
+    """
+    segment = CatalogSegment(path)
+    if unlink:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    return segment
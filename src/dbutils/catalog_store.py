@@ -0,0 +1,556 @@
+"""Columnar storage for large catalogs.
+
+Every TableInfo and ColumnInfo is a full object with its own instance dict,
+and their strings are kept alive by the process-wide intern cache, so a
+catalog with millions of columns costs gigabytes. ``CatalogStore`` keeps
+the catalog as parallel arrays instead:
+- every string (schema, table, column and type names, remarks) is stored
+  once in the store's own ``StringTable`` and referenced by an int id
+- lengths and scales live in int arrays, nullability in a byte array
+- tables and columns are exposed as sequences of lightweight ``TableRow``
+  and ``ColumnRow`` views with the same attributes as TableInfo and
+  ColumnInfo, so models, filters and the search index run over the store
+  unchanged
+
+The store is also the catalog's lookup index: tables by (schema, name) or
+"schema.table" key, a table's columns, a column by name and the tables per
+schema are all found through hash lookups rather than scanning the rows.
+``find_table`` and ``count_schema_tables`` use it for a RowList and fall
+back to a scan for plain lists.
+
+Rows are only ever appended; removing or replacing tables (apply_delta)
+drops them from the sequences but keeps their data until ``compact()``,
+so views already handed out stay valid. Dropping the store frees all of
+its strings, unlike the intern cache.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from dbutils.db_browser import ColumnInfo, TableInfo
+
+# Stored in the length/scale arrays for None
+_NULL = -(2**63)
+
+
+class StringTable:
+    """Strings stored once each and referred to by int ids."""
+
+    __slots__ = ("_strings", "_ids")
+
+    def __init__(self):
+        self._strings: List[str] = [""]
+        self._ids: Dict[str, int] = {"": 0}
+
+    def intern(self, s: Optional[str]) -> int:
+        """Return the id of ``s`` (None is stored as ""), adding it if new."""
+        s = s or ""
+        sid = self._ids.get(s)
+        if sid is None:
+            sid = len(self._strings)
+            self._strings.append(s)
+            self._ids[s] = sid
+        return sid
+
+    def lookup(self, s: Optional[str]) -> Optional[int]:
+        """Return the id of ``s`` without adding it, or None when it is not stored."""
+        return self._ids.get(s or "")
+
+    def __getitem__(self, sid: int) -> str:
+        return self._strings[sid]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class TableRow:
+    """Read-only TableInfo-like view of one table in a CatalogStore."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "CatalogStore", row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def schema(self) -> str:
+        return self._store.strings[self._store._t_schema[self._row]]
+
+    @property
+    def name(self) -> str:
+        return self._store.strings[self._store._t_name[self._row]]
+
+    @property
+    def remarks(self) -> str:
+        return self._store.strings[self._store._t_remarks[self._row]]
+
+    def to_info(self) -> TableInfo:
+        """Materialize the row as a TableInfo."""
+        return TableInfo(schema=self.schema, name=self.name, remarks=self.remarks)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (TableRow, TableInfo)):
+            return NotImplemented
+        return (self.schema, self.name, self.remarks) == (other.schema, other.name, other.remarks)
+
+    # Like the TableInfo dataclass, rows compare by value and are not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TableRow(schema={self.schema!r}, name={self.name!r}, remarks={self.remarks!r})"
+
+
+class ColumnRow:
+    """Read-only ColumnInfo-like view of one column in a CatalogStore."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "CatalogStore", row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def schema(self) -> str:
+        return self._store.strings[self._store._c_schema[self._row]]
+
+    @property
+    def table(self) -> str:
+        return self._store.strings[self._store._c_table[self._row]]
+
+    @property
+    def name(self) -> str:
+        return self._store.strings[self._store._c_name[self._row]]
+
+    @property
+    def typename(self) -> str:
+        return self._store.strings[self._store._c_typename[self._row]]
+
+    @property
+    def length(self) -> Optional[int]:
+        value = self._store._c_length[self._row]
+        return None if value == _NULL else value
+
+    @property
+    def scale(self) -> Optional[int]:
+        value = self._store._c_scale[self._row]
+        return None if value == _NULL else value
+
+    @property
+    def nulls(self) -> str:
+        return "Y" if self._store._c_nulls[self._row] else "N"
+
+    @property
+    def remarks(self) -> str:
+        return self._store.strings[self._store._c_remarks[self._row]]
+
+    def _fields(self) -> tuple:
+        return (self.schema, self.table, self.name, self.typename, self.length, self.scale, self.nulls, self.remarks)
+
+    def to_info(self) -> ColumnInfo:
+        """Materialize the row as a ColumnInfo."""
+        return ColumnInfo(*self._fields())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnRow):
+            return self._fields() == other._fields()
+        if isinstance(other, ColumnInfo):
+            return self._fields() == (
+                other.schema,
+                other.table,
+                other.name,
+                other.typename,
+                other.length,
+                other.scale,
+                other.nulls,
+                other.remarks,
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnRow(schema={self.schema!r}, table={self.table!r}, name={self.name!r}, "
+            f"typename={self.typename!r}, length={self.length!r}, scale={self.scale!r}, "
+            f"nulls={self.nulls!r}, remarks={self.remarks!r})"
+        )
+
+
+# For isinstance checks that accept either the dataclasses or row views
+TABLE_TYPES = (TableInfo, TableRow)
+COLUMN_TYPES = (ColumnInfo, ColumnRow)
+
+
+class RowList(Sequence):
+    """The live tables or columns of a CatalogStore as a list-like sequence of row views.
+
+    Supports ``append`` and ``extend`` with TableInfo/ColumnInfo objects, rows
+    of another store or the loader's dicts, so it can stand in for the lists
+    the catalog used to be kept in.
+    """
+
+    __slots__ = ("_store", "_kind")
+
+    def __init__(self, store: "CatalogStore", kind: str):
+        self._store = store
+        self._kind = kind
+
+    @property
+    def store(self):
+        """The store (or segment) the rows belong to."""
+        return self._store
+
+    def _live(self) -> array:
+        return self._store._t_live if self._kind == "tables" else self._store._c_live
+
+    def _view(self, row: int):
+        return TableRow(self._store, row) if self._kind == "tables" else ColumnRow(self._store, row)
+
+    def __len__(self) -> int:
+        return len(self._live())
+
+    def __getitem__(self, i):
+        live = self._live()
+        if isinstance(i, slice):
+            return [self._view(row) for row in live[i]]
+        return self._view(live[i])
+
+    def __iter__(self) -> Iterator[Any]:
+        view = self._view
+        for row in self._live():
+            yield view(row)
+
+    def append(self, item: Any) -> None:
+        self.extend((item,))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        if self._kind == "tables":
+            self._store.add_tables(items)
+        else:
+            self._store.add_columns(items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, RowList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RowList({self._kind}, {len(self)} rows)"
+
+
+def _get(item: Any, attr: str, key: str) -> Any:
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, attr)
+
+
+def _pick(values: Sequence, rows: Sequence[int]) -> Sequence:
+    """``values`` at ``rows``; the sequence itself when every row is picked."""
+    return values if len(rows) == len(values) else [values[row] for row in rows]
+
+
+class CatalogStore:
+    """Tables and columns of a catalog kept in parallel arrays.
+
+    ``tables`` and ``columns`` are list-like sequences of row views in the
+    order the rows were added; ``get_table``, ``columns_of``, ``get_column``
+    and ``table_count`` look rows up by key.
+    """
+
+    def __init__(self, tables: Iterable[Any] = (), columns: Iterable[Any] = ()):
+        self.strings = StringTable()
+        self._t_schema = array("I")
+        self._t_name = array("I")
+        self._t_remarks = array("I")
+        self._c_schema = array("I")
+        self._c_table = array("I")
+        self._c_name = array("I")
+        self._c_typename = array("I")
+        self._c_remarks = array("I")
+        self._c_length = array("q")
+        self._c_scale = array("q")
+        self._c_nulls = array("b")
+        # Row ids currently part of the catalog, in catalog order
+        self._t_live = array("I")
+        self._c_live = array("I")
+        # Table row -> its position in _t_live, to replace a table in place
+        self._t_pos: Dict[int, int] = {}
+        # (schema id, table id) -> table row / live column rows
+        self._table_rows: Dict[Tuple[int, int], int] = {}
+        self._table_columns: Dict[Tuple[int, int], array] = {}
+        # schema id -> number of live tables
+        self._schema_tables: Dict[int, int] = {}
+        self.tables = RowList(self, "tables")
+        self.columns = RowList(self, "columns")
+        self.add_tables(tables)
+        self.add_columns(columns)
+
+    def add_tables(self, tables: Iterable[Any]) -> List[TableRow]:
+        """Append tables (TableInfo-like objects or loader dicts); returns their rows.
+
+        A table already in the store is replaced where it stands.
+        """
+        intern = self.strings.intern
+        return [
+            self._add_table(
+                intern(_get(t, "schema", "schema")),
+                intern(_get(t, "name", "name")),
+                intern(_get(t, "remarks", "remarks")),
+            )
+            for t in tables
+        ]
+
+    def _add_table(self, schema_id: int, name_id: int, remarks_id: int) -> TableRow:
+        """Append one table given by string ids, replacing a table with the same key."""
+        key = (schema_id, name_id)
+        row = len(self._t_schema)
+        self._t_schema.append(schema_id)
+        self._t_name.append(name_id)
+        self._t_remarks.append(remarks_id)
+        old = self._table_rows.get(key)
+        self._table_rows[key] = row
+        if old is None:
+            self._t_pos[row] = len(self._t_live)
+            self._t_live.append(row)
+            self._schema_tables[schema_id] = self._schema_tables.get(schema_id, 0) + 1
+        else:
+            pos = self._t_pos.pop(old)
+            self._t_live[pos] = row
+            self._t_pos[row] = pos
+        return TableRow(self, row)
+
+    def add_columns(self, columns: Iterable[Any]) -> List[ColumnRow]:
+        """Append columns (ColumnInfo-like objects or loader dicts); returns their rows."""
+        intern = self.strings.intern
+        added = []
+        for c in columns:
+            key = (intern(_get(c, "schema", "schema")), intern(_get(c, "table", "table")))
+            row = len(self._c_schema)
+            self._c_schema.append(key[0])
+            self._c_table.append(key[1])
+            self._c_name.append(intern(_get(c, "name", "name")))
+            self._c_typename.append(intern(_get(c, "typename", "typename")))
+            self._c_remarks.append(intern(_get(c, "remarks", "remarks")))
+            length = _get(c, "length", "length")
+            scale = _get(c, "scale", "scale")
+            self._c_length.append(_NULL if length is None else int(length))
+            self._c_scale.append(_NULL if scale is None else int(scale))
+            self._c_nulls.append(1 if _get(c, "nulls", "nulls") == "Y" else 0)
+            self._c_live.append(row)
+            bucket = self._table_columns.get(key)
+            if bucket is None:
+                self._table_columns[key] = array("I", (row,))
+            else:
+                bucket.append(row)
+            added.append(ColumnRow(self, row))
+        return added
+
+    def adopt(self, source: Any) -> Tuple[List[TableRow], List[ColumnRow]]:
+        """Append the live rows of another store or a CatalogSegment; returns their rows here.
+
+        Unlike add_tables/add_columns this never goes through row views: each
+        distinct string of ``source`` is interned once and the column arrays
+        are extended in bulk. Tables already in the store are replaced where
+        they stand.
+        """
+        strings = source.strings
+        intern = self.strings.intern
+        remap = [intern(strings[sid]) for sid in range(len(strings))].__getitem__
+
+        table_rows = [
+            self._add_table(remap(source._t_schema[row]), remap(source._t_name[row]), remap(source._t_remarks[row]))
+            for row in source._t_live
+        ]
+
+        rows = source._c_live
+        base = len(self._c_schema)
+        for mine, theirs in (
+            (self._c_schema, source._c_schema),
+            (self._c_table, source._c_table),
+            (self._c_name, source._c_name),
+            (self._c_typename, source._c_typename),
+            (self._c_remarks, source._c_remarks),
+        ):
+            mine.extend(map(remap, _pick(theirs, rows)))
+        self._c_length.extend(_pick(source._c_length, rows))
+        self._c_scale.extend(_pick(source._c_scale, rows))
+        self._c_nulls.extend(_pick(source._c_nulls, rows))
+        added = range(base, len(self._c_schema))
+        self._c_live.extend(added)
+        table_columns = self._table_columns
+        for row, key in zip(added, zip(self._c_schema[base:], self._c_table[base:], strict=True), strict=True):
+            bucket = table_columns.get(key)
+            if bucket is None:
+                table_columns[key] = array("I", (row,))
+            else:
+                bucket.append(row)
+        return table_rows, [ColumnRow(self, row) for row in added]
+
+    def _key(self, schema: str, name: str) -> Optional[Tuple[int, int]]:
+        schema_id = self.strings.lookup(schema)
+        name_id = self.strings.lookup(name)
+        if schema_id is None or name_id is None:
+            return None
+        return schema_id, name_id
+
+    def get_table(self, schema: str, name: str) -> Optional[TableRow]:
+        """Return the row of one table, or None."""
+        key = self._key(schema, name)
+        row = self._table_rows.get(key) if key is not None else None
+        return TableRow(self, row) if row is not None else None
+
+    def table_for_key(self, table_key: str) -> Optional[TableRow]:
+        """Return the row of the table with a "schema.table" key, or None."""
+        schema, _, name = table_key.partition(".")
+        return self.get_table(schema, name)
+
+    def columns_of(self, schema: str, name: str) -> List[ColumnRow]:
+        """Return the columns of one table in the order they were added."""
+        key = self._key(schema, name)
+        rows = self._table_columns.get(key, ()) if key is not None else ()
+        return [ColumnRow(self, row) for row in rows]
+
+    def get_column(self, schema: str, table: str, name: str) -> Optional[ColumnRow]:
+        """Return the row of one column of a table, or None."""
+        key = self._key(schema, table)
+        name_id = self.strings.lookup(name)
+        if key is None or name_id is None:
+            return None
+        for row in self._table_columns.get(key, ()):
+            if self._c_name[row] == name_id:
+                return ColumnRow(self, row)
+        return None
+
+    def schemas(self) -> List[str]:
+        """Return the schemas that have tables, in the order they first appeared."""
+        return [self.strings[sid] for sid in self._schema_tables]
+
+    def table_count(self, schema: str) -> int:
+        """Return the number of tables in a schema."""
+        sid = self.strings.lookup(schema)
+        return self._schema_tables.get(sid, 0) if sid is not None else 0
+
+    def remove_tables(self, keys: Iterable[Tuple[str, str]]) -> int:
+        """Drop tables, given as (schema, table) pairs, and their columns.
+
+        Returns the number of tables removed.
+        """
+        dead_tables: Set[int] = set()
+        dead_columns: Set[int] = set()
+        self._forget_tables(keys, dead_tables, dead_columns)
+        self._drop_rows(dead_tables, dead_columns)
+        return len(dead_tables)
+
+    def _forget_tables(self, keys: Iterable[Tuple[str, str]], dead_tables: Set[int], dead_columns: Set[int]) -> None:
+        """Unindex tables and their columns, collecting their rows for _drop_rows."""
+        for schema, name in keys:
+            key = self._key(schema, name)
+            if key is None or key not in self._table_rows:
+                continue
+            dead_tables.add(self._table_rows.pop(key))
+            dead_columns.update(self._table_columns.pop(key, ()))
+            left = self._schema_tables[key[0]] - 1
+            if left:
+                self._schema_tables[key[0]] = left
+            else:
+                del self._schema_tables[key[0]]
+
+    def _drop_rows(self, dead_tables: Set[int], dead_columns: Set[int]) -> None:
+        """Take rows out of the live arrays, one pass over each."""
+        if dead_tables:
+            self._t_live = array("I", (row for row in self._t_live if row not in dead_tables))
+            self._t_pos = {row: pos for pos, row in enumerate(self._t_live)}
+        if dead_columns:
+            self._c_live = array("I", (row for row in self._c_live if row not in dead_columns))
+
+    def apply_delta(
+        self, delta, tables: Iterable[Any], columns: Iterable[Any]
+    ) -> Tuple[List[TableRow], List[ColumnRow]]:
+        """Patch the store with a catalog_refresh.CatalogDelta and the reloaded tables.
+
+        Changed tables keep their place, added ones are appended and removed
+        ones dropped. Returns the rows of the reloaded tables and columns.
+        The live arrays are filtered once for the whole delta.
+        """
+        dead_tables: Set[int] = set()
+        dead_columns: Set[int] = set()
+        changed = list(delta.changed)
+        self._forget_tables(delta.removed, dead_tables, dead_columns)
+        # Old columns of changed tables go before the fresh ones come in
+        for schema, name in changed:
+            key = self._key(schema, name)
+            if key is not None:
+                dead_columns.update(self._table_columns.pop(key, ()))
+        wanted = set(delta.stale)
+        table_rows = self.add_tables(
+            t for t in tables if (_get(t, "schema", "schema"), _get(t, "name", "name")) in wanted
+        )
+        # Changed tables that vanished before they could be reloaded
+        reloaded = {(t.schema, t.name) for t in table_rows}
+        self._forget_tables((key for key in changed if key not in reloaded), dead_tables, dead_columns)
+        self._drop_rows(dead_tables, dead_columns)
+        column_rows = self.add_columns(
+            c for c in columns if (_get(c, "schema", "schema"), _get(c, "table", "table")) in reloaded
+        )
+        return table_rows, column_rows
+
+    def compact(self) -> "CatalogStore":
+        """Return a new store holding only the live rows, freeing dropped ones.
+
+        Views into this store keep pointing at this store.
+        """
+        return CatalogStore(self.tables, self.columns)
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the arrays, string table and lookups."""
+        arrays = (
+            self._t_schema,
+            self._t_name,
+            self._t_remarks,
+            self._c_schema,
+            self._c_table,
+            self._c_name,
+            self._c_typename,
+            self._c_remarks,
+            self._c_length,
+            self._c_scale,
+            self._c_nulls,
+            self._t_live,
+            self._c_live,
+        )
+        size = sum(a.itemsize * len(a) for a in arrays)
+        size += sum(sys.getsizeof(s) for s in self.strings._strings)
+        size += sys.getsizeof(self.strings._strings) + sys.getsizeof(self.strings._ids)
+        size += sys.getsizeof(self._table_rows) + sys.getsizeof(self._table_columns)
+        size += sys.getsizeof(self._schema_tables) + sys.getsizeof(self._t_pos)
+        size += sum(a.itemsize * len(a) for a in self._table_columns.values())
+        return size
+
+
+def find_table(tables: Iterable[Any], schema: Optional[str], name: Optional[str]) -> Optional[Any]:
+    """Return the table (schema, name) of a table sequence, or None.
+
+    Uses the store's index for the tables of a CatalogStore; other
+    sequences are scanned.
+    """
+    store = getattr(tables, "store", None)
+    if isinstance(store, CatalogStore):
+        return store.get_table(schema, name) if schema is not None and name is not None else None
+    for t in tables:
+        if t.schema == schema and t.name == name:
+            return t
+    return None
+
+
+def count_schema_tables(tables: Iterable[Any], schema: str) -> int:
+    """Return how many tables of a table sequence are in ``schema``; indexed like find_table."""
+    store = getattr(tables, "store", None)
+    if isinstance(store, CatalogStore):
+        return store.table_count(schema)
+    return sum(1 for t in tables if getattr(t, "schema", None) == schema)
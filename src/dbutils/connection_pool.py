@@ -0,0 +1,410 @@
+"""Pooled JDBC connections for the query runners.
+
+Opening a JDBC connection (especially against DB2 for i) costs far more than
+the catalog queries the browser runs, so ``query_runner`` can borrow warm
+connections from a pool instead of connecting and closing per statement.
+
+Pools are keyed by provider name, URL parameters, user and a hash of the
+password. Each pool supports:
+- configurable min/max size, with ``min_size`` connections opened when the
+  pool is created
+- idle eviction (performed lazily on borrow/return)
+- validation-on-borrow so dead sessions are replaced transparently
+- a per-thread session API so a worker thread reuses one connection for every
+  statement it runs (e.g. the chunked loaders paging through the catalog)
+
+Pooling is opt-in via ``DBUTILS_JDBC_POOL=1``; the Qt GUI enables it by
+default. Sizing can be tuned with DBUTILS_JDBC_POOL_MIN, DBUTILS_JDBC_POOL_MAX
+and DBUTILS_JDBC_POOL_IDLE (seconds).
+
+Loaders that run several catalog statements at once share one
+``query_executor()``. It is sized to the pool so concurrent statements never
+wait on a borrow; DBUTILS_QUERY_CONCURRENCY lowers or raises the limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def pooling_enabled() -> bool:
+    """Return True when query runners should use pooled connections."""
+    return os.environ.get("DBUTILS_JDBC_POOL", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass
+class PoolConfig:
+    """Sizing and lifecycle settings for a ConnectionPool."""
+
+    min_size: int = 0
+    max_size: int = 4
+    idle_timeout: float = 300.0  # seconds an idle connection may sit in the pool
+    validate_on_borrow: bool = True
+    borrow_timeout: float = 30.0  # seconds to wait for a free slot when the pool is full
+
+    @staticmethod
+    def from_env() -> "PoolConfig":
+        """Build a config from DBUTILS_JDBC_POOL_* environment variables."""
+        cfg = PoolConfig()
+        try:
+            cfg.min_size = int(os.environ.get("DBUTILS_JDBC_POOL_MIN", cfg.min_size))
+            cfg.max_size = int(os.environ.get("DBUTILS_JDBC_POOL_MAX", cfg.max_size))
+            cfg.idle_timeout = float(os.environ.get("DBUTILS_JDBC_POOL_IDLE", cfg.idle_timeout))
+        except ValueError:
+            logger.warning("Invalid DBUTILS_JDBC_POOL_* setting, using defaults")
+            cfg = PoolConfig()
+        cfg.max_size = max(1, cfg.max_size)
+        cfg.min_size = max(0, min(cfg.min_size, cfg.max_size))
+        return cfg
+
+
+class ConnectionPool:
+    """Thread-safe pool of connections created by ``factory``.
+
+    Connections only need ``query()`` and ``close()``; if they expose
+    ``is_valid()`` it is used for validation-on-borrow.
+    """
+
+    def __init__(self, factory: Callable[[], Any], config: Optional[PoolConfig] = None):
+        self._factory = factory
+        self.config = config or PoolConfig()
+        self._cond = threading.Condition()
+        # Idle connections as (connection, last_used) with the most recently used last
+        self._idle: List[Tuple[Any, float]] = []
+        self._in_use = 0
+        self._closed = False
+        self._local = threading.local()
+
+        # Statistics
+        self._created = 0
+        self._reused = 0
+        self._evicted = 0
+        self._invalidated = 0
+
+    # -- borrowing -------------------------------------------------------
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Borrow a connection, opening a new one if none is idle.
+
+        Inside a ``session()`` the thread's bound connection is returned
+        instead, so repeated statements reuse the same session.
+        """
+        bound = self._thread_bound()
+        if bound is not None:
+            return bound
+
+        conn = self._acquire_raw(timeout)
+        if getattr(self._local, "depth", 0) > 0:
+            self._local.conn = conn
+        return conn
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """Return a borrowed connection; ``discard`` closes it instead."""
+        if conn is None:
+            return
+        if self._thread_bound() is conn:
+            if not discard:
+                # Stays checked out until the owning session ends
+                return
+            self._local.conn = None
+        self._release_raw(conn, discard)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Context manager that borrows a connection and returns it on exit."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def session(self) -> Iterator["ConnectionPool"]:
+        """Pin one connection to the current thread for the duration of the block.
+
+        The connection is checked out lazily on first use, shared by every
+        ``acquire()``/``connection()`` call made from this thread inside the
+        block (nested sessions included), and returned when the outermost
+        session exits.
+        """
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._local.depth = depth
+            if depth == 0:
+                conn = getattr(self._local, "conn", None)
+                self._local.conn = None
+                if conn is not None:
+                    self._release_raw(conn, False)
+
+    def _thread_bound(self) -> Optional[Any]:
+        if getattr(self._local, "depth", 0) > 0:
+            return getattr(self._local, "conn", None)
+        return None
+
+    def _acquire_raw(self, timeout: Optional[float]) -> Any:
+        wait_for = self.config.borrow_timeout if timeout is None else timeout
+        deadline = time.monotonic() + wait_for
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                self._evict_idle_locked()
+                while self._idle:
+                    conn, _ = self._idle.pop()
+                    if self.config.validate_on_borrow and not self._is_valid(conn):
+                        self._invalidated += 1
+                        self._close_quietly(conn)
+                        continue
+                    self._in_use += 1
+                    self._reused += 1
+                    return conn
+                if self._in_use < self.config.max_size:
+                    # Reserve the slot, then connect outside the lock
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError(f"Connection pool exhausted ({self.config.max_size} connections in use)")
+                self._cond.wait(remaining)
+
+        try:
+            conn = self._factory()
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created += 1
+        return conn
+
+    def _release_raw(self, conn: Any, discard: bool) -> None:
+        with self._cond:
+            self._in_use = max(0, self._in_use - 1)
+            if discard or self._closed:
+                self._close_quietly(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+                self._evict_idle_locked()
+            self._cond.notify()
+
+    # -- maintenance -----------------------------------------------------
+
+    def warm(self) -> int:
+        """Open connections until ``min_size`` are idle. Returns how many were opened."""
+        opened = 0
+        while True:
+            with self._cond:
+                if self._closed or len(self._idle) + self._in_use >= self.config.max_size:
+                    break
+                if len(self._idle) >= self.config.min_size:
+                    break
+            conn = self._factory()
+            with self._cond:
+                self._created += 1
+                self._idle.insert(0, (conn, time.monotonic()))
+            opened += 1
+        return opened
+
+    def evict_idle(self) -> int:
+        """Close idle connections older than ``idle_timeout``. Returns the count closed."""
+        with self._cond:
+            return self._evict_idle_locked()
+
+    def _evict_idle_locked(self) -> int:
+        if not self._idle or self.config.idle_timeout is None:
+            return 0
+        cutoff = time.monotonic() - self.config.idle_timeout
+        evicted = 0
+        # Oldest entries sit at the front; never drop below min_size
+        while len(self._idle) > self.config.min_size and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.pop(0)
+            self._close_quietly(conn)
+            evicted += 1
+        self._evicted += evicted
+        return evicted
+
+    def close(self) -> None:
+        """Close all idle connections and refuse further borrows."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool usage statistics."""
+        with self._cond:
+            return {
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "created": self._created,
+                "reused": self._reused,
+                "evicted": self._evicted,
+                "invalidated": self._invalidated,
+            }
+
+    @staticmethod
+    def _is_valid(conn: Any) -> bool:
+        check = getattr(conn, "is_valid", None)
+        if check is None:
+            return True
+        try:
+            return bool(check())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# Registry of pools keyed by (provider, url params, user)
+_pools: Dict[Tuple[str, str, str, str], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_key(
+    provider_name: str, url_params: Dict[str, Any], user: Optional[str], password: Optional[str] = None
+) -> Tuple[str, str, str, str]:
+    # Keys end up in caches and logs, so the password is only kept as a digest
+    secret = hashlib.sha256(password.encode("utf-8")).hexdigest() if password else ""
+    return (provider_name, json.dumps(url_params or {}, sort_keys=True, default=str), user or "", secret)
+
+
+def get_pool(
+    provider_name: str,
+    url_params: Dict[str, Any],
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+    config: Optional[PoolConfig] = None,
+) -> ConnectionPool:
+    """Return the shared pool for this provider/URL/user/password, creating it on first use.
+
+    A new pool opens its ``min_size`` connections before it is returned.
+    """
+    key = _pool_key(provider_name, url_params, user, password)
+    with _pools_lock:
+        pool = _pools.get(key)
+        created = pool is None
+        if created:
+            params = dict(url_params or {})
+
+            def factory():
+                # Resolve connect() at call time so a patched/reloaded provider module is honoured
+                from dbutils import jdbc_provider
+
+                return jdbc_provider.connect(provider_name, params, user=user, password=password)
+
+            pool = ConnectionPool(factory, config or PoolConfig.from_env())
+            _pools[key] = pool
+    if created:
+        # Outside the lock: connecting is slow and must not hold up other pools
+        try:
+            pool.warm()
+        except Exception as e:
+            # The first borrow reports the connection error to its caller
+            logger.warning("Could not warm connection pool for %s: %s", provider_name, e)
+    return pool
+
+
+def close_all_pools() -> None:
+    """Close and forget every pool (e.g. on application shutdown)."""
+    global _executor
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        executor, _executor = _executor, None
+    for pool in pools:
+        pool.close()
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+# Shared threads for running statements concurrently, created on first use
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def query_concurrency() -> int:
+    """Return how many statements loaders may run at once.
+
+    Defaults to the pool's max_size, so each concurrent statement can hold
+    its own pooled connection without waiting for another to be returned.
+    """
+    try:
+        return max(1, int(os.environ.get("DBUTILS_QUERY_CONCURRENCY", PoolConfig.from_env().max_size)))
+    except ValueError:
+        logger.warning("Invalid DBUTILS_QUERY_CONCURRENCY setting, using the pool size")
+        return PoolConfig.from_env().max_size
+
+
+def query_executor() -> ThreadPoolExecutor:
+    """Return the shared executor that loaders run concurrent statements on."""
+    global _executor
+    with _pools_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=query_concurrency(), thread_name_prefix="dbutils-query")
+        return _executor
+
+
+def env_connection_settings() -> Optional[Tuple[str, Dict[str, Any], Optional[str], Optional[str]]]:
+    """Read (provider, url_params, user, password) from the DBUTILS_JDBC_* environment."""
+    provider_name = os.environ.get("DBUTILS_JDBC_PROVIDER")
+    if not provider_name:
+        return None
+    url_params_raw = os.environ.get("DBUTILS_JDBC_URL_PARAMS", "{}")
+    try:
+        url_params = json.loads(url_params_raw) if url_params_raw else {}
+    except Exception:
+        url_params = {}
+    return (
+        provider_name,
+        url_params,
+        os.environ.get("DBUTILS_JDBC_USER"),
+        os.environ.get("DBUTILS_JDBC_PASSWORD"),
+    )
+
+
+def env_connection_key() -> Tuple[str, str, str, str]:
+    """Identify the database the DBUTILS_JDBC_* environment connects to, as its pool is keyed.
+
+    Caches holding query results use it so two connections never share entries.
+    """
+    settings = env_connection_settings()
+    if settings is None:
+        return _pool_key("", {}, None)
+    provider_name, url_params, user, password = settings
+    return _pool_key(provider_name, url_params, user, password)
+
+
+def pooled_session():
+    """Pin a pooled connection to the calling thread for a block of query_runner calls.
+
+    Returns a no-op context manager when pooling is disabled or no provider
+    is configured, so callers can wrap their work unconditionally.
+    """
+    if not pooling_enabled():
+        return nullcontext()
+    settings = env_connection_settings()
+    if settings is None:
+        return nullcontext()
+    provider_name, url_params, user, password = settings
+    return get_pool(provider_name, url_params, user=user, password=password).session()
@@ -0,0 +1,216 @@
+"""In-memory cache of table-contents preview pages.
+
+Re-selecting a table or re-applying a contents filter asks for exactly the
+same page again. ``ContentsCache`` keeps recent pages keyed by
+(provider, schema, table, where clause, key range or offset, limit), so
+those requests are answered locally instead of by another query.
+
+Entries expire after a TTL and the least recently used ones are evicted
+once the estimated size of the cached rows passes a memory budget. Pages
+can also be invalidated by hand, for one table, one schema or everything.
+
+Sizing can be tuned with DBUTILS_CONTENTS_CACHE_MB and
+DBUTILS_CONTENTS_CACHE_TTL (seconds); a size of 0 disables the cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+from dbutils.result_set import ResultSet
+
+logger = logging.getLogger(__name__)
+
+# Rows sampled when estimating the memory a page uses
+_SIZE_SAMPLE_ROWS = 8
+
+
+@dataclass
+class ContentsCacheConfig:
+    """Memory budget and lifetime for a ContentsCache."""
+
+    max_bytes: int = 32 * 1024 * 1024
+    ttl: float = 300.0  # seconds a cached page stays valid
+
+    @staticmethod
+    def from_env() -> "ContentsCacheConfig":
+        """Build a config from DBUTILS_CONTENTS_CACHE_* environment variables."""
+        cfg = ContentsCacheConfig()
+        try:
+            if "DBUTILS_CONTENTS_CACHE_MB" in os.environ:
+                cfg.max_bytes = int(float(os.environ["DBUTILS_CONTENTS_CACHE_MB"]) * 1024 * 1024)
+            cfg.ttl = float(os.environ.get("DBUTILS_CONTENTS_CACHE_TTL", cfg.ttl))
+        except ValueError:
+            logger.warning("Invalid DBUTILS_CONTENTS_CACHE_* setting, using defaults")
+            cfg = ContentsCacheConfig()
+        cfg.max_bytes = max(0, cfg.max_bytes)
+        return cfg
+
+
+def page_key(
+    provider: Hashable,
+    schema: str,
+    table: str,
+    where: str = "",
+    offset: int = 0,
+    limit: int = 25,
+    after_key: Optional[Sequence[Any]] = None,
+) -> Tuple[Hashable, ...]:
+    """Build the cache key for one page of ``schema.table``.
+
+    ``provider`` identifies the database, e.g. connection_pool.env_connection_key().
+    A page reached by seeking after a key is identified by that key, since
+    the same key can sit at different offsets as the table changes.
+    """
+    span = ("after", tuple(after_key)) if after_key is not None else ("offset", int(offset))
+    return (provider or "", schema or "", table or "", where or "", span, int(limit))
+
+
+def estimate_size(rows: Any) -> int:
+    """Roughly estimate the bytes held by a page of rows from a small sample."""
+    try:
+        count = len(rows)
+    except TypeError:
+        return 0
+    if count == 0:
+        return sys.getsizeof(rows)
+
+    if isinstance(rows, ResultSet):
+        sample = rows[:_SIZE_SAMPLE_ROWS].tuples()
+    else:
+        sample = [r.values() if hasattr(r, "values") else r for r in list(rows[:_SIZE_SAMPLE_ROWS])]
+
+    sampled = 0
+    for row in sample:
+        values = list(row)
+        sampled += sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+    return sys.getsizeof(rows) + sampled * count // len(sample)
+
+
+class ContentsCache:
+    """Thread-safe LRU cache of preview pages bounded by memory and TTL."""
+
+    def __init__(self, config: Optional[ContentsCacheConfig] = None):
+        self.config = config or ContentsCacheConfig()
+        self._lock = threading.RLock()
+        # key -> (stored_at, size, page) with the most recently used last
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached page for ``key``, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[0] >= self.config.ttl:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[2]
+
+    def put(self, key: Hashable, page: Any, rows: Any = None):
+        """Cache ``page``; ``rows`` (default: the page itself) sizes the entry."""
+        if not self.enabled:
+            return
+        size = estimate_size(page if rows is None else rows)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.config.max_bytes:
+                # Would evict everything else and still not fit
+                return
+            self._entries[key] = (time.time(), size, page)
+            self._bytes += size
+            if self._bytes > self.config.max_bytes:
+                # Expired pages go before any live page is evicted
+                self.expire()
+            while self._bytes > self.config.max_bytes:
+                old = next(iter(self._entries))
+                self._drop(old)
+                self._evictions += 1
+
+    def invalidate(self, schema: Optional[str] = None, table: Optional[str] = None) -> int:
+        """Drop cached pages of one table, one schema, or all pages when both are None.
+
+        Returns the number of pages dropped.
+        """
+        with self._lock:
+            if schema is None and table is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return dropped
+            doomed = [
+                k
+                for k in self._entries
+                if (schema is None or k[1] == schema) and (table is None or k[2] == table)
+            ]
+            for k in doomed:
+                self._drop(k)
+            return len(doomed)
+
+    def expire(self) -> int:
+        """Drop every page older than the TTL and return how many were dropped."""
+        cutoff = time.time() - self.config.ttl
+        with self._lock:
+            doomed = [k for k, (stored_at, _size, _page) in self._entries.items() if stored_at <= cutoff]
+            for k in doomed:
+                self._drop(k)
+            return len(doomed)
+
+    def clear(self):
+        """Drop all pages and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache performance statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "cache_hits": self._hits,
+                "cache_misses": self._misses,
+                "cache_size": len(self._entries),
+                "cache_bytes": self._bytes,
+                "cache_evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def _drop(self, key: Hashable):
+        _stored_at, size, _page = self._entries.pop(key)
+        self._bytes -= size
+
+
+_contents_cache: Optional[ContentsCache] = None
+_contents_cache_lock = threading.Lock()
+
+
+def get_contents_cache() -> ContentsCache:
+    """Get the process-wide contents cache, configured from the environment."""
+    global _contents_cache
+    with _contents_cache_lock:
+        if _contents_cache is None:
+            _contents_cache = ContentsCache(ContentsCacheConfig.from_env())
+        return _contents_cache
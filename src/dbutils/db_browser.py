@@ -12,10 +12,13 @@ import logging
 import os
 import pickle
 import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterable, Iterator, List, Optional
 from dataclasses import dataclass
-from typing import Set
+from typing import Set, Tuple
+
+from dbutils.cache_store import get_store
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +107,26 @@ class TrieNode:
         node.is_end_of_word = True
         node.items.add(item_key)
 
+    def remove(self, word: str, item_key: str) -> None:
+        """Remove an item key from a word, pruning nodes left empty."""
+        path = [self]
+        node = self
+        for char in word.lower():
+            node = node.children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        node.items.discard(item_key)
+        if not node.items:
+            node.is_end_of_word = False
+        # Walk back up and drop empty leaves
+        chars = word.lower()
+        for i in range(len(chars) - 1, -1, -1):
+            child = path[i + 1]
+            if child.children or child.is_end_of_word:
+                break
+            del path[i].children[chars[i]]
+
     def search_prefix(self, prefix: str) -> Set[str]:
         """Search for all items that start with the given prefix."""
         node = self
@@ -132,56 +155,262 @@ class TrieNode:
             stack.extend(current.children.values())
 
 
+# Bits in the field masks returned by TrigramIndex.search(). Tables index
+# (name, schema, remarks) and columns index (name, typename, remarks).
+MATCH_NAME = 1
+MATCH_SCHEMA = 2
+MATCH_TYPE = 2
+MATCH_REMARKS = 4
+
+
+class TrigramIndex:
+    """Trigram index for substring (infix) matching over short text fields.
+
+    Each document's fields are lowercased once and kept; a posting set of
+    document ids is stored per trigram. Fields are padded with a NUL on both
+    sides, so one- and two-character fields still produce trigrams and
+    short queries can be answered from the trigram vocabulary instead of
+    scanning every document. Candidates are always verified against the
+    stored lowercase text, so results are exact.
+
+    Repeated lowercase texts (type names, common remarks) are shared through
+    a reference-counted table owned by the index, not the process-wide
+    intern cache, so they are freed with their documents or the index.
+    """
+
+    __slots__ = ("_ids", "_keys", "_texts", "_grams", "_next_id", "_strings")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._keys: Dict[int, str] = {}
+        self._texts: Dict[int, Tuple[str, ...]] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        self._next_id = 0
+        # Lowercase text -> [shared string, number of stored fields using it]
+        self._strings: Dict[str, List] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ids
+
+    @staticmethod
+    def _trigrams(fields: Tuple[str, ...]) -> Set[str]:
+        grams = set()
+        for field in fields:
+            if not field:
+                continue
+            padded = f"\0{field}\0"
+            for i in range(len(padded) - 2):
+                grams.add(padded[i : i + 3])
+        return grams
+
+    def add(self, key: str, fields) -> None:
+        """Index ``fields`` under ``key``; re-adding a key replaces its entry."""
+        if key in self._ids:
+            self.remove(key)
+        doc = self._next_id
+        self._next_id += 1
+        lowered = tuple(self._share(f.lower()) if f else "" for f in fields)
+        self._ids[key] = doc
+        self._keys[doc] = key
+        self._texts[doc] = lowered
+        for gram in self._trigrams(lowered):
+            postings = self._grams.get(gram)
+            if postings is None:
+                self._grams[gram] = {doc}
+            else:
+                postings.add(doc)
+
+    def remove(self, key: str) -> bool:
+        """Drop ``key`` from the index. Returns False if it was not indexed."""
+        doc = self._ids.pop(key, None)
+        if doc is None:
+            return False
+        del self._keys[doc]
+        texts = self._texts.pop(doc)
+        for gram in self._trigrams(texts):
+            postings = self._grams.get(gram)
+            if postings is not None:
+                postings.discard(doc)
+                if not postings:
+                    del self._grams[gram]
+        for text in texts:
+            if text:
+                self._release(text)
+        return True
+
+    def _share(self, text: str) -> str:
+        entry = self._strings.get(text)
+        if entry is None:
+            self._strings[text] = [text, 1]
+            return text
+        entry[1] += 1
+        return entry[0]
+
+    def _release(self, text: str) -> None:
+        entry = self._strings[text]
+        entry[1] -= 1
+        if not entry[1]:
+            del self._strings[text]
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._keys.clear()
+        self._texts.clear()
+        self._grams.clear()
+        self._strings.clear()
+
+    def search(self, query: str) -> Dict[str, int]:
+        """Return ``{key: field_mask}`` for documents containing ``query`` as a substring.
+
+        Bit ``i`` of the mask is set when field ``i`` contains the query.
+        Keys come back in insertion order. An empty query matches nothing.
+        """
+        q = query.lower().strip()
+        if not q:
+            return {}
+
+        if len(q) >= 3:
+            postings = []
+            for i in range(len(q) - 2):
+                ids = self._grams.get(q[i : i + 3])
+                if not ids:
+                    return {}
+                postings.append(ids)
+            # Intersect starting from the rarest trigram
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for ids in postings[1:]:
+                candidates &= ids
+                if not candidates:
+                    return {}
+        else:
+            # Too short to split: union the postings of every trigram containing it
+            candidates = set()
+            for gram, ids in self._grams.items():
+                if q in gram:
+                    candidates |= ids
+
+        matches: Dict[str, int] = {}
+        for doc in sorted(candidates):
+            mask = 0
+            for bit, text in enumerate(self._texts[doc]):
+                if q in text:
+                    mask |= 1 << bit
+            if mask:
+                matches[self._keys[doc]] = mask
+        return matches
+
+
 class SearchIndex:
-    """Fast search index using trie data structure."""
+    """Fast search index using trie data structure.
+
+    The index can be built in one go with build_index() or grown as data
+    streams in with add_tables()/add_columns(); remove_schema() drops a
+    schema's entries when it is reloaded, and remove_tables() drops single
+    tables when a catalog refresh finds them changed or gone.
+
+    Word-prefix queries go through the tries (search_tables/search_columns);
+    substring queries go through trigram indexes kept alongside them
+    (substring_tables/substring_columns).
+    """
 
     def __init__(self):
         self.table_trie = TrieNode()
         self.column_trie = TrieNode()
+        self.table_grams = TrigramIndex()
+        self.column_grams = TrigramIndex()
         self.table_keys: Dict[str, TableInfo] = {}
         self.column_keys: Dict[str, ColumnInfo] = {}
 
+    @staticmethod
+    def _words(terms) -> Set[str]:
+        """Split compound terms into the words stored in the trie."""
+        words = set()
+        for term in terms:
+            if term:
+                for word in term.replace("_", " ").split():
+                    if word.strip():
+                        words.add(word.strip())
+        return words
+
     def build_index(self, tables: List[TableInfo], columns: List[ColumnInfo]) -> None:
         """Build the search index from tables and columns."""
         # Clear existing index
         self.table_trie = TrieNode()
         self.column_trie = TrieNode()
+        self.table_grams.clear()
+        self.column_grams.clear()
         self.table_keys.clear()
         self.column_keys.clear()
 
-        # Index tables
+        self.add_tables(tables)
+        self.add_columns(columns)
+
+    def add_tables(self, tables: List[TableInfo]) -> None:
+        """Index additional tables; re-adding a table replaces its entry."""
         for table in tables:
             table_key = f"{table.schema}.{table.name}"
+            old = self.table_keys.get(table_key)
+            if old is not None:
+                self._unindex(self.table_trie, table_key, (old.name, old.schema, old.remarks))
             self.table_keys[table_key] = table
 
             # Index by name, schema, and remarks
-            search_terms = [table.name, table.schema]
-            if table.remarks:
-                search_terms.append(table.remarks)
-
-            for term in search_terms:
-                # Split compound terms and index each word
-                words = term.replace("_", " ").split()
-                for word in words:
-                    if word.strip():
-                        self.table_trie.insert(word.strip(), table_key)
+            for word in self._words((table.name, table.schema, table.remarks)):
+                self.table_trie.insert(word, table_key)
+            self.table_grams.add(table_key, (table.name, table.schema, table.remarks))
 
-        # Index columns
+    def add_columns(self, columns: List[ColumnInfo]) -> None:
+        """Index additional columns; re-adding a column replaces its entry."""
         for col in columns:
             col_key = f"{col.schema}.{col.table}.{col.name}"
+            old = self.column_keys.get(col_key)
+            if old is not None:
+                self._unindex(self.column_trie, col_key, (old.name, old.typename, old.remarks))
             self.column_keys[col_key] = col
 
             # Index by name, type, and remarks
-            search_terms = [col.name, col.typename]
-            if col.remarks:
-                search_terms.append(col.remarks)
-
-            for term in search_terms:
-                # Split compound terms and index each word
-                words = term.replace("_", " ").split()
-                for word in words:
-                    if word.strip():
-                        self.column_trie.insert(word.strip(), col_key)
+            for word in self._words((col.name, col.typename, col.remarks)):
+                self.column_trie.insert(word, col_key)
+            self.column_grams.add(col_key, (col.name, col.typename, col.remarks))
+
+    def remove_schema(self, schema: str) -> int:
+        """Remove every table and column of a schema. Returns the number of entries removed."""
+        return self._remove(
+            [k for k, t in self.table_keys.items() if t.schema == schema],
+            [k for k, c in self.column_keys.items() if c.schema == schema],
+        )
+
+    def remove_tables(self, keys: Iterable[Tuple[str, str]]) -> int:
+        """Remove tables, given as (schema, table) pairs, and their columns.
+
+        Returns the number of entries removed.
+        """
+        wanted = set(keys)
+        if not wanted:
+            return 0
+        return self._remove(
+            [k for k, t in self.table_keys.items() if (t.schema, t.name) in wanted],
+            [k for k, c in self.column_keys.items() if (c.schema, c.table) in wanted],
+        )
+
+    def _remove(self, table_keys: List[str], column_keys: List[str]) -> int:
+        for key in table_keys:
+            table = self.table_keys.pop(key)
+            self._unindex(self.table_trie, key, (table.name, table.schema, table.remarks))
+            self.table_grams.remove(key)
+        for key in column_keys:
+            col = self.column_keys.pop(key)
+            self._unindex(self.column_trie, key, (col.name, col.typename, col.remarks))
+            self.column_grams.remove(key)
+        return len(table_keys) + len(column_keys)
+
+    def _unindex(self, trie: TrieNode, item_key: str, terms) -> None:
+        for word in self._words(terms):
+            trie.remove(word, item_key)
 
     def search_tables(self, query: str) -> List[TableInfo]:
         """Fast search for tables matching the query."""
@@ -225,13 +454,28 @@ class SearchIndex:
 
         return [self.column_keys[key] for key in matching_keys if key in self.column_keys]
 
+    def substring_tables(self, query: str) -> List[Tuple[TableInfo, int]]:
+        """Tables whose name, schema or remarks contain the query, with field masks.
+
+        Mask bits are MATCH_NAME, MATCH_SCHEMA and MATCH_REMARKS.
+        """
+        return [(self.table_keys[key], mask) for key, mask in self.table_grams.search(query).items()]
+
+    def substring_columns(self, query: str) -> List[Tuple[ColumnInfo, int]]:
+        """Columns whose name, type or remarks contain the query, with field masks.
+
+        Mask bits are MATCH_NAME, MATCH_TYPE and MATCH_REMARKS.
+        """
+        return [(self.column_keys[key], mask) for key, mask in self.column_grams.search(query).items()]
+
 
 def query_runner(sql: str, timeout: int = 30) -> List[Dict]:
-    """Execute SQL via JDBC and return rows as list[dict].
+    """Execute SQL via JDBC and return rows as a list[dict]-compatible ResultSet.
 
     This function now uses only JDBC provider via JayDeBeApi.
     Requires DBUTILS_JDBC_PROVIDER environment variable to be set.
     Optionally pass DBUTILS_JDBC_URL_PARAMS (JSON) and DBUTILS_JDBC_USER/PASSWORD.
+    Set DBUTILS_JDBC_POOL=1 to reuse pooled connections instead of connecting per statement.
     Added timeout parameter to prevent hanging queries.
     """
     # JDBC path only - no fallback to external query runner
@@ -241,6 +485,7 @@ def query_runner(sql: str, timeout: int = 30) -> List[Dict]:
 
     try:
         from dbutils.jdbc_provider import connect as _jdbc_connect, MissingJDBCDriverError
+        from dbutils.connection_pool import get_pool, pooling_enabled
 
         url_params_raw = os.environ.get("DBUTILS_JDBC_URL_PARAMS", "{}")
         try:
@@ -249,6 +494,10 @@ def query_runner(sql: str, timeout: int = 30) -> List[Dict]:
             url_params = {}
         user = os.environ.get("DBUTILS_JDBC_USER")
         password = os.environ.get("DBUTILS_JDBC_PASSWORD")
+        if pooling_enabled():
+            pool = get_pool(provider_name, url_params, user=user, password=password)
+            with pool.connection() as conn:
+                return conn.query(sql)
         conn = _jdbc_connect(provider_name, url_params, user=user, password=password)
         try:
             return conn.query(sql)
@@ -261,6 +510,79 @@ def query_runner(sql: str, timeout: int = 30) -> List[Dict]:
         raise RuntimeError(f"JDBC query failed: {e}") from e
 
 
+def iter_query_runner(sql: str, batch_size: int = 1000) -> Iterator[tuple]:
+    """Stream rows for SQL as tuples in SELECT-list order.
+
+    Unlike query_runner, rows are pulled from the cursor one fetchmany()
+    batch at a time, so large catalog scans never sit in memory as a list of
+    dicts. The connection is held until the generator is exhausted or closed.
+    """
+    from dbutils.connection_pool import env_connection_settings, get_pool, pooling_enabled
+
+    settings = env_connection_settings()
+    if settings is None:
+        raise RuntimeError("DBUTILS_JDBC_PROVIDER environment variable not set")
+    provider_name, url_params, user, password = settings
+
+    try:
+        if pooling_enabled():
+            with get_pool(provider_name, url_params, user=user, password=password).connection() as conn:
+                yield from conn.iter_query(sql, batch_size=batch_size)
+            return
+
+        from dbutils.jdbc_provider import connect as _jdbc_connect
+
+        conn = _jdbc_connect(provider_name, url_params, user=user, password=password)
+        try:
+            yield from conn.iter_query(sql, batch_size=batch_size)
+        finally:
+            conn.close()
+    except GeneratorExit:
+        raise
+    except Exception as e:
+        if e.__class__.__name__ == "MissingJDBCDriverError":
+            raise
+        raise RuntimeError(f"JDBC query failed: {e}") from e
+
+
+def _column_from_row(row) -> ColumnInfo:
+    """Build a ColumnInfo from a SYSCOLUMNS row.
+
+    Accepts either a dict keyed by column name or a tuple in the loader's
+    SELECT order: TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE, LENGTH,
+    NUMERIC_SCALE, IS_NULLABLE, COLUMN_TEXT.
+    """
+    if isinstance(row, dict):
+        schema = row.get("TABLE_SCHEMA", "")
+        table = row.get("TABLE_NAME", "")
+        name = row.get("COLUMN_NAME", "")
+        typename = row.get("DATA_TYPE", "")
+        length = row.get("LENGTH")
+        scale = row.get("NUMERIC_SCALE")
+        nullable = row.get("IS_NULLABLE")
+        remarks = row.get("COLUMN_TEXT", "")
+    else:
+        schema, table, name, typename, length, scale, nullable, remarks = row
+
+    # Convert to int if they're strings
+    if isinstance(length, str):
+        length = int(length) if length and length.isdigit() else None
+    if isinstance(scale, str):
+        scale = int(scale) if scale and scale.isdigit() else None
+
+    return ColumnInfo(
+        schema=schema or "",
+        table=table or "",
+        name=name or "",
+        typename=typename or "",
+        length=length,
+        scale=scale,
+        # Map IS_NULLABLE to Y/N format
+        nulls="Y" if nullable == "Y" else "N",
+        remarks=remarks or "",
+    )
+
+
 def mock_get_tables() -> List[TableInfo]:
     """Mock data for testing."""
     return [
@@ -519,7 +841,13 @@ def mock_get_columns_heavy(num_schemas: int = 5, tables_per_schema: int = 50,
 
 # Cache configuration
 CACHE_DIR = Path.home() / ".cache" / "dbutils"
+# Legacy single-file cache (one pickled dict of every key); read once for migration
 CACHE_FILE = CACHE_DIR / "schema_cache.pkl.gz"
+CACHE_DB_NAME = "schema_cache.sqlite3"
+CACHE_TTL = 3600  # seconds
+# Cache key suffix for the table fingerprints of a full catalog entry
+FINGERPRINTS_SUFFIX = ":FINGERPRINTS"
+_legacy_checked: Set[Path] = set()
 
 
 def get_cache_key(schema_filter: Optional[str], limit: Optional[int] = None, offset: Optional[int] = None) -> str:
@@ -531,41 +859,59 @@ def get_cache_key(schema_filter: Optional[str], limit: Optional[int] = None, off
     return base_key
 
 
+def _cache_store():
+    """Return the per-key cache store next to CACHE_FILE, migrating the legacy file once."""
+    store = get_store(Path(CACHE_FILE).parent / CACHE_DB_NAME)
+    if store.path not in _legacy_checked:
+        _legacy_checked.add(store.path)
+        _migrate_legacy_cache(store)
+    return store
+
+
+def _migrate_legacy_cache(store) -> None:
+    """Copy entries from the old whole-dict pickle cache into the store, then remove it."""
+    cache_file = Path(CACHE_FILE)
+    for legacy, is_gzip in ((cache_file, True), (cache_file.parent / "schema_cache.pkl", False)):
+        if not legacy.exists():
+            continue
+        try:
+            opener = gzip.open if is_gzip else open
+            with opener(legacy, "rb") as f:
+                cache_data = pickle.load(f)
+            store.put_many(
+                {
+                    key: (item["timestamp"], (item["tables"], item["columns"]))
+                    for key, item in cache_data.items()
+                }
+            )
+            legacy.unlink()
+        except Exception as e:
+            # Unreadable legacy caches are ignored; the store is rebuilt as pages load
+            logger.debug("Skipping legacy schema cache %s: %s", legacy, e)
+
+
 def load_from_cache(
     schema_filter: Optional[str],
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    allow_expired: bool = False,
 ) -> Optional[tuple[List[TableInfo], List[ColumnInfo]]]:
-    """Load tables and columns from cache if available and recent."""
-    if not CACHE_FILE.exists():
-        # Backward compatibility: try old uncompressed cache
-        legacy = CACHE_DIR / "schema_cache.pkl"
-        if not legacy.exists():
-            return None
-        cache_path = legacy
-        is_gzip = False
-    else:
-        cache_path = CACHE_FILE
-        is_gzip = True
+    """Load tables and columns from cache if available and recent.
 
+    Only the entry for this schema/page is read and unpickled.
+    ``allow_expired`` returns the entry whatever its age.
+    """
     try:
-        if is_gzip:
-            with gzip.open(cache_path, "rb") as f:
-                cache_data = pickle.load(f)
-        else:
-            with open(cache_path, "rb") as f:
-                cache_data = pickle.load(f)
-
-        cache_key = get_cache_key(schema_filter, limit, offset)
-        if cache_key not in cache_data:
+        entry = _cache_store().get(get_cache_key(schema_filter, limit, offset))
+        if entry is None:
             return None
 
-        cached_item = cache_data[cache_key]
+        timestamp, (tables, columns) = entry
         # Check if cache is less than 1 hour old
-        if time.time() - cached_item["timestamp"] > 3600:
+        if not allow_expired and time.time() - timestamp > CACHE_TTL:
             return None
 
-        return cached_item["tables"], cached_item["columns"]
+        return tables, columns
     except Exception:
         return None
 
@@ -576,33 +922,60 @@ def save_to_cache(
     columns: List[ColumnInfo],
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    fingerprints: Optional[Dict[Tuple[str, str], tuple]] = None,
 ) -> None:
-    """Save tables and columns to cache (compressed)."""
+    """Save tables and columns to cache as a single entry for this schema/page.
+
+    ``fingerprints`` (see catalog_refresh) are stored alongside so the entry
+    can be delta-refreshed once it expires; saving without them forgets any
+    stored for this key.
+    """
     try:
-        # Create cache directory if it doesn't exist
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
-        # Load existing cache or create new
-        cache_data = {}
-        if CACHE_FILE.exists():
-            try:
-                with gzip.open(CACHE_FILE, "rb") as f:
-                    cache_data = pickle.load(f)
-            except Exception:
-                cache_data = {}
-
-        # Update cache
-        cache_key = get_cache_key(schema_filter, limit, offset)
-        cache_data[cache_key] = {"timestamp": time.time(), "tables": tables, "columns": columns}
-
-        # Save cache compressed
-        with gzip.open(CACHE_FILE, "wb", compresslevel=5) as f:
-            pickle.dump(cache_data, f)
+        store = _cache_store()
+        key = get_cache_key(schema_filter, limit, offset)
+        if fingerprints is None:
+            store.put(key, (tables, columns))
+            store.delete(key + FINGERPRINTS_SUFFIX)
+        else:
+            now = time.time()
+            store.put_many({key: (now, (tables, columns)), key + FINGERPRINTS_SUFFIX: (now, fingerprints)})
     except Exception:
         # Silently fail - caching is optional
         pass
 
 
+def load_cached_fingerprints(schema_filter: Optional[str]) -> Optional[Dict[Tuple[str, str], tuple]]:
+    """Return the table fingerprints saved with the full catalog of ``schema_filter``, if any."""
+    try:
+        entry = _cache_store().get(get_cache_key(schema_filter) + FINGERPRINTS_SUFFIX)
+    except Exception:
+        return None
+    return entry[1] if entry is not None else None
+
+
+def _catalog_fingerprints(schema_filter: Optional[str]) -> Optional[Dict[Tuple[str, str], tuple]]:
+    """Read the current table fingerprints, or None when they cannot be read."""
+    from dbutils.catalog_refresh import fetch_fingerprints
+
+    try:
+        return fetch_fingerprints(schema_filter)
+    except Exception as e:
+        logger.debug(f"Could not read table fingerprints: {e}")
+        return None
+
+
+def _refresh_expired_cache(schema_filter: Optional[str]) -> Optional[tuple[List[TableInfo], List[ColumnInfo]]]:
+    """Patch an expired full-catalog cache entry with just the tables changed since it was saved."""
+    from dbutils.catalog_refresh import refresh_cached_catalog
+
+    try:
+        result = refresh_cached_catalog(schema_filter)
+    except Exception as e:
+        logger.warning(f"Catalog delta refresh failed, reloading: {e}")
+        return None
+    return (result.tables, result.columns) if result is not None else None
+
+
 @dataclass
 class SchemaInfo:
     """Represents a schema with table count."""
@@ -731,6 +1104,247 @@ async def schema_exists_async(schema: str, use_mock: bool = False) -> bool:
         return False
 
 
+def _tables_scan_sql(
+    schema_filter: Optional[str] = None, pagination_clause: str = "", altered_since: Optional[str] = None
+) -> str:
+    """Build the SYSTABLES query for user tables and physical files in key order.
+
+    ``altered_since`` keeps only tables created or altered at or after that
+    LAST_ALTERED_TIMESTAMP.
+    """
+    # DB2 for i uses QSYS2.SYSTABLES instead of SYSCAT.TABLES
+    schema_clause = ""
+    if schema_filter:
+        schema_clause = f"AND TABLE_SCHEMA = '{schema_filter.upper()}'"
+    if altered_since:
+        from dbutils.pagination import sql_literal
+
+        schema_clause += f"\n        AND LAST_ALTERED_TIMESTAMP >= {sql_literal(altered_since)}"
+    return f"""
+        SELECT
+            TABLE_SCHEMA,
+            TABLE_NAME,
+            TABLE_TEXT
+        FROM QSYS2.SYSTABLES
+        WHERE TABLE_TYPE IN ('T', 'P')
+        AND SYSTEM_TABLE = 'N'
+        {schema_clause}
+        ORDER BY TABLE_SCHEMA, TABLE_NAME
+        {pagination_clause}
+    """
+
+
+def _columns_scan_sql(
+    schema_filter: Optional[str] = None,
+    first: Optional[Tuple[str, str]] = None,
+    last: Optional[Tuple[str, str]] = None,
+    page_clause: str = "",
+    altered_since: Optional[str] = None,
+) -> str:
+    """Build one ordered SYSCOLUMNS scan over the tables _tables_scan_sql lists.
+
+    The join applies the same table filter, so columns arrive grouped by
+    table in the same (schema, table) order as the tables query. ``first``
+    and ``last`` bound the scan to a contiguous range of (schema, table)
+    keys, which is how a page of tables is fetched without naming each one.
+    A ``page_clause`` instead joins the page of SYSTABLES it selects, so the
+    scan does not have to wait for the tables query. ``altered_since``
+    applies the same filter as in _tables_scan_sql.
+    """
+    from dbutils.pagination import sql_literal
+
+    conditions = []
+    if page_clause:
+        source = f"({_tables_scan_sql(schema_filter, page_clause, altered_since)})"
+    else:
+        source = "QSYS2.SYSTABLES"
+        conditions += ["t.TABLE_TYPE IN ('T', 'P')", "t.SYSTEM_TABLE = 'N'"]
+        if schema_filter:
+            conditions.append(f"t.TABLE_SCHEMA = {sql_literal(schema_filter.upper())}")
+        if altered_since:
+            conditions.append(f"t.LAST_ALTERED_TIMESTAMP >= {sql_literal(altered_since)}")
+    if first is not None:
+        schema, name = sql_literal(first[0]), sql_literal(first[1])
+        conditions.append(f"(c.TABLE_SCHEMA > {schema} OR (c.TABLE_SCHEMA = {schema} AND c.TABLE_NAME >= {name}))")
+    if last is not None:
+        schema, name = sql_literal(last[0]), sql_literal(last[1])
+        conditions.append(f"(c.TABLE_SCHEMA < {schema} OR (c.TABLE_SCHEMA = {schema} AND c.TABLE_NAME <= {name}))")
+    where_clause = "WHERE " + "\n            AND ".join(conditions) if conditions else ""
+    return f"""
+        SELECT
+            c.TABLE_SCHEMA,
+            c.TABLE_NAME,
+            c.COLUMN_NAME,
+            c.DATA_TYPE,
+            c.LENGTH,
+            c.NUMERIC_SCALE,
+            c.IS_NULLABLE,
+            c.COLUMN_TEXT
+        FROM QSYS2.SYSCOLUMNS c
+        INNER JOIN {source} t ON
+            c.TABLE_SCHEMA = t.TABLE_SCHEMA AND
+            c.TABLE_NAME = t.TABLE_NAME
+        {where_clause}
+        ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
+    """
+
+
+def _load_columns_streaming(columns_sql: str) -> List[ColumnInfo]:
+    """Run a SYSCOLUMNS query and convert rows to ColumnInfo as they stream in."""
+    return [_column_from_row(row) for row in iter_query_runner(columns_sql)]
+
+
+def _columns_of(tables: List[TableInfo], columns: List[ColumnInfo]) -> List[ColumnInfo]:
+    """Keep the columns that belong to ``tables``.
+
+    Drops columns of tables created after the tables query ran.
+    """
+    keys = {(t.schema or "", t.name or "") for t in tables}
+    return [c for c in columns if (c.schema, c.table) in keys]
+
+
+def _load_columns_for_tables(
+    tables: List[TableInfo], schema_filter: Optional[str] = None, paged: bool = False
+) -> List[ColumnInfo]:
+    """Load the columns of ``tables`` with one streamed SYSCOLUMNS scan.
+
+    A page of tables is contiguous in (schema, table) order, so it is read
+    by key range between its first and last table. Rows are matched back to
+    the loaded tables client-side.
+    """
+    if not tables:
+        return []
+    bounds = {}
+    if paged:
+        bounds = {
+            "first": (tables[0].schema or "", tables[0].name or ""),
+            "last": (tables[-1].schema or "", tables[-1].name or ""),
+        }
+    return _columns_of(tables, _load_columns_streaming(_columns_scan_sql(schema_filter, **bounds)))
+
+
+class CatalogScan:
+    """Stream tables with their columns from two ordered catalog scans.
+
+    SYSTABLES and SYSCOLUMNS are each read once, in (schema, table) order,
+    and merge-joined client-side. Iterating yields ``(tables, columns)``
+    chunks of up to ``chunk_size`` tables (``first_chunk_size`` for the
+    first one) together with all of their columns, instead of one tables
+    query plus one column query per page. ``chunk_size`` may be changed
+    between chunks; the new size applies from the next chunk read (a chunk
+    may have been read ahead to find a column's table).
+
+    ``offset`` skips that many tables, for resuming a load; the column scan
+    then starts at the first table returned. ``altered_since`` limits both
+    scans to tables altered at or after that timestamp (mock data ignores it).
+    """
+
+    def __init__(
+        self,
+        schema_filter: Optional[str] = None,
+        chunk_size: int = 500,
+        first_chunk_size: Optional[int] = None,
+        offset: int = 0,
+        use_mock: bool = False,
+        altered_since: Optional[str] = None,
+    ):
+        self.schema_filter = schema_filter
+        self.chunk_size = chunk_size
+        self.first_chunk_size = first_chunk_size
+        self.offset = offset
+        self.use_mock = use_mock
+        self.altered_since = altered_since
+        self.tables_loaded = 0
+
+    def __iter__(self) -> Iterator[Tuple[List[TableInfo], List[ColumnInfo]]]:
+        if self.use_mock:
+            table_rows, open_columns = self._mock_scans()
+        else:
+            pagination_clause = f"OFFSET {self.offset} ROWS" if self.offset else ""
+            table_rows = iter_query_runner(_tables_scan_sql(self.schema_filter, pagination_clause, self.altered_since))
+
+            def open_columns(first):
+                return iter_query_runner(
+                    _columns_scan_sql(self.schema_filter, first=first, altered_since=self.altered_since)
+                )
+
+        column_rows = None
+        try:
+            current = self._read_tables(table_rows, self.first_chunk_size or self.chunk_size)
+            if not current:
+                return
+            column_rows = open_columns(next(iter(current)) if self.offset else None)
+            # Chunks read past the current one while looking for a column's table
+            ahead: Deque[Dict[Tuple[str, str], Tuple[TableInfo, List[ColumnInfo]]]] = deque()
+            ahead_keys: Set[Tuple[str, str]] = set()
+            exhausted = False
+            for row in column_rows:
+                key = (row[0] or "", row[1] or "")
+                entry = current.get(key)
+                if entry is None:
+                    # Both scans share the database's collation (EBCDIC on DB2 for
+                    # i), which Python string order does not follow, so match on
+                    # membership: read on until a chunk holds the column's table.
+                    while key not in ahead_keys and not exhausted:
+                        chunk = self._read_tables(table_rows, self.chunk_size)
+                        exhausted = not chunk
+                        if chunk:
+                            ahead.append(chunk)
+                            ahead_keys.update(chunk)
+                    if key not in ahead_keys:
+                        # The table was created after the tables scan read past it
+                        continue
+                    # Chunks before it are complete, including tables without columns
+                    while key not in current:
+                        yield self._emit(current)
+                        current = ahead.popleft()
+                        ahead_keys.difference_update(current)
+                    entry = current[key]
+                entry[1].append(_column_from_row(row))
+            while current:
+                yield self._emit(current)
+                if ahead:
+                    current = ahead.popleft()
+                else:
+                    current = self._read_tables(table_rows, self.chunk_size)
+        finally:
+            for rows in (column_rows, table_rows):
+                close = getattr(rows, "close", None)
+                if close is not None:
+                    close()
+
+    @staticmethod
+    def _read_tables(table_rows, count: int) -> Dict[Tuple[str, str], Tuple[TableInfo, List[ColumnInfo]]]:
+        chunk: Dict[Tuple[str, str], Tuple[TableInfo, List[ColumnInfo]]] = {}
+        for _ in range(max(1, count)):
+            row = next(table_rows, None)
+            if row is None:
+                break
+            schema, name, remarks = row
+            table = TableInfo(schema=schema or "", name=name or "", remarks=remarks or "")
+            chunk[(table.schema, table.name)] = (table, [])
+        return chunk
+
+    def _emit(self, chunk) -> Tuple[List[TableInfo], List[ColumnInfo]]:
+        tables = [table for table, _cols in chunk.values()]
+        columns = [col for _table, cols in chunk.values() for col in cols]
+        self.tables_loaded += len(tables)
+        return tables, columns
+
+    def _mock_scans(self):
+        tables = mock_get_tables()
+        columns = mock_get_columns()
+        if self.schema_filter:
+            tables = [t for t in tables if t.schema.upper() == self.schema_filter.upper()]
+        # Both scans are ordered by (schema, table), like the catalog queries
+        tables = sorted(tables, key=lambda t: (t.schema, t.name))[self.offset :]
+        order = {(t.schema, t.name): i for i, t in enumerate(tables)}
+        columns = sorted((c for c in columns if (c.schema, c.table) in order), key=lambda c: order[(c.schema, c.table)])
+        table_rows = iter([(t.schema, t.name, t.remarks) for t in tables])
+        column_rows = [(c.schema, c.table, c.name, c.typename, c.length, c.scale, c.nulls, c.remarks) for c in columns]
+        return table_rows, lambda first: iter(column_rows)
+
+
 async def get_all_tables_and_columns_async(
     schema_filter: Optional[str] = None,
     use_mock: bool = False,
@@ -740,7 +1354,7 @@ async def get_all_tables_and_columns_async(
     use_heavy_mock: bool = False,
     db_file: Optional[str] = None,
 ) -> tuple[List[TableInfo], List[ColumnInfo]]:
-    """Async version that can run queries in parallel."""
+    """Async version that runs the tables and columns queries concurrently."""
     # For SQLite, use sync implementation (SQLite doesn't benefit from async here)
     if db_file:
         return _get_all_tables_and_columns_sync(schema_filter, use_mock, use_cache, limit, offset, use_heavy_mock, db_file)
@@ -769,17 +1383,15 @@ async def get_all_tables_and_columns_async(
 
         return tables, columns
 
-    # Try to load from cache first
+    # Try to load from cache first; an expired full catalog is delta-refreshed
+    full_catalog = limit is None and not offset
     if use_cache:
         cached_data = load_from_cache(schema_filter, limit, offset)
+        if not cached_data and full_catalog:
+            cached_data = _refresh_expired_cache(schema_filter)
         if cached_data:
             return cached_data
 
-    # Build schema filter clause
-    schema_clause = ""
-    if schema_filter:
-        schema_clause = f"AND TABLE_SCHEMA = '{schema_filter.upper()}'"
-
     # Build pagination clause (DB2 for i syntax)
     pagination_clause = ""
     if limit is not None:
@@ -789,32 +1401,30 @@ async def get_all_tables_and_columns_async(
         else:
             pagination_clause = f"FETCH FIRST {limit} ROWS ONLY"
 
-    # Query for tables (DB2 for i uses QSYS2.SYSTABLES instead of SYSCAT.TABLES)
-    tables_sql = f"""
-        SELECT
-            TABLE_SCHEMA,
-            TABLE_NAME,
-            TABLE_TEXT
-        FROM QSYS2.SYSTABLES
-        WHERE TABLE_TYPE IN ('T', 'P')
-        AND SYSTEM_TABLE = 'N'
-        {schema_clause}
-        ORDER BY TABLE_SCHEMA, TABLE_NAME
-        {pagination_clause}
-    """
+    tables_sql = _tables_scan_sql(schema_filter, pagination_clause)
 
-    # Run both queries in parallel
-    import asyncio
+    # The column scan joins the same page of SYSTABLES itself, so both
+    # queries run at once on the shared executor (and pooled connections)
+    from dbutils.connection_pool import query_executor
 
-    async def run_query_async(sql: str) -> List[Dict]:
-        """Run a query asynchronously."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, query_runner, sql)
+    loop = asyncio.get_running_loop()
+    executor = query_executor()
+    columns_sql = _columns_scan_sql(schema_filter, page_clause=pagination_clause)
+
+    # Fingerprints let the cached catalog be delta-refreshed once it expires.
+    # They are read before the scans start, so a table altered during the
+    # scans shows up as changed at the next refresh instead of being missed.
+    fingerprints = None
+    if use_cache and full_catalog:
+        fingerprints = await loop.run_in_executor(executor, _catalog_fingerprints, schema_filter)
+
+    jobs = [
+        loop.run_in_executor(executor, query_runner, tables_sql),
+        loop.run_in_executor(executor, _load_columns_streaming, columns_sql),
+    ]
 
     try:
-        # Start both queries concurrently
-        tables_task = run_query_async(tables_sql)
-        tables_data = await tables_task
+        tables_data, columns = await asyncio.gather(*jobs)
 
         tables = []
         for row in tables_data:
@@ -825,80 +1435,7 @@ async def get_all_tables_and_columns_async(
                     remarks=row.get("TABLE_TEXT", ""),
                 ),
             )
-
-        # Query for columns based on loaded tables
-        if tables:
-            # Build IN clause for the specific tables we loaded
-            table_conditions = []
-            for table in tables:
-                table_conditions.append(f"(c.TABLE_SCHEMA = '{table.schema}' AND c.TABLE_NAME = '{table.name}')")
-            tables_in_clause = " OR ".join(table_conditions)
-
-            columns_sql = f"""
-                SELECT
-                    c.TABLE_SCHEMA,
-                    c.TABLE_NAME,
-                    c.COLUMN_NAME,
-                    c.DATA_TYPE,
-                    c.LENGTH,
-                    c.NUMERIC_SCALE,
-                    c.IS_NULLABLE,
-                    c.COLUMN_TEXT
-                FROM QSYS2.SYSCOLUMNS c
-                WHERE ({tables_in_clause})
-                ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
-            """
-        else:
-            # Fallback if no tables loaded - use JOIN instead of subquery for better performance
-            columns_sql = f"""
-                SELECT
-                    c.TABLE_SCHEMA,
-                    c.TABLE_NAME,
-                    c.COLUMN_NAME,
-                    c.DATA_TYPE,
-                    c.LENGTH,
-                    c.NUMERIC_SCALE,
-                    c.IS_NULLABLE,
-                    c.COLUMN_TEXT
-                FROM QSYS2.SYSCOLUMNS c
-                INNER JOIN QSYS2.SYSTABLES t ON
-                    c.TABLE_SCHEMA = t.TABLE_SCHEMA AND
-                    c.TABLE_NAME = t.TABLE_NAME
-                WHERE t.TABLE_TYPE IN ('T', 'P')
-                    AND t.SYSTEM_TABLE = 'N' {schema_clause}
-                ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
-            """
-
-        columns_task = run_query_async(columns_sql)
-        columns_data = await columns_task
-
-        columns = []
-        for row in columns_data:
-            # Handle numeric fields that might be strings
-            length = row.get("LENGTH")
-            scale = row.get("NUMERIC_SCALE")
-
-            # Convert to int if they're strings
-            if isinstance(length, str):
-                length = int(length) if length and length.isdigit() else None
-            if isinstance(scale, str):
-                scale = int(scale) if scale and scale.isdigit() else None
-
-            # Map IS_NULLABLE to Y/N format
-            nulls = "Y" if row.get("IS_NULLABLE") == "Y" else "N"
-
-            columns.append(
-                ColumnInfo(
-                    schema=row.get("TABLE_SCHEMA", ""),
-                    table=row.get("TABLE_NAME", ""),
-                    name=row.get("COLUMN_NAME", ""),
-                    typename=row.get("DATA_TYPE", ""),
-                    length=length,
-                    scale=scale,
-                    nulls=nulls,
-                    remarks=row.get("COLUMN_TEXT", ""),
-                ),
-            )
+        columns = _columns_of(tables, columns)
 
     except Exception as e:
         # If query fails, return empty list (graceful degradation)
@@ -907,7 +1444,7 @@ async def get_all_tables_and_columns_async(
 
     # Save to cache if we got data
     if use_cache and (tables or columns):
-        save_to_cache(schema_filter, tables, columns, limit, offset)
+        save_to_cache(schema_filter, tables, columns, limit, offset, fingerprints=fingerprints)
 
     return tables, columns
 
@@ -1031,17 +1568,15 @@ def _get_all_tables_and_columns_sync(
 
         return tables, columns
 
-    # Try to load from cache first
+    # Try to load from cache first; an expired full catalog is delta-refreshed
+    full_catalog = limit is None and not offset
     if use_cache:
         cached_data = load_from_cache(schema_filter, limit, offset)
+        if not cached_data and full_catalog:
+            cached_data = _refresh_expired_cache(schema_filter)
         if cached_data:
             return cached_data
 
-    # Build schema filter clause
-    schema_clause = ""
-    if schema_filter:
-        schema_clause = f"AND TABLE_SCHEMA = '{schema_filter.upper()}'"
-
     # Build pagination clause (DB2 for i syntax)
     pagination_clause = ""
     if limit is not None:
@@ -1051,19 +1586,9 @@ def _get_all_tables_and_columns_sync(
         else:
             pagination_clause = f"FETCH FIRST {limit} ROWS ONLY"
 
-    # Query for tables (DB2 for i uses QSYS2.SYSTABLES instead of SYSCAT.TABLES)
-    tables_sql = f"""
-        SELECT
-            TABLE_SCHEMA,
-            TABLE_NAME,
-            TABLE_TEXT
-        FROM QSYS2.SYSTABLES
-        WHERE TABLE_TYPE IN ('T', 'P')
-        AND SYSTEM_TABLE = 'N'
-        {schema_clause}
-        ORDER BY TABLE_SCHEMA, TABLE_NAME
-        {pagination_clause}
-    """
+    tables_sql = _tables_scan_sql(schema_filter, pagination_clause)
+    # Read before the scan, so tables altered while it runs look changed next time
+    fingerprints = _catalog_fingerprints(schema_filter) if use_cache and full_catalog else None
 
     try:
         tables_data = query_runner(tables_sql)
@@ -1077,77 +1602,8 @@ def _get_all_tables_and_columns_sync(
                 ),
             )
 
-        # Query for columns based on loaded tables
-        if tables:
-            # Build IN clause for the specific tables we loaded
-            table_conditions = []
-            for table in tables:
-                table_conditions.append(f"(c.TABLE_SCHEMA = '{table.schema}' AND c.TABLE_NAME = '{table.name}')")
-            tables_in_clause = " OR ".join(table_conditions)
-
-            columns_sql = f"""
-                SELECT
-                    c.TABLE_SCHEMA,
-                    c.TABLE_NAME,
-                    c.COLUMN_NAME,
-                    c.DATA_TYPE,
-                    c.LENGTH,
-                    c.NUMERIC_SCALE,
-                    c.IS_NULLABLE,
-                    c.COLUMN_TEXT
-                FROM QSYS2.SYSCOLUMNS c
-                WHERE ({tables_in_clause})
-                ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
-            """
-        else:
-            # Fallback if no tables loaded - use JOIN instead of subquery for better performance
-            columns_sql = f"""
-                SELECT
-                    c.TABLE_SCHEMA,
-                    c.TABLE_NAME,
-                    c.COLUMN_NAME,
-                    c.DATA_TYPE,
-                    c.LENGTH,
-                    c.NUMERIC_SCALE,
-                    c.IS_NULLABLE,
-                    c.COLUMN_TEXT
-                FROM QSYS2.SYSCOLUMNS c
-                INNER JOIN QSYS2.SYSTABLES t ON
-                    c.TABLE_SCHEMA = t.TABLE_SCHEMA AND
-                    c.TABLE_NAME = t.TABLE_NAME
-                WHERE t.TABLE_TYPE IN ('T', 'P')
-                    AND t.SYSTEM_TABLE = 'N' {schema_clause}
-                ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
-            """
-
-        columns_data = query_runner(columns_sql)
-        columns = []
-        for row in columns_data:
-            # Handle numeric fields that might be strings
-            length = row.get("LENGTH")
-            scale = row.get("NUMERIC_SCALE")
-
-            # Convert to int if they're strings
-            if isinstance(length, str):
-                length = int(length) if length and length.isdigit() else None
-            if isinstance(scale, str):
-                scale = int(scale) if scale and scale.isdigit() else None
-
-            # Map IS_NULLABLE to Y/N format
-            nulls = "Y" if row.get("IS_NULLABLE") == "Y" else "N"
-
-            columns.append(
-                ColumnInfo(
-                    schema=row.get("TABLE_SCHEMA", ""),
-                    table=row.get("TABLE_NAME", ""),
-                    name=row.get("COLUMN_NAME", ""),
-                    typename=row.get("DATA_TYPE", ""),
-                    length=length,
-                    scale=scale,
-                    nulls=nulls,
-                    remarks=row.get("COLUMN_TEXT", ""),
-                ),
-            )
+        # One key-range scan for the page's columns, matched to its tables client-side
+        columns = _load_columns_for_tables(tables, schema_filter, paged=limit is not None)
     except Exception as e:
         # If query fails, return empty list (graceful degradation)
         logger.warning(f"Could not fetch tables/columns: {e}")
@@ -1155,152 +1611,7 @@ def _get_all_tables_and_columns_sync(
 
     # Save to cache if we got data
     if use_cache and (tables or columns):
-        save_to_cache(schema_filter, tables, columns, limit, offset)
-
-    return tables, columns
-    """Fetch all tables and columns from the database."""
-    if use_mock:
-        tables = mock_get_tables()
-        columns = mock_get_columns()
-
-        # Apply schema filter to mock data if needed
-        if schema_filter:
-            tables = [t for t in tables if t.schema.upper() == schema_filter.upper()]
-            columns = [c for c in columns if c.schema.upper() == schema_filter.upper()]
-
-        return tables, columns
-
-    # Try to load from cache first
-    if use_cache:
-        cached_data = load_from_cache(schema_filter, limit, offset)
-        if cached_data:
-            return cached_data
-
-    # Real database implementation
-    tables = []
-    columns = []
-
-    # Build schema filter clause
-    schema_clause = ""
-    if schema_filter:
-        schema_clause = f"AND TABLE_SCHEMA = '{schema_filter.upper()}'"
-
-    # Build pagination clause (DB2 for i syntax)
-    pagination_clause = ""
-    if limit is not None:
-        if offset is not None and offset > 0:
-            # DB2 for i requires OFFSET before FETCH
-            pagination_clause = f"OFFSET {offset} ROWS FETCH FIRST {limit} ROWS ONLY"
-        else:
-            pagination_clause = f"FETCH FIRST {limit} ROWS ONLY"
-
-    # Query for tables (DB2 for i uses QSYS2.SYSTABLES instead of SYSCAT.TABLES)
-    tables_sql = f"""
-        SELECT
-            TABLE_SCHEMA,
-            TABLE_NAME,
-            TABLE_TEXT
-        FROM QSYS2.SYSTABLES
-        WHERE TABLE_TYPE IN ('T', 'P')
-        AND SYSTEM_TABLE = 'N'
-        {schema_clause}
-        ORDER BY TABLE_SCHEMA, TABLE_NAME
-        {pagination_clause}
-    """
-
-    try:
-        tables_data = query_runner(tables_sql)
-        for row in tables_data:
-            tables.append(
-                TableInfo(
-                    schema=row.get("TABLE_SCHEMA", ""),
-                    name=row.get("TABLE_NAME", ""),
-                    remarks=row.get("TABLE_TEXT", ""),
-                ),
-            )
-    except Exception as e:
-        # If query fails, return empty list (graceful degradation)
-        logger.warning(f"Could not fetch tables: {e}")
-
-    # Query for columns (DB2 for i uses QSYS2.SYSCOLUMNS instead of SYSCAT.COLUMNS)
-    # Only load columns for tables that were actually loaded (important for pagination)
-    if tables:
-        # Build IN clause for the specific tables we loaded
-        table_conditions = []
-        for table in tables:
-            table_conditions.append(f"(c.TABLE_SCHEMA = '{table.schema}' AND c.TABLE_NAME = '{table.name}')")
-        tables_in_clause = " OR ".join(table_conditions)
-
-        columns_sql = f"""
-            SELECT
-                c.TABLE_SCHEMA,
-                c.TABLE_NAME,
-                c.COLUMN_NAME,
-                c.DATA_TYPE,
-                c.LENGTH,
-                c.NUMERIC_SCALE,
-                c.IS_NULLABLE,
-                c.COLUMN_TEXT
-            FROM QSYS2.SYSCOLUMNS c
-            WHERE ({tables_in_clause})
-            ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
-        """
-    else:
-        # Fallback if no tables loaded - use JOIN instead of subquery for better performance
-        columns_sql = f"""
-            SELECT
-                c.TABLE_SCHEMA,
-                c.TABLE_NAME,
-                c.COLUMN_NAME,
-                c.DATA_TYPE,
-                c.LENGTH,
-                c.NUMERIC_SCALE,
-                c.IS_NULLABLE,
-                c.COLUMN_TEXT
-            FROM QSYS2.SYSCOLUMNS c
-            INNER JOIN QSYS2.SYSTABLES t ON
-                c.TABLE_SCHEMA = t.TABLE_SCHEMA AND
-                c.TABLE_NAME = t.TABLE_NAME
-            WHERE t.TABLE_TYPE IN ('T', 'P')
-                AND t.SYSTEM_TABLE = 'N' {schema_clause}
-            ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
-        """
-
-    try:
-        columns_data = query_runner(columns_sql)
-        for row in columns_data:
-            # Handle numeric fields that might be strings
-            length = row.get("LENGTH")
-            scale = row.get("NUMERIC_SCALE")
-
-            # Convert to int if they're strings
-            if isinstance(length, str):
-                length = int(length) if length and length.isdigit() else None
-            if isinstance(scale, str):
-                scale = int(scale) if scale and scale.isdigit() else None
-
-            # Map IS_NULLABLE to Y/N format
-            nulls = "Y" if row.get("IS_NULLABLE") == "Y" else "N"
-
-            columns.append(
-                ColumnInfo(
-                    schema=row.get("TABLE_SCHEMA", ""),
-                    table=row.get("TABLE_NAME", ""),
-                    name=row.get("COLUMN_NAME", ""),
-                    typename=row.get("DATA_TYPE", ""),
-                    length=length,
-                    scale=scale,
-                    nulls=nulls,
-                    remarks=row.get("COLUMN_TEXT", ""),
-                ),
-            )
-    except Exception as e:
-        # If query fails, return what we have so far
-        logger.warning(f"Could not fetch columns: {e}")
-
-    # Save to cache if we got data
-    if use_cache and (tables or columns):
-        save_to_cache(schema_filter, tables, columns, limit, offset)
+        save_to_cache(schema_filter, tables, columns, limit, offset, fingerprints=fingerprints)
 
     return tables, columns
 
@@ -11,6 +11,8 @@ import os
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from dbutils.result_set import ResultSet
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -192,7 +194,7 @@ class JDBCConnection(QObject):
     connected = Signal()
     disconnected = Signal()
     error_occurred = Signal(str)  # Error message
-    query_finished = Signal(list)  # Query results
+    query_finished = Signal(object)  # Query results (ResultSet)
 
     def __init__(self, provider: JDBCProvider, username: Optional[str] = None, password: Optional[str] = None):
         super().__init__()
@@ -279,7 +281,7 @@ class JDBCConnection(QObject):
 class QueryWorker(QObject):
     """Worker for executing database queries in background thread."""
 
-    query_finished = Signal(list)  # Results
+    query_finished = Signal(object)  # Results (ResultSet)
     error_occurred = Signal(str)  # Error message
     finished = Signal()
 
@@ -309,18 +311,8 @@ class QueryWorker(QObject):
             # Get column info
             columns = [desc[0] for desc in cursor.description] if cursor.description else []
 
-            # Fetch all results
-            rows = cursor.fetchall()
-
-            # Convert to list of dictionaries
-            results = []
-            for row in rows:
-                if self._cancelled:
-                    break
-                result_dict = {}
-                for i, col_name in enumerate(columns):
-                    result_dict[col_name] = row[i] if i < len(row) else None
-                results.append(result_dict)
+            # Fetch all results; keep the row tuples under a single column header
+            results = ResultSet(columns, cursor.fetchall())
 
             if not self._cancelled:
                 self.query_finished.emit(results)
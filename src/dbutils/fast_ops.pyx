@@ -8,6 +8,7 @@
 Fast native implementations for performance-critical dbutils operations.
 """
 
+from libc.stdint cimport uint64_t
 from libc.string cimport strlen, strstr, strcasecmp
 from cpython.unicode cimport PyUnicode_AsUTF8String
 
@@ -38,17 +39,22 @@ def fast_word_prefix_match(str text, str query):
     return False
 
 
-def fast_search_tables(list tables, str query):
-    """Optimized table search with scoring."""
-    if not query.strip():
-        return [(t, 1.0) for t in tables]
-    
+def fast_search_tables(object tables, str query):
+    """Optimized table search with scoring over any iterable of tables (lists, catalog row views).
+
+    Yields (table, score) pairs in input order, unsorted; callers keep the
+    best ones with a TopKCollector instead of sorting every match.
+    """
     cdef str query_lower = query.lower()
-    cdef list results = []
     cdef object table
     cdef double score
     cdef str name_lower, remarks_lower
     
+    if not query.strip():
+        for table in tables:
+            yield table, 1.0
+        return
+
     for table in tables:
         score = 0.0
         name_lower = table.name.lower()
@@ -69,24 +75,24 @@ def fast_search_tables(list tables, str query):
                 score = 0.8
         
         if score > 0:
-            results.append((table, score))
-    
-    # Sort by score descending
-    results.sort(key=lambda x: x[1], reverse=True)
-    return results
+            yield table, score
 
 
-def fast_search_columns(list columns, str query):
-    """Optimized column search with scoring."""
-    if not query.strip():
-        return [(c, 1.0) for c in columns]
-    
+def fast_search_columns(object columns, str query):
+    """Optimized column search with scoring over any iterable of columns.
+
+    Yields (column, score) pairs in input order, unsorted, like fast_search_tables.
+    """
     cdef str query_lower = query.lower()
-    cdef list results = []
     cdef object col
     cdef double score
     cdef str name_lower, typename_lower, remarks_lower
     
+    if not query.strip():
+        for col in columns:
+            yield col, 1.0
+        return
+
     for col in columns:
         score = 0.0
         name_lower = col.name.lower()
@@ -108,11 +114,74 @@ def fast_search_columns(list columns, str query):
                 score = 0.5
         
         if score > 0:
-            results.append((col, score))
-    
-    # Sort by score descending
-    results.sort(key=lambda x: x[1], reverse=True)
-    return results
+            yield col, score
+
+
+cdef int _myers64(str text, uint64_t *peq_ascii, dict peq, int m, int max_dist):
+    """Bit-parallel (Myers/Hyyro) Levenshtein distance for a pattern of <= 64 chars."""
+    cdef uint64_t mask = <uint64_t>0xFFFFFFFFFFFFFFFF if m == 64 else ((<uint64_t>1 << m) - 1)
+    cdef uint64_t high = <uint64_t>1 << (m - 1)
+    cdef uint64_t pv = mask
+    cdef uint64_t mv = 0
+    cdef uint64_t eq, xv, xh, ph, mh
+    cdef int score = m
+    cdef Py_ssize_t remaining = len(text)
+    cdef Py_UCS4 ch
+
+    for ch in text:
+        if ch < 128:
+            eq = peq_ascii[ch]
+        else:
+            eq = <uint64_t>peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        remaining -= 1
+        if max_dist >= 0 and score - remaining > max_dist:
+            return max_dist + 1
+    return score
+
+
+def batch_edit_distance(list texts, str query, int max_dist=-1):
+    """Levenshtein distance from query (<= 64 chars) to every text.
+
+    Distances above max_dist (when >= 0) are reported as max_dist + 1.
+    """
+    cdef int m = len(query)
+    cdef uint64_t peq_ascii[128]
+    cdef dict peq = {}
+    cdef Py_ssize_t i
+    cdef Py_UCS4 ch
+    cdef str text
+    cdef list out = []
+
+    if m == 0 or m > 64:
+        raise ValueError("query must be 1-64 characters")
+    for i in range(128):
+        peq_ascii[i] = 0
+    i = 0
+    for ch in query:
+        if ch < 128:
+            peq_ascii[ch] |= <uint64_t>1 << i
+        else:
+            peq[ch] = peq.get(ch, 0) | (<uint64_t>1 << i)
+        i += 1
+
+    for text in texts:
+        if max_dist >= 0 and abs(len(text) - m) > max_dist:
+            out.append(max_dist + 1)
+        else:
+            out.append(_myers64(text, peq_ascii, peq, m, max_dist))
+    return out
 
 
 cdef class FastTrieNode:
@@ -140,6 +209,31 @@ cdef class FastTrieNode:
         node.is_end_of_word = True
         node.items.add(item_key)
 
+    cdef void remove(self, str word, str item_key):
+        """Remove an item key from a word, pruning nodes left empty."""
+        cdef list path = [self]
+        cdef FastTrieNode node = self
+        cdef str char
+        cdef str chars = word.lower()
+        cdef Py_ssize_t i
+
+        for char in chars:
+            if char not in node.children:
+                return
+            node = node.children[char]
+            path.append(node)
+
+        node.items.discard(item_key)
+        if not node.items:
+            node.is_end_of_word = False
+
+        # Walk back up and drop empty leaves
+        for i in range(len(chars) - 1, -1, -1):
+            node = path[i + 1]
+            if node.children or node.is_end_of_word:
+                break
+            del (<FastTrieNode>path[i]).children[chars[i]]
+
     cdef inline set search_prefix(self, str prefix):
         """Search for all items that start with the given prefix."""
         cdef FastTrieNode node = self
@@ -166,17 +260,147 @@ cdef class FastTrieNode:
             self._collect_all_items(child, result)
 
 
+cdef class FastTrigramIndex:
+    """Native trigram index for substring matching, mirroring db_browser.TrigramIndex."""
+
+    cdef dict _ids
+    cdef dict _keys
+    cdef dict _texts
+    cdef dict _grams
+    cdef Py_ssize_t _next_id
+
+    def __cinit__(self):
+        self._ids = {}
+        self._keys = {}
+        self._texts = {}
+        self._grams = {}
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    cdef set _trigrams(self, tuple fields):
+        cdef set grams = set()
+        cdef str field, padded
+        cdef Py_ssize_t i
+
+        for field in fields:
+            if not field:
+                continue
+            padded = "\0" + field + "\0"
+            for i in range(len(padded) - 2):
+                grams.add(padded[i:i + 3])
+        return grams
+
+    cpdef add(self, str key, fields):
+        """Index fields under key; re-adding a key replaces its entry."""
+        cdef Py_ssize_t doc
+        cdef tuple lowered
+        cdef str gram
+        cdef set postings
+
+        if key in self._ids:
+            self.remove(key)
+        doc = self._next_id
+        self._next_id += 1
+        lowered = tuple([f.lower() if f else "" for f in fields])
+        self._ids[key] = doc
+        self._keys[doc] = key
+        self._texts[doc] = lowered
+        for gram in self._trigrams(lowered):
+            postings = self._grams.get(gram)
+            if postings is None:
+                self._grams[gram] = {doc}
+            else:
+                postings.add(doc)
+
+    cpdef bint remove(self, str key):
+        """Drop key from the index. Returns False if it was not indexed."""
+        cdef object doc = self._ids.pop(key, None)
+        cdef str gram
+        cdef set postings
+
+        if doc is None:
+            return False
+        del self._keys[doc]
+        for gram in self._trigrams(self._texts.pop(doc)):
+            postings = self._grams.get(gram)
+            if postings is not None:
+                postings.discard(doc)
+                if not postings:
+                    del self._grams[gram]
+        return True
+
+    def clear(self):
+        self._ids.clear()
+        self._keys.clear()
+        self._texts.clear()
+        self._grams.clear()
+
+    def search(self, str query):
+        """Return {key: field_mask} for documents containing query as a substring."""
+        cdef str q = query.lower().strip()
+        cdef list postings
+        cdef set candidates, ids
+        cdef dict matches = {}
+        cdef Py_ssize_t i, bit
+        cdef int mask
+        cdef str gram, text
+        cdef object doc
+
+        if not q:
+            return matches
+
+        if len(q) >= 3:
+            postings = []
+            for i in range(len(q) - 2):
+                ids = self._grams.get(q[i:i + 3])
+                if not ids:
+                    return matches
+                postings.append(ids)
+            # Intersect starting from the rarest trigram
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for ids in postings[1:]:
+                candidates &= ids
+                if not candidates:
+                    return matches
+        else:
+            candidates = set()
+            for gram, ids in self._grams.items():
+                if q in gram:
+                    candidates |= ids
+
+        for doc in sorted(candidates):
+            mask = 0
+            bit = 0
+            for text in self._texts[doc]:
+                if q in text:
+                    mask |= 1 << bit
+                bit += 1
+            if mask:
+                matches[self._keys[doc]] = mask
+        return matches
+
+
 cdef class FastSearchIndex:
     """High-performance search index using native trie implementation."""
 
     cdef public FastTrieNode table_trie
     cdef public FastTrieNode column_trie
+    cdef public FastTrigramIndex table_grams
+    cdef public FastTrigramIndex column_grams
     cdef public dict table_keys
     cdef public dict column_keys
 
     def __cinit__(self):
         self.table_trie = FastTrieNode()
         self.column_trie = FastTrieNode()
+        self.table_grams = FastTrigramIndex()
+        self.column_grams = FastTrigramIndex()
         self.table_keys = {}
         self.column_keys = {}
 
@@ -184,6 +408,53 @@ cdef class FastSearchIndex:
         """Python wrapper for the cdef build_index method."""
         self._build_index(tables, columns)
 
+    def add_tables(self, tables):
+        """Index additional tables; re-adding a table replaces its entry."""
+        self._add_tables(list(tables))
+
+    def add_columns(self, columns):
+        """Index additional columns; re-adding a column replaces its entry."""
+        self._add_columns(list(columns))
+
+    def remove_schema(self, str schema):
+        """Remove every table and column of a schema. Returns the number of entries removed."""
+        cdef int removed = 0
+        cdef str key
+        cdef object item
+
+        for key, item in [(k, t) for k, t in self.table_keys.items() if t.schema == schema]:
+            self._unindex_text(self.table_trie, self._table_text(item), key)
+            self.table_grams.remove(key)
+            del self.table_keys[key]
+            removed += 1
+        for key, item in [(k, c) for k, c in self.column_keys.items() if c.schema == schema]:
+            self._unindex_text(self.column_trie, self._column_text(item), key)
+            self.column_grams.remove(key)
+            del self.column_keys[key]
+            removed += 1
+        return removed
+
+    def remove_tables(self, keys):
+        """Remove tables, given as (schema, table) pairs, and their columns. Returns the number of entries removed."""
+        cdef int removed = 0
+        cdef str key
+        cdef object item
+        cdef set wanted = set(keys)
+
+        if not wanted:
+            return 0
+        for key, item in [(k, t) for k, t in self.table_keys.items() if (t.schema, t.name) in wanted]:
+            self._unindex_text(self.table_trie, self._table_text(item), key)
+            self.table_grams.remove(key)
+            del self.table_keys[key]
+            removed += 1
+        for key, item in [(k, c) for k, c in self.column_keys.items() if (c.schema, c.table) in wanted]:
+            self._unindex_text(self.column_trie, self._column_text(item), key)
+            self.column_grams.remove(key)
+            del self.column_keys[key]
+            removed += 1
+        return removed
+
     def search_tables(self, query):
         """Python wrapper for the cdef search_tables method."""
         return self._search_tables(query)
@@ -192,34 +463,60 @@ cdef class FastSearchIndex:
         """Python wrapper for the cdef search_columns method."""
         return self._search_columns(query)
 
+    def substring_tables(self, query):
+        """Tables containing query in name/schema/remarks, as (table, field_mask) pairs."""
+        return [(self.table_keys[key], mask) for key, mask in self.table_grams.search(query).items()]
+
+    def substring_columns(self, query):
+        """Columns containing query in name/type/remarks, as (column, field_mask) pairs."""
+        return [(self.column_keys[key], mask) for key, mask in self.column_grams.search(query).items()]
+
     cdef inline void _build_index(self, list tables, list columns):
         """Build the search index from tables and columns."""
-        cdef object table, col
-        cdef str table_key, col_key, search_text
-
         # Clear existing index
         self.table_trie = FastTrieNode()
         self.column_trie = FastTrieNode()
+        self.table_grams.clear()
+        self.column_grams.clear()
         self.table_keys.clear()
         self.column_keys.clear()
 
-        # Index tables
+        self._add_tables(tables)
+        self._add_columns(columns)
+
+    cdef inline str _table_text(self, object table):
+        """Lowercase searchable text for a table."""
+        return f"{table.name} {table.schema} {table.remarks or ''}".lower()
+
+    cdef inline str _column_text(self, object col):
+        """Lowercase searchable text for a column."""
+        return f"{col.name} {col.typename} {col.remarks or ''}".lower()
+
+    cdef void _add_tables(self, list tables):
+        cdef object table, old
+        cdef str table_key
+
         for table in tables:
             table_key = f"{table.schema}.{table.name}"
+            old = self.table_keys.get(table_key)
+            if old is not None:
+                self._unindex_text(self.table_trie, self._table_text(old), table_key)
             self.table_keys[table_key] = table
+            self._index_text(self.table_trie, self._table_text(table), table_key)
+            self.table_grams.add(table_key, (table.name, table.schema, table.remarks))
 
-            # Pre-compute lowercase searchable text for each table
-            search_text = f"{table.name} {table.schema} {table.remarks or ''}".lower()
-            self._index_text(self.table_trie, search_text, table_key)
+    cdef void _add_columns(self, list columns):
+        cdef object col, old
+        cdef str col_key
 
-        # Index columns
         for col in columns:
             col_key = f"{col.schema}.{col.table}.{col.name}"
+            old = self.column_keys.get(col_key)
+            if old is not None:
+                self._unindex_text(self.column_trie, self._column_text(old), col_key)
             self.column_keys[col_key] = col
-
-            # Pre-compute lowercase searchable text for each column
-            search_text = f"{col.name} {col.typename} {col.remarks or ''}".lower()
-            self._index_text(self.column_trie, search_text, col_key)
+            self._index_text(self.column_trie, self._column_text(col), col_key)
+            self.column_grams.add(col_key, (col.name, col.typename, col.remarks))
 
     cdef inline void _index_text(self, FastTrieNode trie, str text, str item_key):
         """Index individual words from text."""
@@ -230,6 +527,13 @@ cdef class FastSearchIndex:
             if word.strip():
                 trie.insert(word.strip(), item_key)
 
+    cdef inline void _unindex_text(self, FastTrieNode trie, str text, str item_key):
+        """Remove the words of text for item_key."""
+        cdef str word
+
+        for word in set(text.replace('_', ' ').split()):
+            trie.remove(word, item_key)
+
     cdef inline list _search_tables(self, str query):
         """Fast search for tables matching the query."""
         if not query.strip():
@@ -1,15 +1,48 @@
 """Subprocess data loader for Qt GUI.
 
 Reads a single JSON command on stdin:
-  {"cmd":"start", "schema_filter": str|null, "use_mock": bool, "initial_limit": int, "batch_size": int}
-
-Emits newline-delimited JSON messages on stdout:
+  {"cmd":"start", "schema_filter": str|null, "use_mock": bool, "initial_limit": int, "batch_size": int,
+   "framings": ["pickle5", "json"], "schema_workers": int, "stale_ok": bool}
+
+With "stale_ok" an expired cache is streamed at once, its chunks marked
+{"stale": true}, and then revalidated; the changes follow as "delta" messages.
+
+With "segment_dir" (a directory owned by the parent) the tables and columns
+of "chunk" and "delta" messages are written to catalog segment files there
+(see dbutils.catalog_segment) and the message carries {"segment": path}
+in their place; the parent maps the file instead of decoding the rows.
+
+A first command {"cmd":"serve", "framings": [...], "segment_dir": str} runs
+the loader as a long-lived service instead (see serve): it answers
+{"type":"ready"} and then takes "load", "switch_schema", "refresh",
+"cancel" and "shutdown" commands, keeping the JVM, pooled connections and
+loaded catalogs warm between loads. A load replaced by a newer command ends
+with {"type":"cancelled"}; every message of a load carries its command's
+"id" as "load".
+
+With "schema_workers" > 0 (and no schema filter) schemas load in parallel:
+chunks carry a "schema" key and arrive in completion order, each schema
+reports "schema_progress", and later {"cmd":"cancel", "schema": str|null}
+lines on stdin stop one schema or all of them.
+
+Emits newline-delimited JSON messages on stdout. If "framings" names a binary
+framing this process supports (see loader_protocol), it first answers with
+  {"type":"hello", "framing": str}
+and sends every later message as a length-prefixed binary frame instead.
+A stray write would corrupt that stream, so from then on sys.stdout points
+at stderr and only the loader's messages reach the real stdout.
+Messages:
   {"type":"progress", "message": str, "current": int, "total": int}
   {"type":"chunk", "tables": [...], "columns": [...], "loaded": int, "estimated": int}
+  {"type":"delta", "tables": [...], "columns": [...], "removed": [[schema, table], ...], "loaded": int}
+  {"type":"schema_progress", "schema": str, "loaded": int, "state": str}
   {"type":"schemas", "schemas": ["SCHEMA1", ...]}
   {"type":"done"}
   {"type":"error", "message": str}
 
+Processed data is cached for 24 hours together with per-table fingerprints;
+once expired, only tables added, altered or dropped since are reloaded.
+
 Tables use dicts: {"schema","name","remarks"}
 Columns use dicts: {"schema","table","name","typename","length","scale","nulls","remarks"}
 """
@@ -18,10 +51,20 @@ from __future__ import annotations
 
 import gzip
 import json
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from dbutils.gui.loader_protocol import (
+    FRAMING_JSON,
+    ChunkSender,
+    CreditGate,
+    encode_message,
+    negotiate_framing,
+)
 
 # Cache expiration time in seconds (24 hours)
 CACHE_EXPIRATION_SECONDS = 24 * 60 * 60
@@ -52,11 +95,134 @@ def _get_compression_setting():
 MIN_BATCH_SIZE = 100
 MAX_BATCH_SIZE = 2000
 TARGET_CHUNK_TIME_MS = 500  # Target 500ms per chunk for responsive UI
+# Tables merged into one chunk while the GUI has no credits left before the loader waits
+MAX_MERGED_TABLES = 4 * MAX_BATCH_SIZE
+
+
+# Framing negotiated with the parent in the start command
+_framing = FRAMING_JSON
+# The real stdout while a binary framing is active (sys.stdout is stderr then)
+_frame_stdout: Optional[Any] = None
+
+# Directory for catalog segment files, when the parent asked for them
+_segment_dir: Optional[Path] = None
+_segment_count = 0
+
+# Loader service state (see serve): set while running as a long-lived service
+_serving = False
+# Id of the load being streamed; tags every message while set
+_load_id: Optional[Any] = None
+# Set to stop the running load; checked between chunks. The service gives
+# every job its own event, so a cancel meant for one job never hits the next.
+_cancel = threading.Event()
+# Held while the command thread cancels the running job and queues the next,
+# and while serve() picks a job, so the two never interleave
+_jobs_lock = threading.Lock()
+# ParallelSchemaLoader of the running load, for per-schema cancels
+_active_loader = None
+# Catalogs already loaded by this service, by schema filter
+_warm_catalogs: Dict[Optional[str], Tuple[List[Dict], List[Dict]]] = {}
+# Set while a thread reads commands from stdin (service or flow-controlled load)
+_reading_commands = False
+# Credits of the running load when the parent asked for flow control
+_credit_gate: Optional[CreditGate] = None
+# Serializes messages written by the load thread and the command thread
+_stdout_lock = threading.Lock()
+
+
+class LoadCancelled(Exception):
+    """Raised inside a load once the service was asked to stop it."""
+
+
+def check_cancelled() -> None:
+    """Raise LoadCancelled if the running load should stop."""
+    if _cancel.is_set():
+        raise LoadCancelled()
+
+
+
+def set_framing(framing: str) -> None:
+    """Switch how jprint encodes messages (see loader_protocol).
+
+    Binary frames cannot skip stray output the way JSON lines are, so a
+    binary framing points sys.stdout at stderr until JSON is set again.
+    """
+    global _framing, _frame_stdout
+    if framing == FRAMING_JSON:
+        if _frame_stdout is not None:
+            sys.stdout, _frame_stdout = _frame_stdout, None
+    elif _frame_stdout is None:
+        _frame_stdout, sys.stdout = sys.stdout, sys.stderr
+    _framing = framing
+
+
+def set_segment_dir(path: Optional[str]) -> None:
+    """Send chunk and delta rows as catalog segment files in ``path`` (None sends them inline)."""
+    global _segment_dir
+    _segment_dir = Path(path) if path else None
+
+
+def to_segment(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """Move the tables and columns of a chunk or delta message into a segment file."""
+    global _segment_count
+    if obj.get("type") not in ("chunk", "delta") or not (obj.get("tables") or obj.get("columns")):
+        return obj
+    from dbutils.catalog_segment import write_segment
+
+    _segment_count += 1
+    path = _segment_dir / f"{os.getpid()}-{_segment_count}.seg"
+    write_segment(path, obj.get("tables") or [], obj.get("columns") or [])
+    out = {k: v for k, v in obj.items() if k not in ("tables", "columns")}
+    out["segment"] = str(path)
+    return out
 
 
 def jprint(obj: Dict[str, Any]) -> None:
-    sys.stdout.write(json.dumps(obj) + "\n")
-    sys.stdout.flush()
+    if _load_id is not None:
+        obj = dict(obj, load=_load_id)
+    # Chunks held back for credits are sent from the command thread
+    with _stdout_lock:
+        if _segment_dir is not None:
+            obj = to_segment(obj)
+        if _framing == FRAMING_JSON:
+            sys.stdout.write(json.dumps(obj) + "\n")
+            sys.stdout.flush()
+            return
+        out = _frame_stdout.buffer
+        out.write(encode_message(obj, _framing))
+        out.flush()
+
+
+# Chunks go out as they come until a load asks for flow control
+_chunk_sender = ChunkSender(jprint)
+
+
+def begin_flow_control(credits: Optional[int]) -> None:
+    """Send the chunks of the next load within ``credits`` (None sends them as they come)."""
+    global _credit_gate, _chunk_sender
+    _credit_gate = CreditGate(credits) if credits else None
+    _chunk_sender = ChunkSender(jprint, _credit_gate, MAX_MERGED_TABLES, check_cancelled)
+
+
+def send_chunk(chunk: Dict[str, Any]) -> None:
+    """Send a "chunk" message, merged with the following ones while the parent is out of credits."""
+    _chunk_sender.send(chunk)
+
+
+def flush_chunks() -> None:
+    """Send a chunk held back for lack of credits, waiting for one if needed."""
+    _chunk_sender.flush()
+
+
+def adapt_chunk_size(size: int, recent_ms: float) -> int:
+    """Grow or shrink a chunk size towards TARGET_CHUNK_TIME_MS per chunk."""
+    if recent_ms < TARGET_CHUNK_TIME_MS * 0.5:
+        # Too fast, increase batch size for efficiency
+        return min(int(size * 1.5), MAX_BATCH_SIZE)
+    if recent_ms > TARGET_CHUNK_TIME_MS * 1.5:
+        # Too slow, decrease batch size for responsiveness
+        return max(int(size * 0.7), MIN_BATCH_SIZE)
+    return size
 
 
 def get_cache_dir() -> Path:
@@ -97,6 +263,16 @@ def is_cache_valid(cache_path: Path, max_age_seconds: int = CACHE_EXPIRATION_SEC
     return age_seconds < max_age_seconds
 
 
+def read_data_cache(cache_path: Path) -> Dict[str, Any]:
+    """Read a data cache file, whatever its age."""
+    # Read and decompress based on file extension (.gz) or content
+    if str(cache_path).endswith(".gz"):
+        with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    with open(cache_path) as f:
+        return json.load(f)
+
+
 def load_cached_data(schema_filter: Optional[str]) -> Optional[Tuple[List[Dict], List[Dict]]]:
     """Load cached table and column data if valid."""
     try:
@@ -107,13 +283,7 @@ def load_cached_data(schema_filter: Optional[str]) -> Optional[Tuple[List[Dict],
             sys.stderr.flush()
             return None
 
-        # Read and decompress based on file extension (.gz) or content
-        if str(cache_path).endswith(".gz"):
-            with gzip.open(cache_path, "rt", encoding="utf-8") as f:
-                data = json.load(f)
-        else:
-            with open(cache_path) as f:
-                data = json.load(f)
+        data = read_data_cache(cache_path)
 
         tables = data.get("tables", [])
         columns = data.get("columns", [])
@@ -135,8 +305,14 @@ def load_cached_data(schema_filter: Optional[str]) -> Optional[Tuple[List[Dict],
     return None
 
 
-def save_data_to_cache(schema_filter: Optional[str], tables: List[Dict], columns: List[Dict]) -> None:
-    """Save table and column data to cache with compression."""
+def save_data_to_cache(
+    schema_filter: Optional[str], tables: List[Dict], columns: List[Dict], fingerprints: Optional[Dict] = None
+) -> None:
+    """Save table and column data to cache with compression.
+
+    ``fingerprints`` (see catalog_refresh) let an expired cache be
+    delta-refreshed instead of reloaded.
+    """
     try:
         cache_path = get_data_cache_path(schema_filter)
 
@@ -146,6 +322,10 @@ def save_data_to_cache(schema_filter: Optional[str], tables: List[Dict], columns
             "cached_at": int(time.time()),
             "schema_filter": schema_filter,
         }
+        if fingerprints is not None:
+            from dbutils.catalog_refresh import fingerprints_to_rows
+
+            data["fingerprints"] = fingerprints_to_rows(fingerprints)
 
         # Write with compression when filename indicates compressed cache (.gz)
         if str(cache_path).endswith(".gz"):
@@ -165,6 +345,50 @@ def save_data_to_cache(schema_filter: Optional[str], tables: List[Dict], columns
         sys.stderr.flush()
 
 
+def refresh_cached_data(
+    schema_filter: Optional[str], use_mock: bool = False, data: Optional[Dict[str, Any]] = None
+) -> Optional[Tuple[List[Dict], List[Dict]]]:
+    """Bring an expired data cache up to date by reloading only the tables that changed.
+
+    ``data`` is the cache contents when the caller has already read them.
+    Returns None when there is no cache with fingerprints to start from, or
+    the refresh fails; the caller then reloads everything.
+    """
+    try:
+        if data is None:
+            cache_path = get_data_cache_path(schema_filter)
+            if not cache_path.exists():
+                return None
+            data = read_data_cache(cache_path)
+        if not data.get("fingerprints"):
+            return None
+
+        from dbutils.catalog_refresh import fingerprints_from_rows, refresh_catalog
+
+        result = refresh_catalog(
+            data.get("tables", []),
+            data.get("columns", []),
+            fingerprints_from_rows(data["fingerprints"]),
+            schema_filter,
+            use_mock,
+        )
+        tables = to_table_dicts(result.tables)
+        columns = to_column_dicts(result.columns)
+        save_data_to_cache(schema_filter, tables, columns, result.fingerprints)
+
+        delta = result.delta
+        sys.stderr.write(
+            f"Refreshed data cache for schema_filter={schema_filter}: {len(delta.added)} added, "
+            f"{len(delta.changed)} changed, {len(delta.removed)} removed\n"
+        )
+        sys.stderr.flush()
+        return tables, columns
+    except Exception as e:
+        sys.stderr.write(f"Failed to refresh data cache: {e}\n")
+        sys.stderr.flush()
+    return None
+
+
 def load_cached_schemas() -> Optional[List[str]]:
     """Load schemas from cache file with compression support."""
     try:
@@ -270,16 +494,501 @@ def to_column_dicts(cols) -> List[Dict[str, Any]]:
     return out
 
 
-def main():  # noqa: C901
+def index_columns_by_table(columns: List[Dict[str, Any]]) -> Dict[Tuple[Any, Any], List[Dict[str, Any]]]:
+    """Group column dicts by (schema, table), preserving their original order.
+
+    Built once per cache load so each streamed chunk can collect its columns
+    with one dict lookup per table instead of rescanning every column.
+    """
+    index: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
+    for c in columns:
+        key = (c.get("schema"), c.get("table"))
+        bucket = index.get(key)
+        if bucket is None:
+            index[key] = [c]
+        else:
+            bucket.append(c)
+    return index
+
+
+def columns_for_tables(
+    tables: List[Dict[str, Any]], columns_by_table: Dict[Tuple[Any, Any], List[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """Collect the columns of ``tables`` from an index built by index_columns_by_table."""
+    out: List[Dict[str, Any]] = []
+    seen = set()
+    for t in tables:
+        key = (t.get("schema"), t.get("name"))
+        if key in seen:
+            continue
+        seen.add(key)
+        out.extend(columns_by_table.get(key, ()))
+    return out
+
+
+def load_stale_data(schema_filter: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Read the data cache whatever its age, for painting while it is revalidated."""
+    try:
+        cache_path = get_data_cache_path(schema_filter)
+        if not cache_path.exists():
+            return None
+        data = read_data_cache(cache_path)
+        if not data.get("tables"):
+            return None
+        age_hours = (time.time() - data.get("cached_at", 0)) / 3600
+        sys.stderr.write(f"Using stale data cache for schema_filter={schema_filter} (age: {age_hours:.1f}h)\n")
+        sys.stderr.flush()
+        return data
+    except Exception as e:
+        sys.stderr.write(f"Failed to load stale data cache: {e}\n")
+        sys.stderr.flush()
+    return None
+
+
+def cached_chunks(
+    tables: List[Dict],
+    columns: List[Dict],
+    initial_limit: int,
+    batch_size: int,
+    start_offset: int = 0,
+    stale: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Split cached tables into "chunk" messages, a small one first for a fast first paint.
+
+    With ``stale`` every chunk is marked {"stale": true}: it comes from an
+    expired cache that is being revalidated.
+    """
+    # Use smaller initial batch for fast first paint, then larger batches
+    size = min(initial_limit, 200)
+    start = start_offset if start_offset else 0
+    total_tables = len(tables)
+
+    # Index columns by table once so each chunk costs only its own size
+    columns_by_table = index_columns_by_table(columns)
+
+    while start < total_tables:
+        end = min(start + size, total_tables)
+        batch_tables = tables[start:end]
+        chunk = {
+            "type": "chunk",
+            "tables": batch_tables,
+            "columns": columns_for_tables(batch_tables, columns_by_table),
+            "loaded": end,
+            "estimated": total_tables,
+        }
+        if stale:
+            chunk["stale"] = True
+        yield chunk
+        start = end
+        size = batch_size
+
+
+def stream_cached_chunks(
+    tables: List[Dict],
+    columns: List[Dict],
+    initial_limit: int,
+    batch_size: int,
+    start_offset: int = 0,
+    stale: bool = False,
+) -> None:
+    """Stream cached tables in chunks (see cached_chunks)."""
+    for chunk in cached_chunks(tables, columns, initial_limit, batch_size, start_offset, stale):
+        check_cancelled()
+        send_chunk(chunk)
+    flush_chunks()
+
+
+def send_schemas(all_tables_dicts: List[Dict]) -> None:
+    """Send the schema list from the schema cache, or built from the tables."""
+    schemas_list = load_cached_schemas()
+    if not schemas_list:
+        # Fallback: build from cached tables
+        schemas_list = sorted({t["schema"] for t in all_tables_dicts})
+        save_schemas_to_cache(schemas_list)
+    jprint({"type": "schemas", "schemas": schemas_list})
+
+
+def reload_data(schema_filter: Optional[str], use_mock: bool, batch_size: int) -> Tuple[List[Dict], List[Dict]]:
+    """Load the whole catalog in one catalog scan and cache it, without streaming it."""
+    from dbutils import catalog_refresh, db_browser
+
+    fingerprints = None
+    try:
+        fingerprints = catalog_refresh.fetch_fingerprints(schema_filter, use_mock)
+    except Exception as e:
+        sys.stderr.write(f"Could not read table fingerprints: {e}\n")
+        sys.stderr.flush()
+
+    tables: List[Any] = []
+    columns: List[Any] = []
+    for t_chunk, c_chunk in db_browser.CatalogScan(schema_filter, chunk_size=batch_size, use_mock=use_mock):
+        tables.extend(t_chunk)
+        columns.extend(c_chunk)
+    tables_dicts = to_table_dicts(tables)
+    columns_dicts = to_column_dicts(columns)
+    save_data_to_cache(schema_filter, tables_dicts, columns_dicts, fingerprints)
+    return tables_dicts, columns_dicts
+
+
+def revalidate_data(
+    schema_filter: Optional[str], use_mock: bool, stale_data: Dict[str, Any], batch_size: int
+) -> Tuple[List[Dict], List[Dict]]:
+    """Bring a stale data cache up to date, by fingerprint delta when it has fingerprints."""
+    fresh = refresh_cached_data(schema_filter, use_mock, data=stale_data)
+    if fresh is None:
+        fresh = reload_data(schema_filter, use_mock, batch_size)
+    return fresh
+
+
+def delta_messages(
+    old_tables: List[Dict], old_columns: List[Dict], tables: List[Dict], columns: List[Dict], batch_size: int
+) -> Iterator[Dict[str, Any]]:
+    """Yield the differences between a stale catalog and its revalidated version.
+
+    Added and changed tables come with all their columns in "delta"
+    messages of up to ``batch_size`` tables; the first one also lists the
+    removed tables as [schema, table] pairs.
+    """
+    from dbutils.catalog_refresh import diff_catalogs
+
+    delta = diff_catalogs(old_tables, old_columns, tables, columns)
+    sys.stderr.write(
+        f"Revalidated catalog: {len(delta.added)} added, {len(delta.changed)} changed, "
+        f"{len(delta.removed)} removed\n"
+    )
+    sys.stderr.flush()
+    if not delta:
+        return
+
+    stale = set(delta.stale)
+    upserts = [t for t in tables if (t.get("schema"), t.get("name")) in stale]
+    columns_by_table = index_columns_by_table(columns)
+    removed = [list(key) for key in delta.removed]
+    for start in range(0, max(len(upserts), 1), max(batch_size, 1)):
+        batch = upserts[start : start + batch_size]
+        yield {
+            "type": "delta",
+            "tables": batch,
+            "columns": columns_for_tables(batch, columns_by_table),
+            "removed": removed,
+            "loaded": len(tables),
+        }
+        removed = []
+
+
+def stream_delta(
+    old_tables: List[Dict], old_columns: List[Dict], tables: List[Dict], columns: List[Dict], batch_size: int
+) -> None:
+    """Send the differences between a stale catalog and its revalidated version (see delta_messages)."""
+    for msg in delta_messages(old_tables, old_columns, tables, columns, batch_size):
+        check_cancelled()
+        jprint(msg)
+
+
+def _read_cancel_commands(loader) -> None:
+    """Apply {"cmd": "cancel", "schema": str|null} lines from stdin to a parallel load."""
+    for line in sys.stdin:
+        try:
+            msg = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(msg, dict) and msg.get("cmd") == "cancel":
+            loader.cancel(msg.get("schema"))
+
+
+def stream_schemas_parallel(
+    db_browser,
+    use_mock: bool,
+    workers: int,
+    initial_limit: int,
+    batch_size: int,
+    all_loaded_tables: List[Any],
+    all_loaded_columns: List[Any],
+) -> bool:
+    """Load every schema across ``workers`` concurrent scans, streaming chunks as they finish.
+
+    Each chunk names its schema, and every schema reports its progress with
+    "schema_progress" messages. Returns True when every schema loaded completely.
+    """
+    global _active_loader
+    from dbutils.schema_loader import DONE, LOADING, ParallelSchemaLoader
+
+    jprint({"type": "progress", "message": "Loading schema list…", "current": 0, "total": 3})
+    schemas = db_browser.get_available_schemas(use_mock)
+    estimated_total = sum(s.table_count for s in schemas)
+    sys.stderr.write(f"Loading {len(schemas)} schemas with {workers} workers\n")
+    sys.stderr.flush()
+
+    loader = ParallelSchemaLoader(
+        [s.name for s in schemas],
+        workers=workers,
+        chunk_size=batch_size,
+        first_chunk_size=initial_limit,
+        use_mock=use_mock,
+    )
+    _active_loader = loader
+    if not _reading_commands:
+        threading.Thread(target=_read_cancel_commands, args=(loader,), name="loader-commands", daemon=True).start()
+
+    loaded_total = 0
+    complete = True
+    try:
+        for chunk in loader:
+            check_cancelled()
+            if chunk.state == LOADING:
+                all_loaded_tables.extend(chunk.tables)
+                all_loaded_columns.extend(chunk.columns)
+                loaded_total += len(chunk.tables)
+                send_chunk(
+                    {
+                        "type": "chunk",
+                        "schema": chunk.schema,
+                        "tables": to_table_dicts(chunk.tables),
+                        "columns": to_column_dicts(chunk.columns),
+                        "loaded": loaded_total,
+                        "estimated": max(estimated_total, loaded_total),
+                    },
+                )
+            elif chunk.state != DONE:
+                complete = False
+            progress = {"type": "schema_progress", "schema": chunk.schema, "loaded": chunk.loaded, "state": chunk.state}
+            if chunk.error:
+                progress["error"] = chunk.error
+            jprint(progress)
+    finally:
+        _active_loader = None
+
+    if loaded_total == 0:
+        # Always send one chunk so the UI leaves its loading state
+        send_chunk({"type": "chunk", "tables": [], "columns": [], "loaded": 0, "estimated": 0})
+    flush_chunks()
+    return complete
+
+
+def warm_catalog(schema_filter: Optional[str]) -> Optional[Tuple[List[Dict], List[Dict]]]:
+    """Return a catalog this service already holds for ``schema_filter``.
+
+    A schema not loaded on its own is cut out of the full catalog when that
+    is loaded.
+    """
+    if schema_filter in _warm_catalogs:
+        return _warm_catalogs[schema_filter]
+    full = _warm_catalogs.get(None)
+    if full is None or not schema_filter:
+        return None
+    schema = schema_filter.upper()
+    tables = [t for t in full[0] if (t.get("schema") or "").upper() == schema]
+    columns_by_table = index_columns_by_table(full[1])
+    return tables, columns_for_tables(tables, columns_by_table)
+
+
+def remember_catalog(schema_filter: Optional[str], tables: List[Dict], columns: List[Dict]) -> None:
+    """Keep a complete catalog in memory for later loads of this service."""
+    if not _serving:
+        return
+    if schema_filter is None:
+        # Single schemas are cut out of the full catalog from now on
+        _warm_catalogs.clear()
+    _warm_catalogs[schema_filter] = (tables, columns)
+
+
+def run_refresh(cmd: Dict[str, Any]) -> int:
+    """Revalidate the catalog for the command's schema filter and stream what changed as deltas."""
+    try:
+        schema_filter: Optional[str] = cmd.get("schema_filter")
+        use_mock: bool = bool(cmd.get("use_mock", False))
+        batch_size: int = int(cmd.get("batch_size", 500))
+        begin_flow_control(int(cmd.get("credits") or 0))
+
+        old = warm_catalog(schema_filter)
+        if old is None:
+            stale_data = load_stale_data(schema_filter)
+            if stale_data:
+                old = stale_data.get("tables", []), stale_data.get("columns", [])
+        jprint({"type": "progress", "message": "Refreshing catalog…", "current": 1, "total": 3})
+        fresh = refresh_cached_data(schema_filter, use_mock)
+        if fresh is None:
+            fresh = reload_data(schema_filter, use_mock, batch_size)
+        check_cancelled()
+        if old is not None:
+            stream_delta(old[0], old[1], fresh[0], fresh[1], batch_size)
+        else:
+            stream_cached_chunks(fresh[0], fresh[1], int(cmd.get("initial_limit", 200)), batch_size)
+        remember_catalog(schema_filter, fresh[0], fresh[1])
+
+        send_schemas(fresh[0])
+        jprint({"type": "progress", "message": "Done", "current": 3, "total": 3})
+        jprint({"type": "done"})
+        return 0
+    except LoadCancelled:
+        jprint({"type": "cancelled"})
+        return 0
+    except Exception as e:
+        sys.stderr.write(f"ERROR refreshing catalog: {e}\n")
+        sys.stderr.flush()
+        jprint({"type": "error", "message": f"{type(e).__name__}: {e!s}"})
+        return 1
+
+
+# Commands that start a load; a new one replaces the load that is running
+LOAD_COMMANDS = ("load", "switch_schema", "refresh")
+
+
+def _cancel_running(schema: Optional[str] = None) -> None:
+    """Stop one schema of the running parallel load, or the whole load when None."""
+    loader = _active_loader
+    if schema is None:
+        _cancel.set()
+    if loader is not None:
+        loader.cancel(schema)
+
+
+def _read_commands(jobs: "Optional[queue.Queue[Optional[Dict[str, Any]]]]") -> None:
+    """Read commands from stdin while loads run.
+
+    Credits and cancels apply at once; load commands and shutdown go to
+    ``jobs`` when running as a service (None for a single load).
+    """
+    for line in sys.stdin:
+        try:
+            msg = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(msg, dict):
+            continue
+        cmd = msg.get("cmd")
+        gate = _credit_gate
+        if cmd == "credit":
+            # Credits for a load that was replaced are of no use
+            if gate is not None and msg.get("load", _load_id) == _load_id:
+                gate.grant(int(msg.get("n", 1)), msg.get("ingest_ms"))
+        elif cmd == "cancel":
+            _cancel_running(msg.get("schema"))
+        elif jobs is not None and (cmd in LOAD_COMMANDS or cmd == "shutdown"):
+            with _jobs_lock:
+                _cancel_running()
+                jobs.put(msg)
+        else:
+            # Keep stdout for the loader's messages; complain on stderr
+            sys.stderr.write(f"Unknown loader command: {cmd}\n")
+            sys.stderr.flush()
+    # No more credits will come
+    gate = _credit_gate
+    if gate is not None:
+        gate.close()
+    if jobs is not None:
+        # The parent went away
+        with _jobs_lock:
+            _cancel_running()
+            jobs.put(None)
+
+
+def start_command_reader(jobs: "Optional[queue.Queue[Optional[Dict[str, Any]]]]") -> None:
+    """Read stdin commands on a background thread (see _read_commands)."""
+    global _reading_commands
+    _reading_commands = True
+    threading.Thread(target=_read_commands, args=(jobs,), name="loader-commands", daemon=True).start()
+
+
+def serve() -> int:
+    """Run as a long-lived loader service until shutdown or the end of stdin.
+
+    The JVM, pooled connections and every catalog loaded stay warm between
+    loads, so switching schemas is served from memory where possible.
+    Commands, one JSON object per line:
+      {"cmd":"load", "id": any, ...start options}   load with new options
+      {"cmd":"switch_schema", "id": any, "schema_filter": str|null}
+      {"cmd":"refresh", "id": any}                   revalidate the current catalog, sending "delta" messages
+      {"cmd":"cancel", "schema": str|null}           stop one schema or the whole running load
+      {"cmd":"shutdown"}
+    A new load replaces the one running, which ends with {"type":"cancelled"}.
+    Every message of a load carries its command's id as "load".
+    """
+    global _serving, _reading_commands, _load_id, _cancel
+    _serving = True
+    # Keep connections open between loads
+    os.environ.setdefault("DBUTILS_JDBC_POOL", "1")
+
+    jobs: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+    start_command_reader(jobs)
+    jprint({"type": "ready"})
+
+    options: Dict[str, Any] = {}
+    try:
+        while True:
+            job = jobs.get()
+            with _jobs_lock:
+                # Only the newest queued command matters; shutdown wins
+                while job is not None and job.get("cmd") != "shutdown" and not jobs.empty():
+                    job = jobs.get()
+                # Commands queued from here on cancel the job picked now
+                _cancel = threading.Event()
+            if job is None or job.get("cmd") == "shutdown":
+                break
+
+            cmd = job.get("cmd")
+            if cmd == "load":
+                options = {k: v for k, v in job.items() if k not in ("cmd", "id")}
+                options["start_offset"] = int(job.get("start_offset", 0))
+            elif "schema_filter" in job:
+                options = dict(options, schema_filter=job.get("schema_filter"), start_offset=0)
+
+            _load_id = job.get("id")
+            try:
+                if cmd == "refresh":
+                    run_refresh(options)
+                else:
+                    run_load(options)
+            finally:
+                _load_id = None
+    finally:
+        _serving = _reading_commands = False
+        _warm_catalogs.clear()
+        from dbutils.connection_pool import close_all_pools
+
+        close_all_pools()
+    return 0
+
+
+def start_io(cmd: Dict[str, Any]) -> None:
+    """Set up framing and segment files as the first command asks."""
+    # Negotiate binary framing; the hello line is the last JSON we write
+    framing = negotiate_framing(cmd.get("framings"))
+    if framing != FRAMING_JSON:
+        jprint({"type": "hello", "framing": framing})
+        set_framing(framing)
+
+    # Catalog rows go through segment files when the parent provides a directory
+    set_segment_dir(cmd.get("segment_dir"))
+
+
+def main():
     try:
         line = sys.stdin.readline()
         if not line:
             return 0
         cmd = json.loads(line)
+        if cmd.get("cmd") == "serve":
+            start_io(cmd)
+            return serve()
         if cmd.get("cmd") != "start":
             jprint({"type": "error", "message": "invalid command"})
             return 1
+        start_io(cmd)
+        if cmd.get("credits"):
+            # Credits arrive on stdin while the load runs
+            start_command_reader(None)
+    except Exception as e:
+        sys.stderr.write(f"ERROR in data loader: {e}\n")
+        sys.stderr.flush()
+        jprint({"type": "error", "message": f"{type(e).__name__}: {e!s}"})
+        return 1
+    return run_load(cmd)
+
 
+def run_load(cmd: Dict[str, Any]) -> int:  # noqa: C901
+    """Run one load with the options of a start or load command, streaming its messages."""
+    try:
         schema_filter: Optional[str] = cmd.get("schema_filter")
         use_mock: bool = bool(cmd.get("use_mock", False))
         initial_limit: int = int(cmd.get("initial_limit", 200))
@@ -287,6 +996,12 @@ def main():  # noqa: C901
         # Optional resume offset so a restarted loader can continue where the
         # UI left off instead of re-streaming the same initial pages.
         start_offset: int = int(cmd.get("start_offset", 0))
+        # Load this many schemas at once instead of scanning the catalog serially
+        schema_workers: int = int(cmd.get("schema_workers", 0))
+        # Paint from an expired cache while it is refreshed (stale-while-revalidate)
+        stale_ok: bool = bool(cmd.get("stale_ok", False))
+        # Chunks the parent lets us have in flight; none means no flow control
+        begin_flow_control(int(cmd.get("credits") or 0))
 
         # Log to stderr for debugging
         sys.stderr.write(
@@ -297,60 +1012,41 @@ def main():  # noqa: C901
         sys.stderr.flush()
 
         # Try to load from processed data cache first (24 hour expiration)
-        cached_data = load_cached_data(schema_filter)
+        cached_data = warm_catalog(schema_filter) or load_cached_data(schema_filter)
+
+        # Stale-while-revalidate: paint from an expired cache right away, then
+        # refresh it and send only what changed
+        stale_data = load_stale_data(schema_filter) if stale_ok and not cached_data else None
+        if stale_data:
+            stale_tables = stale_data.get("tables", [])
+            stale_columns = stale_data.get("columns", [])
+            jprint({"type": "progress", "message": "Loading from cache (refreshing)…", "current": 0, "total": 3})
+            stream_cached_chunks(stale_tables, stale_columns, initial_limit, batch_size, start_offset, stale=True)
+
+            jprint({"type": "progress", "message": "Refreshing catalog…", "current": 1, "total": 3})
+            fresh = revalidate_data(schema_filter, use_mock, stale_data, batch_size)
+            stream_delta(stale_tables, stale_columns, fresh[0], fresh[1], batch_size)
+            remember_catalog(schema_filter, fresh[0], fresh[1])
+            jprint({"type": "progress", "message": f"Refreshed {len(fresh[0])} tables", "current": 2, "total": 3})
+
+            send_schemas(fresh[0])
+            jprint({"type": "progress", "message": "Done", "current": 3, "total": 3})
+            jprint({"type": "done"})
+            sys.stderr.write("Revalidated stale cache\n")
+            sys.stderr.flush()
+            return 0
+
+        # Otherwise an expired cache only reloads the tables changed since it was saved
+        if not cached_data:
+            cached_data = refresh_cached_data(schema_filter, use_mock)
 
         if cached_data:
             all_tables_dicts, all_columns_dicts = cached_data
 
-            # Stream the cached data in batches to avoid blocking UI
             sys.stderr.write(f"Streaming {len(all_tables_dicts)} tables from cache in batches...\n")
             sys.stderr.flush()
             jprint({"type": "progress", "message": "Loading from cache…", "current": 0, "total": 3})
-
-            # Stream in batches to keep UI responsive
-            # Use smaller initial batch for fast first paint, then larger batches
-            first_batch_size = min(initial_limit, 200)  # Quick first chunk
-            subsequent_batch_size = batch_size
-
-            start = start_offset if start_offset else 0
-            total_tables = len(all_tables_dicts)
-
-            # Send first small batch immediately for fast UI response
-            if start < total_tables:
-                end = min(start + first_batch_size, total_tables)
-                batch_tables = all_tables_dicts[start:end]
-                batch_keys = {f"{t['schema']}.{t['name']}" for t in batch_tables}
-                batch_columns = [c for c in all_columns_dicts if f"{c.get('schema')}.{c.get('table')}" in batch_keys]
-
-                jprint(
-                    {
-                        "type": "chunk",
-                        "tables": batch_tables,
-                        "columns": batch_columns,
-                        "loaded": end,
-                        "estimated": total_tables,
-                    }
-                )
-                start = end
-
-            # Stream remaining data in larger batches
-            while start < total_tables:
-                end = min(start + subsequent_batch_size, total_tables)
-                batch_tables = all_tables_dicts[start:end]
-                batch_keys = {f"{t['schema']}.{t['name']}" for t in batch_tables}
-                batch_columns = [c for c in all_columns_dicts if f"{c.get('schema')}.{c.get('table')}" in batch_keys]
-
-                jprint(
-                    {
-                        "type": "chunk",
-                        "tables": batch_tables,
-                        "columns": batch_columns,
-                        "loaded": end,
-                        "estimated": total_tables,
-                    }
-                )
-                start = end
-                sys.stdout.flush()  # Ensure chunks are sent immediately
+            stream_cached_chunks(all_tables_dicts, all_columns_dicts, initial_limit, batch_size, start_offset)
             jprint(
                 {
                     "type": "progress",
@@ -360,17 +1056,12 @@ def main():  # noqa: C901
                 }
             )
 
-            # Load schemas from cache
-            schemas_list = load_cached_schemas()
-            if not schemas_list:
-                # Fallback: build from cached tables
-                schemas_list = sorted({t["schema"] for t in all_tables_dicts})
-                save_schemas_to_cache(schemas_list)
+            remember_catalog(schema_filter, all_tables_dicts, all_columns_dicts)
 
-            jprint({"type": "schemas", "schemas": schemas_list})
+            send_schemas(all_tables_dicts)
             jprint({"type": "progress", "message": "Done", "current": 3, "total": 3})
             jprint({"type": "done"})
-            sys.stderr.write("Loaded from cache, exiting normally\n")
+            sys.stderr.write("Loaded from cache\n")
             sys.stderr.flush()
             return 0
 
@@ -380,9 +1071,6 @@ def main():  # noqa: C901
 
         # Import from absolute paths since this runs as __main__
         # Ensure the src directory is in the Python path for subprocess
-        import sys
-        import os
-
         # Add the src directory to Python path if not already there
         src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "src")
         if src_path not in sys.path:
@@ -394,120 +1082,104 @@ def main():  # noqa: C901
         all_loaded_tables = []
         all_loaded_columns = []
 
-        # Initial chunk
-        sys.stderr.write("Loading initial chunk...\n")
-        sys.stderr.flush()
-        jprint({"type": "progress", "message": "Connecting…", "current": 0, "total": 3})
+        # Read before loading, so tables altered meanwhile look changed next time
+        fingerprints = None
+        if not start_offset:
+            from dbutils.catalog_refresh import fetch_fingerprints
 
-        cached = db_browser.load_from_cache(schema_filter, limit=initial_limit, offset=start_offset)
-        sys.stderr.write(f"DB cache result: {'hit' if cached else 'miss'}\n")
-        sys.stderr.flush()
-        if cached:
-            tables, columns = cached
-        else:
-            tables, columns = db_browser.get_all_tables_and_columns(
-                schema_filter,
-                use_mock,
-                use_cache=True,
-                limit=initial_limit,
-                offset=0,
-            )
+            try:
+                fingerprints = fetch_fingerprints(schema_filter, use_mock)
+            except Exception as e:
+                sys.stderr.write(f"Could not read table fingerprints: {e}\n")
+                sys.stderr.flush()
 
-        all_loaded_tables.extend(tables)
-        all_loaded_columns.extend(columns)
-        loaded_total = len(tables)
-        # Estimate if we likely have more
-        if loaded_total < initial_limit:
-            estimated_total = loaded_total
+        if schema_workers and not schema_filter and not start_offset:
+            complete = stream_schemas_parallel(
+                db_browser, use_mock, schema_workers, initial_limit, batch_size, all_loaded_tables, all_loaded_columns
+            )
         else:
-            estimated_total = loaded_total + batch_size * 4
-
-        sys.stderr.write(f"Sending initial chunk: {loaded_total} tables, {len(columns)} columns\n")
-        sys.stderr.flush()
-        jprint(
-            {
-                "type": "chunk",
-                "tables": to_table_dicts(tables),
-                "columns": to_column_dicts(columns),
-                "loaded": loaded_total,
-                "estimated": estimated_total,
-            },
-        )
-        sys.stderr.write("Sent chunk\n")
-        sys.stderr.flush()
-        jprint({"type": "progress", "message": f"Loaded {loaded_total} tables…", "current": 1, "total": 3})
-
-        # Stream remaining pages with dynamic batch sizing
-        offset = start_offset + initial_limit
-        current_batch_size = batch_size
-        chunk_times = []  # Track recent chunk load times for adaptive sizing
+            # Tables and columns come from one ordered scan each, merge-joined
+            # into chunks, instead of two queries per page
+            sys.stderr.write("Starting catalog scan...\n")
+            sys.stderr.flush()
+            jprint({"type": "progress", "message": "Connecting…", "current": 0, "total": 3})
 
-        while True:
+            scan = db_browser.CatalogScan(
+                schema_filter,
+                chunk_size=batch_size,
+                first_chunk_size=initial_limit,
+                offset=start_offset,
+                use_mock=use_mock,
+            )
+            loaded_total = 0
+            estimated_total = 0
+            chunk_times = []  # Track recent chunk load times for adaptive sizing
             chunk_start = time.time()
 
-            cached = db_browser.load_from_cache(schema_filter, limit=current_batch_size, offset=offset)
-            if cached:
-                t_chunk, c_chunk = cached
-            else:
-                t_chunk, c_chunk = db_browser.get_all_tables_and_columns(
-                    schema_filter,
-                    use_mock,
-                    use_cache=True,
-                    limit=current_batch_size,
-                    offset=offset,
-                )
-
-            chunk_time_ms = (time.time() - chunk_start) * 1000
-            chunk_times.append(chunk_time_ms)
+            for t_chunk, c_chunk in scan:
+                check_cancelled()
+                chunk_time_ms = (time.time() - chunk_start) * 1000
+                first_chunk = loaded_total == 0
+
+                all_loaded_tables.extend(t_chunk)
+                all_loaded_columns.extend(c_chunk)
+                loaded_total += len(t_chunk)
+                if first_chunk:
+                    # Estimate if we likely have more
+                    if loaded_total < initial_limit:
+                        estimated_total = loaded_total
+                    else:
+                        estimated_total = loaded_total + batch_size * 4
+                else:
+                    chunk_times.append(chunk_time_ms)
 
-            if not t_chunk:
-                break
+                send_chunk(
+                    {
+                        "type": "chunk",
+                        "tables": to_table_dicts(t_chunk),
+                        "columns": to_column_dicts(c_chunk),
+                        "loaded": loaded_total,
+                        "estimated": estimated_total,
+                    },
+                )
+                jprint(
+                    {
+                        "type": "progress",
+                        "message": f"Loaded {loaded_total} tables…",
+                        "current": 1 if first_chunk else 2,
+                        "total": 3,
+                    }
+                )
 
-            all_loaded_tables.extend(t_chunk)
-            all_loaded_columns.extend(c_chunk)
-            loaded_total += len(t_chunk)
-            jprint(
-                {
-                    "type": "chunk",
-                    "tables": to_table_dicts(t_chunk),
-                    "columns": to_column_dicts(c_chunk),
-                    "loaded": loaded_total,
-                    "estimated": estimated_total,
-                },
-            )
-            jprint({"type": "progress", "message": f"Loaded {loaded_total} tables…", "current": 2, "total": 3})
-
-            # Adaptive batch sizing: adjust based on recent performance
-            if len(chunk_times) >= 3:
-                avg_time = sum(chunk_times[-3:]) / 3
-
-                if avg_time < TARGET_CHUNK_TIME_MS * 0.5:
-                    # Too fast, increase batch size for efficiency
-                    new_size = min(int(current_batch_size * 1.5), MAX_BATCH_SIZE)
-                    if new_size != current_batch_size:
-                        sys.stderr.write(
-                            f"Increasing batch size: {current_batch_size} -> {new_size} (avg {avg_time:.0f}ms)\n"
-                        )
-                        sys.stderr.flush()
-                        current_batch_size = new_size
-                elif avg_time > TARGET_CHUNK_TIME_MS * 1.5:
-                    # Too slow, decrease batch size for responsiveness
-                    new_size = max(int(current_batch_size * 0.7), MIN_BATCH_SIZE)
-                    if new_size != current_batch_size:
-                        sys.stderr.write(
-                            f"Decreasing batch size: {current_batch_size} -> {new_size} (avg {avg_time:.0f}ms)\n"
-                        )
+                # Adaptive batch sizing: adjust based on recent performance,
+                # of the database or of the UI ingesting chunks, whichever is slower
+                if len(chunk_times) >= 3:
+                    avg_time = sum(chunk_times[-3:]) / 3
+                    if _credit_gate is not None and _credit_gate.ingest_ms is not None:
+                        avg_time = max(avg_time, _credit_gate.ingest_ms)
+                    new_size = adapt_chunk_size(scan.chunk_size, avg_time)
+                    if new_size != scan.chunk_size:
+                        sys.stderr.write(f"Batch size: {scan.chunk_size} -> {new_size} (avg {avg_time:.0f}ms)\n")
                         sys.stderr.flush()
-                        current_batch_size = new_size
-
-            offset += len(t_chunk)
-            if len(t_chunk) < current_batch_size:
-                break
-
-        # Save loaded data to cache for next time (with 24 hour expiration)
-        all_tables_dicts = to_table_dicts(all_loaded_tables)
-        all_columns_dicts = to_column_dicts(all_loaded_columns)
-        save_data_to_cache(schema_filter, all_tables_dicts, all_columns_dicts)
+                        scan.chunk_size = new_size
+
+                # Waiting for credits above does not count as database time
+                chunk_start = time.time()
+
+            if loaded_total == 0:
+                # Always send one chunk so the UI leaves its loading state
+                send_chunk({"type": "chunk", "tables": [], "columns": [], "loaded": 0, "estimated": 0})
+            flush_chunks()
+            complete = True
+
+        # Save loaded data to cache for next time (with 24 hour expiration);
+        # a load with cancelled or failed schemas is missing tables
+        if complete:
+            all_tables_dicts = to_table_dicts(all_loaded_tables)
+            all_columns_dicts = to_column_dicts(all_loaded_columns)
+            save_data_to_cache(schema_filter, all_tables_dicts, all_columns_dicts, fingerprints)
+            if not start_offset:
+                remember_catalog(schema_filter, all_tables_dicts, all_columns_dicts)
 
         # Try to load schemas from cache first
         schemas_list = load_cached_schemas()
@@ -541,9 +1213,14 @@ def main():  # noqa: C901
         jprint({"type": "schemas", "schemas": schemas_list})
         jprint({"type": "progress", "message": "Done", "current": 3, "total": 3})
         jprint({"type": "done"})
-        sys.stderr.write("All done, exiting normally\n")
+        sys.stderr.write("All done\n")
         sys.stderr.flush()
 
+        return 0
+    except LoadCancelled:
+        sys.stderr.write("Load cancelled\n")
+        sys.stderr.flush()
+        jprint({"type": "cancelled"})
         return 0
     except Exception as e:
         import traceback
@@ -0,0 +1,119 @@
+"""Frame-budgeted ingestion of streamed catalog rows into a view.
+
+Inserting a whole loader chunk into the tables model at once (or resetting
+the model for it) makes the proxy and the view process every row before the
+next paint. Instead the browser appends a chunk to its catalog and lets an
+``IngestScheduler`` reveal the new rows in slices: each slice is one
+``beginInsertRows`` batch sized so it fits a per-frame time budget, and the
+scheduler yields to the event loop between slices. The proxy then only
+filters and sorts the rows of each inserted slice.
+
+The module does not depend on Qt; the caller passes in how to insert rows
+and how to run a callback on the next event loop iteration.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, List, Optional, Tuple
+
+# Time one slice may take, leaving the rest of a 60 Hz frame for painting
+DEFAULT_FRAME_BUDGET_MS = 8.0
+
+
+class FrameBudget:
+    """Sizes slices of rows so each takes about ``budget_ms``.
+
+    Keeps a moving average of the measured cost per row; until the first
+    measurement slices are ``initial_rows`` long.
+    """
+
+    def __init__(
+        self,
+        budget_ms: float = DEFAULT_FRAME_BUDGET_MS,
+        initial_rows: int = 256,
+        min_rows: int = 16,
+        max_rows: int = 10000,
+    ):
+        self.budget_ms = budget_ms
+        self.initial_rows = initial_rows
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+        self.row_ms: Optional[float] = None
+
+    def next_size(self) -> int:
+        if self.row_ms is None:
+            return self.initial_rows
+        if self.row_ms <= 0:
+            return self.max_rows
+        return max(self.min_rows, min(self.max_rows, int(self.budget_ms / self.row_ms)))
+
+    def record(self, rows: int, elapsed_ms: float) -> None:
+        if rows <= 0:
+            return
+        cost = max(elapsed_ms, 0.0) / rows
+        self.row_ms = cost if self.row_ms is None else 0.7 * self.row_ms + 0.3 * cost
+
+
+class IngestScheduler:
+    """Feeds pending rows to ``insert`` one budgeted slice per event loop iteration.
+
+    ``insert(limit)`` shows up to ``limit`` more rows and returns how many it
+    showed; ``pending()`` says how many are still waiting; ``defer(fn)`` runs
+    ``fn`` on the next event loop iteration (``QTimer.singleShot(0, fn)``).
+    Call wake() whenever rows were added.
+    """
+
+    def __init__(
+        self,
+        insert: Callable[[int], int],
+        pending: Callable[[], int],
+        defer: Callable[[Callable[[], None]], None],
+        budget: Optional[FrameBudget] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._insert = insert
+        self._pending = pending
+        self._defer = defer
+        self.budget = budget or FrameBudget()
+        self._clock = clock
+        self._scheduled = False
+        self._inserted = 0
+        # (rows inserted when due, callback), in order
+        self._waiting: List[Tuple[int, Callable[[], None]]] = []
+
+    def wake(self) -> None:
+        """Schedule a slice unless one is already scheduled."""
+        if not self._scheduled:
+            self._scheduled = True
+            self._defer(self._run)
+
+    def after_ingested(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once every row pending now has been inserted.
+
+        Also runs when nothing is pending any more for other reasons (the
+        model was reset), so callers waiting on it are never stranded.
+        """
+        self._waiting.append((self._inserted + self._pending(), callback))
+        self.wake()
+
+    def _run(self) -> None:
+        self._scheduled = False
+        more = False
+        try:
+            limit = self.budget.next_size()
+            started = self._clock()
+            count = self._insert(limit)
+            if count:
+                self.budget.record(count, (self._clock() - started) * 1000)
+                self._inserted += count
+            more = self._pending() > 0
+        finally:
+            # A failed insert is not retried, so it releases every waiting
+            # callback; they return loader credits and must not be stranded.
+            due = [cb for mark, cb in self._waiting if not more or mark <= self._inserted]
+            self._waiting = [(mark, cb) for mark, cb in self._waiting if more and mark > self._inserted]
+            if more:
+                self.wake()
+            for callback in due:
+                callback()
@@ -0,0 +1,314 @@
+"""Wire framing between DataLoaderProcess and the data_loader_process subprocess.
+
+The default protocol is newline-delimited JSON. A client may ask for a
+binary framing in its ``start`` command::
+
+  {"cmd": "start", ..., "framings": ["msgpack", "pickle5", "json"]}
+
+The subprocess picks the first framing it supports, answers with a single
+JSON line ``{"type": "hello", "framing": "<name>"}`` and writes every later
+message as a length-prefixed binary frame:
+
+  u32 header_len | u32 buffer_count | u32 buffer_len * buffer_count | header | buffers
+
+All integers are big-endian. For ``pickle5`` the header is a protocol-5
+pickle and the buffers are its out-of-band PickleBuffers. Pickle only puts
+``pickle.PickleBuffer`` values out of band, and the loader's messages hold
+plain lists, dicts and strings, so their frames carry no buffers; the slots
+are there for binary payloads. ``msgpack`` frames never carry buffers.
+msgpack is optional and only offered when importable.
+
+Chunks can also be flow-controlled. A command with ``"credits": n`` lets
+the loader have n "chunk" messages in flight; the client hands a credit
+back for each chunk it has finished ingesting::
+
+  {"cmd": "credit", "n": 1, "ingest_ms": float}
+
+While the loader is out of credits it merges further chunks into one
+(``ChunkSender``), sent as soon as a credit arrives; once that holds too
+many tables it stops reading until then, so neither side buffers more than
+a few chunks.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import struct
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import msgpack
+except Exception:
+    msgpack = None
+
+FRAMING_JSON = "json"
+FRAMING_PICKLE5 = "pickle5"
+FRAMING_MSGPACK = "msgpack"
+
+_U32 = struct.Struct(">I")
+
+# Chunks a flow-controlled loader may send before the client hands credits back
+DEFAULT_CREDITS = 4
+
+
+def available_framings() -> List[str]:
+    """Return framings this interpreter can encode/decode, preferred first."""
+    framings = []
+    if msgpack is not None:
+        framings.append(FRAMING_MSGPACK)
+    framings.append(FRAMING_PICKLE5)
+    framings.append(FRAMING_JSON)
+    return framings
+
+
+def negotiate_framing(requested: Optional[Iterable[str]]) -> str:
+    """Pick the first requested framing that is available, falling back to JSON."""
+    supported = available_framings()
+    for name in requested or ():
+        if name in supported:
+            return name
+    return FRAMING_JSON
+
+
+def encode_message(obj: Any, framing: str) -> bytes:
+    """Encode one message for the wire in the given framing."""
+    if framing == FRAMING_JSON:
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
+    buffers: List[pickle.PickleBuffer] = []
+    if framing == FRAMING_PICKLE5:
+        header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    elif framing == FRAMING_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("msgpack framing requested but msgpack is not installed")
+        header = msgpack.packb(obj, use_bin_type=True)
+    else:
+        raise ValueError(f"Unknown framing: {framing}")
+
+    raws = [b.raw() for b in buffers]
+    parts = [_U32.pack(len(header)), _U32.pack(len(raws))]
+    parts.extend(_U32.pack(r.nbytes) for r in raws)
+    parts.append(header)
+    parts.extend(raws)
+    return b"".join(parts)
+
+
+class FrameDecoder:
+    """Incremental decoder for the loader's stdout stream.
+
+    Starts in JSON-lines mode; a ``hello`` message switches it to the binary
+    framing it announces. Bytes are kept in one bytearray with a read offset,
+    so partial frames never cause the whole buffer to be re-split.
+    """
+
+    def __init__(self):
+        self.framing = FRAMING_JSON
+        self._buf = bytearray()
+        self._pos = 0
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add raw bytes and return every message that is now complete."""
+        if data:
+            self._buf += data
+        out: List[Any] = []
+        while True:
+            msg, ok = self._next()
+            if not ok:
+                break
+            if msg is not None:
+                out.append(msg)
+                if isinstance(msg, dict) and msg.get("type") == "hello":
+                    self.framing = msg.get("framing") or FRAMING_JSON
+        # Compact consumed bytes once they dominate the buffer
+        if self._pos and self._pos * 2 >= len(self._buf):
+            del self._buf[: self._pos]
+            self._pos = 0
+        return out
+
+    def _next(self):
+        """Return (message, True) for one complete message, or (None, False) if more bytes are needed."""
+        if self.framing == FRAMING_JSON:
+            return self._next_line()
+        return self._next_frame()
+
+    def _next_line(self):
+        end = self._buf.find(b"\n", self._pos)
+        if end < 0:
+            return None, False
+        line = bytes(self._buf[self._pos : end]).strip()
+        self._pos = end + 1
+        if not line:
+            return None, True
+        try:
+            return json.loads(line.decode("utf-8", errors="ignore")), True
+        except Exception:
+            # Skip non-JSON noise, matching the line-based reader
+            return None, True
+
+    def _next_frame(self):
+        avail = len(self._buf) - self._pos
+        if avail < 8:
+            return None, False
+        header_len = _U32.unpack_from(self._buf, self._pos)[0]
+        count = _U32.unpack_from(self._buf, self._pos + 4)[0]
+        lens_end = self._pos + 8 + 4 * count
+        if len(self._buf) < lens_end:
+            return None, False
+        lens = [_U32.unpack_from(self._buf, self._pos + 8 + 4 * i)[0] for i in range(count)]
+        frame_end = lens_end + header_len + sum(lens)
+        if len(self._buf) < frame_end:
+            return None, False
+
+        view = memoryview(self._buf)
+        try:
+            header = bytes(view[lens_end : lens_end + header_len])
+            offset = lens_end + header_len
+            buffers = []
+            for n in lens:
+                buffers.append(bytes(view[offset : offset + n]))
+                offset += n
+        finally:
+            view.release()
+        self._pos = frame_end
+
+        if self.framing == FRAMING_PICKLE5:
+            return pickle.loads(header, buffers=buffers), True
+        if self.framing == FRAMING_MSGPACK:
+            if msgpack is None:
+                raise RuntimeError("msgpack frame received but msgpack is not installed")
+            return msgpack.unpackb(header, raw=False), True
+        raise ValueError(f"Unknown framing: {self.framing}")
+
+
+class CreditGate:
+    """Credits granted by the client for sending chunks.
+
+    Also keeps a moving average of the client's reported ingest time per
+    chunk in ``ingest_ms`` (None until the first report). ``on_grant`` is
+    called, on the granting thread, after credits were added.
+    """
+
+    def __init__(self, credits: int = DEFAULT_CREDITS):
+        self._credits = credits
+        self._closed = False
+        self._cond = threading.Condition()
+        self.ingest_ms: Optional[float] = None
+        self.on_grant: Optional[Callable[[], None]] = None
+
+    @property
+    def available(self) -> int:
+        with self._cond:
+            return self._credits
+
+    def grant(self, n: int = 1, ingest_ms: Optional[float] = None) -> None:
+        with self._cond:
+            self._credits += n
+            if ingest_ms is not None:
+                self.ingest_ms = ingest_ms if self.ingest_ms is None else 0.7 * self.ingest_ms + 0.3 * ingest_ms
+            self._cond.notify_all()
+        on_grant = self.on_grant
+        if on_grant is not None:
+            on_grant()
+
+    def try_acquire(self) -> bool:
+        """Take a credit if one is available, without waiting."""
+        return self.acquire(timeout=0)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take a credit, waiting up to ``timeout`` seconds; True once taken or the gate is closed."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._credits > 0 or self._closed, timeout):
+                return False
+            if self._credits > 0:
+                self._credits -= 1
+            return True
+
+    def close(self) -> None:
+        """Stop limiting: the client will not hand out credits any more."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class ChunkSender:
+    """Sends "chunk" messages within the credits of a CreditGate.
+
+    Without credits, chunks are merged into one pending chunk, which goes
+    out on the thread granting the next credit; ``send`` must therefore be
+    safe to call from that thread. Once the pending chunk holds
+    ``max_pending_tables`` tables, send() waits for a credit, calling
+    ``check`` between waits (it may raise to abort). flush() sends what is
+    pending. Without a gate every chunk is sent at once.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Dict[str, Any]], None],
+        gate: Optional[CreditGate] = None,
+        max_pending_tables: int = 8000,
+        check: Optional[Callable[[], None]] = None,
+    ):
+        self._send = send
+        self.gate = gate
+        self.max_pending_tables = max_pending_tables
+        self._check = check
+        self._pending: Optional[Dict[str, Any]] = None
+        # Guards _pending against the granting thread
+        self._lock = threading.Lock()
+        # Set while send()/flush() wait for a credit and will use it themselves
+        self._waiting = False
+        if gate is not None:
+            gate.on_grant = self._on_grant
+
+    def send(self, msg: Dict[str, Any]) -> None:
+        if self.gate is None:
+            self._send(msg)
+            return
+        with self._lock:
+            self._merge(msg)
+            if self.gate.try_acquire():
+                self._send_pending()
+            elif len(self._pending.get("tables") or ()) >= self.max_pending_tables:
+                self._wait()
+                self._send_pending()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._wait()
+                self._send_pending()
+
+    def _on_grant(self) -> None:
+        if self._waiting:
+            # Also keeps a grant from ``check`` off the lock its caller holds
+            return
+        with self._lock:
+            if self._pending is not None and self.gate.try_acquire():
+                self._send_pending()
+
+    def _merge(self, msg: Dict[str, Any]) -> None:
+        pending = self._pending
+        if pending is None:
+            self._pending = dict(msg, tables=list(msg.get("tables") or ()), columns=list(msg.get("columns") or ()))
+            return
+        pending["tables"].extend(msg.get("tables") or ())
+        pending["columns"].extend(msg.get("columns") or ())
+        pending["loaded"] = msg.get("loaded", pending.get("loaded"))
+        pending["estimated"] = msg.get("estimated", pending.get("estimated"))
+        if pending.get("schema") != msg.get("schema"):
+            pending.pop("schema", None)
+
+    def _wait(self) -> None:
+        self._waiting = True
+        try:
+            while not self.gate.acquire(timeout=0.1):
+                if self._check is not None:
+                    self._check()
+        finally:
+            self._waiting = False
+
+    def _send_pending(self) -> None:
+        msg, self._pending = self._pending, None
+        self._send(msg)
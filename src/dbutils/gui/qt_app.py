@@ -20,7 +20,12 @@ import asyncio
 import json
 import csv
 import logging
-from typing import Dict, List, Optional, Any
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import html
 from dataclasses import dataclass
 
@@ -145,7 +150,16 @@ except ImportError:
 
 # Core helpers & data types from library
 from dbutils.catalog import get_all_tables_and_columns
+from dbutils.catalog_refresh import CatalogDelta
+from dbutils.catalog_store import COLUMN_TYPES, TABLE_TYPES, CatalogStore, count_schema_tables, find_table
+from dbutils.contents_cache import get_contents_cache, page_key
 from dbutils.db_browser import TableInfo, ColumnInfo
+from dbutils.gui.ingest_scheduler import IngestScheduler
+from dbutils.gui.loader_protocol import DEFAULT_CREDITS, ChunkSender, CreditGate
+from dbutils.pagination import RowWindow, build_page_sql, get_key_columns, get_row_estimate, last_key
+from dbutils.prefetch import ContentsPrefetcher, PrefetchConfig
+from dbutils.ranking import DEFAULT_TOP_K, TopKCollector, top_k
+from dbutils.result_set import ResultSet
 from .widgets.enhanced_widgets import BusyOverlay
 
 # Try to import accelerated C extensions for performance (optional)
@@ -159,6 +173,12 @@ except Exception:
     fast_search_columns = None
     USE_FAST_OPS = False
 
+# Incrementally maintained catalog index (native when the extension is built)
+try:
+    from dbutils.fast_ops import FastSearchIndex as CatalogSearchIndex
+except Exception:
+    from dbutils.db_browser import SearchIndex as CatalogSearchIndex
+
 # Qt is a hard runtime requirement — we fail fast if the bindings are missing.
 
 
@@ -172,6 +192,11 @@ class SearchResult:
     table_key: str = ""
 
 
+def _is_ranked(results: List[SearchResult]) -> bool:
+    """Return True if results are already in descending relevance order."""
+    return all(a.relevance_score >= b.relevance_score for a, b in zip(results, results[1:]))
+
+
 class DatabaseModel(QAbstractTableModel):
     """Qt model for database tables with search support."""
 
@@ -179,6 +204,10 @@ class DatabaseModel(QAbstractTableModel):
         super().__init__()
         self._tables: List[TableInfo] = []
         self._columns: Dict[str, List[ColumnInfo]] = {}
+        # Rows of `_tables` the views know about when the model follows a
+        # growing list (the browser's catalog while a load streams in); rows
+        # appended to it are revealed with show_more(). None shows them all.
+        self._shown: Optional[int] = None
         # `_search_results` holds the active search result items when a
         # search is active. We also track `_search_active` so we can
         # distinguish between "no active search (show all tables)" and
@@ -193,25 +222,70 @@ class DatabaseModel(QAbstractTableModel):
     def set_data(self, tables: List[TableInfo], columns: Dict[str, List[ColumnInfo]]):
         """Set the model data."""
         # Check if we can do incremental update
-        old_count = len(self._tables)
+        old_count = self._table_count()
         new_count = len(tables)
 
-        # For small incremental changes, use dataChanged to avoid full reset
-        if old_count > 0 and new_count > old_count and new_count - old_count < 1000:
+        # For small incremental changes, use dataChanged to avoid full reset.
+        # The same list may have been changed anywhere, so it is reset.
+        if tables is not self._tables and old_count > 0 and new_count > old_count and new_count - old_count < 1000:
             # Incremental update - just append
             first_new = old_count
             self.beginInsertRows(QModelIndex(), first_new, new_count - 1)
             self._tables = tables
             self._columns = columns
+            self._shown = None
             self.endInsertRows()
         else:
             # Full reset for large changes or initial load
             self.beginResetModel()
             self._tables = tables
             self._columns = columns
+            self._shown = None
             self._search_results = []
             self.endResetModel()
 
+    def follow(self, tables: List[TableInfo], columns: Dict[str, List[ColumnInfo]]):
+        """Show ``tables`` as it is now; rows appended to it later wait for show_more()."""
+        self.beginResetModel()
+        self._tables = tables
+        self._columns = columns
+        self._shown = len(tables)
+        self._search_results = []
+        self.endResetModel()
+
+    def follows(self, tables: List[TableInfo]) -> bool:
+        """Whether the model was bound to ``tables`` with follow()."""
+        return self._tables is tables and self._shown is not None
+
+    def _table_count(self) -> int:
+        if self._shown is None:
+            return len(self._tables)
+        return min(self._shown, len(self._tables))
+
+    def pending_rows(self) -> int:
+        """Number of rows appended to a followed table list that show_more() has not revealed yet."""
+        if self._shown is None:
+            return 0
+        return max(0, len(self._tables) - self._shown)
+
+    def show_more(self, limit: int) -> int:
+        """Insert up to ``limit`` rows appended to the table list since they were last shown.
+
+        Returns how many rows were inserted. While a search is active the
+        rows are only counted; they show up once the search is cleared.
+        """
+        count = min(limit, self.pending_rows())
+        if count <= 0:
+            return 0
+        if self._search_active:
+            self._shown += count
+            return count
+        first = self._shown
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self._shown += count
+        self.endInsertRows()
+        return count
+
     def set_search_results(self, results: Optional[List[SearchResult]]):
         """Set search results with relevance scoring."""
         self.beginResetModel()
@@ -226,15 +300,32 @@ class DatabaseModel(QAbstractTableModel):
             # (no active search); otherwise we have a non-empty search
             # result list and mark search active.
             self._search_active = bool(results)
-            # Defer sorting for large result sets to avoid blocking
-            # Sort in place is faster than creating new list
             if results:
-                results.sort(key=lambda x: x.relevance_score, reverse=True)
+                # SearchWorker already emits a ranked (bounded top-K) list;
+                # only sort lists that arrive out of order, in place.
+                if not _is_ranked(results):
+                    results.sort(key=lambda x: x.relevance_score, reverse=True)
                 self._search_results = results
             else:
                 self._search_results = []
         self.endResetModel()
 
+    def append_search_results(self, results: List[SearchResult]):
+        """Append a streamed batch of search results without resetting the model.
+
+        Used for SearchWorker.results_delta batches; the final ranked list
+        still replaces everything via set_search_results.
+        """
+        if not results:
+            return
+        if not self._search_active:
+            self.set_search_results(list(results))
+            return
+        first = len(self._search_results)
+        self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+        self._search_results.extend(results)
+        self.endInsertRows()
+
     def rowCount(self, parent=QModelIndex()):
         """Return number of rows."""
         # mark `parent` as used for linters/static analyzers
@@ -244,7 +335,7 @@ class DatabaseModel(QAbstractTableModel):
         # table list.
         if self._search_active:
             return len(self._search_results)
-        return len(self._tables)
+        return self._table_count()
 
     def columnCount(self, parent=QModelIndex()):
         """Return number of columns."""
@@ -272,17 +363,14 @@ class DatabaseModel(QAbstractTableModel):
             item = result.item
 
             # Handle both table and column search results
-            if isinstance(item, TableInfo):
+            if isinstance(item, TABLE_TYPES):
                 table = item
-            elif isinstance(item, ColumnInfo):
+            elif isinstance(item, COLUMN_TYPES):
                 column = item
                 # Find the corresponding table for display
-                for t in self._tables:
-                    if t.name == column.table and t.schema == column.schema:
-                        table = t
-                        break
+                table = find_table(self._tables, column.schema, column.table)
         else:
-            if row >= len(self._tables):
+            if row >= self._table_count():
                 return None
             table = self._tables[row]
 
@@ -573,23 +661,69 @@ class ColumnModel(QAbstractTableModel):
 class TableContentsModel(QAbstractTableModel):
     """Qt model to hold a preview of rows for a selected table.
 
-    Stores a list of column names and a list of rows (each a dict mapping
-    column name to value). This mirrors the lightweight preview used by
-    the GUI and is testable without the rest of Qt code.
+    Stores a list of column names and the rows, either a ResultSet (one
+    header plus row tuples) or a list of dicts mapping column name to value.
+    This mirrors the lightweight preview used by the GUI and is testable
+    without the rest of Qt code.
+
+    For long scroll sessions the rows can instead live in a RowWindow (see
+    set_window): only a bounded number of fetched blocks stay in memory,
+    and touching a row whose block was evicted emits block_requested so
+    the owner can fetch it again.
     """
 
+    block_requested = Signal(int)  # block index to (re)fetch
+
     def __init__(self):
         super().__init__()
         self._columns: List[str] = []
         # _display_columns holds the header labels shown in the view
         # which may be either the column names or descriptive text.
         self._display_columns: List[str] = []
-        self._rows: List[Dict[str, Any]] = []
+        self._rows: Any = []  # ResultSet or List[Dict[str, Any]]
+        self._window: Optional[RowWindow] = None
         self._is_loading = False
         self._loading_message = ""
 
-    def set_contents(self, columns: List[str], rows: List[Dict[str, Any]]):
+    @property
+    def window(self) -> Optional[RowWindow]:
+        return self._window
+
+    @staticmethod
+    def _row_value(rows: Any, r: int, col_name: str) -> Any:
+        if isinstance(rows, ResultSet):
+            # Read straight from the row tuple; no per-row dict or view
+            return rows.value(r, col_name)
+        try:
+            return rows[r].get(col_name)
+        except Exception:
+            return None
+
+    def _value(self, r: int, col_name: str) -> Any:
+        if self._window is not None:
+            hit = self._window.lookup(r)
+            if hit is None:
+                self._request_block(self._window.block_of(r))
+                return None
+            return self._row_value(hit[0], hit[1], col_name)
+        return self._row_value(self._rows, r, col_name)
+
+    def _request_block(self, block: int):
+        window = self._window
+        if window is None or block in window.pending:
+            return
+        window.pending.add(block)
+        self.block_requested.emit(block)
+
+    def set_contents(self, columns: List[str], rows: Any):
         """Replace the model contents with provided columns and rows."""
+        if self._window is not None:
+            # Leaving windowed mode always needs a full reset
+            self.beginResetModel()
+            self._window = None
+            self._rows = []
+            self.endResetModel()
+
         # Check if we can do incremental update for pagination
         old_row_count = len(self._rows)
         new_row_count = len(rows or [])
@@ -610,6 +744,40 @@ class TableContentsModel(QAbstractTableModel):
             self._rows = rows or []
             self.endResetModel()
 
+    def set_window(self, columns: List[str], window: RowWindow):
+        """Show rows from ``window`` instead of a fully held row list."""
+        self.beginResetModel()
+        self._columns = columns or []
+        self._display_columns = list(self._columns)
+        self._rows = []
+        self._window = window
+        self.endResetModel()
+
+    def add_block(self, block: int, rows: Any):
+        """Store a fetched block in the window and notify the view."""
+        window = self._window
+        if window is None:
+            return
+        # Views must hear of the new row count before the window reports it
+        old_count = window.row_count
+        new_count = window.count_after(block, rows)
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            window.put(block, rows)
+            self.endInsertRows()
+        elif new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            window.put(block, rows)
+            self.endRemoveRows()
+        else:
+            window.put(block, rows)
+
+        # Rows of a refetched block were showing as blanks
+        first = block * window.block_size
+        last = min(first + len(rows or []), old_count, new_count) - 1
+        if last >= first and self._columns:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, len(self._columns) - 1))
+
     def clear(self):
         self.set_contents([], [])
         self._is_loading = False
@@ -623,6 +791,7 @@ class TableContentsModel(QAbstractTableModel):
         self._columns = []
         self._display_columns = []
         self._rows = []
+        self._window = None
         self.endResetModel()
 
     def hide_loading(self):
@@ -637,6 +806,8 @@ class TableContentsModel(QAbstractTableModel):
         _ = parent
         if self._is_loading:
             return 1  # Show single placeholder row
+        if self._window is not None:
+            return self._window.row_count
         return len(self._rows)
 
     def columnCount(self, parent=QModelIndex()):
@@ -664,25 +835,14 @@ class TableContentsModel(QAbstractTableModel):
                 return QColor("#888")
             return None
 
-        if r >= len(self._rows) or c >= len(self._columns):
+        if r >= self.rowCount() or c >= len(self._columns):
             return None
 
         col_name = self._columns[c]
-        row = self._rows[r]
 
-        if QT_AVAILABLE and role == Qt.DisplayRole:
+        if QT_AVAILABLE and role in (Qt.DisplayRole, Qt.ToolTipRole):
             # Convert value to string for display
-            try:
-                val = row.get(col_name)
-            except Exception:
-                val = None
-            return "" if val is None else str(val)
-
-        elif QT_AVAILABLE and role == Qt.ToolTipRole:
-            try:
-                val = row.get(col_name)
-            except Exception:
-                val = None
+            val = self._value(r, col_name)
             return "" if val is None else str(val)
 
         return None
@@ -726,239 +886,164 @@ class TableContentsModel(QAbstractTableModel):
 
 
 class SearchWorker(QObject):
-    """Worker for streaming search results."""
+    """Worker for streaming search results.
+
+    Matches are ranked in a bounded top-K heap (``max_results``) rather than
+    collected and sorted in full. While scanning, ``results_delta`` carries
+    only the rows admitted since the previous emit; ``results_ready`` carries
+    the final ranked list once the scan is done.
+    """
 
     results_ready = Signal(list)
+    results_delta = Signal(list)
     search_complete = Signal()
     error_occurred = Signal(str)
 
-    def __init__(self):
+    # Emit a delta after this many newly admitted results
+    DELTA_BATCH = 50
+
+    def __init__(self, max_results: int = DEFAULT_TOP_K):
         super().__init__()
         self._search_cancelled = False
+        self.max_results = max_results
 
     def cancel_search(self):
         """Cancel the current search."""
         self._search_cancelled = True
 
-    def perform_search(self, tables: List[TableInfo], columns: List[ColumnInfo], query: str, search_mode: str):
-        """Perform streaming search and emit results as found with improved async behavior."""
-        try:
-            self._search_cancelled = False
-            results = []
-
-            # Use C-accelerated search if available
-            if USE_FAST_OPS:
-                if search_mode == "tables":
-                    scored_results = fast_search_tables(tables, query)
-                    for table, score in scored_results:
-                        if self._search_cancelled:
-                            return
-                        result = SearchResult(
-                            item=table,
-                            match_type="exact" if score >= 1.0 else "fuzzy",
-                            relevance_score=score,
-                            table_key=f"{table.schema}.{table.name}",
-                        )
-                        results.append(result)
-
-                        # Emit results in batches
-                        if len(results) % 10 == 0:
-                            self.results_ready.emit(results.copy())
-
-                elif search_mode == "columns":
-                    scored_results = fast_search_columns(columns, query)
-                    # Collect per-table aggregates and per-column results.
-                    table_matches: dict[str, dict] = {}
-                    column_results: list[tuple[ColumnInfo, float]] = []
-
-                    for col, score in scored_results:
-                        if self._search_cancelled:
-                            return
-                        column_results.append((col, score))
-                        table_key = f"{col.schema}.{col.table}"
-                        entry = table_matches.setdefault(table_key, {"cols": [], "max_score": 0.0})
-                        entry["cols"].append(col)
-                        if score > entry["max_score"]:
-                            entry["max_score"] = score
-
-                        # Emit intermediate column items occasionally to keep UI responsive
-                        if len(column_results) % 15 == 0:
-                            # For streaming responsiveness emit a copy of the
-                            # current column results (not the final aggregates)
-                            interim = [
-                                SearchResult(
-                                    item=c,
-                                    match_type=("exact" if s >= 1.0 else "fuzzy"),
-                                    relevance_score=s,
-                                    table_key=f"{c.schema}.{c.table}",
-                                )
-                                for c, s in column_results
-                            ]
-                            self.results_ready.emit(interim)
-
-                # Build final results combining per-table aggregates and
-                # per-column items so the UI shows tables (with a column
-                # match marker) followed by detailed column matches.
-                table_lookup = {f"{t.schema}.{t.name}": t for t in tables}
-                agg_results = []
-                for t_key, info in table_matches.items():
-                    t_obj = table_lookup.get(t_key)
-                    if t_obj:
-                        count = len(info.get("cols", []))
-                        agg_results.append(
-                            SearchResult(item=t_obj, match_type="column", relevance_score=float(count), table_key=t_key)
-                        )
-
-                agg_results.sort(key=lambda r: -r.relevance_score)
-                col_results_sorted = [
-                    SearchResult(
-                        item=c,
-                        match_type=("exact" if s >= 1.0 else "fuzzy"),
-                        relevance_score=s,
-                        table_key=f"{c.schema}.{c.table}",
-                    )
-                    for c, s in sorted(column_results, key=lambda x: -x[1])
-                ]
-                results = agg_results + col_results_sorted
-                self.search_complete.emit()
+    def _score_tables(self, tables: List[TableInfo], query_lower: str):
+        """Yield (table, score) for tables matching the query (Python fallback)."""
+        for table in tables:
+            if self._search_cancelled:
+                return
+            # Check for match - prioritize fast checks first
+            name_lower = table.name.lower()
+            if query_lower in name_lower:
+                yield table, 1.0
+            elif any(word.startswith(query_lower) for word in name_lower.split("_")):
+                yield table, 0.6
+            elif table.remarks and query_lower in table.remarks.lower():
+                # Process remarks only if needed - this is the expensive operation
+                yield table, 0.8
+
+    def _score_columns(self, columns: List[ColumnInfo], query_lower: str):
+        """Yield (column, score) for columns matching the query (Python fallback)."""
+        for col in columns:
+            if self._search_cancelled:
                 return
+            if query_lower in col.name.lower():
+                yield col, 1.0
+            elif query_lower in col.typename.lower():
+                yield col, 0.7
+            elif col.remarks and query_lower in col.remarks.lower():
+                yield col, 0.5
 
-            # Fallback to Python implementation
-            if search_mode == "tables":
-                # Table search with improved async behavior
-                query_lower = query.lower()
-                for i, table in enumerate(tables):
-                    if self._search_cancelled:
-                        return
-
-                    # Check for match - prioritize fast checks first
-                    match_score = 0.0
-                    if query_lower in table.name.lower():
-                        match_score = 1.0
-                    elif any(word.startswith(query_lower) for word in table.name.lower().split("_")):
-                        match_score = 0.6
-                    elif table.remarks:
-                        # Process remarks only if needed - this is the expensive operation
-                        if query_lower in table.remarks.lower():
-                            match_score = 0.8
-
-                    if match_score > 0:
-                        result = SearchResult(
-                            item=table,
-                            match_type="exact" if query_lower in table.name.lower() else "fuzzy",
-                            relevance_score=match_score,
-                            table_key=f"{table.schema}.{table.name}",
-                        )
-                        results.append(result)
+    @staticmethod
+    def _to_search_results(ranked) -> List[SearchResult]:
+        """Wrap ranked (item, score) pairs in SearchResult objects."""
+        out = []
+        for item, score in ranked:
+            if isinstance(item, COLUMN_TYPES):
+                table_key = f"{item.schema}.{item.table}"
+            else:
+                table_key = f"{item.schema}.{item.name}"
+            out.append(
+                SearchResult(
+                    item=item,
+                    match_type="exact" if score >= 1.0 else "fuzzy",
+                    relevance_score=score,
+                    table_key=table_key,
+                )
+            )
+        return out
 
-                        # Emit results more frequently for better streaming UX
-                        if len(results) % 3 == 0:  # Emit every 3 results instead of 5
-                            self.results_ready.emit(results.copy())
+    def perform_search(
+        self,
+        tables: List[TableInfo],
+        columns: List[ColumnInfo],
+        query: str,
+        search_mode: str,
+        index=None,
+        index_lock=None,
+    ):
+        """Perform streaming search and emit ranked results as they are found.
 
-                    # Yield point for better async behavior - signal emits will process events
-                    if i % 20 == 0:
-                        # Just emit current results to keep UI updated
-                        if results:
-                            self.results_ready.emit(results.copy())
+        When a ``index`` (SearchIndex/FastSearchIndex) is passed, its trigram
+        index supplies the tables/columns that contain the query, and only
+        those are scored instead of scanning and lowercasing the whole catalog.
+        ``index_lock`` is held while the index is read; the GUI thread takes
+        it to add streamed chunks.
+        """
+        try:
+            self._search_cancelled = False
 
-            elif search_mode == "columns":
-                # Column search with improved async behavior
-                query_lower = query.lower()
-                # Build per-table aggregation and per-column listings
-                table_matches = {}
-                column_results = []
-
-                for i, col in enumerate(columns):
-                    if self._search_cancelled:
-                        return
-
-                    # Check for match - prioritize fast checks first
-                    match_score = 0.0
-                    if query_lower in col.name.lower():
-                        match_score = 1.0
-                    elif query_lower in col.typename.lower():
-                        match_score = 0.7
-                    elif col.remarks:
-                        # Process remarks only if needed - this is the expensive operation
-                        if query_lower in col.remarks.lower():
-                            match_score = 0.5
-
-                    if match_score > 0:
-                        table_key = f"{col.schema}.{col.table}"
-                        entry = table_matches.setdefault(table_key, {"cols": [], "max_score": 0.0})
-                        entry["cols"].append(col)
-                        if match_score > entry["max_score"]:
-                            entry["max_score"] = match_score
-
-                        # Collect per-column results for later emission
-                        column_results.append((col, match_score))
-
-                        # Emit intermediate column items occasionally to keep UI responsive
-                        if len(column_results) % 5 == 0:
-                            interim = [
-                                SearchResult(
-                                    item=c,
-                                    match_type=("exact" if (query_lower in c.name.lower()) else "fuzzy"),
-                                    relevance_score=s,
-                                    table_key=f"{c.schema}.{c.table}",
-                                )
-                                for c, s in column_results
-                            ]
-                            self.results_ready.emit(interim)
-
-                    # Yield point - emit results to update UI
-                    if i % 20 == 0 and column_results:
-                        interim = [
-                            SearchResult(
-                                item=c,
-                                match_type=("exact" if (query_lower in c.name.lower()) else "fuzzy"),
-                                relevance_score=s,
-                                table_key=f"{c.schema}.{c.table}",
-                            )
-                            for c, s in column_results
-                        ]
-                        self.results_ready.emit(interim)
-
-            # Emit final results. For column-mode, synthesize aggregate table
-            # SearchResult entries (type TableInfo with match_type 'column')
-            # so tables containing matching columns appear as matches as well.
-            if search_mode == "columns":
-                # Build table lookup
-                table_lookup = {f"{t.schema}.{t.name}": t for t in tables}
-                agg_results: list[SearchResult] = []
-
-                for t_key, info in table_matches.items():
-                    t_obj = table_lookup.get(t_key)
-                    if t_obj:
-                        count = len(info.get("cols", []))
-                        # Use count as a simple relevance proxy
-                        agg_results.append(
-                            SearchResult(item=t_obj, match_type="column", relevance_score=float(count), table_key=t_key)
-                        )
+            if index is not None and query.strip():
+                with index_lock or nullcontext():
+                    if search_mode == "tables":
+                        tables = [t for t, _mask in index.substring_tables(query)]
+                    elif search_mode == "columns":
+                        # Keep the full table list for the per-table aggregates
+                        columns = [c for c, _mask in index.substring_columns(query)]
 
-                # Sort aggregates by descending count then append column results sorted by score
-                agg_results.sort(key=lambda r: -r.relevance_score)
+            # Use C-accelerated scoring if available
+            if search_mode == "tables":
+                if USE_FAST_OPS:
+                    scored = fast_search_tables(tables, query)
+                else:
+                    scored = self._score_tables(tables, query.lower())
+            elif search_mode == "columns":
+                if USE_FAST_OPS:
+                    scored = fast_search_columns(columns, query)
+                else:
+                    scored = self._score_columns(columns, query.lower())
+            else:
+                scored = ()
+
+            collector = TopKCollector(self.max_results)
+            # Per-table match counts for column mode; only ints, not result objects
+            table_counts: Dict[Tuple[str, str], int] = {}
+            pending = 0
+            for item, score in scored:
+                if self._search_cancelled:
+                    return
+                if search_mode == "columns":
+                    t_ref = (item.schema, item.table)
+                    table_counts[t_ref] = table_counts.get(t_ref, 0) + 1
+                if collector.offer(score, item):
+                    pending += 1
+                    # Stream only what is new since the last emit
+                    if pending >= self.DELTA_BATCH:
+                        self.results_delta.emit(self._to_search_results(collector.drain_delta()))
+                        pending = 0
+            if self._search_cancelled:
+                return
 
-                col_results_sorted = []
-                try:
-                    # For fast path column_results may exist
-                    if "column_results" in locals():
-                        col_results_sorted = [
-                            SearchResult(
-                                item=c,
-                                match_type=("exact" if s >= 1.0 else "fuzzy"),
-                                relevance_score=s,
-                                table_key=f"{c.schema}.{c.table}",
-                            )
-                            for c, s in sorted(column_results, key=lambda x: -x[1])
-                        ]
-                except Exception:
-                    col_results_sorted = results
+            results = self._to_search_results(collector.results())
+
+            # For column-mode, synthesize aggregate table SearchResult entries
+            # (type TableInfo with match_type 'column') so tables containing
+            # matching columns appear ahead of the detailed column matches.
+            if search_mode == "columns" and table_counts:
+                # Resolve only the matched tables, through the store's index when
+                # the catalog has one, instead of keying every table by name
+                matched = ((find_table(tables, schema, name), count) for (schema, name), count in table_counts.items())
+                # Use the match count as a simple relevance proxy
+                best_tables = top_k(
+                    ((table, float(count)) for table, count in matched if table is not None),
+                    self.max_results,
+                )
+                agg_results = [
+                    SearchResult(
+                        item=table,
+                        match_type="column",
+                        relevance_score=count,
+                        table_key=f"{table.schema}.{table.name}",
+                    )
+                    for table, count in best_tables
+                ]
+                results = agg_results + results
 
-                final = agg_results + col_results_sorted
-                self.results_ready.emit(final)
-            else:
-                self.results_ready.emit(results)
+            self.results_ready.emit(results)
             self.search_complete.emit()
 
         except Exception as e:
@@ -973,12 +1058,14 @@ class TableContentsWorker(QObject):
     with (columns, rows) upon success, or error_occurred on failures.
     """
 
-    results_ready = Signal(list, list)
+    results_ready = Signal(list, object)  # (columns, rows as ResultSet or list[dict])
     error_occurred = Signal(str)
 
     def __init__(self):
         super().__init__()
         self._cancelled = False
+        self.key_columns = ()
+        self.last_key = None
 
     def cancel(self):
         self._cancelled = True
@@ -1006,175 +1093,250 @@ class TableContentsWorker(QObject):
         use_mock: bool = False,
         table_columns: Optional[Dict] = None,
         db_file: Optional[str] = None,
+        after_key: Optional[Sequence[Any]] = None,
     ):
         """Perform a fetch and emit results_ready(columns, rows).
 
+        See fetch_page for how the query is built. After the fetch,
+        ``key_columns`` and ``last_key`` hold the ordering key and the key
+        of the last row, for the caller to pass back as after_key.
+        """
+        try:
+            self._cancelled = False
+            self.key_columns = ()
+            self.last_key = None
+
+            columns, rows, key_columns = self.fetch_page(
+                schema,
+                table,
+                limit=limit,
+                start_offset=start_offset,
+                column_filter=column_filter,
+                value=value,
+                where_clause=where_clause,
+                use_mock=use_mock,
+                table_columns=table_columns,
+                db_file=db_file,
+                after_key=after_key,
+            )
+
+            if self._cancelled:
+                return
+
+            self.key_columns = key_columns
+            self.last_key = last_key(rows, key_columns)
+            self.results_ready.emit(columns, rows)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    @classmethod
+    def fetch_page(
+        cls,
+        schema: str,
+        table: str,
+        limit: int = 25,
+        start_offset: int = 0,
+        column_filter: Optional[str] = None,
+        value: Optional[str] = None,
+        where_clause: Optional[str] = None,
+        use_mock: bool = False,
+        table_columns: Optional[Dict] = None,
+        db_file: Optional[str] = None,
+        after_key: Optional[Sequence[Any]] = None,
+    ) -> Tuple[List[str], Any, Tuple[str, ...]]:
+        """Fetch one page of rows and return ``(columns, rows, key_columns)``.
+
         - If where_clause is provided it is used verbatim (caller responsibility).
         - Otherwise, if column_filter and value are provided, a WHERE clause is constructed
           using heuristic quoting based on column types.
+        - Rows are ordered by the table's primary key (or a unique index) when one
+          exists; after_key (the last key of the previous page) then seeks past
+          the previous page instead of using OFFSET.
         - If use_mock is True, generates mock row data instead of querying database.
         - If db_file is provided, queries SQLite database instead of DB2.
-        """
-        try:
-            self._cancelled = False
 
-            # Handle SQLite database
-            if db_file:
-                import sqlite3
-                
-                conn = sqlite3.connect(db_file)
-                conn.row_factory = sqlite3.Row  # Enable column name access
-                cursor = conn.cursor()
-                
-                # Build WHERE clause
-                where = ""
-                if where_clause:
-                    where = f" WHERE {where_clause}"
-                elif column_filter and (value is not None):
-                    # SQLite handles quoting more simply
-                    safe_val = str(value).replace("'", "''")
-                    where = f" WHERE {column_filter} = '{safe_val}'"
-                
-                # Build query with LIMIT and OFFSET
-                sql = f"SELECT * FROM {table}{where} LIMIT {int(limit)} OFFSET {int(start_offset)}"
-                
-                cursor.execute(sql)
-                rows_data = cursor.fetchall()
-                
-                # Convert to list of dicts
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                rows = []
-                for row in rows_data:
-                    row_dict = {col: row[col] for col in columns}
-                    rows.append(row_dict)
-                
-                conn.close()
-                
-                if self._cancelled:
-                    return
-                
-                self.results_ready.emit(columns, rows)
-                return
+        Pages already in the contents cache are returned without a query.
 
-            # Import here so worker can be used in tests without heavy imports at module load
-            from dbutils.db_browser import query_runner
+        Errors are raised. This touches no Qt state, so it is safe to call
+        from any thread.
+        """
+        cache = get_contents_cache()
 
-            # Build base SQL
-            tbl = f"{schema}.{table}"
+        # Handle SQLite database
+        if db_file:
+            import sqlite3
 
+            # Build WHERE clause
             where = ""
             if where_clause:
                 where = f" WHERE {where_clause}"
             elif column_filter and (value is not None):
-                # Try to be type-aware: attempt to inspect column metadata via catalog
-                try:
-                    # Caller is expected to have table_columns mapping; attempt to import metadata helper(s)
-                    from dbutils.catalog import get_columns_for_table as _get_cols_fn
-                except Exception:
-                    _get_cols_fn = None
+                # SQLite handles quoting more simply
+                safe_val = str(value).replace("'", "''")
+                where = f" WHERE {column_filter} = '{safe_val}'"
 
-                # Some legacy code/tests provide `get_columns` instead - check that too
-                try:
-                    from dbutils.catalog import get_columns as _get_cols_alt
-                except Exception:
-                    _get_cols_alt = None
+            cache_key = page_key(f"sqlite:{db_file}", schema, table, where, start_offset, limit)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-                is_str = True
-                if _get_cols_fn or _get_cols_alt:
-                    try:
-                        cols = None
-                        if _get_cols_fn:
-                            cols = _get_cols_fn(schema, table)
-                        elif _get_cols_alt:
-                            cols = _get_cols_alt(schema, table)
+            conn = sqlite3.connect(db_file)
+            cursor = conn.cursor()
 
-                        # find the column definition
-                        found = None
-                        if cols:
-                            for c in cols:
-                                if isinstance(c, dict):
-                                    if c.get("COLNAME") == column_filter or c.get("name") == column_filter:
-                                        found = c
-                                        break
-                                else:
-                                    if getattr(c, "name", None) == column_filter:
-                                        found = c
-                                        break
+            # Build query with LIMIT and OFFSET
+            sql = f"SELECT * FROM {table}{where} LIMIT {int(limit)} OFFSET {int(start_offset)}"
 
-                        if found:
-                            typename = (
-                                found.get("TYPENAME") if isinstance(found, dict) else getattr(found, "typename", None)
-                            )
-                            is_str = self._is_string_type(typename)
-                    except Exception:
-                        # best-effort fallback
-                        is_str = True
+            cursor.execute(sql)
 
-                # Quote or not
-                if is_str:
-                    safe_val = str(value).replace("'", "''")
-                    where = f" WHERE {column_filter} = '{safe_val}'"
-                else:
-                    where = f" WHERE {column_filter} = {value}"
+            # Keep plain row tuples under one column header
+            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+            rows = ResultSet(columns, cursor.fetchall())
 
-            # Include offset for pagination when requested (OFFSET <n> ROWS)
-            # NOTE: OFFSET requires a stable ORDER BY for predictable results
-            # We'll order by the first column as a simple heuristic
-            # TODO: Use primary key columns if available for better performance
-            order_by = " ORDER BY 1"
+            conn.close()
 
-            if int(start_offset) > 0:
-                sql = f"SELECT * FROM {tbl}{where}{order_by} OFFSET {int(start_offset)} ROWS FETCH FIRST {int(limit)} ROWS ONLY"
-            else:
-                sql = f"SELECT * FROM {tbl}{where}{order_by} FETCH FIRST {int(limit)} ROWS ONLY"
+            page = (columns, rows, ())
+            cache.put(cache_key, page, rows)
+            return page
 
-            # Run the query
-            rows = []
+        # Import here so worker can be used in tests without heavy imports at module load
+        from dbutils.connection_pool import env_connection_key
+        from dbutils.db_browser import query_runner
+
+        # Build base SQL
+        tbl = f"{schema}.{table}"
+
+        where = ""
+        if where_clause:
+            where = f" WHERE {where_clause}"
+        elif column_filter and (value is not None):
+            # Try to be type-aware: attempt to inspect column metadata via catalog
             try:
-                rows = query_runner(sql) or []
-            except Exception as e:
-                # If in mock mode, generate mock data instead of failing
-                if use_mock and table_columns:
-                    rows = []
-                    for row_id in range(int(start_offset), int(start_offset) + int(limit)):
-                        row_data = {}
-                        for i, col in enumerate(table_columns):
-                            col_name = col.name
-                            # Generate mock data based on column type
-                            if "INT" in (col.typename or "").upper():
-                                row_data[col_name] = row_id * 100 + i
-                            elif "DECIMAL" in (col.typename or "").upper() or "FLOAT" in (col.typename or "").upper():
-                                row_data[col_name] = float(row_id) * 10.5 + float(i)
-                            elif "DATE" in (col.typename or "").upper():
-                                # Generate dates with rotation
-                                day = (row_id % 28) + 1
-                                month = ((row_id // 28) % 12) + 1
-                                row_data[col_name] = f"2024-{month:02d}-{day:02d}"
+                # Caller is expected to have table_columns mapping; attempt to import metadata helper(s)
+                from dbutils.catalog import get_columns_for_table as _get_cols_fn
+            except Exception:
+                _get_cols_fn = None
+
+            # Some legacy code/tests provide `get_columns` instead - check that too
+            try:
+                from dbutils.catalog import get_columns as _get_cols_alt
+            except Exception:
+                _get_cols_alt = None
+
+            is_str = True
+            if _get_cols_fn or _get_cols_alt:
+                try:
+                    cols = None
+                    if _get_cols_fn:
+                        cols = _get_cols_fn(schema, table)
+                    elif _get_cols_alt:
+                        cols = _get_cols_alt(schema, table)
+
+                    # find the column definition
+                    found = None
+                    if cols:
+                        for c in cols:
+                            if isinstance(c, dict):
+                                if c.get("COLNAME") == column_filter or c.get("name") == column_filter:
+                                    found = c
+                                    break
                             else:
-                                # String/default
-                                row_data[col_name] = f"{table}.{col_name}.row{row_id}"
-                        rows.append(row_data)
-                else:
-                    # Bubble to error emission
-                    self.error_occurred.emit(str(e))
-                    return
+                                if getattr(c, "name", None) == column_filter:
+                                    found = c
+                                    break
 
-            # Try to infer columns
-            columns = []
-            if rows:
-                first = rows[0]
-                if isinstance(first, dict):
-                    columns = list(first.keys())
-                else:
-                    # if tuples returned, we cannot know column names here; return empty list (UI can use metadata)
-                    columns = []
+                    if found:
+                        typename = (
+                            found.get("TYPENAME") if isinstance(found, dict) else getattr(found, "typename", None)
+                        )
+                        is_str = cls._is_string_type(typename)
+                except Exception:
+                    # best-effort fallback
+                    is_str = True
 
-            if self._cancelled:
-                return
+            # Quote or not
+            if is_str:
+                safe_val = str(value).replace("'", "''")
+                where = f" WHERE {column_filter} = '{safe_val}'"
+            else:
+                where = f" WHERE {column_filter} = {value}"
+
+        # Order by a unique key so later pages can seek past the last key
+        # instead of re-reading OFFSET rows; fall back to ORDER BY 1 + OFFSET
+        key_columns = () if use_mock else get_key_columns(schema, table)
+        if not use_mock and not where and not start_offset:
+            # Look the row estimate up here, off the GUI thread, for the row window
+            get_row_estimate(schema, table)
+        sql = build_page_sql(
+            tbl,
+            where[len(" WHERE ") :] if where else "",
+            limit=limit,
+            offset=start_offset,
+            key_columns=key_columns,
+            after_key=after_key,
+        )
 
-            self.results_ready.emit(columns, rows)
+        # Repeated previews (re-selecting a table, re-applying a filter) are served locally
+        seek = bool(key_columns) and after_key is not None and len(after_key) == len(key_columns)
+        cache_key = page_key(
+            env_connection_key(),
+            schema,
+            table,
+            where,
+            start_offset,
+            limit,
+            after_key if seek else None,
+        )
+        if not use_mock:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Run the query
+        rows = []
+        try:
+            rows = query_runner(sql) or []
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            # If in mock mode, generate mock data instead of failing
+            if use_mock and table_columns:
+                rows = []
+                for row_id in range(int(start_offset), int(start_offset) + int(limit)):
+                    row_data = {}
+                    for i, col in enumerate(table_columns):
+                        col_name = col.name
+                        # Generate mock data based on column type
+                        if "INT" in (col.typename or "").upper():
+                            row_data[col_name] = row_id * 100 + i
+                        elif "DECIMAL" in (col.typename or "").upper() or "FLOAT" in (col.typename or "").upper():
+                            row_data[col_name] = float(row_id) * 10.5 + float(i)
+                        elif "DATE" in (col.typename or "").upper():
+                            # Generate dates with rotation
+                            day = (row_id % 28) + 1
+                            month = ((row_id // 28) % 12) + 1
+                            row_data[col_name] = f"2024-{month:02d}-{day:02d}"
+                        else:
+                            # String/default
+                            row_data[col_name] = f"{table}.{col_name}.row{row_id}"
+                    rows.append(row_data)
+            else:
+                # Bubble to error emission
+                raise
+
+        # Try to infer columns
+        columns = []
+        if isinstance(rows, ResultSet):
+            columns = list(rows.columns)
+        elif rows:
+            first = rows[0]
+            if isinstance(first, dict):
+                columns = list(first.keys())
+            else:
+                # if tuples returned, we cannot know column names here; return empty list (UI can use metadata)
+                columns = []
+
+        page = (columns, rows, key_columns)
+        if not use_mock:
+            cache.put(cache_key, page, rows)
+        return page
 
 
 class DataLoaderWorker(QObject):
@@ -1186,12 +1348,68 @@ class DataLoaderWorker(QObject):
     missing_driver_detected = Signal(str)  # Emits provider_name when missing JDBC driver is detected
     progress_updated = Signal(str)
     progress_value = Signal(int, int)  # (current, total)
+    schema_progress = Signal(str, int, str)  # (schema, tables loaded, state) in parallel loads
+    catalog_stale = Signal(bool)  # True while chunks come from an expired cache being revalidated
+    catalog_delta = Signal(object, object, object)  # (tables, columns, removed (schema, table) keys)
 
-    def __init__(self):
+    def __init__(self, credits: int = 0):
         super().__init__()
+        self._schema_loader = None
+        # With credits, at most that many chunks wait for the UI (which calls
+        # grant_credit as it takes them in); more are merged until it does
+        self._credits = CreditGate(credits) if credits else None
+        self._chunks = ChunkSender(self._emit_chunk, self._credits)
+
+    def cancel_schema(self, schema: Optional[str] = None):
+        """Cancel one schema of a parallel load, or all of it when None. Safe from any thread."""
+        loader = self._schema_loader
+        if loader is not None:
+            loader.cancel(schema)
+        if schema is None and self._credits is not None:
+            # Nobody will take in further chunks
+            self._credits.close()
+
+    def grant_credit(self, ingest_ms: Optional[float] = None):
+        """Let the loader send another chunk; the UI has taken one in. Safe from any thread."""
+        if self._credits is not None:
+            self._credits.grant(1, ingest_ms)
+
+    def _emit_chunk(self, chunk: Dict[str, Any]):
+        self.chunk_loaded.emit(chunk["tables"], chunk["columns"], chunk["loaded"], chunk["estimated"])
+
+    def _send_chunk(self, tables, columns, loaded: int, estimated: int):
+        self._chunks.send(
+            {"type": "chunk", "tables": tables, "columns": columns, "loaded": loaded, "estimated": estimated}
+        )
 
-    def load_data(self, schema_filter: Optional[str], use_mock: bool, start_offset: int = 0, use_heavy_mock: bool = False, db_file: Optional[str] = None):
-        """Load database data in background thread with granular progress updates and chunked streaming."""
+    def load_data(self, schema_filter: Optional[str], use_mock: bool, start_offset: int = 0, use_heavy_mock: bool = False, db_file: Optional[str] = None, stale_ok: bool = False):
+        """Load database data in background thread with granular progress updates and chunked streaming.
+
+        With ``stale_ok`` an expired data cache is shown at once (see
+        catalog_stale) and the changes found revalidating it arrive through
+        catalog_delta.
+        """
+        from dbutils.connection_pool import pooled_session
+
+        if self._schema_workers(schema_filter, start_offset, use_heavy_mock, db_file):
+            # Schema scans borrow their own connections; one pinned here would only shrink the pool
+            self._load_data(schema_filter, use_mock, start_offset, use_heavy_mock, db_file, stale_ok)
+            return
+        # Pin one pooled connection to this thread so every page reuses a warm session
+        with pooled_session():
+            self._load_data(schema_filter, use_mock, start_offset, use_heavy_mock, db_file, stale_ok)
+
+    @staticmethod
+    def _schema_workers(schema_filter: Optional[str], start_offset: int, use_heavy_mock: bool, db_file: Optional[str]) -> int:
+        """Return how many schemas to load in parallel, or 0 for the paged loader."""
+        from dbutils.schema_loader import SchemaLoadConfig
+
+        # Whole-catalog loads can fan out across schemas instead of paging serially
+        if schema_filter or db_file or use_heavy_mock or start_offset:
+            return 0
+        return SchemaLoadConfig.from_env().workers
+
+    def _load_data(self, schema_filter: Optional[str], use_mock: bool, start_offset: int = 0, use_heavy_mock: bool = False, db_file: Optional[str] = None, stale_ok: bool = False):
         try:
             # Prefer async loader with pagination to avoid huge initial transfer
             self.progress_updated.emit("Connecting to database…")
@@ -1206,6 +1424,16 @@ class DataLoaderWorker(QObject):
 
             initial_limit = 200
             batch_size = 500
+
+            # Stale-while-revalidate: paint from an expired cache, then send only what changed
+            if stale_ok and not (start_offset or use_heavy_mock or db_file):
+                if self._load_stale(schema_filter, use_mock, initial_limit, batch_size):
+                    return
+
+            schema_workers = self._schema_workers(schema_filter, start_offset, use_heavy_mock, db_file)
+            if schema_workers:
+                self._load_schemas_parallel(use_mock, schema_workers, initial_limit, batch_size)
+                return
             loaded_total = 0
             estimated_total = 0  # Unknown until we probe
 
@@ -1222,7 +1450,7 @@ class DataLoaderWorker(QObject):
             # Emit first chunk immediately so UI becomes usable
             self.progress_updated.emit(f"Loaded {len(tables)} tables (initial chunk)…")
             self.progress_value.emit(1, 3)
-            self.chunk_loaded.emit(tables, columns, loaded_total, estimated_total)
+            self._send_chunk(tables, columns, loaded_total, estimated_total)
 
             # Estimate total tables count (best effort)
             try:
@@ -1255,7 +1483,7 @@ class DataLoaderWorker(QObject):
                 loaded_total += len(t_chunk)
                 self.progress_updated.emit(f"Loaded {loaded_total} tables…")
                 # Emit chunk to UI
-                self.chunk_loaded.emit(t_chunk, c_chunk, loaded_total, estimated_total)
+                self._send_chunk(t_chunk, c_chunk, loaded_total, estimated_total)
 
                 # Advance
                 offset += len(t_chunk)
@@ -1263,6 +1491,8 @@ class DataLoaderWorker(QObject):
                 if len(t_chunk) < batch_size:
                     more = False
 
+            self._chunks.flush()
+
             # After streaming chunks, fetch schemas list (one light query)
             self.progress_updated.emit("Loading available schemas…")
             all_tables = get_tables(mock=use_mock)
@@ -1280,23 +1510,205 @@ class DataLoaderWorker(QObject):
             else:
                 self.error_occurred.emit(str(e))
 
+    def _load_stale(self, schema_filter: Optional[str], use_mock: bool, initial_limit: int, batch_size: int) -> bool:
+        """Show an expired data cache at once, then revalidate it and emit only the changes.
+
+        Returns False when there is no expired cache to start from; the
+        catalog is then loaded as usual.
+        """
+        from dbutils.gui import data_loader_process as cache
+
+        if cache.is_cache_valid(cache.get_data_cache_path(schema_filter)):
+            return False
+        stale_data = cache.load_stale_data(schema_filter)
+        if not stale_data:
+            return False
+        stale_tables = stale_data.get("tables", [])
+        stale_columns = stale_data.get("columns", [])
+
+        self.catalog_stale.emit(True)
+        self.progress_updated.emit("Loading from cache (refreshing)…")
+        for chunk in cache.cached_chunks(stale_tables, stale_columns, initial_limit, batch_size):
+            tables, columns = _loader_chunk_infos(chunk)
+            self._send_chunk(tables, columns, chunk["loaded"], chunk["estimated"])
+        self._chunks.flush()
+        self.progress_value.emit(1, 3)
+
+        self.progress_updated.emit("Refreshing catalog…")
+        fresh_tables, fresh_columns = cache.revalidate_data(schema_filter, use_mock, stale_data, batch_size)
+        for msg in cache.delta_messages(stale_tables, stale_columns, fresh_tables, fresh_columns, batch_size):
+            tables, columns = _loader_chunk_infos(msg)
+            self.catalog_delta.emit(tables, columns, [tuple(key) for key in msg["removed"]])
+        self.catalog_stale.emit(False)
+
+        self.progress_value.emit(3, 3)
+        self.data_loaded.emit([], [], sorted({t["schema"] for t in fresh_tables}))
+        return True
+
+    def _load_schemas_parallel(self, use_mock: bool, workers: int, initial_limit: int, batch_size: int):
+        """Load every schema concurrently, emitting chunks in the order they arrive."""
+        from dbutils.db_browser import get_available_schemas
+        from dbutils.schema_loader import LOADING, ParallelSchemaLoader
+
+        self.progress_updated.emit("Loading schema list…")
+        schemas = get_available_schemas(use_mock)
+        estimated_total = sum(s.table_count for s in schemas)
+
+        loader = ParallelSchemaLoader(
+            [s.name for s in schemas],
+            workers=workers,
+            chunk_size=batch_size,
+            first_chunk_size=initial_limit,
+            use_mock=use_mock,
+        )
+        self._schema_loader = loader
+        loaded_total = 0
+        finished = 0
+        try:
+            for chunk in loader:
+                if chunk.state == LOADING:
+                    loaded_total += len(chunk.tables)
+                    self._send_chunk(chunk.tables, chunk.columns, loaded_total, max(estimated_total, loaded_total))
+                else:
+                    finished += 1
+                    self.progress_value.emit(finished, len(schemas))
+                self.schema_progress.emit(chunk.schema, chunk.loaded, chunk.state)
+                self.progress_updated.emit(f"Loaded {loaded_total} tables ({finished}/{len(schemas)} schemas)…")
+        finally:
+            self._schema_loader = None
+
+        self._chunks.flush()
+        self.data_loaded.emit([], [], sorted(s.name for s in schemas))
+
+
+def _loader_chunk_infos(msg: Dict[str, Any]):
+    """Convert a loader chunk's table/column dicts to TableInfo/ColumnInfo lists.
+
+    A chunk sent as a catalog segment is mapped instead, its strings decoded
+    (this runs off the GUI thread) and its row views returned as they are,
+    for the GUI to adopt into its CatalogStore in one go.
+    """
+    if msg.get("segment"):
+        from dbutils.catalog_segment import open_segment
+
+        segment = open_segment(msg["segment"])
+        segment.strings.decode_all()
+        return segment.tables, segment.columns
+    t_list = [
+        TableInfo(schema=t.get("schema"), name=t.get("name"), remarks=t.get("remarks", ""))
+        for t in msg.get("tables", [])
+    ]
+    c_list = [
+        ColumnInfo(
+            schema=c.get("schema"),
+            table=c.get("table"),
+            name=c.get("name"),
+            typename=c.get("typename"),
+            length=c.get("length"),
+            scale=c.get("scale"),
+            nulls=c.get("nulls"),
+            remarks=c.get("remarks", ""),
+        )
+        for c in msg.get("columns", [])
+    ]
+    return t_list, c_list
+
+
+class LoaderDecodeWorker(QObject):
+    """Decodes DataLoaderProcess stdout off the GUI thread.
+
+    Raw bytes are framed (JSON lines or a negotiated binary framing) and
+    chunk payloads are turned into TableInfo/ColumnInfo (or their catalog
+    segments mapped) here, so the GUI thread only receives ready-to-use
+    messages.
+    """
+
+    messages_decoded = Signal(object)  # list of decoded messages
+
+    def __init__(self):
+        super().__init__()
+        from dbutils.gui.loader_protocol import FrameDecoder
+
+        self._decoder = FrameDecoder()
+
+    def feed(self, data):
+        try:
+            messages = self._decoder.feed(bytes(data))
+        except Exception as e:
+            messages = [{"type": "error", "message": f"Stdout processing error: {e}"}]
+        for msg in messages:
+            if isinstance(msg, dict) and msg.get("type") in ("chunk", "delta"):
+                msg["infos"] = _loader_chunk_infos(msg)
+        if messages:
+            self.messages_decoded.emit(messages)
+
 
 class DataLoaderProcess(QObject):
-    """Subprocess-based data loader using QProcess to avoid GIL/UI hitching."""
+    """Subprocess-based data loader using QProcess to avoid GIL/UI hitching.
+
+    With ``binary_framing`` the start command offers the binary framings from
+    loader_protocol, and stdout is decoded on a separate thread. With
+    ``shared_catalog`` the subprocess hands tables and columns over as
+    memory-mapped catalog segments (see dbutils.catalog_segment) in a
+    temporary directory owned by this object.
+
+    With ``persistent`` the subprocess runs as a loader service: it is
+    launched by the first start() and later loads, switch_schema() and
+    refresh() are commands to the same warm process, which keeps its JVM,
+    connections and loaded catalogs. Messages of a load that was replaced
+    by a newer one are dropped. Once the process has ended (shutdown()),
+    a new DataLoaderProcess is needed.
+
+    With ``credits`` chunks are flow-controlled (see loader_protocol): each
+    chunk's credit goes back once the event loop has caught up after
+    chunk_loaded, so the loader merges chunks instead of flooding a busy UI.
+    """
 
     data_loaded = Signal(object, object, object)  # (tables, columns, all_schemas)
     chunk_loaded = Signal(object, object, int, int)  # (tables_chunk, columns_chunk, loaded, total_est)
     error_occurred = Signal(str)
     progress_updated = Signal(str)
     progress_value = Signal(int, int)  # (current, total)
+    schema_progress = Signal(str, int, str)  # (schema, tables loaded, state) in parallel loads
+    catalog_stale = Signal(bool)  # True while chunks come from an expired cache being revalidated
+    catalog_delta = Signal(object, object, object)  # (tables, columns, removed (schema, table) keys)
+    _raw_output = Signal(object)  # stdout bytes handed to the decode thread
 
-    def __init__(self):
+    def __init__(
+        self,
+        binary_framing: bool = True,
+        shared_catalog: bool = True,
+        persistent: bool = True,
+        credits: int = DEFAULT_CREDITS,
+    ):
         super().__init__()
         self._proc = QProcess()
-        self._stdout_buffer = ""
+        self._binary_framing = binary_framing
+        self._shared_catalog = shared_catalog
+        self._segment_dir: Optional[str] = None
+        self._persistent = persistent
+        self._launched = False
+        self._started = False  # start command written to the process
+        self._queued: List[Dict[str, Any]] = []  # service commands waiting for the process to start
+        self._load_id = 0  # id of the load whose messages are shown
+        self._credits = credits
         self._schemas = None
+        self._stale = False
         self._finished_handled = False  # Track if we've already handled the finish event
 
+        # Decode stdout on a worker thread so large chunks don't stall the UI
+        self._decode_worker = LoaderDecodeWorker()
+        self._decode_thread = None
+        self._decode_worker.messages_decoded.connect(self._handle_messages)
+        self._raw_output.connect(self._decode_worker.feed)
+        if QT_AVAILABLE:
+            try:
+                self._decode_thread = QThread()
+                self._decode_worker.moveToThread(self._decode_thread)
+                self._decode_thread.start()
+            except Exception:
+                self._decode_thread = None
+
         # Connect signals if running within Qt
         if QT_AVAILABLE:
             try:
@@ -1324,8 +1736,63 @@ class DataLoaderProcess(QObject):
         initial_limit: int = 200,
         batch_size: int = 500,
         start_offset: int = 0,
+        schema_workers: int = 0,
+        stale_ok: bool = False,
     ):
-        """Start the data loader subprocess and send the initial command."""
+        """Start a load, launching the data loader subprocess when needed.
+
+        A non-zero ``schema_workers`` loads that many schemas at once. With
+        ``stale_ok`` an expired cache is shown at once (see catalog_stale)
+        and the changes found revalidating it arrive through catalog_delta.
+        """
+        options = {
+            "schema_filter": schema_filter,
+            "use_mock": bool(use_mock),
+            "initial_limit": int(initial_limit),
+            "batch_size": int(batch_size),
+            "start_offset": int(start_offset),
+            "schema_workers": int(schema_workers),
+            "stale_ok": bool(stale_ok),
+        }
+        if self._credits:
+            options["credits"] = int(self._credits)
+        if self._persistent:
+            self._send_load("load", options)
+        else:
+            self._launch(dict(options, cmd="start"))
+
+    def switch_schema(self, schema_filter: Optional[str]):
+        """Load another schema with the options of the last load (loader service only)."""
+        self._send_load("switch_schema", {"schema_filter": schema_filter})
+
+    def refresh(self):
+        """Revalidate the loaded catalog; changes arrive through catalog_delta (loader service only)."""
+        self._send_load("refresh")
+
+    def shutdown(self):
+        """Ask the loader service to exit."""
+        self._send_command({"cmd": "shutdown"})
+
+    def _send_load(self, cmd: str, options: Optional[Dict[str, Any]] = None):
+        """Send a load command to the loader service, launching it first if needed."""
+        self._load_id += 1
+        self._schemas = None
+        if self._stale:
+            self._stale = False
+            self.catalog_stale.emit(False)
+        self._send_command(dict(options or {}, cmd=cmd, id=self._load_id))
+        if not self._launched:
+            self._launch({"cmd": "serve"})
+
+    def _send_command(self, msg: Dict[str, Any]):
+        if not self._started:
+            self._queued.append(msg)
+            return
+        self._write(msg)
+
+    def _launch(self, payload: Dict[str, Any]):
+        """Launch the subprocess; ``payload`` is sent as its first command once it runs."""
+        self._launched = True
         # Launch module as subprocess
         # Check if we're running under uv (UV_PROJECT_DIR env var is set)
         # or if sys.executable can import dbutils, otherwise use fallback
@@ -1368,14 +1835,14 @@ class DataLoaderProcess(QObject):
             self._started_connected = True
 
         # Store payload for sending after process starts
-        payload = {
-            "cmd": "start",
-            "schema_filter": schema_filter,
-            "use_mock": bool(use_mock),
-            "initial_limit": int(initial_limit),
-            "batch_size": int(batch_size),
-            "start_offset": int(start_offset),
-        }
+        if self._binary_framing:
+            from dbutils.gui.loader_protocol import available_framings
+
+            payload["framings"] = available_framings()
+        if self._shared_catalog:
+            if self._segment_dir is None:
+                self._segment_dir = tempfile.mkdtemp(prefix="dbutils-catalog-")
+            payload["segment_dir"] = self._segment_dir
         self._start_payload = payload
 
     def _send_start_command(self):
@@ -1385,37 +1852,35 @@ class DataLoaderProcess(QObject):
         payload = self._start_payload
         self._start_payload = None
 
-        data = (json.dumps(payload) + "\n").encode("utf-8")
+        self._started = True
+        self._write(payload)
+        queued, self._queued = self._queued, []
+        for msg in queued:
+            self._write(msg)
+
+    def _write(self, msg: Dict[str, Any]):
+        data = (json.dumps(msg) + "\n").encode("utf-8")
         try:
             self._proc.write(data)
         except Exception as e:
             self.error_occurred.emit(f"Failed to communicate with data loader: {e}")
 
+    def cancel_schema(self, schema: Optional[str] = None):
+        """Ask a parallel load to stop one schema, or every schema when None."""
+        self._send_command({"cmd": "cancel", "schema": schema})
+
+    def _grant_credit(self, load_id, started: float):
+        msg = {"cmd": "credit", "n": 1, "ingest_ms": (time.perf_counter() - started) * 1000}
+        if load_id is not None:
+            msg["load"] = load_id
+        self._send_command(msg)
+
     def _on_stdout(self):
         try:
-            raw = bytes(self._proc.readAllStandardOutput()).decode("utf-8", errors="ignore")
-            if not raw:
-                return
-            self._stdout_buffer += raw
-            lines = self._stdout_buffer.splitlines(keepends=True)
-            # Keep incomplete last line in buffer
-            if not lines:
-                return
-            if not lines[-1].endswith("\n"):
-                self._stdout_buffer = lines[-1]
-                lines = lines[:-1]
-            else:
-                self._stdout_buffer = ""
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    msg = json.loads(line)
-                except Exception:
-                    continue
-                self._handle_message(msg)
+            raw = bytes(self._proc.readAllStandardOutput())
+            if raw:
+                # Framing and TableInfo/ColumnInfo conversion happen in the decode worker
+                self._raw_output.emit(raw)
         except Exception as e:
             self.error_occurred.emit(f"Stdout processing error: {e}")
 
@@ -1458,9 +1923,35 @@ class DataLoaderProcess(QObject):
                 self._proc.deleteLater()
         except Exception as e:
             print(f"Error cleaning up process: {e}", file=sys.stderr)
+        self._stop_decode_thread()
+        self._remove_segment_dir()
+
+    def _remove_segment_dir(self):
+        """Delete segment files the GUI did not map (already mapped ones stay valid)."""
+        path = self._segment_dir
+        self._segment_dir = None
+        if path:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _stop_decode_thread(self):
+        thread = getattr(self, "_decode_thread", None)
+        self._decode_thread = None
+        if thread is not None:
+            try:
+                thread.quit()
+                thread.wait(1000)
+            except Exception:
+                pass
+
+    def _handle_messages(self, messages):
+        for msg in messages:
+            self._handle_message(msg)
 
     def _handle_message(self, msg: Dict[str, Any]):
         typ = msg.get("type")
+        if msg.get("load", self._load_id) != self._load_id:
+            # Left over from a load the service has been asked to replace
+            return
         if typ == "progress":
             self.progress_updated.emit(msg.get("message", ""))
             cur = int(msg.get("current", 0))
@@ -1468,30 +1959,30 @@ class DataLoaderProcess(QObject):
             if tot:
                 self.progress_value.emit(cur, tot)
         elif typ == "chunk":
-            # Convert payload dicts to TableInfo/ColumnInfo
-            t_list = [
-                TableInfo(schema=t.get("schema"), name=t.get("name"), remarks=t.get("remarks", ""))
-                for t in msg.get("tables", [])
-            ]
-            c_list = [
-                ColumnInfo(
-                    schema=c.get("schema"),
-                    table=c.get("table"),
-                    name=c.get("name"),
-                    typename=c.get("typename"),
-                    length=c.get("length"),
-                    scale=c.get("scale"),
-                    nulls=c.get("nulls"),
-                    remarks=c.get("remarks", ""),
-                )
-                for c in msg.get("columns", [])
-            ]
+            # Payload dicts are normally converted by the decode worker already
+            t_list, c_list = msg.get("infos") or _loader_chunk_infos(msg)
             loaded = int(msg.get("loaded", 0))
             est = int(msg.get("estimated", 0)) if msg.get("estimated") is not None else 0
+            if msg.get("stale") and not self._stale:
+                self._stale = True
+                self.catalog_stale.emit(True)
+            started = time.perf_counter()
             self.chunk_loaded.emit(t_list, c_list, loaded, est)
+            if self._credits:
+                # Hand the credit back once the updates this chunk queued have run
+                QTimer.singleShot(0, lambda: self._grant_credit(msg.get("load"), started))
+        elif typ == "delta":
+            t_list, c_list = msg.get("infos") or _loader_chunk_infos(msg)
+            removed = [tuple(key) for key in msg.get("removed", [])]
+            self.catalog_delta.emit(t_list, c_list, removed)
+        elif typ == "schema_progress":
+            self.schema_progress.emit(msg.get("schema", ""), int(msg.get("loaded", 0)), msg.get("state", ""))
         elif typ == "schemas":
             self._schemas = list(msg.get("schemas", []))
-        elif typ == "done":
+        elif typ in ("done", "cancelled"):
+            if self._stale:
+                self._stale = False
+                self.catalog_stale.emit(False)
             # Emit final data_loaded with schemas only (tables/columns streamed via chunks)
             self.data_loaded.emit([], [], self._schemas or [])
         elif typ == "error":
@@ -1508,9 +1999,23 @@ def humanize_schema_name(raw: str) -> str:
     return " ".join(part for part in raw.replace("__", "_").split("_") if part)
 
 
+def contents_row_estimate(browser: Any, schema: str, table: str) -> Optional[int]:
+    """Rows an unfiltered preview of ``schema.table`` is expected to hold, from the catalog statistics.
+
+    Reads the browser's filter and data source with getattr, so partial
+    stand-ins for a QtDBBrowser get None instead of an error.
+    """
+    column_filter, _value, where_clause = getattr(browser, "contents_filter", None) or (None, None, None)
+    if column_filter or where_clause or getattr(browser, "use_mock", False) or getattr(browser, "db_file", None):
+        return None
+    return get_row_estimate(schema, table)
+
+
 class QtDBBrowser(QMainWindow):
     """Main Qt Database Browser application."""
 
+    contents_prefetched = Signal(object)  # page key finished by the prefetcher
+
     def __init__(self, schema_filter: Optional[str] = None, use_mock: bool = False, use_heavy_mock: bool = False, db_file: Optional[str] = None):
         super().__init__()
 
@@ -1526,8 +2031,7 @@ class QtDBBrowser(QMainWindow):
         self.use_mock = use_mock
         self.use_heavy_mock = use_heavy_mock
         self.db_file = db_file
-        self.tables: List[TableInfo] = []
-        self.columns: List[ColumnInfo] = []
+        self._set_catalog(CatalogStore())
         self.table_columns: Dict[str, List[ColumnInfo]] = {}
 
         # Search state
@@ -1548,9 +2052,24 @@ class QtDBBrowser(QMainWindow):
         self.data_loader_thread = None
         self.data_loader_proc = None
         self.use_subprocess_loader = True
+        # Search index fed chunk by chunk while the catalog streams in
+        self.search_index = CatalogSearchIndex()
+        # Held while search_index changes and while a SearchWorker reads it
+        self.search_index_lock = threading.Lock()
+        self._catalog_loading = False
+        # schema -> (tables loaded, state) while schemas load in parallel
+        self.schema_load_progress: Dict[str, Tuple[int, str]] = {}
+        # True while the catalog shown comes from an expired cache being revalidated
+        self.catalog_stale = False
         # Table contents background worker references
         self.contents_worker = None
         self.contents_thread = None
+        # Next pages and neighbouring tables' previews fetched ahead of time
+        self.contents_prefetcher = ContentsPrefetcher(
+            TableContentsWorker.fetch_page, PrefetchConfig.from_env(), on_ready=self.contents_prefetched.emit
+        )
+        self.contents_prefetched.connect(self._on_contents_prefetched)
+        self._contents_awaiting = None
 
         self.setup_ui()
         self.setup_menu()
@@ -1960,6 +2479,8 @@ class QtDBBrowser(QMainWindow):
         self.contents_table = QTableView()
         self.contents_model = TableContentsModel()
         self.contents_table.setModel(self.contents_model)
+        # Evicted blocks are fetched again when the view paints their rows
+        self.contents_model.block_requested.connect(self._on_contents_block_requested)
 
         # Configure view - read-only preview
         self.contents_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -2110,6 +2631,11 @@ class QtDBBrowser(QMainWindow):
         refresh_schemas_action.triggered.connect(self.rebuild_schema_cache)
         file_menu.addAction(refresh_schemas_action)
 
+        refresh_contents_action = QAction("Refresh Table Contents", self)
+        refresh_contents_action.setShortcut("Ctrl+R")
+        refresh_contents_action.triggered.connect(self.refresh_table_contents)
+        file_menu.addAction(refresh_contents_action)
+
         clear_cache_action = QAction("Clear All Caches", self)
         clear_cache_action.setShortcut("Ctrl+Shift+C")
         clear_cache_action.triggered.connect(self.clear_all_caches)
@@ -2243,6 +2769,7 @@ class QtDBBrowser(QMainWindow):
 
         # Cancel any existing data loader thread/process
         if self.data_loader_worker:
+            self.data_loader_worker.cancel_schema()
             self.data_loader_worker = None
 
         if self.data_loader_thread:
@@ -2266,9 +2793,12 @@ class QtDBBrowser(QMainWindow):
         # loaded tables. We want the UI to be seamless and keep existing
         # results while the loader continues from where it left off.
         start_offset = len(self.tables) if getattr(self, "tables", None) else 0
+        self._catalog_loading = True
+        self.schema_load_progress = {}
+        self.catalog_stale = False
 
         # Use thread-based worker (disable subprocess for now due to path issues)
-        self.data_loader_worker = DataLoaderWorker()
+        self.data_loader_worker = DataLoaderWorker(credits=DEFAULT_CREDITS)
         self.data_loader_thread = QThread()
         self.data_loader_worker.data_loaded.connect(self.on_data_loaded)
         self.data_loader_worker.chunk_loaded.connect(self.on_data_chunk)
@@ -2276,24 +2806,99 @@ class QtDBBrowser(QMainWindow):
         self.data_loader_worker.missing_driver_detected.connect(self.on_missing_jdbc_driver)
         self.data_loader_worker.progress_updated.connect(self.status_label.setText)
         self.data_loader_worker.progress_value.connect(self.on_data_progress)
+        self.data_loader_worker.schema_progress.connect(self.on_schema_progress)
+        self.data_loader_worker.catalog_stale.connect(self.on_catalog_stale)
+        self.data_loader_worker.catalog_delta.connect(self.on_catalog_delta)
         self.data_loader_thread.started.connect(
-            lambda: self.data_loader_worker.load_data(self.schema_filter, self.use_mock, start_offset=start_offset, use_heavy_mock=self.use_heavy_mock, db_file=self.db_file)
+            lambda: self.data_loader_worker.load_data(self.schema_filter, self.use_mock, start_offset=start_offset, use_heavy_mock=self.use_heavy_mock, db_file=self.db_file, stale_ok=True)
         )
         self.data_loader_thread.start()
 
+    def _set_catalog(self, catalog: CatalogStore):
+        """Make ``catalog`` the loaded catalog; self.tables and self.columns are its row views.
+
+        The store also serves table, column and schema lookups, here and in
+        the shared SearchManager.
+        """
+        from dbutils.gui.search_manager import get_search_manager
+
+        self.catalog = catalog
+        self.tables = catalog.tables
+        self.columns = catalog.columns
+        get_search_manager().set_catalog(catalog)
+
     def on_data_progress(self, current: int, total: int):
         """Handle data loading progress updates."""
         progress_percent = int((current / total) * 100) if total > 0 else 0
         self.progress_bar.setValue(progress_percent)
 
+    def on_schema_progress(self, schema: str, loaded: int, state: str):
+        """Track per-schema progress of a parallel catalog load."""
+        self.schema_load_progress[schema] = (loaded, state)
+        if state != "loading":
+            self.status_label.setText(f"{schema}: {loaded} tables ({state})")
+
+    def cancel_schema_load(self, schema: Optional[str] = None):
+        """Stop loading one schema of a parallel load, or the whole load when None."""
+        if self.data_loader_worker is not None:
+            self.data_loader_worker.cancel_schema(schema)
+
+    def on_catalog_stale(self, stale: bool):
+        """Mark the catalog shown as a stale copy while the loader revalidates it."""
+        self.catalog_stale = stale
+        if stale:
+            self.status_label.setText("Showing cached catalog, refreshing…")
+
+    def on_catalog_delta(self, tables, columns, removed):
+        """Patch the loaded catalog with the changes found revalidating a stale copy."""
+        try:
+            tables = list(tables or [])
+            columns = list(columns or [])
+            keys = [(t.schema, t.name) for t in tables]
+            known = {k for k in keys if self.catalog.get_table(*k) is not None}
+            delta = CatalogDelta(
+                added=[k for k in keys if k not in known],
+                changed=[k for k in keys if k in known],
+                removed=list(removed or []),
+            )
+            tables, columns = self.catalog.apply_delta(delta, tables, columns)
+
+            for schema, name in delta.changed + delta.removed:
+                self.table_columns.pop(f"{schema}.{name}", None)
+            for col in columns:
+                self.table_columns.setdefault(f"{col.schema}.{col.table}", []).append(col)
+
+            try:
+                with self.search_index_lock:
+                    self.search_index.remove_tables(delta.changed + delta.removed)
+                    self.search_index.add_tables(tables)
+                    self.search_index.add_columns(columns)
+            except Exception:
+                pass
+
+            if not hasattr(self, "_model_update_timer"):
+                self._model_update_timer = QTimer()
+                self._model_update_timer.setSingleShot(True)
+                self._model_update_timer.timeout.connect(self._update_model)
+            self._model_update_timer.start(0)
+            if getattr(self, "search_query", "") and self.search_query.strip():
+                QTimer.singleShot(0, self._deferred_search_update)
+        except Exception as e:
+            self.status_label.setText(f"Catalog refresh error: {e}")
+
     def on_data_loaded(self, tables, columns, all_schemas=None):
         """Handle data loaded from background thread."""
         try:
             # Finalization step: only schemas are provided at this point in streaming mode
+            self._catalog_loading = False
             if tables and columns:
                 # Fallback if full data was sent (non-streaming path)
-                self.tables = tables
-                self.columns = columns
+                self._set_catalog(CatalogStore(tables, columns))
+                try:
+                    with self.search_index_lock:
+                        self.search_index.build_index(self.tables, self.columns)
+                except Exception:
+                    pass
             if all_schemas:
                 self.all_schemas = all_schemas  # Store all available schemas
 
@@ -2301,20 +2906,20 @@ class QtDBBrowser(QMainWindow):
             if not hasattr(self, "table_columns") or self.table_columns is None:
                 self.table_columns = {}
 
-            # Ensure tables and columns lists exist
-            if not hasattr(self, "tables") or self.tables is None:
-                self.tables = []
-            if not hasattr(self, "columns") or self.columns is None:
-                self.columns = []
+            # Ensure the catalog store exists
+            if getattr(self, "catalog", None) is None:
+                self._set_catalog(CatalogStore())
 
             # Defer all UI updates to avoid blocking on completion
             def finalize_load():
                 try:
-                    # Update UI if we received data (e.g., non-streaming path)
+                    # Update UI if we received data (e.g., non-streaming path);
+                    # streamed rows are still being revealed by the ingest scheduler
                     if self.tables or self.columns:
-                        self.tables_model.set_data(self.tables, self.table_columns)
-                        if getattr(self, "tables_proxy", None):
-                            self.tables_proxy.invalidate()
+                        if self.tables_model.follows(self.tables):
+                            self._ingest_scheduler().wake()
+                        else:
+                            self.tables_model.set_data(self.tables, self.table_columns)
                     if hasattr(self, "all_schemas") and self.all_schemas:
                         self.update_schema_combo()
 
@@ -2330,6 +2935,11 @@ class QtDBBrowser(QMainWindow):
                         self.columns_overlay.hide()
                     self.search_input.setEnabled(True)
                     self.schema_combo.setEnabled(True)
+
+                    # Searches during the load were answered from the prefix
+                    # index; rescan once so substring matches show up too
+                    if getattr(self, "search_query", "") and self.search_query.strip():
+                        self._trigger_incremental_search()
                 except Exception:
                     pass
 
@@ -2393,6 +3003,7 @@ class QtDBBrowser(QMainWindow):
 
     def on_data_load_error(self, error: str):
         """Handle data loading errors."""
+        self._catalog_loading = False
         self.status_label.setText(f"Error loading data: {error}")
         self.progress_bar.setVisible(False)
 
@@ -2468,43 +3079,49 @@ class QtDBBrowser(QMainWindow):
 
     def on_data_chunk(self, tables_chunk, columns_chunk, loaded: int, total_est: int):
         """Handle streaming chunk of tables/columns loaded in background."""
+        started = time.perf_counter()
         try:
             # Initialize data structures if first chunk
-            if not hasattr(self, "tables") or self.tables is None:
-                self.tables = []
-            if not hasattr(self, "columns") or self.columns is None:
-                self.columns = []
+            if getattr(self, "catalog", None) is None:
+                self._set_catalog(CatalogStore())
             if not hasattr(self, "table_columns") or self.table_columns is None:
                 self.table_columns = {}
 
             first_chunk = len(self.tables) == 0 and len(self.columns) == 0
 
-            # Append new data (fast operation)
-            self.tables.extend(tables_chunk or [])
-            self.columns.extend(columns_chunk or [])
+            # The model shows the catalog's own row list; rows appended below
+            # are revealed by the ingest scheduler
+            if not self.tables_model.follows(self.tables):
+                self.tables_model.follow(self.tables, self.table_columns)
+
+            # Copy the chunk into the store; only its row views are kept from here on.
+            # A mapped segment (or another store) is adopted array by array.
+            source = getattr(tables_chunk, "store", None)
+            if source is not None and source is getattr(columns_chunk, "store", None) and source is not self.catalog:
+                new_tables, new_columns = self.catalog.adopt(source)
+            else:
+                new_tables = self.catalog.add_tables(tables_chunk or [])
+                new_columns = self.catalog.add_columns(columns_chunk or [])
+
+            # Grow the search index with just this chunk
+            try:
+                with self.search_index_lock:
+                    self.search_index.add_tables(new_tables)
+                    self.search_index.add_columns(new_columns)
+            except Exception:
+                pass
 
-            for col in columns_chunk or []:
+            for col in new_columns:
                 table_key = f"{col.schema}.{col.table}"
                 if table_key not in self.table_columns:
                     self.table_columns[table_key] = []
                 self.table_columns[table_key].append(col)
 
-            # Only update model on first chunk and every 5th chunk to reduce UI updates
-            # This dramatically reduces hitching during initial load
-            chunk_count = getattr(self, "_chunk_count", 0) + 1
-            self._chunk_count = chunk_count
-
-            should_update_ui = first_chunk or (chunk_count % 5 == 0)
-
-            if should_update_ui:
-                # Defer model update to avoid blocking on beginResetModel
-                # Use timer with 0ms delay to run after current event processing
-                if not hasattr(self, "_model_update_timer"):
-                    self._model_update_timer = QTimer()
-                    self._model_update_timer.setSingleShot(True)
-                    self._model_update_timer.timeout.connect(self._update_model)
-                # Schedule update for next event loop iteration
-                self._model_update_timer.start(0)
+            # Insert the new rows in slices that fit a frame, yielding to
+            # the event loop in between; the proxy only filters the inserted
+            # rows. Loaders only send another chunk once this one has been
+            # shown (see _return_chunk_credit) and merge chunks meanwhile.
+            self._ingest_scheduler().wake()
 
             # After first chunk, enable UI immediately for interaction
             if first_chunk:
@@ -2518,16 +3135,15 @@ class QtDBBrowser(QMainWindow):
                 except Exception:
                     pass
 
-            # Defer search updates to avoid blocking - only on larger chunks
+            # Defer search updates to avoid blocking
             if hasattr(self, "search_query") and self.search_query and self.search_query.strip():
-                if should_update_ui:
-                    # Use timer to defer search so UI stays responsive
-                    if not hasattr(self, "_search_update_timer"):
-                        self._search_update_timer = QTimer()
-                        self._search_update_timer.setSingleShot(True)
-                        self._search_update_timer.timeout.connect(self._deferred_search_update)
-                    # Restart timer - only search after chunks stop coming
-                    self._search_update_timer.start(150)
+                # Use timer to defer search so UI stays responsive
+                if not hasattr(self, "_search_update_timer"):
+                    self._search_update_timer = QTimer()
+                    self._search_update_timer.setSingleShot(True)
+                    self._search_update_timer.timeout.connect(self._deferred_search_update)
+                # Restart timer - only search after chunks stop coming
+                self._search_update_timer.start(150)
 
             # Update progress bar (lightweight operation)
             if total_est and total_est > 0:
@@ -2536,16 +3152,33 @@ class QtDBBrowser(QMainWindow):
 
         except Exception as e:
             self.status_label.setText(f"Chunk processing error: {e}")
+        finally:
+            self._return_chunk_credit(started)
+
+    def _return_chunk_credit(self, started: float):
+        """Give the thread loader its credit back once the rows of a chunk have been shown."""
+        worker = self.sender()
+        if not hasattr(worker, "grant_credit"):
+            return
+        self._ingest_scheduler().after_ingested(lambda: worker.grant_credit((time.perf_counter() - started) * 1000))
+
+    def _ingest_scheduler(self) -> IngestScheduler:
+        """Scheduler revealing rows appended to the catalog in frame-budgeted slices."""
+        if getattr(self, "_ingest", None) is None:
+            self._ingest = IngestScheduler(
+                self.tables_model.show_more,
+                self.tables_model.pending_rows,
+                lambda fn: QTimer.singleShot(0, fn),
+            )
+        return self._ingest
 
     def _update_model(self):
         """Deferred model update to avoid blocking during chunk processing."""
         try:
-            # Update model with current data
+            # Update model with current data; the reset also re-filters the proxy.
+            # Rows still streaming in keep being revealed by the ingest scheduler.
             if hasattr(self, "tables") and hasattr(self, "table_columns"):
-                self.tables_model.set_data(self.tables, self.table_columns)
-                # Defer invalidate to avoid blocking
-                if getattr(self, "tables_proxy", None):
-                    QTimer.singleShot(0, self.tables_proxy.invalidate)
+                self.tables_model.follow(self.tables, self.table_columns)
         except Exception:
             pass
 
@@ -2618,7 +3251,7 @@ class QtDBBrowser(QMainWindow):
                         count = self._schema_counts_cache[name]
                     elif compute_counts and self.tables:
                         # Only compute if we have few enough tables
-                        computed = sum(1 for t in self.tables if getattr(t, "schema", None) == name)
+                        computed = count_schema_tables(self.tables, name)
                         count = computed if computed > 0 else None
                         self._schema_counts_cache[name] = count
 
@@ -2739,6 +3372,7 @@ class QtDBBrowser(QMainWindow):
                 pass
 
         # Create worker and thread
+        self._search_streamed = False
         self.search_worker = SearchWorker()
         self.search_thread = QThread()
 
@@ -2747,15 +3381,40 @@ class QtDBBrowser(QMainWindow):
 
         # Connect signals
         self.search_worker.results_ready.connect(self.on_search_results)
+        self.search_worker.results_delta.connect(self.on_search_results_delta)
         self.search_worker.search_complete.connect(self.on_search_complete)
         self.search_worker.error_occurred.connect(self.on_search_error)
 
         # Start thread
+        index = self._search_index_for_query()
         self.search_thread.started.connect(
-            lambda: self.search_worker.perform_search(self.tables, self.columns, self.search_query, self.search_mode)
+            lambda: self.search_worker.perform_search(
+                self.tables,
+                self.columns,
+                self.search_query,
+                self.search_mode,
+                index=index,
+                index_lock=self.search_index_lock,
+            )
         )
         self.search_thread.start()
 
+    def _search_index_for_query(self):
+        """Return the search index when it can stand in for a full catalog scan.
+
+        While loading, the index holds exactly the chunks received so far.
+        Afterwards it is used only if it still covers every loaded table and
+        column; otherwise the worker falls back to scanning the lists.
+        """
+        index = getattr(self, "search_index", None)
+        if index is None:
+            return None
+        if getattr(self, "_catalog_loading", False):
+            return index
+        if len(index.table_keys) >= len(self.tables or []) and len(index.column_keys) >= len(self.columns or []):
+            return index
+        return None
+
     def _trigger_incremental_search(self):
         """Trigger search immediately without debounce - used for incremental updates during data loading."""
         if not self.search_query or not self.search_query.strip():
@@ -2780,6 +3439,7 @@ class QtDBBrowser(QMainWindow):
                 pass
 
         # Create worker and thread
+        self._search_streamed = False
         self.search_worker = SearchWorker()
         self.search_thread = QThread()
 
@@ -2788,12 +3448,21 @@ class QtDBBrowser(QMainWindow):
 
         # Connect signals
         self.search_worker.results_ready.connect(self.on_search_results)
+        self.search_worker.results_delta.connect(self.on_search_results_delta)
         self.search_worker.search_complete.connect(self.on_incremental_search_complete)
         self.search_worker.error_occurred.connect(self.on_search_error)
 
         # Start thread
+        index = self._search_index_for_query()
         self.search_thread.started.connect(
-            lambda: self.search_worker.perform_search(self.tables, self.columns, self.search_query, self.search_mode)
+            lambda: self.search_worker.perform_search(
+                self.tables,
+                self.columns,
+                self.search_query,
+                self.search_mode,
+                index=index,
+                index_lock=self.search_index_lock,
+            )
         )
         self.search_thread.start()
 
@@ -2821,13 +3490,13 @@ class QtDBBrowser(QMainWindow):
             # appear as hits (indirect matches). This also ensures the
             # 'show_non_matching' toggle behaves sensibly during streaming.
             if self.search_mode == "columns" and results:
-                has_table = any(isinstance(r.item, TableInfo) for r in results)
+                has_table = any(isinstance(r.item, TABLE_TYPES) for r in results)
                 # If results are only ColumnInfo items, synthesize aggregates
                 if not has_table:
                     table_map = {}
                     col_results = []
                     for r in results:
-                        if isinstance(r.item, ColumnInfo):
+                        if isinstance(r.item, COLUMN_TYPES):
                             table_key = r.table_key or f"{r.item.schema}.{r.item.table}"
                             table_map.setdefault(table_key, []).append(r)
                             col_results.append(r)
@@ -2836,14 +3505,7 @@ class QtDBBrowser(QMainWindow):
                     # Find table objects for these keys from current data
                     for t_key, cols in table_map.items():
                         schema, name = t_key.split(".", 1) if "." in t_key else (None, t_key)
-                        t_obj = next(
-                            (
-                                t
-                                for t in self.tables
-                                if getattr(t, "schema", None) == schema and getattr(t, "name", None) == name
-                            ),
-                            None,
-                        )
+                        t_obj = find_table(self.tables, schema, name)
                         if t_obj:
                             agg_results.append(
                                 SearchResult(
@@ -2872,6 +3534,21 @@ class QtDBBrowser(QMainWindow):
             self.search_progress.setValue(min(len(results) * 10, 100))
             self.status_label.setText(f"Found {len(results)} results...")
 
+    def on_search_results_delta(self, results: List[SearchResult]):
+        """Handle a batch of newly ranked results streamed during a search."""
+        if not results:
+            return
+        if getattr(self, "_search_streamed", False):
+            self.tables_model.append_search_results(results)
+        else:
+            # First batch of a new search replaces the previous query's rows
+            self._search_streamed = True
+            self.tables_model.set_search_results(list(results))
+        if self.search_query:
+            count = self.tables_model.rowCount()
+            self.search_progress.setValue(min(count * 10, 100))
+            self.status_label.setText(f"Found {count} results...")
+
     def on_search_complete(self):
         """Handle search completion."""
         self.search_progress.setVisible(False)
@@ -2914,6 +3591,33 @@ class QtDBBrowser(QMainWindow):
         except Exception:
             pass
 
+    def _table_at_proxy_row(self, row: int):
+        """Return the catalog's row for the table shown at ``row`` of the tables view."""
+        source_row = self.tables_proxy.mapToSource(self.tables_proxy.index(row, 0)).row()
+        table_key = self._table_key_at_source_row(source_row)
+        return self.catalog.table_for_key(table_key) if table_key else None
+
+    def _table_key_at_source_row(self, row: int) -> Optional[str]:
+        """Return the "schema.table" key shown at ``row`` of the tables model."""
+        if self.tables_model._search_results:
+            # Search results mode
+            if row < len(self.tables_model._search_results):
+                result = self.tables_model._search_results[row]
+
+                # For table search, use the table info directly
+                if self.search_mode == "tables" and isinstance(result.item, TABLE_TYPES):
+                    return f"{result.item.schema}.{result.item.name}"
+                # For column search, get the table from the column result
+                elif self.search_mode == "columns" and isinstance(result.item, COLUMN_TYPES):
+                    return f"{result.item.schema}.{result.item.table}"
+            return None
+
+        # Normal mode
+        if 0 <= row < len(self.tables_model._tables):
+            table = self.tables_model._tables[row]
+            return f"{table.schema}.{table.name}"
+        return None
+
     def on_table_selected(self, selected, deselected):
         """Handle table selection."""
         if not selected.indexes():
@@ -2925,30 +3629,15 @@ class QtDBBrowser(QMainWindow):
         source_index = self.tables_proxy.mapToSource(index)
         row = source_index.row()
 
-        table_key = None
-
-        if self.tables_model._search_results:
-            # Search results mode
-            if row < len(self.tables_model._search_results):
-                result = self.tables_model._search_results[row]
-
-                # For table search, use the table info directly
-                if self.search_mode == "tables" and isinstance(result.item, TableInfo):
-                    table_key = f"{result.item.schema}.{result.item.name}"
-                # For column search, get the table from the column result
-                elif self.search_mode == "columns" and isinstance(result.item, ColumnInfo):
-                    table_key = f"{result.item.schema}.{result.item.table}"
-        else:
-            # Normal mode
-            if row < len(self.tables_model._tables):
-                table = self.tables_model._tables[row]
-                table_key = f"{table.schema}.{table.name}"
-            else:
-                self.columns_model.set_columns([])
-                return
+        if not self.tables_model._search_results and row >= len(self.tables_model._tables):
+            self.columns_model.set_columns([])
+            return
+        table_key = self._table_key_at_source_row(row)
 
         # Update columns panel if we found a valid table key
         if table_key:
+            # Previews of the tables around this one are likely next
+            self._prefetch_neighbor_contents(index.row())
             columns = self.table_columns.get(table_key, [])
             self.columns_model.set_columns(columns)
             self.update_column_details(table_key, columns)
@@ -3097,15 +3786,8 @@ class QtDBBrowser(QMainWindow):
         """
         try:
             # Find TableInfo object
-            parts = table_key.split(".")
-            schema = parts[0] if len(parts) > 0 else None
-            name = parts[1] if len(parts) > 1 else None
-
-            table_obj = None
-            for t in getattr(self, "tables", []):
-                if f"{t.schema}.{t.name}" == table_key:
-                    table_obj = t
-                    break
+            schema, _, name = table_key.partition(".")
+            table_obj = find_table(getattr(self, "tables", []), schema, name)
 
             if table_obj is None:
                 # Nothing to fetch
@@ -3122,9 +3804,14 @@ class QtDBBrowser(QMainWindow):
             if should_reset:
                 self.contents_table_key = table_key
                 self.contents_offset = 0
-                self.contents_accumulated_rows = []
                 self.contents_has_more = True
                 self.contents_loading = False
+                # Keyset pagination state: ordering key and last key shown
+                self.contents_key_columns = ()
+                self.contents_last_key = None
+                # Filter reused when later blocks are fetched or refetched
+                self.contents_filter = (column_filter, value, where_clause)
+                self.contents_block_queue = []
                 # Hide loading indicator when starting fresh
                 if hasattr(self, "contents_loading_container"):
                     self.contents_loading_container.setVisible(False)
@@ -3137,6 +3824,16 @@ class QtDBBrowser(QMainWindow):
                     # Already loading, skip this request
                     return
 
+            # Seek from the key that ended the previous block when it is known
+            after_key = None
+            if int(start_offset) > 0:
+                model = getattr(self, "contents_model", None)
+                window = model.window if model is not None else None
+                if window is not None:
+                    after_key = window.fetch_args(int(start_offset) // window.block_size)[1]
+                else:
+                    after_key = getattr(self, "contents_last_key", None)
+
             # If caller asked for async_fetch and Qt runtime/threading is available
             if async_fetch and QT_AVAILABLE and hasattr(self, "_start_contents_fetch"):
                 # Cancel any previous worker
@@ -3167,6 +3864,7 @@ class QtDBBrowser(QMainWindow):
                     column_filter=column_filter,
                     value=value,
                     where_clause=where_clause,
+                    after_key=after_key,
                 )
                 return
 
@@ -3228,14 +3926,17 @@ class QtDBBrowser(QMainWindow):
                 else:
                     where = f" WHERE {column_filter} = {value}"
 
-            # Add ORDER BY for stable pagination (order by first column)
-            order_by = " ORDER BY 1"
-
-            # Include OFFSET for pagination if start_offset > 0
-            if int(start_offset) > 0:
-                sql = f"SELECT * FROM {tbl}{where}{order_by} OFFSET {int(start_offset)} ROWS FETCH FIRST {int(limit)} ROWS ONLY"
-            else:
-                sql = f"SELECT * FROM {tbl}{where}{order_by} FETCH FIRST {int(limit)} ROWS ONLY"
+            # Order by the table's key and seek past the last key shown;
+            # tables without a usable key fall back to ORDER BY 1 + OFFSET
+            key_columns = () if getattr(self, "use_mock", False) else get_key_columns(schema, name)
+            sql = build_page_sql(
+                tbl,
+                where[len(" WHERE ") :] if where else "",
+                limit=limit,
+                offset=start_offset,
+                key_columns=key_columns,
+                after_key=after_key,
+            )
 
             rows = []
             try:
@@ -3278,7 +3979,9 @@ class QtDBBrowser(QMainWindow):
 
             # Derive columns either from rows or from metadata table_columns
             columns = []
-            if rows:
+            if isinstance(rows, ResultSet) and rows.columns:
+                columns = list(rows.columns)
+            elif rows:
                 # Use keys from first row (keeping stable ordering)
                 first = rows[0]
                 if isinstance(first, dict):
@@ -3294,20 +3997,24 @@ class QtDBBrowser(QMainWindow):
                 # Hide loading placeholder
                 self.contents_model.hide_loading()
 
-                # Update accumulated rows
-                if int(start_offset) > 0:
-                    self.contents_accumulated_rows.extend(rows)
-                    self.contents_offset = int(start_offset) + len(rows)
-                else:
-                    self.contents_accumulated_rows = list(rows)
-                    self.contents_offset = len(rows)
-
-                # Determine if we probably have more rows to fetch
-                self.contents_has_more = len(rows) >= int(limit)
-
                 # Use current columns if the worker didn't provide them
                 cols_final = columns if columns else [c.name for c in self.table_columns.get(table_key, [])]
-                self.contents_model.set_contents(cols_final, self.contents_accumulated_rows)
+
+                # Pages go into a bounded block window rather than one ever-growing list
+                window = self.contents_model.window if int(start_offset) > 0 else None
+                if window is None:
+                    window = RowWindow(
+                        block_size=limit, key_columns=key_columns, estimate=contents_row_estimate(self, schema, name)
+                    )
+                    window.put(int(start_offset) // window.block_size, rows)
+                    self.contents_model.set_window(cols_final, window)
+                else:
+                    self.contents_model.add_block(int(start_offset) // window.block_size, rows)
+
+                self.contents_key_columns = key_columns
+                self.contents_last_key = last_key(rows, key_columns)
+                self.contents_offset = window.fetched_rows
+                self.contents_has_more = window.has_more
 
         except Exception as e:
             # Log to stderr but don't raise
@@ -3328,8 +4035,14 @@ class QtDBBrowser(QMainWindow):
         column_filter: Optional[str] = None,
         value: Optional[str] = None,
         where_clause: Optional[str] = None,
+        after_key: Optional[Sequence[Any]] = None,
+        refetch: bool = False,
     ):
-        """Create a TableContentsWorker in a new thread and perform fetch asynchronously."""
+        """Create a TableContentsWorker in a new thread and perform fetch asynchronously.
+
+        With refetch the rows replace a block of the current row window
+        instead of starting a new preview, even for the first block.
+        """
         try:
             # Clean up any existing worker/thread without blocking
             if getattr(self, "contents_worker", None):
@@ -3347,6 +4060,37 @@ class QtDBBrowser(QMainWindow):
                     pass
                 # Don't set to None yet - let finished handler clean it up
 
+            # Serve the page from the prefetcher when it already has it
+            self._contents_awaiting = None
+            page_key = self._contents_page_key(
+                f"{schema}.{table}", (column_filter, value, where_clause), start_offset, limit
+            )
+            prefetcher = getattr(self, "contents_prefetcher", None)
+            if prefetcher is not None:
+                page = prefetcher.take(page_key)
+                if page is not None:
+                    cols, rows, key_columns = page
+                    self._apply_contents_page(schema, table, int(start_offset), limit, refetch, cols, rows, key_columns)
+                    return
+                if prefetcher.is_pending(page_key):
+                    # Already on its way; wait for it instead of asking twice
+                    self.contents_loading = True
+                    self._contents_awaiting = (
+                        page_key,
+                        schema,
+                        table,
+                        dict(
+                            limit=limit,
+                            start_offset=start_offset,
+                            column_filter=column_filter,
+                            value=value,
+                            where_clause=where_clause,
+                            after_key=after_key,
+                            refetch=refetch,
+                        ),
+                    )
+                    return
+
             # Create worker and thread
             self.contents_worker = TableContentsWorker()
             self.contents_thread = QThread()
@@ -3355,42 +4099,10 @@ class QtDBBrowser(QMainWindow):
             # Connect signals to update UI
             # Capture start_offset locally so closure knows whether to append
             start = int(start_offset)
+            worker = self.contents_worker
 
             def on_results(cols, rows):
-                try:
-                    cols_final = cols if cols else [c.name for c in self.table_columns.get(f"{schema}.{table}", [])]
-                    if getattr(self, "contents_model", None):
-                        # Hide loading placeholder
-                        self.contents_model.hide_loading()
-
-                        # If this is a paginated fetch (start > 0), append rows
-                        if start > 0:
-                            try:
-                                if not hasattr(self, "contents_accumulated_rows"):
-                                    self.contents_accumulated_rows = []
-                                self.contents_accumulated_rows.extend(rows or [])
-                                self.contents_offset = start + len(rows or [])
-                                self.contents_has_more = len(rows or []) >= int(limit)
-                                self.contents_model.set_contents(cols_final, self.contents_accumulated_rows)
-                            except Exception:
-                                # Fallback to replace if append fails
-                                self.contents_model.set_contents(cols_final, rows or [])
-                        else:
-                            # Fresh fetch - replace
-                            self.contents_accumulated_rows = list(rows or [])
-                            self.contents_offset = len(rows or [])
-                            self.contents_has_more = len(rows or []) >= int(limit)
-                            self.contents_model.set_contents(cols_final, self.contents_accumulated_rows)
-
-                    # Mark loading finished and hide loading indicator
-                    try:
-                        self.contents_loading = False
-                        if hasattr(self, "contents_loading_container"):
-                            self.contents_loading_container.setVisible(False)
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
+                self._apply_contents_page(schema, table, start, limit, refetch, cols, rows, worker.key_columns)
 
             def on_error(msg):
                 try:
@@ -3399,6 +4111,11 @@ class QtDBBrowser(QMainWindow):
                     if hasattr(self, "contents_loading_container"):
                         self.contents_loading_container.setVisible(False)
                     self.contents_loading = False
+                    # Let the block be requested again when it is next painted
+                    window = self.contents_model.window if getattr(self, "contents_model", None) else None
+                    if window is not None:
+                        window.pending.discard(start // window.block_size)
+                    QTimer.singleShot(0, self._fetch_next_contents_block)
                 except Exception:
                     pass
 
@@ -3438,6 +4155,7 @@ class QtDBBrowser(QMainWindow):
                     use_mock=self.use_mock,
                     table_columns=self.table_columns.get(f"{schema}.{table}", []),
                     db_file=self.db_file,
+                    after_key=after_key,
                 )
             )
 
@@ -3460,6 +4178,128 @@ class QtDBBrowser(QMainWindow):
             except Exception:
                 pass
 
+    @staticmethod
+    def _contents_page_key(table_key: str, contents_filter: Sequence[Any], offset: int, limit: int) -> tuple:
+        """Identify one page of a contents preview for the prefetcher."""
+        return (table_key, tuple(contents_filter), int(offset), int(limit))
+
+    def _apply_contents_page(
+        self,
+        schema: str,
+        table: str,
+        start: int,
+        limit: int,
+        refetch: bool,
+        cols: List[str],
+        rows: Any,
+        key_columns: Sequence[str],
+    ):
+        """Show a fetched contents page, then queue the fetches that follow it."""
+        try:
+            self.contents_key_columns = key_columns
+            cols_final = cols if cols else [c.name for c in self.table_columns.get(f"{schema}.{table}", [])]
+            window = None
+            model = getattr(self, "contents_model", None)
+            if model:
+                # Hide loading placeholder
+                model.hide_loading()
+
+                window = model.window if start > 0 or refetch else None
+                if window is None:
+                    # Fresh fetch - start a new block window
+                    window = RowWindow(
+                        block_size=limit, key_columns=key_columns, estimate=contents_row_estimate(self, schema, table)
+                    )
+                    window.put(start // window.block_size, rows)
+                    model.set_window(cols_final, window)
+                else:
+                    # Next page or a refetch of an evicted block
+                    model.add_block(start // window.block_size, rows)
+                self.contents_offset = window.fetched_rows
+                self.contents_has_more = window.has_more
+
+            # Mark loading finished and hide loading indicator
+            try:
+                self.contents_loading = False
+                if hasattr(self, "contents_loading_container"):
+                    self.contents_loading_container.setVisible(False)
+            except Exception:
+                pass
+
+            # Fetch the next page while this one is on screen
+            if window is not None and window.has_more and not refetch:
+                self._prefetch_contents_page(schema, table, window.row_count, window)
+            QTimer.singleShot(0, self._fetch_next_contents_block)
+        except Exception:
+            pass
+
+    def _prefetch_contents_page(self, schema: str, table: str, start: int, window: RowWindow):
+        """Ask the prefetcher for the contents block starting at row ``start``."""
+        prefetcher = getattr(self, "contents_prefetcher", None)
+        if prefetcher is None:
+            return
+        column_filter, value, where_clause = getattr(self, "contents_filter", (None, None, None))
+        _offset, after_key = window.fetch_args(window.block_of(start))
+        prefetcher.prefetch(
+            self._contents_page_key(
+                f"{schema}.{table}", (column_filter, value, where_clause), start, window.block_size
+            ),
+            schema,
+            table,
+            limit=window.block_size,
+            start_offset=start,
+            column_filter=column_filter,
+            value=value,
+            where_clause=where_clause,
+            use_mock=self.use_mock,
+            table_columns=self.table_columns.get(f"{schema}.{table}", []),
+            db_file=self.db_file,
+            after_key=after_key,
+        )
+
+    def _prefetch_neighbor_contents(self, proxy_row: int):
+        """Speculatively fetch the first preview page of tables next to ``proxy_row``."""
+        prefetcher = getattr(self, "contents_prefetcher", None)
+        if prefetcher is None or not prefetcher.enabled:
+            return
+        try:
+            # Neighbours of the previous selection are no longer interesting
+            prefetcher.cancel_speculative()
+            limit = self.contents_limit.value() if hasattr(self.contents_limit, "value") else 25
+            for distance in range(1, prefetcher.config.neighbors + 1):
+                for row in (proxy_row + distance, proxy_row - distance):
+                    if row < 0 or row >= self.tables_proxy.rowCount():
+                        continue
+                    table_key = self._table_key_at_source_row(
+                        self.tables_proxy.mapToSource(self.tables_proxy.index(row, 0)).row()
+                    )
+                    if not table_key:
+                        continue
+                    schema, _, table = table_key.partition(".")
+                    prefetcher.prefetch(
+                        self._contents_page_key(table_key, (None, None, None), 0, limit),
+                        schema,
+                        table,
+                        speculative=True,
+                        limit=limit,
+                        use_mock=self.use_mock,
+                        table_columns=self.table_columns.get(table_key, []),
+                        db_file=self.db_file,
+                    )
+        except Exception:
+            pass
+
+    def _on_contents_prefetched(self, key):
+        """Finish a contents load that was waiting for the prefetcher."""
+        awaiting = self._contents_awaiting
+        if awaiting is None or awaiting[0] != key:
+            return
+        self._contents_awaiting = None
+        self.contents_loading = False
+        _key, schema, table, kwargs = awaiting
+        # Takes the prefetched page, or fetches it directly if the prefetch failed
+        self._start_contents_fetch(schema, table, **kwargs)
+
     def toggle_search_mode(self):
         """Toggle between table and column search modes."""
         if self.search_mode == "tables":
@@ -3557,7 +4397,6 @@ class QtDBBrowser(QMainWindow):
             # Reset pagination for a new filter and start async fetch
             try:
                 self.contents_offset = 0
-                self.contents_accumulated_rows = []
                 self.contents_has_more = True
                 self.contents_loading = False
             except Exception:
@@ -3663,19 +4502,68 @@ class QtDBBrowser(QMainWindow):
                         self.contents_loading_container.setVisible(True)
 
                     current_offset = getattr(self, "contents_offset", 0) or 0
-                    limit = self.contents_limit.value() if hasattr(self.contents_limit, "value") else 25
+                    window = self.contents_model.window
+                    if window is not None:
+                        # Keep pages aligned with the window's blocks
+                        limit = window.block_size
+                    else:
+                        limit = self.contents_limit.value() if hasattr(self.contents_limit, "value") else 25
                     # Next page starts at current_offset (which tracks total rows loaded)
                     next_offset = current_offset
                     if next_offset is None:
                         next_offset = 0
+                    column_filter, value, where_clause = getattr(self, "contents_filter", (None, None, None))
                     self.load_table_contents(
-                        getattr(self, "contents_table_key", ""), limit=limit, start_offset=next_offset, async_fetch=True
+                        getattr(self, "contents_table_key", ""),
+                        limit=limit,
+                        start_offset=next_offset,
+                        column_filter=column_filter,
+                        value=value,
+                        where_clause=where_clause,
+                        async_fetch=True,
                     )
                 except Exception:
                     pass
         except Exception:
             pass
 
+    def _on_contents_block_requested(self, block: int):
+        """Queue a fetch for a contents block the view needs but the window evicted."""
+        queue = getattr(self, "contents_block_queue", None)
+        if queue is None:
+            queue = self.contents_block_queue = []
+        if block not in queue:
+            queue.append(block)
+        if not getattr(self, "contents_loading", False):
+            QTimer.singleShot(0, self._fetch_next_contents_block)
+
+    def _fetch_next_contents_block(self):
+        """Start fetching the next queued contents block, one fetch at a time."""
+        try:
+            if getattr(self, "contents_loading", False):
+                return
+            queue = getattr(self, "contents_block_queue", None)
+            window = self.contents_model.window
+            if not queue or window is None:
+                return
+            block = queue.pop(0)
+            schema, _, table = getattr(self, "contents_table_key", "").partition(".")
+            column_filter, value, where_clause = getattr(self, "contents_filter", (None, None, None))
+            offset, after_key = window.fetch_args(block)
+            self._start_contents_fetch(
+                schema,
+                table,
+                limit=window.block_size,
+                start_offset=offset,
+                column_filter=column_filter,
+                value=value,
+                where_clause=where_clause,
+                after_key=after_key,
+                refetch=True,
+            )
+        except Exception:
+            pass
+
     def toggle_search_dock(self):
         """Toggle the search dock widget visibility."""
         if self.search_dock.isVisible():
@@ -3818,31 +4706,27 @@ class QtDBBrowser(QMainWindow):
                 if progress.wasCanceled():
                     break
 
-                schema_idx = proxy.index(row, 0)
-                table_idx = proxy.index(row, 1)
-                desc_idx = proxy.index(row, 3)
-
-                schema = proxy.data(schema_idx)
-                table = proxy.data(table_idx)
-                desc = proxy.data(desc_idx) or ""
+                table_obj = self._table_at_proxy_row(row)
+                if table_obj is None:
+                    continue
+                schema, table = table_obj.schema, table_obj.name
+                desc = table_obj.remarks or ""
 
                 if schema not in schema_data:
                     schema_data[schema] = {}
 
                 # Get columns for this table
-                columns = []
-                for col in self.all_columns:
-                    if col.table_schema == schema and col.table_name == table:
-                        columns.append(
-                            {
-                                "name": col.column_name,
-                                "type": col.data_type,
-                                "length": col.length,
-                                "scale": col.scale,
-                                "nullable": col.nullable,
-                                "remarks": col.remarks or "",
-                            }
-                        )
+                columns = [
+                    {
+                        "name": col.name,
+                        "type": col.typename,
+                        "length": col.length,
+                        "scale": col.scale,
+                        "nullable": col.nulls == "Y",
+                        "remarks": col.remarks or "",
+                    }
+                    for col in self.catalog.columns_of(schema, table)
+                ]
 
                 schema_data[schema][table] = {"description": desc, "columns": columns}
 
@@ -3878,13 +4762,11 @@ class QtDBBrowser(QMainWindow):
                     if progress.wasCanceled():
                         break
 
-                    schema_idx = proxy.index(row, 0)
-                    table_idx = proxy.index(row, 1)
-                    desc_idx = proxy.index(row, 3)
-
-                    schema = proxy.data(schema_idx)
-                    table = proxy.data(table_idx)
-                    desc = proxy.data(desc_idx)
+                    table_obj = self._table_at_proxy_row(row)
+                    if table_obj is None:
+                        continue
+                    schema, table = table_obj.schema, table_obj.name
+                    desc = table_obj.remarks
 
                     # Write table comment if available
                     if desc:
@@ -3893,21 +4775,18 @@ class QtDBBrowser(QMainWindow):
                     f.write(f"CREATE TABLE {schema}.{table} (\\n")
 
                     # Get columns for this table
-                    columns = []
-                    for col in self.all_columns:
-                        if col.table_schema == schema and col.table_name == table:
-                            columns.append(col)
+                    columns = self.catalog.columns_of(schema, table)
 
                     # Write column definitions
                     col_lines = []
                     for col in columns:
-                        col_def = f"    {col.column_name} {col.data_type}"
+                        col_def = f"    {col.name} {col.typename}"
                         if col.length:
                             if col.scale:
                                 col_def += f"({col.length},{col.scale})"
                             else:
                                 col_def += f"({col.length})"
-                        if not col.nullable:
+                        if col.nulls != "Y":
                             col_def += " NOT NULL"
                         col_lines.append(col_def)
 
@@ -3917,7 +4796,7 @@ class QtDBBrowser(QMainWindow):
                     # Add column comments if available
                     for col in columns:
                         if col.remarks:
-                            f.write(f"COMMENT ON COLUMN {schema}.{table}.{col.column_name} IS '{col.remarks}';\\n")
+                            f.write(f"COMMENT ON COLUMN {schema}.{table}.{col.name} IS '{col.remarks}';\\n")
 
                     if any(col.remarks for col in columns):
                         f.write("\\n")
@@ -4028,7 +4907,7 @@ class QtDBBrowser(QMainWindow):
                 QMessageBox.warning(self, "No Data Loaded", "Please load data first before rebuilding the schema list.")
                 return
 
-            schemas = sorted({t.schema for t in self.tables})
+            schemas = sorted(self.catalog.schemas())
 
             # Save to cache
             cache_dir = Path.home() / ".cache" / "dbutils"
@@ -4059,6 +4938,11 @@ class QtDBBrowser(QMainWindow):
         import glob
 
         try:
+            # Cached and prefetched contents pages live in memory only
+            get_contents_cache().invalidate()
+            if getattr(self, "contents_prefetcher", None):
+                self.contents_prefetcher.clear()
+
             cache_dir = Path.home() / ".cache" / "dbutils"
 
             if not cache_dir.exists():
@@ -4102,6 +4986,28 @@ class QtDBBrowser(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to clear caches: {e}")
 
+    def refresh_table_contents(self):
+        """Drop cached pages of the previewed table and fetch it again."""
+        table_key = getattr(self, "contents_table_key", None)
+        if not table_key:
+            return
+        schema, _, table = table_key.partition(".")
+        dropped = get_contents_cache().invalidate(schema, table)
+        if getattr(self, "contents_prefetcher", None):
+            self.contents_prefetcher.clear()
+        column_filter, value, where_clause = getattr(self, "contents_filter", (None, None, None))
+        window = self.contents_model.window
+        limit = window.block_size if window is not None else 25
+        self.load_table_contents(
+            table_key,
+            limit=limit,
+            start_offset=0,
+            column_filter=column_filter,
+            value=value,
+            where_clause=where_clause,
+        )
+        self.status_label.setText(f"Refreshed {table_key} ({dropped} cached page(s) dropped)")
+
     def show_about(self):
         """Show about dialog."""
         QMessageBox.about(
@@ -4136,6 +5042,9 @@ class QtDBBrowser(QMainWindow):
                 # Thread may already be deleted or invalid, ignore gracefully
                 pass
 
+        if getattr(self, "contents_prefetcher", None):
+            self.contents_prefetcher.close()
+
         # Cancel table contents worker if running
         if hasattr(self, "contents_worker") and self.contents_worker:
             if hasattr(self.contents_worker, "cancel"):
@@ -4160,6 +5069,14 @@ class QtDBBrowser(QMainWindow):
                 pass
             self.data_loader_proc = None
 
+        # Close pooled JDBC connections
+        try:
+            from dbutils.connection_pool import close_all_pools
+
+            close_all_pools()
+        except Exception:
+            pass
+
         event.accept()
 
 
@@ -4191,6 +5108,9 @@ def main(args=None):
         if not hasattr(args, 'db_file'):
             args.db_file = None
 
+    # Reuse pooled JDBC connections across queries unless explicitly disabled
+    os.environ.setdefault("DBUTILS_JDBC_POOL", "1")
+
     # Check if QApplication instance already exists
     try:
         from PySide6.QtCore import QCoreApplication
@@ -21,8 +21,9 @@ from enum import Enum, auto
 from typing import Any, Dict, List, Optional, Tuple
 
 # Local imports
-from dbutils.db_browser import ColumnInfo, TableInfo
+from dbutils.db_browser import MATCH_NAME, MATCH_REMARKS, MATCH_SCHEMA, MATCH_TYPE, ColumnInfo, TableInfo
 from dbutils.gui.qt_app import SearchResult
+from dbutils.ranking import TopKCollector, top_k
 
 
 class SearchMode(Enum):
@@ -73,6 +74,8 @@ class SearchManager:
         self._search_worker = None
         self._search_thread = None
         self._cancel_requested = False
+        # CatalogStore the searched tables come from, for key lookups
+        self._catalog = None
 
         # Performance metrics
         self._search_count = 0
@@ -84,6 +87,11 @@ class SearchManager:
         with self._lock:
             self._current_context = context
 
+    def set_catalog(self, catalog):
+        """Use ``catalog`` (a CatalogStore) to find the tables behind column matches."""
+        with self._lock:
+            self._catalog = catalog
+
     def get_state(self) -> SearchState:
         """Get current search state."""
         with self._lock:
@@ -178,10 +186,13 @@ class SearchManager:
         query: str,
         mode: SearchMode = SearchMode.TABLES,
         use_cache: bool = True,
+        index=None,
     ) -> List[SearchResult]:
         """Perform a search operation with caching and debouncing.
 
         This consolidates the previously scattered search implementations.
+        When a SearchIndex is passed, substring matches come from its trigram
+        index instead of a linear scan over ``tables``/``columns``.
         """
         # Normalize query
         query = query.strip()
@@ -199,11 +210,11 @@ class SearchManager:
 
         # Perform the actual search based on mode
         if mode == SearchMode.TABLES:
-            results = self._search_tables(tables, query)
+            results = self._search_tables(tables, query, index)
         elif mode == SearchMode.COLUMNS:
-            results = self._search_columns(columns, query)
+            results = self._search_columns(columns, query, index)
         else:
-            results = self._search_advanced(tables, columns, query)
+            results = self._search_advanced(tables, columns, query, index)
 
         # Cache results if successful
         if results and use_cache:
@@ -211,88 +222,119 @@ class SearchManager:
 
         return results
 
-    def _search_tables(self, tables: List[TableInfo], query: str) -> List[SearchResult]:
-        """Search tables using optimized algorithm."""
-        query_lower = query.lower()
-        results = []
+    def _search_tables(self, tables: List[TableInfo], query: str, index=None) -> List[SearchResult]:
+        """Search tables, keeping only the top ``max_results`` matches by relevance."""
+        collector = TopKCollector(self._current_context.max_results)
 
-        for table in tables:
+        for table, mask in self._table_matches(tables, query, index):
             if self._cancel_requested:
                 break
 
             # Check for matches in table name, schema, and remarks
-            name_match = query_lower in table.name.lower()
-            schema_match = query_lower in table.schema.lower()
-            remarks_match = table.remarks and query_lower in table.remarks.lower()
+            name_match = bool(mask & MATCH_NAME)
+            schema_match = bool(mask & MATCH_SCHEMA)
+            remarks_match = bool(mask & MATCH_REMARKS)
 
             if name_match or schema_match or remarks_match:
                 # Calculate relevance score
                 score = self._calculate_relevance_score(name_match, schema_match, remarks_match)
-                match_type = "exact" if name_match else "fuzzy"
-
-                result = SearchResult(
-                    item=table, match_type=match_type, relevance_score=score, table_key=f"{table.schema}.{table.name}"
-                )
-                results.append(result)
-
-        # Sort by relevance score
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
-        return results
-
-    def _search_columns(self, columns: List[ColumnInfo], query: str) -> List[SearchResult]:
-        """Search columns using optimized algorithm."""
-        query_lower = query.lower()
-        results = []
-        table_aggregates = {}  # For aggregating column matches by table
-
-        for col in columns:
+                # Result objects are only built for matches that make the cut
+                collector.offer(score, (table, "exact" if name_match else "fuzzy"))
+
+        return [
+            SearchResult(
+                item=table, match_type=match_type, relevance_score=score, table_key=f"{table.schema}.{table.name}"
+            )
+            for (table, match_type), score in collector.results()
+        ]
+
+    def _search_columns(self, columns: List[ColumnInfo], query: str, index=None) -> List[SearchResult]:
+        """Search columns, keeping only the top ``max_results`` matches by relevance."""
+        max_results = self._current_context.max_results
+        collector = TopKCollector(max_results)
+        table_counts: Dict[str, int] = {}  # Matching columns per table, for aggregates
+
+        for col, mask in self._column_matches(columns, query, index):
             if self._cancel_requested:
                 break
 
             # Check for matches in column name, type, and remarks
-            name_match = query_lower in col.name.lower()
-            type_match = query_lower in col.typename.lower()
-            remarks_match = col.remarks and query_lower in col.remarks.lower()
+            name_match = bool(mask & MATCH_NAME)
+            type_match = bool(mask & MATCH_TYPE)
+            remarks_match = bool(mask & MATCH_REMARKS)
 
             if name_match or type_match or remarks_match:
                 # Calculate relevance score
                 score = self._calculate_relevance_score(name_match, type_match, remarks_match)
-                match_type = "exact" if name_match else "fuzzy"
-
-                result = SearchResult(
-                    item=col, match_type=match_type, relevance_score=score, table_key=f"{col.schema}.{col.table}"
-                )
-                results.append(result)
+                collector.offer(score, (col, "exact" if name_match else "fuzzy"))
 
                 # Aggregate by table for "show non-matching" functionality
                 table_key = f"{col.schema}.{col.table}"
-                if table_key not in table_aggregates:
-                    table_aggregates[table_key] = []
-                table_aggregates[table_key].append(result)
+                table_counts[table_key] = table_counts.get(table_key, 0) + 1
 
         # Create table aggregate results for UI display
-        aggregate_results = self._create_table_aggregates(table_aggregates, columns)
-
-        # Combine and sort results
-        combined = aggregate_results + results
+        aggregate_results = top_k(
+            ((r, r.relevance_score) for r in self._create_table_aggregates(table_counts, columns)), max_results
+        )
+        column_results = [
+            SearchResult(item=col, match_type=match_type, relevance_score=score, table_key=f"{col.schema}.{col.table}")
+            for (col, match_type), score in collector.results()
+        ]
+
+        # Merge the two ranked lists; the stable sort keeps aggregates ahead on ties
+        combined = [r for r, _score in aggregate_results] + column_results
         combined.sort(key=lambda x: x.relevance_score, reverse=True)
-
-        return combined
-
-    def _create_table_aggregates(
-        self, table_aggregates: Dict[str, List[SearchResult]], columns: List[ColumnInfo]
-    ) -> List[SearchResult]:
+        return combined[:max_results]
+
+    @staticmethod
+    def _table_matches(tables: List[TableInfo], query: str, index=None):
+        """Yield (table, field_mask) for tables containing the query."""
+        if index is not None:
+            yield from index.substring_tables(query)
+            return
+        query_lower = query.lower()
+        for table in tables:
+            mask = 0
+            if query_lower in table.name.lower():
+                mask |= MATCH_NAME
+            if query_lower in table.schema.lower():
+                mask |= MATCH_SCHEMA
+            if table.remarks and query_lower in table.remarks.lower():
+                mask |= MATCH_REMARKS
+            yield table, mask
+
+    @staticmethod
+    def _column_matches(columns: List[ColumnInfo], query: str, index=None):
+        """Yield (column, field_mask) for columns containing the query."""
+        if index is not None:
+            yield from index.substring_columns(query)
+            return
+        query_lower = query.lower()
+        for col in columns:
+            mask = 0
+            if query_lower in col.name.lower():
+                mask |= MATCH_NAME
+            if query_lower in col.typename.lower():
+                mask |= MATCH_TYPE
+            if col.remarks and query_lower in col.remarks.lower():
+                mask |= MATCH_REMARKS
+            yield col, mask
+
+    def _create_table_aggregates(self, table_counts: Dict[str, int], columns: List[ColumnInfo]) -> List[SearchResult]:
         """Create aggregate search results for tables containing matching columns."""
         aggregate_results = []
+        if not table_counts:
+            return aggregate_results
 
-        for table_key, col_results in table_aggregates.items():
+        catalog = self._catalog
+        if catalog is None:
+            return aggregate_results
+        for table_key, count in table_counts.items():
             # Find the table object for this key
-            schema, table_name = table_key.split(".", 1)
-            table_obj = next((t for t in self._get_all_tables() if t.schema == schema and t.name == table_name), None)
+            table_obj = catalog.table_for_key(table_key)
 
             if table_obj:
                 # Count of matching columns as relevance score
-                count = len(col_results)
                 aggregate_results.append(
                     SearchResult(item=table_obj, match_type="column", relevance_score=float(count), table_key=table_key)
                 )
@@ -309,16 +351,17 @@ class SearchManager:
         return exact_matches * 1.0 + fuzzy_matches * 0.3
 
     def _get_all_tables(self) -> List[TableInfo]:
-        """Get all tables from the application context."""
-        # This would be connected to the main application's data model
-        # For now, return empty list as placeholder
-        return []
+        """Get all tables of the catalog set with set_catalog()."""
+        catalog = self._catalog
+        return list(catalog.tables) if catalog is not None else []
 
-    def _search_advanced(self, tables: List[TableInfo], columns: List[ColumnInfo], query: str) -> List[SearchResult]:
+    def _search_advanced(
+        self, tables: List[TableInfo], columns: List[ColumnInfo], query: str, index=None
+    ) -> List[SearchResult]:
         """Advanced search combining table and column searches."""
         # Combine results from both table and column searches
-        table_results = self._search_tables(tables, query)
-        column_results = self._search_columns(columns, query)
+        table_results = self._search_tables(tables, query, index)
+        column_results = self._search_columns(columns, query, index)
 
         # Merge and deduplicate results
         combined = table_results + column_results
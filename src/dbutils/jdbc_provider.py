@@ -8,7 +8,7 @@ that can be configured via GUI and persisted to a JSON file.
 Design goals:
 - Keep Python + Qt app. Use JDBC drivers (redistributable/licensed) via JVM.
 - Avoid tight coupling to any specific DB vendor.
-- Provide simple query execution returning list[dict] for GUI models.
+- Provide simple query execution returning a list[dict]-compatible ResultSet for GUI models.
 
 Flatpak notes:
 - You will need to bundle a Java runtime (e.g., OpenJDK) and the JDBC driver JARs.
@@ -22,7 +22,9 @@ import json
 import logging
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+from dbutils.result_set import ResultSet
 
 logger = logging.getLogger(__name__)
 
@@ -166,7 +168,7 @@ class ProviderRegistry:
 
 
 class JDBCConnection:
-    """Wraps a JDBC connection via JayDeBeApi, returning rows as dicts."""
+    """Wraps a JDBC connection via JayDeBeApi, returning rows as dict-like views."""
 
     def __init__(
         self,
@@ -253,7 +255,25 @@ class JDBCConnection:
         finally:
             self._conn = None
 
-    def query(self, sql: str) -> List[Dict[str, Any]]:
+    def is_valid(self, timeout: int = 2) -> bool:
+        """Return True if the underlying JDBC session is still usable."""
+        if self._conn is None:
+            return False
+        try:
+            # jaydebeapi exposes the java.sql.Connection as `jconn`
+            jconn = getattr(self._conn, "jconn", None)
+            if jconn is not None:
+                return bool(jconn.isValid(int(timeout)))
+            return True
+        except Exception:
+            return False
+
+    def query(self, sql: str) -> ResultSet:
+        """Execute SQL and return a ResultSet (one header plus row tuples).
+
+        The ResultSet behaves like a list of dicts for callers that use
+        ``row.get(name)``, without building a dict per row.
+        """
         if self._conn is None:
             raise RuntimeError("Connection not established")
         cur = self._conn.cursor()
@@ -261,15 +281,36 @@ class JDBCConnection:
             cur.execute(sql)
             # Attempt to fetch column names from cursor description
             cols = [d[0] for d in (cur.description or [])]
-            rows_out: List[Dict[str, Any]] = []
-            for row in cur.fetchall():
-                # Row may be a tuple; zip with columns
-                try:
-                    rows_out.append(dict(zip(cols, row)))
-                except Exception:
-                    # Fallback to sequential index mapping
-                    rows_out.append({str(i): v for i, v in enumerate(row)})
-            return rows_out
+            return ResultSet(cols, cur.fetchall())
+        finally:
+            try:
+                cur.close()
+            except Exception:
+                pass
+
+    def iter_query(self, sql: str, batch_size: int = 1000, as_dicts: bool = False) -> Iterator[Any]:
+        """Execute SQL and yield rows incrementally using cursor.fetchmany().
+
+        Rows are yielded as tuples in SELECT-list order (or dicts when
+        ``as_dicts`` is set), so only one batch is held in memory at a time.
+        The cursor is closed when the generator is exhausted or closed.
+        """
+        if self._conn is None:
+            raise RuntimeError("Connection not established")
+        batch_size = max(1, int(batch_size))
+        cur = self._conn.cursor()
+        try:
+            cur.execute(sql)
+            cols = [d[0] for d in (cur.description or [])]
+            while True:
+                batch = cur.fetchmany(batch_size)
+                if not batch:
+                    break
+                if as_dicts:
+                    for row in batch:
+                        yield dict(zip(cols, row))
+                else:
+                    yield from batch
         finally:
             try:
                 cur.close()
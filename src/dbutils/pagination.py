@@ -0,0 +1,366 @@
+"""Keyset pagination for table-contents previews.
+
+Paging with ``ORDER BY 1 OFFSET n ROWS`` makes DB2 read and discard ``n``
+rows for every page, so each page of a deep scroll is slower than the one
+before. Keyset (seek) pagination orders by a unique key instead and
+remembers the last key shown; the next page asks only for rows after it::
+
+  WHERE k1 > v1 OR (k1 = v1 AND k2 > v2) ORDER BY k1, k2 FETCH FIRST m ROWS ONLY
+
+which the database can answer with an index probe at any depth. The
+``(k1, k2) > (v1, v2)`` row comparison is spelled out as OR/AND terms so it
+also works on servers without row-value comparison support.
+
+Key columns come from the table's primary key, or from its narrowest unique
+index. Tables with neither keep using OFFSET.
+
+``RowWindow`` keeps only a bounded number of fetched pages ("blocks") of a
+preview in memory. Evicted blocks are fetched again when they are scrolled
+back into view, seeking from the key that ended the block before them.
+Until the end of the table has been fetched, the window reports the row
+count from the catalog statistics (``get_row_estimate``) so the view can
+size its scroll range for the whole table.
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SIMPLE_IDENT = re.compile(r"^[A-Z_#@$][A-Z0-9_#@$]*$")
+
+# (schema, table) -> key columns, empty when the table has no usable key
+_key_cache: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+# schema -> {table: primary key columns}; primary keys are fetched per schema
+_pk_cache: Dict[str, Dict[str, List[str]]] = {}
+# schema -> {table: row count from the catalog statistics}; fetched per schema
+_size_cache: Dict[str, Dict[str, int]] = {}
+_cache_lock = threading.Lock()
+
+# Rows a RowWindow keeps resident before evicting least recently used blocks
+DEFAULT_WINDOW_ROWS = 5000
+
+
+def clear_key_cache() -> None:
+    """Forget every cached key lookup (e.g. after switching connections)."""
+    with _cache_lock:
+        _key_cache.clear()
+        _pk_cache.clear()
+        _size_cache.clear()
+
+
+def _primary_keys_by_table(schema: str) -> Dict[str, List[str]]:
+    with _cache_lock:
+        cached = _pk_cache.get(schema)
+    if cached is not None:
+        return cached
+
+    from dbutils.catalog import get_primary_keys
+
+    by_table: Dict[str, List[str]] = {}
+    for row in get_primary_keys(schema) or []:
+        name = row.get("TABNAME")
+        col = row.get("COLNAME")
+        if name and col:
+            by_table.setdefault(name, []).append(col)
+    with _cache_lock:
+        _pk_cache[schema] = by_table
+    return by_table
+
+
+def _unique_index_columns(schema: str, table: str) -> List[str]:
+    from dbutils.catalog import get_indexes
+
+    indexes: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
+    for row in get_indexes(schema, table) or []:
+        if row.get("IS_UNIQUE") != "Y" or not row.get("COLUMN_NAME"):
+            continue
+        idx = (row.get("INDEX_SCHEMA") or "", row.get("INDEX_NAME") or "")
+        indexes.setdefault(idx, []).append((int(row.get("ORDINAL_POSITION") or 0), row["COLUMN_NAME"]))
+    if not indexes:
+        return []
+    # The narrowest unique index makes the cheapest seek predicate
+    best = min(indexes.values(), key=len)
+    return [col for _pos, col in sorted(best)]
+
+
+def get_key_columns(schema: str, table: str) -> Tuple[str, ...]:
+    """Return the columns that uniquely order rows of ``schema.table``.
+
+    Uses the primary key, else the narrowest unique index. Returns an empty
+    tuple when the table has neither. Successful lookups are cached; a
+    failed catalog query is not, so a later call can retry.
+    """
+    cache_key = (schema, table)
+    with _cache_lock:
+        cached = _key_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        columns = _primary_keys_by_table(schema).get(table) or _unique_index_columns(schema, table)
+    except Exception as e:
+        logger.debug("Key lookup for %s.%s failed: %s", schema, table, e)
+        return ()
+
+    key = tuple(columns)
+    with _cache_lock:
+        _key_cache[cache_key] = key
+    return key
+
+
+def get_row_estimate(schema: str, table: str) -> Optional[int]:
+    """Return the row count the catalog statistics hold for ``schema.table``.
+
+    Reads QSYS2.SYSTABLESTAT once per schema. Returns None when there are no
+    statistics for the table; a schema without any is not cached, so a later
+    call can retry.
+    """
+    with _cache_lock:
+        sizes = _size_cache.get(schema)
+    if sizes is None:
+        from dbutils.catalog import get_table_sizes
+
+        try:
+            rows = get_table_sizes(schema) or []
+        except Exception as e:
+            logger.debug("Table size lookup for %s failed: %s", schema, e)
+            return None
+        sizes = {row["TABNAME"]: int(row.get("ROWCOUNT") or 0) for row in rows if row.get("TABNAME")}
+        if not sizes:
+            return None
+        with _cache_lock:
+            _size_cache[schema] = sizes
+    return sizes.get(table)
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a column name unless it is a plain upper-case identifier."""
+    if _SIMPLE_IDENT.match(name):
+        return name
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_literal(value: Any) -> str:
+    """Render a key value as an SQL literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float, decimal.Decimal)):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return "X'" + bytes(value).hex().upper() + "'"
+    if isinstance(value, (datetime.date, datetime.time)):
+        value = value.isoformat(sep=" ") if isinstance(value, datetime.datetime) else value.isoformat()
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def keyset_predicate(key_columns: Sequence[str], after_key: Sequence[Any]) -> str:
+    """Return the condition selecting rows whose key sorts after ``after_key``."""
+    cols = [quote_identifier(c) for c in key_columns]
+    vals = [sql_literal(v) for v in after_key]
+    terms = []
+    for i in range(len(cols)):
+        parts = [f"{cols[j]} = {vals[j]}" for j in range(i)]
+        parts.append(f"{cols[i]} > {vals[i]}")
+        terms.append(parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")")
+    return terms[0] if len(terms) == 1 else "(" + " OR ".join(terms) + ")"
+
+
+def build_page_sql(
+    table_ref: str,
+    condition: str = "",
+    limit: int = 25,
+    offset: int = 0,
+    key_columns: Sequence[str] = (),
+    after_key: Optional[Sequence[Any]] = None,
+) -> str:
+    """Build the SELECT for one page of ``table_ref``.
+
+    ``condition`` is an optional filter (without the WHERE keyword). With
+    key columns the rows are ordered by the key, and a non-None
+    ``after_key`` seeks past the previous page instead of using OFFSET.
+    Without key columns, or without a last key to seek from, ``offset``
+    is applied with OFFSET as before.
+    """
+    conditions = [f"({condition})"] if condition else []
+    if key_columns:
+        order_by = " ORDER BY " + ", ".join(quote_identifier(c) for c in key_columns)
+    else:
+        order_by = " ORDER BY 1"
+
+    seek = bool(key_columns) and after_key is not None and len(after_key) == len(key_columns)
+    if seek:
+        conditions.append(keyset_predicate(key_columns, after_key))
+
+    if len(conditions) == 1 and condition:
+        where = f" WHERE {condition}"
+    elif conditions:
+        where = " WHERE " + " AND ".join(conditions)
+    else:
+        where = ""
+
+    fetch = f"FETCH FIRST {int(limit)} ROWS ONLY"
+    if not seek and int(offset) > 0:
+        return f"SELECT * FROM {table_ref}{where}{order_by} OFFSET {int(offset)} ROWS {fetch}"
+    return f"SELECT * FROM {table_ref}{where}{order_by} {fetch}"
+
+
+def last_key(rows: Sequence[Any], key_columns: Sequence[str]) -> Optional[Tuple[Any, ...]]:
+    """Return the key of the last row in a page, or None if it cannot be read.
+
+    Column names are matched case-insensitively. None is returned when the
+    page is empty, a key column is missing or a key value is NULL; the next
+    page then falls back to OFFSET.
+    """
+    if not key_columns or not rows:
+        return None
+    row = rows[-1]
+    if not hasattr(row, "get"):
+        return None
+    names: Optional[Dict[str, str]] = None
+    values = []
+    for col in key_columns:
+        if col in row:
+            value = row[col]
+        else:
+            if names is None:
+                names = {str(k).upper(): k for k in _row_keys(row)}
+            actual = names.get(col.upper())
+            if actual is None:
+                return None
+            value = row[actual]
+        if value is None:
+            return None
+        values.append(value)
+    return tuple(values)
+
+
+def _row_keys(row: Any) -> Iterable[str]:
+    try:
+        return list(row.keys())
+    except Exception:
+        return []
+
+
+class RowWindow:
+    """Bounded LRU cache of fetched blocks of a table preview.
+
+    Block ``n`` holds rows ``n * block_size`` up to the next block. At most
+    ``max_rows`` rows (rounded up to whole blocks, and never fewer than two
+    blocks) stay resident; older blocks are evicted least recently used
+    first. ``row_count`` is the exact total once a short block shows where
+    the table ends. Until then it is the highest row fetched so far
+    (``fetched_rows``), or ``estimate`` when that is larger.
+
+    The key that ends each block is remembered even after the block is
+    evicted, so ``fetch_args`` can seek straight to any block that follows
+    one already seen.
+    """
+
+    def __init__(
+        self,
+        block_size: int = 25,
+        max_rows: int = DEFAULT_WINDOW_ROWS,
+        key_columns: Sequence[str] = (),
+        estimate: Optional[int] = None,
+    ):
+        self.block_size = max(1, int(block_size))
+        self.max_blocks = max(2, -(-int(max_rows) // self.block_size))
+        self.key_columns = tuple(key_columns)
+        self.estimate = estimate
+        self.total: Optional[int] = None
+        self.pending: Set[int] = set()
+        self._blocks: "OrderedDict[int, Any]" = OrderedDict()
+        # block -> key of the last row of the block before it
+        self._start_keys: Dict[int, Tuple[Any, ...]] = {}
+        self._high = 0
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count(self.total, self._high)
+
+    @property
+    def fetched_rows(self) -> int:
+        return self._high
+
+    @property
+    def has_more(self) -> bool:
+        return self.total is None
+
+    @property
+    def resident_blocks(self) -> List[int]:
+        return list(self._blocks)
+
+    def block_of(self, row: int) -> int:
+        return row // self.block_size
+
+    def lookup(self, row: int) -> Optional[Tuple[Any, int]]:
+        """Return ``(block_rows, index)`` for a resident row, else None."""
+        block = row // self.block_size
+        rows = self._blocks.get(block)
+        if rows is None:
+            return None
+        self._blocks.move_to_end(block)
+        index = row - block * self.block_size
+        if index >= len(rows):
+            return None
+        return rows, index
+
+    def count_after(self, block: int, rows: Any) -> int:
+        """Return what ``row_count`` will be once ``rows`` are put as ``block``."""
+        return self._row_count(*self._bounds_after(block, len(rows) if rows is not None else 0))
+
+    def _row_count(self, total: Optional[int], high: int) -> int:
+        if total is not None:
+            return total
+        return max(high, self.estimate or 0)
+
+    def _bounds_after(self, block: int, count: int) -> Tuple[Optional[int], int]:
+        """Return ``(total, fetched rows)`` after storing ``count`` rows as ``block``."""
+        start = block * self.block_size
+        total = self.total
+        if count < self.block_size:
+            # A short block ends the table
+            total = start + count
+        elif total is not None and start + count > total:
+            total = None
+        return total, max(self._high, start + count)
+
+    def put(self, block: int, rows: Any) -> List[int]:
+        """Store a fetched block and return the blocks evicted to make room."""
+        rows = rows if rows is not None else []
+        self.pending.discard(block)
+        self._blocks[block] = rows
+        self._blocks.move_to_end(block)
+
+        self.total, self._high = self._bounds_after(block, len(rows))
+        if len(rows) < self.block_size:
+            for later in [b for b in self._blocks if b > block]:
+                del self._blocks[later]
+
+        key = last_key(rows, self.key_columns)
+        if key is not None:
+            self._start_keys[block + 1] = key
+
+        evicted = []
+        while len(self._blocks) > self.max_blocks:
+            old, _rows = self._blocks.popitem(last=False)
+            evicted.append(old)
+        return evicted
+
+    def fetch_args(self, block: int) -> Tuple[int, Optional[Tuple[Any, ...]]]:
+        """Return ``(offset, after_key)`` for fetching ``block``.
+
+        ``after_key`` is None for the first block and for blocks whose
+        predecessor's key is unknown; those are fetched with OFFSET.
+        """
+        return block * self.block_size, self._start_keys.get(block) if block > 0 else None
@@ -0,0 +1,195 @@
+"""Background prefetching of table-contents pages.
+
+On a high-latency link every page of a table preview costs a full round
+trip, so the browser asks for pages before they are needed:
+- the next page of the preview on screen, while the current one is shown
+- the first page of the tables next to the selected one, so arrowing
+  through the tables view finds their previews ready
+
+``ContentsPrefetcher`` runs these fetches on a background thread and keeps
+the finished pages until the GUI takes them. Its budget bounds both the
+pages held and the fetches queued, so speculation never floods the server.
+Speculative requests still waiting in the queue are dropped as soon as the
+selection moves on.
+
+The budget can be tuned with DBUTILS_PREFETCH_PAGES (pages held or queued)
+and DBUTILS_PREFETCH_NEIGHBORS (tables on each side of the selection);
+``DBUTILS_PREFETCH_PAGES=0`` turns prefetching off.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefetchConfig:
+    """Budget for a ContentsPrefetcher."""
+
+    max_pages: int = 6  # pages held plus fetches queued or running
+    neighbors: int = 1  # tables prefetched on each side of the selection
+
+    @staticmethod
+    def from_env() -> "PrefetchConfig":
+        """Build a config from DBUTILS_PREFETCH_* environment variables."""
+        cfg = PrefetchConfig()
+        try:
+            cfg.max_pages = int(os.environ.get("DBUTILS_PREFETCH_PAGES", cfg.max_pages))
+            cfg.neighbors = int(os.environ.get("DBUTILS_PREFETCH_NEIGHBORS", cfg.neighbors))
+        except ValueError:
+            logger.warning("Invalid DBUTILS_PREFETCH_* setting, using defaults")
+            cfg = PrefetchConfig()
+        cfg.max_pages = max(0, cfg.max_pages)
+        cfg.neighbors = max(0, cfg.neighbors)
+        return cfg
+
+
+class ContentsPrefetcher:
+    """Fetch pages ahead of time on a background thread.
+
+    ``fetch`` is called as ``fetch(*args, **kwargs)`` for each request and
+    its return value is kept under the request key until ``take`` claims
+    it. ``on_ready(key)`` is called from the background thread after every
+    request finishes, whether or not it succeeded; a failed fetch leaves
+    nothing to take.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Any],
+        config: Optional[PrefetchConfig] = None,
+        on_ready: Optional[Callable[[Hashable], None]] = None,
+    ):
+        self._fetch = fetch
+        self.config = config or PrefetchConfig()
+        self.on_ready = on_ready
+        self._cond = threading.Condition()
+        # key -> (args, kwargs, speculative), in request order
+        self._queue: Deque[Tuple[Hashable, tuple, dict, bool]] = deque()
+        self._running: Optional[Hashable] = None
+        self._pages: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # Bumped by clear() so a fetch already running is not kept afterwards
+        self._generation = 0
+
+        self._requested = 0
+        self._hits = 0
+        self._dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.max_pages > 0 and not self._closed
+
+    def _used(self) -> int:
+        return len(self._pages) + len(self._queue) + (1 if self._running is not None else 0)
+
+    def _known(self, key: Hashable) -> bool:
+        return key in self._pages or key == self._running or any(k == key for k, *_ in self._queue)
+
+    def prefetch(self, key: Hashable, *args, speculative: bool = False, **kwargs) -> bool:
+        """Queue a fetch for ``key`` unless it is already held, queued or over budget.
+
+        Returns True when a fetch was queued.
+        """
+        with self._cond:
+            if not self.enabled or self._known(key):
+                return False
+            if self._used() >= self.config.max_pages:
+                if not self._pages:
+                    return False
+                # Make room by forgetting the oldest unclaimed page
+                self._pages.popitem(last=False)
+                self._dropped += 1
+            self._queue.append((key, args, kwargs, speculative))
+            self._requested += 1
+            self._ensure_thread()
+            self._cond.notify()
+            return True
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Return True while a fetch for ``key`` is queued or running."""
+        with self._cond:
+            return key == self._running or any(k == key for k, *_ in self._queue)
+
+    def take(self, key: Hashable) -> Optional[Any]:
+        """Remove and return the prefetched page for ``key``, if there is one."""
+        with self._cond:
+            page = self._pages.pop(key, None)
+            if page is not None:
+                self._hits += 1
+            return page
+
+    def cancel_speculative(self):
+        """Drop speculative requests that have not started yet."""
+        with self._cond:
+            kept = [item for item in self._queue if not item[3]]
+            self._dropped += len(self._queue) - len(kept)
+            self._queue = deque(kept)
+
+    def clear(self):
+        """Forget every queued request and held page."""
+        with self._cond:
+            self._dropped += len(self._queue) + len(self._pages)
+            self._queue.clear()
+            self._pages.clear()
+            self._generation += 1
+
+    def close(self):
+        """Stop the background thread and drop all state."""
+        self.clear()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return request, hit and drop counters."""
+        with self._cond:
+            return {
+                "prefetch_requested": self._requested,
+                "prefetch_hits": self._hits,
+                "prefetch_dropped": self._dropped,
+                "prefetch_held": len(self._pages),
+                "prefetch_queued": len(self._queue),
+            }
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="contents-prefetch", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                key, args, kwargs, _speculative = self._queue.popleft()
+                self._running = key
+                generation = self._generation
+
+            page = None
+            try:
+                page = self._fetch(*args, **kwargs)
+            except Exception as e:
+                logger.debug("Prefetch of %r failed: %s", key, e)
+
+            with self._cond:
+                self._running = None
+                if page is not None and generation == self._generation:
+                    self._pages[key] = page
+
+            callback = self.on_ready
+            if callback is not None:
+                try:
+                    callback(key)
+                except Exception:
+                    pass
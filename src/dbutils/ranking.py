@@ -0,0 +1,97 @@
+"""Bounded top-K ranking for search results.
+
+Search paths used to collect every match and sort the whole list, which on
+a large catalog means millions of result objects for a short query such as
+"id". ``TopKCollector`` keeps only the best ``k`` (score, item) pairs in a
+min-heap, so memory stays O(k) and each match costs O(log k) at most.
+
+It also remembers which entries were admitted since the last
+``drain_delta()`` call, so a streaming UI can be sent only the new rows
+instead of re-sending everything found so far.
+
+Ties are stable: among equal scores the entry offered first ranks higher
+and is evicted last, matching ``list.sort(reverse=True)`` on the old lists.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Iterable, List, Tuple
+
+DEFAULT_TOP_K = 1000
+
+
+class TopKCollector:
+    """Keep the ``k`` highest-scoring items offered, plus a delta since the last drain."""
+
+    __slots__ = ("k", "total", "_heap", "_seq", "_drained")
+
+    def __init__(self, k: int = DEFAULT_TOP_K):
+        self.k = max(0, int(k))
+        # Number of items offered, admitted or not
+        self.total = 0
+        # Entries are (score, -seq, item): the heap root is the lowest score
+        # and, among equal scores, the most recently offered item.
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._seq = 0
+        # Entries with seq >= _drained have not been handed out yet
+        self._drained = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def min_score(self) -> float:
+        """Score an item must beat to be admitted once the collector is full."""
+        if len(self._heap) < self.k:
+            return float("-inf")
+        return self._heap[0][0]
+
+    def offer(self, score: float, item: Any) -> bool:
+        """Offer one scored item; return True if it is now in the top K."""
+        self.total += 1
+        if self.k == 0:
+            return False
+        seq = self._seq
+        self._seq += 1
+        heap = self._heap
+        if len(heap) < self.k:
+            heapq.heappush(heap, (score, -seq, item))
+            return True
+        if score > heap[0][0]:
+            heapq.heapreplace(heap, (score, -seq, item))
+            return True
+        return False
+
+    def extend(self, scored: Iterable[Tuple[Any, float]]) -> None:
+        """Offer every ``(item, score)`` pair from an iterable."""
+        for item, score in scored:
+            self.offer(score, item)
+
+    def drain_delta(self) -> List[Tuple[Any, float]]:
+        """Return entries admitted since the last drain that are still in the top K.
+
+        The delta is ranked best-first. Entries admitted and then evicted
+        between two drains are never reported.
+        """
+        mark = self._drained
+        self._drained = self._seq
+        fresh = [entry for entry in self._heap if -entry[1] >= mark]
+        fresh.sort(reverse=True, key=_rank_key)
+        return [(item, score) for score, _neg_seq, item in fresh]
+
+    def results(self) -> List[Tuple[Any, float]]:
+        """Return the current top K as ``(item, score)`` pairs, best first."""
+        ranked = sorted(self._heap, reverse=True, key=_rank_key)
+        return [(item, score) for score, _neg_seq, item in ranked]
+
+
+def _rank_key(entry: Tuple[float, int, Any]) -> Tuple[float, int]:
+    # Never compare the items themselves
+    return entry[0], entry[1]
+
+
+def top_k(scored: Iterable[Tuple[Any, float]], k: int = DEFAULT_TOP_K) -> List[Tuple[Any, float]]:
+    """Return the ``k`` best ``(item, score)`` pairs from an iterable, best first."""
+    collector = TopKCollector(k)
+    collector.extend(scored)
+    return collector.results()
@@ -0,0 +1,172 @@
+"""Columnar query results.
+
+Query paths used to build ``dict(zip(cols, row))`` for every row, repeating
+the column-name keys for each of possibly millions of rows. ``ResultSet``
+keeps one header of column names plus the row tuples exactly as the cursor
+returned them (or one list per column), and hands out lightweight
+dict-like ``RowView`` objects only when a row is actually accessed.
+
+A ResultSet behaves like a read-only ``list[dict]``: ``len()``, indexing,
+iteration, ``row.get(name)`` and ``row[name]`` all work, and it compares
+equal to the equivalent list of dicts, so existing callers keep working.
+It is not a ``list`` though: ``json.dumps`` rejects it, so serialize
+``to_dicts()`` instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class RowView(Mapping):
+    """Read-only mapping view of one row of a ResultSet."""
+
+    __slots__ = ("_rs", "_i")
+
+    def __init__(self, rs: "ResultSet", i: int):
+        self._rs = rs
+        self._i = i
+
+    def __getitem__(self, key: str) -> Any:
+        pos = self._rs._index[key]
+        return self._rs._value(self._i, pos)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        pos = self._rs._index.get(key)
+        if pos is None:
+            return default
+        return self._rs._value(self._i, pos)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rs._index)
+
+    def __len__(self) -> int:
+        return len(self._rs._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rs._index
+
+    def copy(self) -> Dict[str, Any]:
+        """Materialize the row as a plain dict."""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+class ResultSet(Sequence):
+    """Column header plus row tuples (row-major) or per-column lists (column-major)."""
+
+    __slots__ = ("columns", "_index", "_rows", "_arrays", "_length")
+
+    def __init__(self, columns: Iterable[str], rows: Optional[Iterable[Sequence]] = None):
+        self.columns: List[str] = list(columns or [])
+        # Later duplicates win, matching dict(zip(cols, row))
+        self._index: Dict[str, int] = {name: pos for pos, name in enumerate(self.columns)}
+        self._rows: Optional[List[Sequence]] = list(rows) if rows is not None else []
+        self._arrays: Optional[List[Sequence]] = None
+        self._length = len(self._rows)
+
+    @classmethod
+    def from_arrays(cls, columns: Iterable[str], arrays: Iterable[Sequence]) -> "ResultSet":
+        """Build a column-major ResultSet from one sequence (list/array) per column."""
+        rs = cls(columns)
+        rs._rows = None
+        rs._arrays = list(arrays)
+        rs._length = len(rs._arrays[0]) if rs._arrays else 0
+        return rs
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Mapping], columns: Optional[Iterable[str]] = None) -> "ResultSet":
+        """Build a ResultSet from dict rows; the header defaults to the first row's keys."""
+        rows = list(rows)
+        if columns is None:
+            columns = list(rows[0].keys()) if rows else []
+        columns = list(columns)
+        return cls(columns, [tuple(r.get(c) for c in columns) for r in rows])
+
+    # -- Sequence protocol ---------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            if self._rows is not None:
+                return ResultSet(self.columns, self._rows[i])
+            return ResultSet.from_arrays(self.columns, [a[i] for a in self._arrays])
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("ResultSet index out of range")
+        return RowView(self, i)
+
+    def __iter__(self) -> Iterator[RowView]:
+        for i in range(self._length):
+            yield RowView(self, i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ResultSet, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ResultSet(columns={self.columns!r}, rows={len(self)})"
+
+    # -- Columnar access -----------------------------------------------------
+
+    def _value(self, i: int, pos: int) -> Any:
+        if self._rows is not None:
+            row = self._rows[i]
+            return row[pos] if pos < len(row) else None
+        return self._arrays[pos][i]
+
+    def value(self, i: int, column: str, default: Any = None) -> Any:
+        """Return the value of ``column`` in row ``i`` without building a row view."""
+        pos = self._index.get(column)
+        if pos is None:
+            return default
+        return self._value(i, pos)
+
+    def column(self, name: str) -> List[Any]:
+        """Return every value of one column."""
+        pos = self._index[name]
+        if self._arrays is not None:
+            return list(self._arrays[pos])
+        return [row[pos] if pos < len(row) else None for row in self._rows]
+
+    def tuples(self) -> List[tuple]:
+        """Return rows as tuples in header order."""
+        if self._rows is not None:
+            return [tuple(r) for r in self._rows]
+        return list(zip(*self._arrays, strict=True))
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize every row as a plain dict, e.g. for ``json.dumps``."""
+        # Like RowView: later duplicate names win and short rows read as None
+        index = self._index
+        return [{name: row[pos] if pos < len(row) else None for name, pos in index.items()} for row in self.tuples()]
+
+    # -- Mutation ------------------------------------------------------------
+
+    def copy(self) -> "ResultSet":
+        return ResultSet(self.columns, self.tuples())
+
+    def extend(self, rows: Iterable) -> None:
+        """Append rows from another ResultSet, tuples, or dict-like rows."""
+        if self._rows is None:
+            # Switch to row-major storage before appending
+            self._rows = self.tuples()
+            self._arrays = None
+        if isinstance(rows, ResultSet) and rows.columns == self.columns:
+            self._rows.extend(rows.tuples())
+        else:
+            for row in rows:
+                if isinstance(row, Mapping):
+                    self._rows.append(tuple(row.get(c) for c in self.columns))
+                else:
+                    self._rows.append(tuple(row))
+        self._length = len(self._rows)
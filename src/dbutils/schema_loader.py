@@ -0,0 +1,232 @@
+"""Parallel per-schema catalog loading.
+
+A serial catalog load walks every schema in key order, so on systems with
+hundreds of libraries one slow schema holds up everything after it.
+``ParallelSchemaLoader`` gives each schema its own CatalogScan and runs up
+to ``workers`` of them at once, each on its own (pooled) connections:
+- chunks are handed back in the order they are produced, tagged with their
+  schema, so fast schemas reach the UI without waiting on slow ones
+- every schema ends with one final chunk carrying its state (done,
+  cancelled or failed) and the number of tables it loaded
+- single schemas, or the whole load, can be cancelled while it runs
+
+Schemas start in the order given; get_available_schemas lists the largest
+first, which keeps the longest scans from starting last.
+
+The number of workers can be set with DBUTILS_SCHEMA_WORKERS; 0 (the
+default) keeps the serial loader. Every scan holds two connections at once,
+so the count is capped to what ``query_concurrency()`` allows, less any
+connections the caller keeps pinned while the load runs.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set
+
+from dbutils.db_browser import CatalogScan, ColumnInfo, TableInfo
+
+logger = logging.getLogger(__name__)
+
+# Schema states, as reported by SchemaChunk.state and progress()
+QUEUED = "queued"
+LOADING = "loading"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+
+def default_workers(pinned: int = 0) -> int:
+    """Return how many schemas can load at once without waiting on connections.
+
+    ``pinned`` connections are held elsewhere for the whole load.
+    """
+    from dbutils.connection_pool import query_concurrency
+
+    # Each scan streams SYSTABLES and SYSCOLUMNS together, holding two connections
+    return max(1, (query_concurrency() - pinned) // 2)
+
+
+@dataclass
+class SchemaLoadConfig:
+    """Settings for parallel per-schema loading."""
+
+    workers: int = 0  # schemas loaded at once; 0 keeps the serial loader
+
+    @staticmethod
+    def from_env() -> "SchemaLoadConfig":
+        """Build a config from the DBUTILS_SCHEMA_WORKERS environment variable."""
+        cfg = SchemaLoadConfig()
+        try:
+            cfg.workers = int(os.environ.get("DBUTILS_SCHEMA_WORKERS", cfg.workers))
+        except ValueError:
+            logger.warning("Invalid DBUTILS_SCHEMA_WORKERS setting, using defaults")
+            cfg = SchemaLoadConfig()
+        cfg.workers = max(0, cfg.workers)
+        return cfg
+
+
+class SchemaChunk(NamedTuple):
+    """One piece of a parallel load.
+
+    Chunks with state LOADING carry tables and columns. The last chunk of
+    each schema is empty and carries its final state instead.
+    """
+
+    schema: str
+    tables: List[TableInfo]
+    columns: List[ColumnInfo]
+    loaded: int  # tables of this schema loaded so far
+    state: str
+    error: str = ""
+
+
+class ParallelSchemaLoader:
+    """Load several schemas concurrently and yield their chunks as they arrive.
+
+    Iterating starts the workers and yields SchemaChunk objects until every
+    schema has finished. At most ``max_pending`` chunks wait to be consumed,
+    so a slow consumer slows the scans down instead of piling up memory.
+    Stopping the iteration early cancels whatever is still loading.
+
+    ``workers`` is capped by default_workers(pinned); pass the number of
+    connections the calling thread keeps checked out as ``pinned``.
+    """
+
+    def __init__(
+        self,
+        schemas: Iterable[str],
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+        first_chunk_size: Optional[int] = None,
+        use_mock: bool = False,
+        max_pending: Optional[int] = None,
+        pinned: int = 0,
+    ):
+        self.schemas = list(schemas)
+        # More workers than connections would leave scans waiting on the pool
+        limit = default_workers(pinned)
+        self.workers = max(1, min(workers or limit, limit, len(self.schemas) or 1))
+        self.chunk_size = chunk_size
+        self.first_chunk_size = first_chunk_size
+        self.use_mock = use_mock
+        self._queue: "queue.Queue[Optional[SchemaChunk]]" = queue.Queue(maxsize=max_pending or self.workers * 2)
+        self._lock = threading.Lock()
+        self._pending = deque(self.schemas)
+        self._progress: Dict[str, Dict[str, Any]] = {s: {"loaded": 0, "state": QUEUED} for s in self.schemas}
+        self._cancelled: Set[str] = set()
+        self._cancel_all = threading.Event()
+        # Set once the consumer has stopped reading
+        self._closed = threading.Event()
+
+    def cancel(self, schema: Optional[str] = None):
+        """Cancel one schema, or every schema still queued or loading when None."""
+        if schema is None:
+            self._cancel_all.set()
+            return
+        with self._lock:
+            self._cancelled.add(schema)
+
+    def is_cancelled(self, schema: str) -> bool:
+        if self._cancel_all.is_set():
+            return True
+        with self._lock:
+            return schema in self._cancelled
+
+    def progress(self) -> Dict[str, Dict[str, Any]]:
+        """Return {schema: {"loaded": tables loaded, "state": state}} for every schema."""
+        with self._lock:
+            return {schema: dict(info) for schema, info in self._progress.items()}
+
+    def __iter__(self) -> Iterator[SchemaChunk]:
+        threads = [
+            threading.Thread(target=self._work, name=f"schema-loader-{i}", daemon=True) for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        running = len(threads)
+        try:
+            while running:
+                chunk = self._queue.get()
+                if chunk is None:
+                    running -= 1
+                    continue
+                yield chunk
+        finally:
+            if running:
+                # The consumer stopped early; unblock workers waiting to put
+                self._cancel_all.set()
+                self._closed.set()
+                while any(thread.is_alive() for thread in threads):
+                    try:
+                        self._queue.get(timeout=0.05)
+                    except queue.Empty:
+                        pass
+
+    def _next_schema(self) -> Optional[str]:
+        with self._lock:
+            return self._pending.popleft() if self._pending else None
+
+    def _update(self, schema: str, state: str, added: int = 0) -> int:
+        with self._lock:
+            info = self._progress[schema]
+            info["state"] = state
+            info["loaded"] += added
+            return info["loaded"]
+
+    def _put(self, chunk: Optional[SchemaChunk]) -> bool:
+        while True:
+            try:
+                self._queue.put(chunk, timeout=0.1)
+                return True
+            except queue.Full:
+                if self._closed.is_set():
+                    return False
+
+    def _work(self):
+        try:
+            while not self._closed.is_set():
+                schema = self._next_schema()
+                if schema is None:
+                    break
+                self._load_schema(schema)
+        finally:
+            self._put(None)
+
+    def _load_schema(self, schema: str):
+        if self.is_cancelled(schema):
+            self._put(SchemaChunk(schema, [], [], self._update(schema, CANCELLED), CANCELLED))
+            return
+
+        loaded = self._update(schema, LOADING)
+        state, error = DONE, ""
+        chunks = iter(
+            CatalogScan(
+                schema,
+                chunk_size=self.chunk_size,
+                first_chunk_size=self.first_chunk_size,
+                use_mock=self.use_mock,
+            )
+        )
+        try:
+            for tables, columns in chunks:
+                if self.is_cancelled(schema):
+                    state = CANCELLED
+                    break
+                loaded = self._update(schema, LOADING, len(tables))
+                if not self._put(SchemaChunk(schema, tables, columns, loaded, LOADING)):
+                    state = CANCELLED
+                    break
+        except Exception as e:
+            logger.warning(f"Could not load schema {schema}: {e}")
+            state, error = FAILED, str(e)
+        finally:
+            chunks.close()
+
+        self._update(schema, state)
+        self._put(SchemaChunk(schema, [], [], loaded, state, error))
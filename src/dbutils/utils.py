@@ -3,21 +3,40 @@
 
 - query_runner: Execute SQL using external `query_runner` tool, parse JSON or delimited text
 - edit_distance, fuzzy_match: Optimized fuzzy matching helpers inspired by db_browser
+- myers_distance, batch_edit_distance, fuzzy_scores: bit-parallel (Myers/Hyyro)
+  Levenshtein, batched over a whole name list; uses fast_ops when compiled,
+  else NumPy, else pure Python
 """
 
 from __future__ import annotations
 
 import json
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from dbutils.fast_ops import batch_edit_distance as _fast_batch_edit_distance
+except Exception:
+    _fast_batch_edit_distance = None
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+# Longest query handled with one machine word per name (fast_ops/NumPy paths)
+_WORD_BITS = 64
+# Names processed per NumPy block, bounding the (block x max_len) scratch arrays
+_NUMPY_BLOCK = 4096
 
 
 def query_runner(sql: str) -> List[Dict]:
-    """Execute SQL via JDBC and return rows as list[dict].
+    """Execute SQL via JDBC and return rows as a list[dict]-compatible ResultSet.
 
     This function now uses only JDBC provider via JayDeBeApi.
     Requires DBUTILS_JDBC_PROVIDER environment variable to be set.
     Optionally pass DBUTILS_JDBC_URL_PARAMS (JSON) and DBUTILS_JDBC_USER/PASSWORD.
+    Set DBUTILS_JDBC_POOL=1 to reuse pooled connections instead of connecting per statement.
     """
     # JDBC path only - no fallback to external query runner
     provider_name = os.environ.get("DBUTILS_JDBC_PROVIDER")
@@ -25,6 +44,7 @@ def query_runner(sql: str) -> List[Dict]:
         raise RuntimeError("DBUTILS_JDBC_PROVIDER environment variable not set")
 
     try:
+        from dbutils.connection_pool import get_pool, pooling_enabled
         from dbutils.jdbc_provider import connect as _jdbc_connect
 
         url_params_raw = os.environ.get("DBUTILS_JDBC_URL_PARAMS", "{}")
@@ -34,6 +54,10 @@ def query_runner(sql: str) -> List[Dict]:
             url_params = {}
         user = os.environ.get("DBUTILS_JDBC_USER")
         password = os.environ.get("DBUTILS_JDBC_PASSWORD")
+        if pooling_enabled():
+            pool = get_pool(provider_name, url_params, user=user, password=password)
+            with pool.connection() as conn:
+                return conn.query(sql)
         conn = _jdbc_connect(provider_name, url_params, user=user, password=password)
         try:
             return conn.query(sql)
@@ -82,20 +106,154 @@ def edit_distance(s1: str, s2: str) -> int:
     return previous_row[-1]
 
 
-def edit_distance_fast(s1: str, s2: str, max_dist: int) -> int:
-    """Compute Levenshtein edit distance with optimizations for small max_dist.
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """Bitmask of the positions of each character in pattern (Myers' Peq table)."""
+    peq: Dict[str, int] = {}
+    for i, ch in enumerate(pattern):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    return peq
+
 
-    This is optimized for cases where we expect small edit distances or
-    when max_dist is small, avoiding full matrix computation when possible.
+def _myers(text: str, peq: Dict[str, int], m: int, max_dist: int) -> int:
+    """Bit-parallel Levenshtein distance between text and a pattern of length m.
+
+    Hyyro's formulation of Myers' algorithm: one column of the DP matrix is
+    kept as vertical +1/-1 delta bit-vectors, so each text character costs a
+    handful of word operations. Python ints make any pattern length work.
+    Stops as soon as the distance is certain to exceed max_dist (if >= 0).
+    """
+    if m == 0:
+        return len(text)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    remaining = len(text)
+    for ch in text:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # Row 0 of the matrix grows by one per column, so shift in a +1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        remaining -= 1
+        if 0 <= max_dist < score - remaining:
+            return max_dist + 1
+    return score
+
+
+def myers_distance(s1: str, s2: str, max_dist: Optional[int] = None) -> int:
+    """Levenshtein distance using the bit-parallel Myers/Hyyro algorithm.
+
+    With max_dist, returns max_dist + 1 as soon as the distance is known to
+    be larger, instead of finishing the computation.
     """
-    # If length difference alone exceeds max_dist, return a value that will exceed threshold
-    len_diff = abs(len(s1) - len(s2))
-    if len_diff > max_dist:
-        return max_dist + 1  # Return a value > max_dist
+    cutoff = -1 if max_dist is None else max_dist
+    if cutoff >= 0 and abs(len(s1) - len(s2)) > cutoff:
+        return cutoff + 1
+    # The shorter string becomes the bit-vector pattern
+    if len(s2) > len(s1):
+        s1, s2 = s2, s1
+    return _myers(s1, _pattern_masks(s2), len(s2), cutoff)
 
-    # Use the standard algorithm but early termination is complex
-    # Instead, return the original optimized version
-    return edit_distance(s1, s2)
+
+def edit_distance_fast(s1: str, s2: str, max_dist: int) -> int:
+    """Compute Levenshtein edit distance with early termination at max_dist.
+
+    Returns the exact distance when it is <= max_dist and some value
+    > max_dist otherwise.
+    """
+    return myers_distance(s1, s2, max_dist)
+
+
+def _batch_distance_numpy(texts: Sequence[str], query: str, cutoff: int) -> List[int]:
+    """Myers' algorithm over many texts at once: one uint64 lane per text."""
+    m = len(query)
+    mask = np.uint64((1 << m) - 1)
+    high = np.uint64(1 << (m - 1))
+    one = np.uint64(1)
+    zero = np.uint64(0)
+    # Code points present in the query, sorted, with their Peq masks
+    peq = _pattern_masks(query)
+    chars = sorted(peq)
+    codes = np.array([ord(c) for c in chars], dtype=np.uint32)
+    masks = np.array([peq[c] for c in chars], dtype=np.uint64)
+
+    out: List[int] = []
+    for start in range(0, len(texts), _NUMPY_BLOCK):
+        block = texts[start : start + _NUMPY_BLOCK]
+        lengths = np.fromiter((len(t) for t in block), dtype=np.int64, count=len(block))
+        width = int(lengths.max()) if len(block) else 0
+        if width == 0:
+            out.extend(m if cutoff < 0 else min(m, cutoff + 1) for _ in block)
+            continue
+        # One UTF-32 code unit per character, padded to the block's longest text
+        padded = "".join(t.ljust(width, "\0") for t in block)
+        text_codes = np.frombuffer(padded.encode("utf-32-le"), dtype=np.uint32).reshape(len(block), width)
+        pos = np.minimum(np.searchsorted(codes, text_codes), len(codes) - 1)
+        eq_all = np.where(codes[pos] == text_codes, masks[pos], zero)
+
+        pv = np.full(len(block), mask, dtype=np.uint64)
+        mv = np.zeros(len(block), dtype=np.uint64)
+        score = np.full(len(block), m, dtype=np.int64)
+        for j in range(width):
+            active = lengths > j
+            eq = eq_all[:, j]
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & mask)
+            mh = pv & xh
+            up = (ph & high) != 0
+            down = ~up & ((mh & high) != 0)
+            score += (active & up).astype(np.int64) - (active & down).astype(np.int64)
+            ph = ((ph << one) | one) & mask
+            mh = (mh << one) & mask
+            pv = np.where(active, mh | (~(xv | ph) & mask), pv)
+            mv = np.where(active, ph & xv, mv)
+            # Every lane is already past the cutoff: the rest cannot bring it back
+            if cutoff >= 0 and bool(np.all(score - np.maximum(lengths - j - 1, 0) > cutoff)):
+                break
+        if cutoff >= 0:
+            score = np.minimum(score, cutoff + 1)
+        out.extend(int(d) for d in score)
+    return out
+
+
+def batch_edit_distance(texts: Sequence[str], query: str, max_dist: Optional[int] = None) -> List[int]:
+    """Levenshtein distance from query to every text, in one call.
+
+    The query's bit masks are built once and shared by all texts. Uses the
+    compiled fast_ops kernel when available, else a NumPy implementation
+    that advances every text in lockstep, else pure Python. With max_dist,
+    distances above it are reported as max_dist + 1.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    cutoff = -1 if max_dist is None else max_dist
+    m = len(query)
+    if 0 < m <= _WORD_BITS:
+        if _fast_batch_edit_distance is not None:
+            return list(_fast_batch_edit_distance(texts, query, cutoff))
+        if np is not None:
+            return _batch_distance_numpy(texts, query, cutoff)
+    peq = _pattern_masks(query)
+    out = []
+    for text in texts:
+        if cutoff >= 0 and abs(len(text) - m) > cutoff:
+            out.append(cutoff + 1)
+        else:
+            out.append(_myers(text, peq, m, cutoff))
+    return out
 
 
 def _has_exact_substring(text_lower: str, query_lower: str) -> bool:
@@ -119,7 +277,7 @@ def _word_prefix_or_edit(text_lower: str, query_lower: str) -> bool:
             max_distance = max(1, len(query_lower) // 3)
             # Use the length check to potentially avoid edit distance calculation
             if abs(len(word) - len(query_lower)) <= max_distance:
-                if edit_distance(word, query_lower) <= max_distance:
+                if myers_distance(word, query_lower, max_distance) <= max_distance:
                     return True
     return False
 
@@ -159,3 +317,65 @@ def fuzzy_match(text: str, query: str) -> bool:
     if _word_prefix_or_edit(text_lower, query_lower):
         return True
     return _sequential_char_match(text_lower, query_lower)
+
+
+def _score_substrings_and_prefixes(
+    lowered: List[str], query_lower: str, max_distance: int, scores: List[float]
+) -> Tuple[List[str], List[int]]:
+    """Score substring and word prefix matches into ``scores`` for fuzzy_scores.
+
+    Returns the words of the other texts that are close enough in length to
+    be worth an edit distance, and the index of the text each came from.
+    """
+    m = len(query_lower)
+    words: List[str] = []
+    owners: List[int] = []
+    for i, text_lower in enumerate(lowered):
+        if not text_lower:
+            continue
+        if query_lower in text_lower:
+            scores[i] = 1.0
+            continue
+        if m < 2:
+            continue
+        text_words = text_lower.replace("_", " ").split()
+        if any(word.startswith(query_lower) for word in text_words):
+            scores[i] = 0.8
+        elif m >= 3:
+            for word in text_words:
+                if abs(len(word) - m) <= min(2, max_distance):
+                    words.append(word)
+                    owners.append(i)
+    return words, owners
+
+
+def fuzzy_scores(texts: Sequence[str], query: str) -> List[float]:
+    """Score query against every text in one call, using fuzzy_match's rules.
+
+    Returns one score per text: 1.0 for a substring match, 0.8 for a word
+    prefix, 0.4-0.6 for a word within edit distance (closer is higher), 0.2
+    for an in-order character match and 0.0 for no match, so that
+    ``fuzzy_scores([t], q)[0] > 0`` agrees with ``fuzzy_match(t, q)``.
+    Edit distances for all candidate words are computed in a single
+    batch_edit_distance call.
+    """
+    texts = list(texts)
+    if not query:
+        return [1.0] * len(texts)
+    query_lower = query.lower()
+    m = len(query_lower)
+    max_distance = max(1, m // 3)
+    scores = [0.0] * len(texts)
+    lowered = [t.lower() if t else "" for t in texts]
+
+    words, owners = _score_substrings_and_prefixes(lowered, query_lower, max_distance, scores)
+    if words:
+        for i, dist in zip(owners, batch_edit_distance(words, query_lower, max_distance), strict=True):
+            if dist <= max_distance:
+                scores[i] = max(scores[i], 0.6 - 0.2 * dist / max_distance)
+
+    if m >= 2:
+        for i, text_lower in enumerate(lowered):
+            if scores[i] == 0.0 and text_lower and _sequential_char_match(text_lower, query_lower):
+                scores[i] = 0.2
+    return scores
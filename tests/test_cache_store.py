@@ -0,0 +1,75 @@
+"""Unit tests for dbutils.cache_store and the per-key schema cache."""
+
+import gzip
+import pickle
+import time
+
+from dbutils import db_browser
+from dbutils.cache_store import CacheStore, get_store
+from dbutils.db_browser import TableInfo, get_cache_key, load_from_cache, save_to_cache
+
+
+def test_put_get_replace_and_delete(tmp_path):
+    store = CacheStore(tmp_path / "c.sqlite3")
+    assert store.get("missing") is None
+
+    store.put("A", {"x": 1}, timestamp=123.0)
+    store.put("B", [1, 2, 3])
+    assert store.get("A") == (123.0, {"x": 1})
+    store.put("A", "new")
+    assert store.get("A")[1] == "new"
+    assert "B" in store and len(store) == 2 and store.keys() == ["A", "B"]
+
+    assert store.delete("A") is True
+    assert store.delete("A") is False
+    store.clear()
+    assert len(store) == 0
+    store.close()
+
+
+def test_entries_are_independent(tmp_path):
+    """A damaged entry does not affect lookups of other keys."""
+    store = CacheStore(tmp_path / "c.sqlite3")
+    store.put("GOOD", "value")
+    store.put("BAD", "value")
+    store._connect().execute("UPDATE entries SET payload = ? WHERE key = 'BAD'", (b"garbage",))
+    assert store.get("GOOD")[1] == "value"
+    store.close()
+
+
+def test_get_store_is_shared_per_path(tmp_path):
+    assert get_store(tmp_path / "a.sqlite3") is get_store(tmp_path / "a.sqlite3")
+    assert get_store(tmp_path / "a.sqlite3") is not get_store(tmp_path / "b.sqlite3")
+
+
+def test_pages_are_stored_as_separate_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_browser, "CACHE_FILE", tmp_path / "schema_cache.pkl.gz")
+    for offset in range(0, 30, 10):
+        tables = [TableInfo(schema="S", name=f"T{offset + i}", remarks="") for i in range(10)]
+        save_to_cache("S", tables, [], limit=10, offset=offset)
+
+    store = get_store(tmp_path / db_browser.CACHE_DB_NAME)
+    assert len(store) == 3
+    tables, columns = load_from_cache("S", limit=10, offset=20)
+    assert [t.name for t in tables][:2] == ["T20", "T21"] and columns == []
+    assert not (tmp_path / "schema_cache.pkl.gz").exists()
+
+
+def test_legacy_cache_is_migrated(tmp_path, monkeypatch):
+    legacy = tmp_path / "schema_cache.pkl.gz"
+    monkeypatch.setattr(db_browser, "CACHE_FILE", legacy)
+    tables = [TableInfo(schema="OLD", name="T", remarks="")]
+    key = get_cache_key("OLD", 5, 0)
+    with gzip.open(legacy, "wb") as f:
+        pickle.dump({key: {"timestamp": time.time(), "tables": tables, "columns": []}}, f)
+
+    loaded = load_from_cache("OLD", limit=5, offset=0)
+    assert loaded is not None and loaded[0][0].name == "T"
+    assert not legacy.exists()
+
+
+def test_corrupt_store_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_browser, "CACHE_FILE", tmp_path / "schema_cache.pkl.gz")
+    (tmp_path / db_browser.CACHE_DB_NAME).write_bytes(b"not a database" * 100)
+    save_to_cache("S", [], [])  # should not raise
+    assert load_from_cache("S") is None
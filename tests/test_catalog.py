@@ -82,3 +82,59 @@ def test_get_columns_queries_query_runner(monkeypatch):
     assert res and isinstance(res, list)
     assert "TABLE_SCHEMA = 'MYSCHEMA'" in called["sql"]
     assert "TABLE_NAME = 'USERS'" in called["sql"]
+
+
+def test_load_catalog_async_merges_parts_per_table():
+    import asyncio
+
+    arrived = []
+    metadata = asyncio.run(catalog.load_catalog_async(mock=True, on_part=lambda name, md: arrived.append(name)))
+
+    assert sorted(arrived) == sorted(catalog.CATALOG_PARTS)
+    users = metadata.tables[("TEST", "USERS")]
+    assert users["REMARKS"] == "User accounts"
+    assert [c["COLNAME"] for c in users["columns"]] == ["ID", "NAME"]
+    assert users["primary_key"] == ["ID"]
+    assert users["indexes"] == {"IDX_USERS_ID": ["ID"]}
+    assert users["row_count"] == 12345
+
+
+def test_load_catalog_async_runs_parts_concurrently(monkeypatch):
+    import asyncio
+    import threading
+
+    # Every part blocks until all three are running at once
+    all_running = threading.Barrier(3, timeout=2)
+
+    def part(rows):
+        def query(schema=None, mock=False):
+            all_running.wait()
+            return rows
+
+        return query
+
+    monkeypatch.setattr(catalog, "get_tables", part([{"TABSCHEMA": "S", "TABNAME": "T", "TYPE": "T"}]))
+    monkeypatch.setattr(catalog, "get_columns", part([{"TABSCHEMA": "S", "TABNAME": "T", "COLNAME": "C"}]))
+    monkeypatch.setattr(catalog, "get_table_sizes", part([{"TABSCHEMA": "S", "TABNAME": "T", "ROWCOUNT": 7}]))
+    monkeypatch.setenv("DBUTILS_QUERY_CONCURRENCY", "3")
+    from dbutils.connection_pool import close_all_pools
+
+    close_all_pools()
+    try:
+        metadata = asyncio.run(catalog.load_catalog_async("S", parts=["tables", "columns", "table_sizes"]))
+    finally:
+        close_all_pools()
+    entry = metadata.tables[("S", "T")]
+    assert entry["TYPE"] == "T" and entry["row_count"] == 7 and len(entry["columns"]) == 1
+
+
+def test_load_catalog_async_failed_part_is_empty(monkeypatch):
+    import asyncio
+
+    def boom(schema=None, mock=False):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(catalog, "get_indexes", boom)
+    metadata = asyncio.run(catalog.load_catalog_async(parts=["tables", "indexes"], mock=True))
+    assert metadata.parts_loaded.count("indexes") == 1
+    assert all(entry["indexes"] == {} for entry in metadata.tables.values())
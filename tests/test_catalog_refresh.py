@@ -0,0 +1,144 @@
+"""Unit tests for dbutils.catalog_refresh.
+
+Tests for:
+- Fingerprint diffs and their JSON round trip
+- Diffs between two loaded catalogs
+- Patching cached tables and columns with a delta
+- refresh_catalog loading only changed tables and patching a search index
+- Delta refresh of an expired db_browser cache entry
+"""
+
+from dbutils import db_browser
+from dbutils.catalog_refresh import (
+    CatalogDelta,
+    TableFingerprint,
+    apply_delta,
+    diff_catalogs,
+    diff_fingerprints,
+    fingerprints_from_rows,
+    fingerprints_to_rows,
+    refresh_cached_catalog,
+    refresh_catalog,
+)
+from dbutils.db_browser import ColumnInfo, SearchIndex, TableInfo
+
+
+def _col(schema, table, name):
+    return (schema, table, name, "CHAR", 1, 0, "N", "")
+
+
+def _fake_catalog(monkeypatch, fingerprint_rows, table_rows, column_rows):
+    """Serve the fingerprint query and both catalog scans from lists, recording the SQL."""
+    seen = []
+
+    def fake_iter(sql, batch_size=1000):
+        seen.append(sql)
+        if "COLUMN_COUNT" in sql:
+            yield from fingerprint_rows
+        elif "SYSCOLUMNS" in sql:
+            yield from column_rows
+        else:
+            yield from table_rows
+
+    monkeypatch.setattr("dbutils.db_browser.iter_query_runner", fake_iter, raising=True)
+    return seen
+
+
+def test_diff_fingerprints():
+    old = {
+        ("S", "A"): TableFingerprint("t1", 2),
+        ("S", "B"): TableFingerprint("t1", 3),
+        ("S", "C"): TableFingerprint("t1", 1),
+    }
+    new = {
+        ("S", "A"): TableFingerprint("t1", 2),
+        ("S", "B"): TableFingerprint("t2", 4),
+        ("S", "D"): TableFingerprint("t2", 1),
+    }
+    delta = diff_fingerprints(old, new)
+    assert delta == CatalogDelta(added=[("S", "D")], changed=[("S", "B")], removed=[("S", "C")])
+    assert delta.stale == [("S", "D"), ("S", "B")]
+    assert not diff_fingerprints(old, old)
+
+
+def test_fingerprint_rows_round_trip():
+    fps = {("S", "A"): TableFingerprint("2024-01-01 00:00:00", 3)}
+    assert fingerprints_from_rows(fingerprints_to_rows(fps)) == fps
+
+
+def test_diff_catalogs_compares_tables_and_columns():
+    old_tables = [{"schema": "S", "name": n, "remarks": ""} for n in ("A", "B", "C")]
+    old_columns = [{"schema": "S", "table": n, "name": "ID"} for n in ("A", "B", "C")]
+    new_tables = [dict(t) for t in old_tables[:2]] + [{"schema": "S", "name": "D", "remarks": ""}]
+    new_columns = old_columns[:2] + [{"schema": "S", "table": "B", "name": "X"}]
+
+    delta = diff_catalogs(old_tables, old_columns, new_tables, new_columns)
+    assert delta == CatalogDelta(added=[("S", "D")], changed=[("S", "B")], removed=[("S", "C")])
+
+
+def test_apply_delta_patches_dicts_in_place():
+    tables = [{"schema": "S", "name": n} for n in ("A", "B", "C")]
+    columns = [{"schema": "S", "table": n, "name": "ID"} for n in ("A", "B", "C")]
+    delta = CatalogDelta(added=[("S", "D")], changed=[("S", "B")], removed=[("S", "C")])
+    fresh_tables = [{"schema": "S", "name": "B", "remarks": "new"}, {"schema": "S", "name": "D"}]
+    fresh_columns = [{"schema": "S", "table": "B", "name": c} for c in ("ID", "X")] + [
+        {"schema": "S", "table": "D", "name": "ID"}
+    ]
+
+    out_tables, out_columns = apply_delta(tables, columns, delta, fresh_tables, fresh_columns)
+    assert [t["name"] for t in out_tables] == ["A", "B", "D"]
+    assert out_tables[1]["remarks"] == "new"
+    assert [(c["table"], c["name"]) for c in out_columns] == [("A", "ID"), ("B", "ID"), ("B", "X"), ("D", "ID")]
+
+
+def test_refresh_catalog_loads_only_changed_tables(monkeypatch):
+    tables = [TableInfo("S", "A", ""), TableInfo("S", "B", "")]
+    columns = [ColumnInfo("S", "A", "ID", "CHAR", 1, 0, "N", ""), ColumnInfo("S", "B", "ID", "CHAR", 1, 0, "N", "")]
+    old = {("S", "A"): TableFingerprint("2024-01-01", 1), ("S", "B"): TableFingerprint("2024-01-01", 1)}
+    seen = _fake_catalog(
+        monkeypatch,
+        [("S", "A", "2024-01-01", 1), ("S", "B", "2024-03-01", 2), ("S", "C", "2024-02-01", 1)],
+        # The scan also returns an unchanged table altered after the oldest stale one
+        [("S", "B", ""), ("S", "C", ""), ("S", "Z", "")],
+        [_col("S", "B", "ID"), _col("S", "B", "NEW"), _col("S", "C", "ID"), _col("S", "Z", "ID")],
+    )
+    index = SearchIndex()
+    index.build_index(tables, columns)
+
+    result = refresh_catalog(tables, columns, old, "S", index=index)
+    assert result.delta.added == [("S", "C")] and result.delta.changed == [("S", "B")]
+    assert [t.name for t in result.tables] == ["A", "B", "C"]
+    assert [(c.table, c.name) for c in result.columns] == [("A", "ID"), ("B", "ID"), ("B", "NEW"), ("C", "ID")]
+    assert result.fingerprints[("S", "B")] == TableFingerprint("2024-03-01", 2)
+    assert all("LAST_ALTERED_TIMESTAMP >= '2024-02-01'" in sql for sql in seen[1:])
+    assert sorted(index.table_keys) == ["S.A", "S.B", "S.C"]
+    assert "S.B.NEW" in index.column_keys and "S.Z.ID" not in index.column_keys
+
+
+def test_refresh_catalog_without_changes_skips_the_scan(monkeypatch):
+    seen = _fake_catalog(monkeypatch, [("S", "A", "2024-01-01", 1)], [], [])
+    old = {("S", "A"): TableFingerprint("2024-01-01", 1)}
+    result = refresh_catalog([TableInfo("S", "A", "")], [], old)
+    assert not result.delta
+    assert len(seen) == 1
+
+
+def test_refresh_cached_catalog_patches_expired_entry(monkeypatch, tmp_path):
+    monkeypatch.setattr(db_browser, "CACHE_FILE", tmp_path / "schema_cache.pkl.gz")
+    monkeypatch.setattr(db_browser, "CACHE_TTL", -1)
+    assert refresh_cached_catalog("S") is None
+
+    old = {("S", "A"): TableFingerprint("2024-01-01", 1), ("S", "GONE"): TableFingerprint("2024-01-01", 1)}
+    db_browser.save_to_cache("S", [TableInfo("S", "A", ""), TableInfo("S", "GONE", "")], [], fingerprints=old)
+    assert db_browser.load_from_cache("S") is None
+    _fake_catalog(monkeypatch, [("S", "A", "2024-01-01", 1)], [], [])
+
+    result = refresh_cached_catalog("S")
+    assert result.delta.removed == [("S", "GONE")]
+    tables, _columns = db_browser.load_from_cache("S", allow_expired=True)
+    assert [t.name for t in tables] == ["A"]
+    assert db_browser.load_cached_fingerprints("S") == {("S", "A"): TableFingerprint("2024-01-01", 1)}
+
+    # Saving without fingerprints forgets the old ones
+    db_browser.save_to_cache("S", tables, [])
+    assert db_browser.load_cached_fingerprints("S") is None
@@ -0,0 +1,90 @@
+"""Unit tests for dbutils.catalog_segment.
+
+Tests for:
+- Round trip of tables and columns through a segment file
+- Mapping and unlinking, and rejecting files that are not segments
+- Copying and adopting a mapped segment into a CatalogStore
+"""
+
+import pytest
+
+from dbutils.catalog_segment import CatalogSegment, open_segment, write_segment
+from dbutils.catalog_store import CatalogStore
+from dbutils.db_browser import ColumnInfo, TableInfo
+
+TABLES = [TableInfo("S", "KUNDEN", "Kundenstamm äöü"), TableInfo("S", "ORDERS", "")]
+COLUMNS = [
+    ColumnInfo("S", "KUNDEN", "ID", "INTEGER", 10, 0, "N", ""),
+    ColumnInfo("S", "KUNDEN", "NAME", "VARCHAR", None, None, "Y", "Name €"),
+    ColumnInfo("S", "ORDERS", "ID", "INTEGER", 10, 0, "N", ""),
+]
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "chunk.seg"
+    size = write_segment(path, TABLES, COLUMNS)
+    assert path.stat().st_size == size
+    assert not (tmp_path / "chunk.seg.tmp").exists()
+
+    segment = CatalogSegment(path)
+    assert segment.tables == TABLES
+    assert segment.columns == COLUMNS
+    assert segment.columns[1].length is None and segment.columns[1].remarks == "Name €"
+    assert [t.name for t in segment.tables[1:]] == ["ORDERS"]
+    with pytest.raises(TypeError):
+        segment.tables.append(TABLES[0])
+
+
+def test_loader_dicts_and_empty_segment(tmp_path):
+    write_segment(tmp_path / "dicts.seg", [{"schema": "S", "name": "T", "remarks": ""}], [])
+    assert [t.name for t in CatalogSegment(tmp_path / "dicts.seg").tables] == ["T"]
+
+    write_segment(tmp_path / "empty.seg", [], [])
+    empty = CatalogSegment(tmp_path / "empty.seg")
+    assert len(empty.tables) == 0 and len(empty.columns) == 0
+
+
+def test_open_segment_unlinks_but_stays_readable(tmp_path):
+    path = tmp_path / "chunk.seg"
+    write_segment(path, TABLES, COLUMNS)
+    segment = open_segment(path)
+    assert not path.exists()
+    assert segment.tables[0].remarks == "Kundenstamm äöü"
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "junk.seg"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        CatalogSegment(path)
+
+
+def test_copy_into_store(tmp_path):
+    write_segment(tmp_path / "chunk.seg", TABLES, COLUMNS)
+    segment = CatalogSegment(tmp_path / "chunk.seg")
+    store = CatalogStore()
+    store.add_tables(segment.tables)
+    store.add_columns(segment.columns)
+    assert store.tables == TABLES and store.columns == COLUMNS
+    assert [c.name for c in store.columns_of("S", "KUNDEN")] == ["ID", "NAME"]
+
+
+def test_adopt_segment_into_store(tmp_path):
+    write_segment(tmp_path / "chunk.seg", TABLES, COLUMNS)
+    segment = CatalogSegment(tmp_path / "chunk.seg")
+    segment.strings.decode_all()
+    store = CatalogStore([TableInfo("S", "ORDERS", "old")], [ColumnInfo("T", "X", "A", "INTEGER", 4, 0, "N", "")])
+    tables, columns = store.adopt(segment)
+    assert tables == TABLES and columns == COLUMNS
+    # ORDERS is replaced where it stood
+    assert [t.name for t in store.tables] == ["ORDERS", "KUNDEN"] and store.tables[0].remarks == ""
+    assert store.columns[1:] == COLUMNS and store.columns[2].length is None
+    assert [c.name for c in store.columns_of("S", "KUNDEN")] == ["ID", "NAME"]
+    assert store.get_column("T", "X", "A").length == 4
+
+    # Rows dropped from a source store are not adopted
+    source = CatalogStore(TABLES, COLUMNS)
+    source.remove_tables([("S", "KUNDEN")])
+    other = CatalogStore()
+    assert other.adopt(source)[1] == COLUMNS[2:]
+    assert other.tables == TABLES[1:]
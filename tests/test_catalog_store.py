@@ -0,0 +1,149 @@
+"""Unit tests for dbutils.catalog_store.
+
+Tests for:
+- Row views matching TableInfo/ColumnInfo attributes and equality
+- Appending dataclasses and loader dicts, per-table column lookup
+- Removing tables and patching the store with a CatalogDelta
+- Keyed lookups of tables, columns and schema sizes
+- Searching a SearchIndex built over row views
+- Memory use compared to the dataclasses
+"""
+
+from dbutils.catalog_refresh import CatalogDelta
+from dbutils.catalog_store import CatalogStore, ColumnRow, StringTable, TableRow, count_schema_tables, find_table
+from dbutils.db_browser import ColumnInfo, SearchIndex, TableInfo
+
+
+def _col(table, name, length=10, scale=0, nulls="Y"):
+    return ColumnInfo("S", table, name, "DECIMAL", length, scale, nulls, f"{name} column")
+
+
+def _store():
+    tables = [TableInfo("S", "CUSTOMERS", "Customer master"), TableInfo("S", "ORDERS", "")]
+    columns = [_col("CUSTOMERS", "ID"), _col("CUSTOMERS", "NAME", None, None, "N"), _col("ORDERS", "ID")]
+    return CatalogStore(tables, columns), tables, columns
+
+
+def test_string_table_stores_each_string_once():
+    strings = StringTable()
+    assert strings.intern(None) == strings.intern("") == 0
+    a = strings.intern("CUSTOMERS")
+    assert strings.intern("CUSTOMERS") == a
+    assert strings[a] == "CUSTOMERS"
+    assert strings.lookup("MISSING") is None
+    assert len(strings) == 2
+
+
+def test_rows_match_the_dataclasses():
+    store, tables, columns = _store()
+    assert store.tables == tables
+    assert store.columns == columns
+    assert isinstance(store.tables[0], TableRow) and isinstance(store.columns[-1], ColumnRow)
+
+    name = store.columns[1]
+    assert (name.length, name.scale, name.nulls) == (None, None, "N")
+    assert name.to_info() == columns[1]
+    assert store.tables[0].remarks == "Customer master"
+    assert [t.name for t in store.tables[1:]] == ["ORDERS"]
+    assert store.tables[-1] != store.tables[0]
+
+
+def test_append_dicts_and_lookup_columns():
+    store, _tables, _columns = _store()
+    store.tables.append({"schema": "S", "name": "ITEMS", "remarks": ""})
+    store.columns.extend([{"schema": "S", "table": "ITEMS", "name": "SKU", "typename": "CHAR", "length": 8}])
+
+    assert len(store.tables) == 3
+    assert store.get_table("S", "ITEMS").name == "ITEMS"
+    assert store.get_table("S", "NOPE") is None
+    assert [c.name for c in store.columns_of("S", "CUSTOMERS")] == ["ID", "NAME"]
+    sku = store.columns_of("S", "ITEMS")[0]
+    assert (sku.typename, sku.length, sku.scale, sku.nulls) == ("CHAR", 8, None, "N")
+
+
+def test_remove_tables_keeps_views_valid():
+    store, _tables, _columns = _store()
+    orders = store.tables[1]
+    assert store.remove_tables([("S", "ORDERS"), ("S", "NOPE")]) == 1
+    assert [t.name for t in store.tables] == ["CUSTOMERS"]
+    assert [c.table for c in store.columns] == ["CUSTOMERS", "CUSTOMERS"]
+    assert orders.name == "ORDERS"
+
+    compact = store.compact()
+    assert compact.tables == store.tables and compact.columns == store.columns
+    assert compact.memory_usage() < store.memory_usage()
+
+
+def test_apply_delta_replaces_changed_tables_in_place():
+    store, _tables, _columns = _store()
+    store.tables.append(TableInfo("S", "OLD", ""))
+    delta = CatalogDelta(added=[("S", "NEW")], changed=[("S", "CUSTOMERS")], removed=[("S", "OLD")])
+    fresh_tables = [TableInfo("S", "CUSTOMERS", "changed"), TableInfo("S", "NEW", ""), TableInfo("S", "OTHER", "")]
+    fresh_columns = [_col("CUSTOMERS", "ID"), _col("CUSTOMERS", "EMAIL"), _col("NEW", "ID"), _col("OTHER", "ID")]
+
+    table_rows, column_rows = store.apply_delta(delta, fresh_tables, fresh_columns)
+    assert [t.name for t in table_rows] == ["CUSTOMERS", "NEW"]
+    assert len(column_rows) == 3
+    assert [(t.name, t.remarks) for t in store.tables] == [("CUSTOMERS", "changed"), ("ORDERS", ""), ("NEW", "")]
+    assert [c.name for c in store.columns_of("S", "CUSTOMERS")] == ["ID", "EMAIL"]
+    assert [(c.table, c.name) for c in store.columns] == [
+        ("ORDERS", "ID"),
+        ("CUSTOMERS", "ID"),
+        ("CUSTOMERS", "EMAIL"),
+        ("NEW", "ID"),
+    ]
+
+
+def test_replacing_after_removal_keeps_table_positions():
+    store, _tables, _columns = _store()
+    store.tables.append(TableInfo("S", "ITEMS", ""))
+    store.remove_tables([("S", "CUSTOMERS")])
+    store.add_tables([TableInfo("S", "ITEMS", "again"), TableInfo("S", "ORDERS", "again")])
+    assert [(t.name, t.remarks) for t in store.tables] == [("ORDERS", "again"), ("ITEMS", "again")]
+
+    delta = CatalogDelta(added=[], changed=[("S", "ORDERS"), ("S", "ITEMS")], removed=[])
+    store.apply_delta(delta, [TableInfo("S", "ITEMS", "third")], [_col("ITEMS", "ID")])
+    # ORDERS vanished before it could be reloaded
+    assert [(t.name, t.remarks) for t in store.tables] == [("ITEMS", "third")]
+    assert [(c.table, c.name) for c in store.columns] == [("ITEMS", "ID")]
+
+
+def test_keyed_lookups_follow_changes():
+    store, tables, _columns = _store()
+    store.tables.append(TableInfo("T", "ORDERS", ""))
+    assert store.table_for_key("S.CUSTOMERS").remarks == "Customer master"
+    assert store.table_for_key("S.NOPE") is None and store.table_for_key("S") is None
+    assert store.get_column("S", "CUSTOMERS", "NAME").length is None
+    assert store.get_column("S", "ORDERS", "NAME") is None
+    assert store.schemas() == ["S", "T"]
+    assert (store.table_count("S"), store.table_count("T"), store.table_count("X")) == (2, 1, 0)
+
+    store.add_tables([TableInfo("T", "ORDERS", "again")])
+    store.remove_tables([("T", "ORDERS"), ("S", "ORDERS")])
+    assert store.schemas() == ["S"]
+    assert (store.table_count("S"), store.table_count("T")) == (1, 0)
+
+    # Plain lists are scanned, store rows looked up
+    assert find_table(store.tables, "S", "CUSTOMERS") == tables[0]
+    assert find_table(tables, "S", "ORDERS") is tables[1]
+    assert find_table(store.tables, None, "CUSTOMERS") is None
+    assert count_schema_tables(store.tables, "S") == 1
+    assert count_schema_tables(tables, "S") == 2
+
+
+def test_search_index_runs_over_row_views():
+    store, _tables, _columns = _store()
+    index = SearchIndex()
+    index.build_index(store.tables, store.columns)
+    assert [t.name for t in index.search_tables("cust")] == ["CUSTOMERS"]
+    assert {(c.table, c.name) for c in index.search_columns("id")} == {("CUSTOMERS", "ID"), ("ORDERS", "ID")}
+
+
+def test_store_is_smaller_than_dataclasses():
+    import sys
+
+    tables = [TableInfo("S", f"T{i}", "") for i in range(200)]
+    columns = [_col(f"T{i}", f"C{j}") for i in range(200) for j in range(20)]
+    store = CatalogStore(tables, columns)
+    objects = sum(sys.getsizeof(o) + sys.getsizeof(o.__dict__) for o in tables + columns)
+    assert store.memory_usage() < objects
@@ -0,0 +1,227 @@
+"""Unit tests for dbutils.connection_pool module.
+
+Tests for:
+- Borrow/return and reuse of pooled connections
+- Max size, idle eviction and validation-on-borrow
+- Per-thread sessions
+- query_runner integration when DBUTILS_JDBC_POOL is set
+"""
+
+import threading
+import time
+
+import pytest
+
+from dbutils import connection_pool
+from dbutils.connection_pool import ConnectionPool, PoolConfig, close_all_pools, get_pool, pooled_session
+
+
+class FakeConn:
+    def __init__(self, n):
+        self.n = n
+        self.closed = False
+        self.valid = True
+
+    def query(self, sql):
+        return [{"N": self.n, "SQL": sql}]
+
+    def is_valid(self):
+        return self.valid
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(**cfg):
+    created = []
+
+    def factory():
+        conn = FakeConn(len(created))
+        created.append(conn)
+        return conn
+
+    return ConnectionPool(factory, PoolConfig(**cfg)), created
+
+
+@pytest.fixture(autouse=True)
+def _reset_pools():
+    close_all_pools()
+    yield
+    close_all_pools()
+
+
+def test_connection_is_reused():
+    pool, created = make_pool()
+    with pool.connection() as c1:
+        pass
+    with pool.connection() as c2:
+        pass
+    assert c1 is c2
+    assert len(created) == 1
+    assert pool.stats()["reused"] == 1
+
+
+def test_max_size_blocks_then_times_out():
+    pool, _ = make_pool(max_size=1, borrow_timeout=0.05)
+    conn = pool.acquire()
+    with pytest.raises(RuntimeError, match="exhausted"):
+        pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+
+
+def test_waiting_borrower_gets_released_connection():
+    pool, created = make_pool(max_size=1, borrow_timeout=2)
+    conn = pool.acquire()
+    got = []
+    t = threading.Thread(target=lambda: got.append(pool.acquire()))
+    t.start()
+    time.sleep(0.05)
+    pool.release(conn)
+    t.join(1)
+    assert got == [conn]
+    assert len(created) == 1
+
+
+def test_invalid_connection_replaced_on_borrow():
+    pool, created = make_pool()
+    with pool.connection() as c1:
+        pass
+    c1.valid = False
+    with pool.connection() as c2:
+        pass
+    assert c2 is not c1
+    assert c1.closed
+    assert pool.stats()["invalidated"] == 1
+
+
+def test_idle_eviction_respects_min_size():
+    pool, created = make_pool(min_size=1, idle_timeout=0.01)
+    a = pool.acquire()
+    b = pool.acquire()
+    pool.release(a)
+    pool.release(b)
+    time.sleep(0.03)
+    assert pool.evict_idle() == 1
+    assert pool.stats()["idle"] == 1
+
+
+def test_warm_opens_min_size():
+    pool, created = make_pool(min_size=2)
+    assert pool.warm() == 2
+    assert pool.stats()["idle"] == 2
+
+
+def test_session_pins_connection_to_thread():
+    pool, created = make_pool(max_size=2)
+    with pool.session():
+        with pool.connection() as c1:
+            pass
+        with pool.connection() as c2:
+            pass
+        assert c1 is c2
+        assert pool.stats()["in_use"] == 1
+    assert pool.stats()["in_use"] == 0
+    assert pool.stats()["idle"] == 1
+
+
+def test_session_is_lazy():
+    pool, created = make_pool()
+    with pool.session():
+        pass
+    assert created == []
+
+
+def test_close_refuses_new_borrows():
+    pool, created = make_pool()
+    with pool.connection():
+        pass
+    pool.close()
+    assert created[0].closed
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_get_pool_keyed_by_provider_params_user():
+    p1 = get_pool("P", {"host": "a"}, user="u")
+    assert get_pool("P", {"host": "a"}, user="u") is p1
+    assert get_pool("P", {"host": "b"}, user="u") is not p1
+    assert get_pool("P", {"host": "a"}, user="other") is not p1
+    assert get_pool("P", {"host": "a"}, user="u", password="secret") is not p1
+    assert all("secret" not in part for key in connection_pool._pools for part in key)
+
+
+def test_get_pool_warms_new_pool(monkeypatch):
+    opened = []
+
+    def fake_connect(name, params, user=None, password=None):
+        opened.append(name)
+        return FakeConn(len(opened))
+
+    monkeypatch.setattr("dbutils.jdbc_provider.connect", fake_connect, raising=True)
+    pool = get_pool("W", {}, config=PoolConfig(min_size=2))
+    assert opened == ["W", "W"] and pool.stats()["idle"] == 2
+    assert get_pool("W", {}) is pool
+    assert len(opened) == 2
+
+
+def test_env_connection_key_tells_databases_apart(monkeypatch):
+    monkeypatch.setenv("DBUTILS_JDBC_PROVIDER", "P")
+    monkeypatch.setenv("DBUTILS_JDBC_URL_PARAMS", '{"host": "a"}')
+    monkeypatch.setenv("DBUTILS_JDBC_USER", "u")
+    key = connection_pool.env_connection_key()
+    assert connection_pool.env_connection_key() == key
+
+    monkeypatch.setenv("DBUTILS_JDBC_URL_PARAMS", '{"host": "b"}')
+    assert connection_pool.env_connection_key() != key
+    monkeypatch.setenv("DBUTILS_JDBC_URL_PARAMS", '{"host": "a"}')
+    monkeypatch.setenv("DBUTILS_JDBC_USER", "other")
+    assert connection_pool.env_connection_key() != key
+    monkeypatch.setenv("DBUTILS_JDBC_USER", "u")
+    monkeypatch.setenv("DBUTILS_JDBC_PASSWORD", "secret")
+    assert connection_pool.env_connection_key() != key
+    assert "secret" not in connection_pool.env_connection_key()
+
+
+def test_query_runner_uses_pool_when_enabled(monkeypatch):
+    from dbutils.utils import query_runner
+
+    monkeypatch.setenv("DBUTILS_JDBC_PROVIDER", "X")
+    monkeypatch.setenv("DBUTILS_JDBC_POOL", "1")
+    calls = []
+
+    def fake_connect(name, params, user=None, password=None):
+        calls.append(name)
+        return FakeConn(len(calls))
+
+    monkeypatch.setattr("dbutils.jdbc_provider.connect", fake_connect, raising=True)
+    query_runner("select 1")
+    query_runner("select 2")
+    assert calls == ["X"]
+
+
+def test_pooled_session_noop_when_disabled(monkeypatch):
+    monkeypatch.delenv("DBUTILS_JDBC_POOL", raising=False)
+    with pooled_session():
+        pass
+    assert connection_pool._pools == {}
+
+
+def test_iter_query_runner_streams_from_pooled_connection(monkeypatch):
+    from dbutils.db_browser import iter_query_runner
+
+    class StreamConn(FakeConn):
+        def iter_query(self, sql, batch_size=1000):
+            yield from [("S", "T1"), ("S", "T2")]
+
+    monkeypatch.setenv("DBUTILS_JDBC_PROVIDER", "X")
+    monkeypatch.setenv("DBUTILS_JDBC_POOL", "1")
+    monkeypatch.setattr("dbutils.jdbc_provider.connect", lambda *a, **k: StreamConn(0), raising=True)
+
+    rows = iter_query_runner("select 1")
+    assert next(rows) == ("S", "T1")
+    pool = next(iter(connection_pool._pools.values()))
+    # Connection stays checked out while the stream is open
+    assert pool.stats()["in_use"] == 1
+    assert list(rows) == [("S", "T2")]
+    assert pool.stats()["in_use"] == 0
@@ -0,0 +1,112 @@
+"""Unit tests for dbutils.contents_cache.
+
+Tests for:
+- Page keys and LRU eviction under the memory budget
+- TTL expiry and manual invalidation
+- Hit-rate statistics
+- TableContentsWorker.fetch_page serving repeated previews from the cache
+"""
+
+import pytest
+
+from dbutils import contents_cache
+from dbutils.contents_cache import ContentsCache, ContentsCacheConfig, estimate_size, page_key
+from dbutils.result_set import ResultSet
+
+
+def page(n):
+    rows = ResultSet(["ID"], [(i,) for i in range(n)])
+    return (["ID"], rows, ("ID",))
+
+
+def test_key_distinguishes_offset_and_seek():
+    by_offset = page_key("db2", "S", "T", "", 50, 25)
+    by_seek = page_key("db2", "S", "T", "", 50, 25, after_key=(49,))
+    assert by_offset != by_seek
+    assert by_offset == page_key("db2", "S", "T", "", 50, 25)
+    assert by_offset != page_key("sqlite", "S", "T", "", 50, 25)
+
+
+def test_get_put_and_hit_rate():
+    cache = ContentsCache()
+    key = page_key("p", "S", "T")
+    assert cache.get(key) is None
+    cache.put(key, page(3))
+    assert cache.get(key)[1] == page(3)[1]
+
+    stats = cache.get_cache_stats()
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 1
+    assert stats["cache_size"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_memory_budget_evicts_least_recently_used():
+    one_page = estimate_size(page(100)[1])
+    cache = ContentsCache(ContentsCacheConfig(max_bytes=one_page * 2 + one_page // 2))
+    keys = [page_key("p", "S", f"T{i}") for i in range(3)]
+    cache.put(keys[0], page(100), page(100)[1])
+    cache.put(keys[1], page(100), page(100)[1])
+    cache.get(keys[0])
+    cache.put(keys[2], page(100), page(100)[1])
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.get_cache_stats()["cache_evictions"] == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(contents_cache.time, "time", lambda: now[0])
+    cache = ContentsCache(ContentsCacheConfig(ttl=60))
+    cache.put("a", page(1))
+    cache.put("b", page(1))
+
+    now[0] += 30
+    assert cache.get("a") is not None
+    now[0] += 31
+    assert cache.get("a") is None
+    assert cache.expire() == 1
+    assert cache.get_cache_stats()["cache_size"] == 0
+
+
+def test_invalidate_by_table_and_schema():
+    cache = ContentsCache()
+    cache.put(page_key("p", "S1", "A"), page(1))
+    cache.put(page_key("p", "S1", "A", "X = 1"), page(1))
+    cache.put(page_key("p", "S1", "B"), page(1))
+    cache.put(page_key("p", "S2", "A"), page(1))
+
+    assert cache.invalidate("S1", "A") == 2
+    assert cache.invalidate("S1") == 1
+    assert cache.invalidate() == 1
+
+
+def test_disabled_cache_stores_nothing():
+    cache = ContentsCache(ContentsCacheConfig(max_bytes=0))
+    cache.put("a", page(1))
+    assert cache.get("a") is None
+
+
+def test_fetch_page_serves_repeated_preview_from_cache(monkeypatch):
+    pytest.importorskip("PySide6")
+    import dbutils.db_browser as dbb
+    from dbutils.gui.qt_app import TableContentsWorker
+
+    calls = []
+
+    def fake_runner(sql):
+        calls.append(sql)
+        return [{"ID": 1}]
+
+    monkeypatch.setattr(dbb, "query_runner", fake_runner)
+    monkeypatch.setattr("dbutils.gui.qt_app.get_key_columns", lambda schema, table: ())
+
+    first = TableContentsWorker.fetch_page("S", "T", limit=5, where_clause="ID = 1")
+    again = TableContentsWorker.fetch_page("S", "T", limit=5, where_clause="ID = 1")
+    TableContentsWorker.fetch_page("S", "T", limit=5)
+
+    assert again == first
+    assert len(calls) == 2
+    assert contents_cache.get_contents_cache().get_cache_stats()["cache_hits"] == 1
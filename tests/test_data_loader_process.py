@@ -4,13 +4,16 @@ import os
 from unittest.mock import patch
 
 from dbutils.gui.data_loader_process import (
+    columns_for_tables,
     get_cache_dir,
     get_data_cache_path,
     get_schema_cache_path,
+    index_columns_by_table,
     is_cache_valid,
     jprint,
     load_cached_data,
     load_cached_schemas,
+    main,
     save_data_to_cache,
     save_schemas_to_cache,
     to_column_dicts,
@@ -595,3 +598,372 @@ def test_cache_compression_performance(tmp_path):
         compressed_data = json.load(f)
 
     assert uncompressed_data == compressed_data
+
+
+def test_index_columns_by_table_and_lookup():
+    """Columns are grouped per table and collected in table order."""
+    columns = [
+        {"schema": "S", "table": "A", "name": "C1"},
+        {"schema": "S", "table": "B", "name": "C1"},
+        {"schema": "S", "table": "A", "name": "C2"},
+    ]
+    index = index_columns_by_table(columns)
+    assert [c["name"] for c in index[("S", "A")]] == ["C1", "C2"]
+
+    tables = [{"schema": "S", "name": "B"}, {"schema": "S", "name": "A"}, {"schema": "S", "name": "MISSING"}]
+    result = columns_for_tables(tables, index)
+    assert [(c["table"], c["name"]) for c in result] == [("B", "C1"), ("A", "C1"), ("A", "C2")]
+
+
+def test_main_streams_cached_chunks_with_their_columns(monkeypatch, capsys):
+    """Streaming from cache sends each table's columns in the same chunk."""
+    import io
+
+    tables = [{"schema": "S", "name": f"T{i}", "remarks": ""} for i in range(7)]
+    columns = [{"schema": "S", "table": f"T{i}", "name": f"C{j}"} for i in range(7) for j in range(3)]
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_data", lambda sf: (tables, columns))
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_schemas", lambda: ["S"])
+    cmd = {"cmd": "start", "schema_filter": None, "initial_limit": 2, "batch_size": 3}
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(cmd) + "\n"))
+
+    assert main() == 0
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    chunks = [m for m in messages if m["type"] == "chunk"]
+    assert [len(c["tables"]) for c in chunks] == [2, 3, 2]
+    for chunk in chunks:
+        names = {t["name"] for t in chunk["tables"]}
+        assert {c["table"] for c in chunk["columns"]} == names
+        assert len(chunk["columns"]) == 3 * len(names)
+
+
+def test_main_streams_catalog_scan_on_cache_miss(monkeypatch, capsys):
+    """Without a cache the loader streams chunks from a catalog scan."""
+    import io
+
+    from dbutils.db_browser import mock_get_tables
+
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_data", lambda sf: None)
+    monkeypatch.setattr("dbutils.gui.data_loader_process.refresh_cached_data", lambda sf, mock: None)
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_schemas", lambda: ["S"])
+    monkeypatch.setattr("dbutils.gui.data_loader_process.save_data_to_cache", lambda *a: None)
+    cmd = {"cmd": "start", "schema_filter": None, "use_mock": True, "initial_limit": 2, "batch_size": 3}
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(cmd) + "\n"))
+
+    assert main() == 0
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    chunks = [m for m in messages if m["type"] == "chunk"]
+    assert len(chunks[0]["tables"]) == 2
+    assert chunks[-1]["loaded"] == len(mock_get_tables())
+    for chunk in chunks:
+        names = {t["name"] for t in chunk["tables"]}
+        assert {c["table"] for c in chunk["columns"]} <= names
+    assert messages[-1]["type"] == "done"
+
+
+def test_main_loads_schemas_in_parallel(monkeypatch, capsys):
+    """With schema_workers each schema streams its own chunks and progress."""
+    import io
+
+    saved = []
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_data", lambda sf: None)
+    monkeypatch.setattr("dbutils.gui.data_loader_process.refresh_cached_data", lambda sf, mock: None)
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_schemas", lambda: ["S"])
+    monkeypatch.setattr("dbutils.gui.data_loader_process.save_data_to_cache", lambda *a: saved.append(a))
+    cmd = {"cmd": "start", "use_mock": True, "initial_limit": 2, "batch_size": 3, "schema_workers": 2}
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(cmd) + "\n"))
+
+    assert main() == 0
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    chunks = [m for m in messages if m["type"] == "chunk"]
+    assert {c["schema"] for c in chunks} == {"TEST", "DACDATA"}
+    for chunk in chunks:
+        assert {t["schema"] for t in chunk["tables"]} == {chunk["schema"]}
+    finals = [m for m in messages if m["type"] == "schema_progress" and m["state"] != "loading"]
+    assert sorted(m["state"] for m in finals) == ["done"] * 4
+    assert len(saved) == 1
+    assert messages[-1]["type"] == "done"
+
+
+def test_refresh_cached_data_reloads_only_changed_tables(monkeypatch, tmp_path):
+    """An expired cache with fingerprints is patched instead of reloaded."""
+    from dbutils.catalog_refresh import TableFingerprint
+    from dbutils.gui.data_loader_process import refresh_cached_data
+
+    cache_file = tmp_path / "data_all.json"
+    monkeypatch.setattr("dbutils.gui.data_loader_process.get_data_cache_path", lambda sf: cache_file)
+    assert refresh_cached_data(None) is None
+
+    tables = [{"schema": "S", "name": "A", "remarks": ""}, {"schema": "S", "name": "B", "remarks": ""}]
+    columns = [{"schema": "S", "table": t, "name": "ID"} for t in ("A", "B")]
+    fingerprints = {("S", "A"): TableFingerprint("t1", 1), ("S", "B"): TableFingerprint("t1", 1)}
+    save_data_to_cache(None, to_table_dicts(tables), to_column_dicts(columns), fingerprints)
+
+    def fake_iter(sql, batch_size=1000):
+        if "COLUMN_COUNT" in sql:
+            yield from [("S", "A", "t1", 1), ("S", "B", "t2", 2)]
+        elif "SYSCOLUMNS" in sql:
+            yield from [("S", "B", c, "CHAR", 1, 0, "N", "") for c in ("ID", "X")]
+        else:
+            yield ("S", "B", "changed")
+
+    monkeypatch.setattr("dbutils.db_browser.iter_query_runner", fake_iter)
+
+    out_tables, out_columns = refresh_cached_data(None)
+    assert [(t["name"], t["remarks"]) for t in out_tables] == [("A", ""), ("B", "changed")]
+    assert [(c["table"], c["name"]) for c in out_columns] == [("A", "ID"), ("B", "ID"), ("B", "X")]
+    saved = json.loads(cache_file.read_text())
+    assert ["S", "B", "t2", 2] in saved["fingerprints"]
+
+
+def test_main_paints_stale_cache_then_streams_delta(monkeypatch, capsys, tmp_path):
+    """With stale_ok an expired cache is streamed first, then only the changes."""
+    import io
+
+    from dbutils.db_browser import mock_get_columns, mock_get_tables
+
+    tables = to_table_dicts(mock_get_tables())
+    columns = to_column_dicts(mock_get_columns())
+    stale_tables = [dict(t) for t in tables[1:]] + [{"schema": "TEST", "name": "DROPPED", "remarks": ""}]
+    stale_tables[0]["remarks"] = "old remarks"
+    cache_file = tmp_path / "data_all.json"
+    cache_file.write_text(json.dumps({"tables": stale_tables, "columns": columns, "cached_at": 0}))
+    os.utime(cache_file, (0, 0))
+
+    monkeypatch.setattr("dbutils.gui.data_loader_process.get_data_cache_path", lambda sf: cache_file)
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_schemas", lambda: ["S"])
+    cmd = {"cmd": "start", "use_mock": True, "initial_limit": 2, "batch_size": 3, "stale_ok": True}
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(cmd) + "\n"))
+
+    assert main() == 0
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    chunks = [m for m in messages if m["type"] == "chunk"]
+    assert sum(len(c["tables"]) for c in chunks) == len(stale_tables)
+    assert all(c["stale"] for c in chunks)
+
+    deltas = [m for m in messages if m["type"] == "delta"]
+    # Catalog scans return tables in (schema, table) order
+    assert [[t["name"] for t in d["tables"]] for d in deltas] == [[tables[1]["name"], tables[0]["name"]]]
+    assert deltas[0]["removed"] == [["TEST", "DROPPED"]]
+    assert {c["table"] for c in deltas[0]["columns"]} <= {tables[0]["name"], tables[1]["name"]}
+    assert messages.index(deltas[0]) > messages.index(chunks[-1])
+    assert messages[-1]["type"] == "done"
+
+    # The revalidated catalog replaced the stale cache, with fingerprints for next time
+    saved = json.loads(cache_file.read_text())
+    assert [(t["schema"], t["name"]) for t in saved["tables"]] == sorted((t["schema"], t["name"]) for t in tables)
+    assert saved["fingerprints"]
+
+
+def test_main_sends_chunks_as_catalog_segments(monkeypatch, capsys, tmp_path):
+    """With a segment_dir chunk rows arrive as segment files instead of inline."""
+    import io
+
+    from dbutils.catalog_segment import open_segment
+
+    tables = [{"schema": "S", "name": f"T{i}", "remarks": ""} for i in range(3)]
+    columns = [{"schema": "S", "table": f"T{i}", "name": "ID", "typename": "CHAR", "length": 1} for i in range(3)]
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_data", lambda sf: (tables, columns))
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_schemas", lambda: ["S"])
+    cmd = {"cmd": "start", "schema_filter": None, "initial_limit": 2, "batch_size": 2, "segment_dir": str(tmp_path)}
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(cmd) + "\n"))
+
+    assert main() == 0
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    chunks = [m for m in messages if m["type"] == "chunk"]
+    assert all("tables" not in c and "columns" not in c for c in chunks)
+    segments = [open_segment(c["segment"]) for c in chunks]
+    assert [t.name for s in segments for t in s.tables] == ["T0", "T1", "T2"]
+    assert [c.length for s in segments for c in s.columns] == [1, 1, 1]
+    assert list(tmp_path.iterdir()) == []
+
+
+class _Pipe:
+    """Blocking stand-in for the parent's end of stdin."""
+
+    def __init__(self):
+        import queue
+
+        self.lines = queue.Queue()
+
+    def send(self, msg):
+        self.lines.put(json.dumps(msg) + "\n")
+
+    def close(self):
+        self.lines.put("")
+
+    def readline(self):
+        return self.lines.get()
+
+    def __iter__(self):
+        while True:
+            line = self.lines.get()
+            if not line:
+                return
+            yield line
+
+
+class _Output:
+    """Collects the messages a service writes to stdout."""
+
+    def __init__(self):
+        import threading
+
+        self.messages = []
+        self._text = ""
+        self._changed = threading.Condition()
+
+    def write(self, text):
+        with self._changed:
+            self._text += text
+            *lines, self._text = self._text.split("\n")
+            self.messages.extend(json.loads(line) for line in lines if line)
+            self._changed.notify_all()
+
+    def flush(self):
+        pass
+
+    def wait_for(self, typ, load=None, timeout=5.0):
+        with self._changed:
+            ok = self._changed.wait_for(
+                lambda: any(m["type"] == typ and m.get("load") == load for m in self.messages), timeout
+            )
+        assert ok, f"no {typ} message for load {load}: {self.messages}"
+
+
+def test_serve_keeps_catalog_warm_across_schema_switches(monkeypatch):
+    """A loader service serves a schema switch from the catalog it already loaded."""
+    import threading
+
+    tables = [{"schema": s, "name": f"T{i}", "remarks": ""} for s in ("S1", "S2") for i in range(3)]
+    columns = [{"schema": t["schema"], "table": t["name"], "name": "ID"} for t in tables]
+    reads = []
+
+    def fake_cache(schema_filter):
+        reads.append(schema_filter)
+        return tables, columns
+
+    monkeypatch.setenv("DBUTILS_JDBC_POOL", "0")
+    monkeypatch.setattr("dbutils.gui.data_loader_process._reading_commands", False)
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_data", fake_cache)
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_schemas", lambda: ["S1", "S2"])
+    pipe, out = _Pipe(), _Output()
+    monkeypatch.setattr("sys.stdin", pipe)
+    monkeypatch.setattr("sys.stdout", out)
+
+    result = []
+    service = threading.Thread(target=lambda: result.append(main()))
+    service.start()
+    pipe.send({"cmd": "serve"})
+    out.wait_for("ready")
+    pipe.send({"cmd": "load", "id": 1, "schema_filter": None, "initial_limit": 10, "batch_size": 10})
+    out.wait_for("done", load=1)
+    pipe.send({"cmd": "switch_schema", "id": 2, "schema_filter": "s2"})
+    out.wait_for("done", load=2)
+    pipe.send({"cmd": "shutdown"})
+    service.join(5)
+
+    assert result == [0]
+    assert reads == [None]
+    switched = [m for m in out.messages if m["type"] == "chunk" and m.get("load") == 2]
+    assert [t["name"] for m in switched for t in m["tables"]] == ["T0", "T1", "T2"]
+    assert {c["schema"] for m in switched for c in m["columns"]} == {"S2"}
+
+
+def test_serve_gives_each_load_its_own_cancel_event(monkeypatch):
+    """Replacing a load cancels only that load, never the one replacing it."""
+    import threading
+
+    from dbutils.gui import data_loader_process
+
+    runs = []
+    replaced = threading.Event()
+
+    def fake_run_load(options):
+        event = data_loader_process._cancel
+        runs.append((options.get("schema_filter"), event, event.is_set()))
+        if len(runs) == 1:
+            # The first load runs until the next command cancels it
+            replaced.set()
+            assert event.wait(5)
+        jprint({"type": "done"})
+
+    monkeypatch.setattr("dbutils.gui.data_loader_process._reading_commands", False)
+    monkeypatch.setattr("dbutils.gui.data_loader_process.run_load", fake_run_load)
+    pipe, out = _Pipe(), _Output()
+    monkeypatch.setattr("sys.stdin", pipe)
+    monkeypatch.setattr("sys.stdout", out)
+
+    result = []
+    service = threading.Thread(target=lambda: result.append(main()))
+    service.start()
+    pipe.send({"cmd": "serve"})
+    out.wait_for("ready")
+    pipe.send({"cmd": "load", "id": 1, "schema_filter": "S1"})
+    assert replaced.wait(5)
+    pipe.send({"cmd": "load", "id": 2, "schema_filter": "S2"})
+    out.wait_for("done", load=2)
+    pipe.send({"cmd": "shutdown"})
+    service.join(5)
+
+    assert result == [0]
+    (first, first_event, _), (second, second_event, second_cancelled) = runs
+    assert (first, second) == ("S1", "S2")
+    assert first_event.is_set() and second_event is not first_event
+    assert not second_cancelled
+    assert not data_loader_process._cancel.is_set()
+
+
+def test_cancelled_load_ends_with_cancelled(monkeypatch, capsys):
+    """A load stopped between chunks reports cancelled instead of done."""
+    from dbutils.gui import data_loader_process
+
+    tables = [{"schema": "S", "name": "T", "remarks": ""}]
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_data", lambda sf: (tables, []))
+    data_loader_process._cancel.set()
+    try:
+        assert data_loader_process.run_load({"schema_filter": None}) == 0
+    finally:
+        data_loader_process._cancel.clear()
+    types = [json.loads(line)["type"] for line in capsys.readouterr().out.splitlines()]
+    assert types[-1] == "cancelled" and "done" not in types
+
+
+def test_adapt_chunk_size_follows_target_time():
+    from dbutils.gui.data_loader_process import MAX_BATCH_SIZE, MIN_BATCH_SIZE, TARGET_CHUNK_TIME_MS, adapt_chunk_size
+
+    assert adapt_chunk_size(500, TARGET_CHUNK_TIME_MS * 0.1) == 750
+    assert adapt_chunk_size(MAX_BATCH_SIZE, 1) == MAX_BATCH_SIZE
+    assert adapt_chunk_size(500, TARGET_CHUNK_TIME_MS) == 500
+    assert adapt_chunk_size(500, TARGET_CHUNK_TIME_MS * 3) == 350
+    assert adapt_chunk_size(MIN_BATCH_SIZE, TARGET_CHUNK_TIME_MS * 3) == MIN_BATCH_SIZE
+
+
+def test_flow_controlled_load_merges_chunks_until_credits_arrive(monkeypatch):
+    """With one credit the first chunk goes out and the rest wait, merged, for the next credit."""
+    import threading
+
+    from dbutils.gui import data_loader_process
+
+    tables = [{"schema": "S", "name": f"T{i}", "remarks": ""} for i in range(7)]
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_data", lambda sf: (tables, []))
+    monkeypatch.setattr("dbutils.gui.data_loader_process.load_cached_schemas", lambda: ["S"])
+    monkeypatch.setattr(data_loader_process, "_reading_commands", False)
+    pipe, out = _Pipe(), _Output()
+    monkeypatch.setattr("sys.stdin", pipe)
+    monkeypatch.setattr("sys.stdout", out)
+
+    result = []
+    loader = threading.Thread(target=lambda: result.append(main()))
+    pipe.send({"cmd": "start", "schema_filter": None, "initial_limit": 2, "batch_size": 2, "credits": 1})
+    loader.start()
+    out.wait_for("chunk")
+    assert not any(m["type"] == "done" for m in out.messages)
+    pipe.send({"cmd": "credit", "n": 1, "ingest_ms": 5.0})
+    out.wait_for("done")
+    loader.join(5)
+    pipe.close()
+
+    chunks = [m for m in out.messages if m["type"] == "chunk"]
+    assert result == [0]
+    assert [len(c["tables"]) for c in chunks] == [2, 5]
+    assert chunks[-1]["loaded"] == 7
@@ -365,3 +365,81 @@ def test_table_contents_worker_builds_offset_sql(monkeypatch):
     assert "sql" in captured
     assert "OFFSET 50 ROWS" in captured["sql"]
     assert "FETCH FIRST 10 ROWS ONLY" in captured["sql"]
+
+
+def test_table_contents_worker_seeks_by_primary_key(monkeypatch):
+    from dbutils import pagination
+    from dbutils.gui.qt_app import TableContentsWorker
+
+    pagination.clear_key_cache()
+    monkeypatch.setattr("dbutils.catalog.get_primary_keys", lambda schema: [{"TABNAME": "T1", "COLNAME": "ID"}])
+    captured = []
+
+    def fake_query_runner(sql):
+        captured.append(sql)
+        return [{"ID": 99, "NAME": "a"}, {"ID": 100, "NAME": "b"}]
+
+    monkeypatch.setattr("dbutils.db_browser.query_runner", fake_query_runner)
+
+    w = TableContentsWorker()
+    w.perform_fetch("S", "T1", limit=2)
+    assert captured[-1] == "SELECT * FROM S.T1 ORDER BY ID FETCH FIRST 2 ROWS ONLY"
+    assert w.key_columns == ("ID",)
+    assert w.last_key == (100,)
+
+    w.perform_fetch("S", "T1", limit=2, start_offset=2, after_key=w.last_key)
+    assert "WHERE ID > 100 ORDER BY ID" in captured[-1]
+    assert "OFFSET" not in captured[-1]
+    pagination.clear_key_cache()
+
+
+def test_database_model_append_search_results_inserts_rows():
+    m = DatabaseModel()
+    tables = [make_table("S", f"T{i}") for i in range(3)]
+    m.set_data(tables, {})
+    inserted = []
+    m.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    first = [SearchResult(item=tables[0], match_type="exact", relevance_score=1.0, table_key="S.T0")]
+    m.append_search_results(first)
+    assert m.rowCount() == 1
+
+    more = [
+        SearchResult(item=t, match_type="fuzzy", relevance_score=0.5, table_key=f"S.{t.name}") for t in tables[1:]
+    ]
+    m.append_search_results(more)
+    assert m.rowCount() == 3
+    assert inserted == [(1, 2)]
+
+
+def test_database_model_show_more_reveals_appended_rows_in_slices():
+    m = DatabaseModel()
+    tables = [make_table("S", "T0")]
+    m.follow(tables, {})
+    assert m.follows(tables)
+    inserted = []
+    m.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    # The browser's catalog grows in place while a load streams in
+    tables.extend(make_table("S", f"T{i}") for i in range(1, 6))
+    assert m.rowCount() == 1 and m.pending_rows() == 5
+    assert m.show_more(3) == 3
+    assert m.show_more(10) == 2
+    assert m.show_more(10) == 0
+    assert m.rowCount() == 6
+    assert inserted == [(1, 3), (4, 5)]
+
+    # Rows arriving during a search are shown once it is cleared
+    m.set_search_results(None)
+    tables.append(make_table("S", "T6"))
+    assert m.show_more(10) == 1
+    assert m.rowCount() == 0
+    m.set_search_results([])
+    assert m.rowCount() == 7
+
+    # set_data shows the whole list, as before
+    m.set_data(tables, {})
+    tables.append(make_table("S", "T7"))
+    assert not m.follows(tables)
+    assert m.pending_rows() == 0
+    assert m.rowCount() == 8
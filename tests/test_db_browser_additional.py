@@ -3,10 +3,12 @@ import gzip
 import pytest
 
 from dbutils.db_browser import (
+    CatalogScan,
     ColumnInfo,
     SearchIndex,
     TableInfo,
     TrieNode,
+    _get_all_tables_and_columns_sync,
     get_all_tables_and_columns_async,
     get_cache_key,
     load_from_cache,
@@ -116,3 +118,157 @@ async def test_get_all_tables_and_columns_async_query_failure(monkeypatch):
     tables, cols = await get_all_tables_and_columns_async(use_mock=False, use_cache=False)
     assert isinstance(tables, list)
     assert isinstance(cols, list)
+
+
+def _fake_catalog(monkeypatch, table_rows, column_rows):
+    """Serve the two catalog scans from lists, recording the SQL of each."""
+    seen = []
+
+    def fake_iter(sql, batch_size=1000):
+        seen.append(sql)
+        rows = column_rows if "SYSCOLUMNS" in sql else table_rows
+        yield from rows
+
+    monkeypatch.setattr("dbutils.db_browser.iter_query_runner", fake_iter, raising=True)
+    return seen
+
+
+def _col(schema, table, name):
+    return (schema, table, name, "INT", 4, 0, "N", "")
+
+
+def test_catalog_scan_merge_joins_chunks(monkeypatch):
+    tables = [("S", f"T{i}", "") for i in range(5)]
+    columns = [_col("S", f"T{i}", f"C{j}") for i in range(5) for j in range(2)]
+    # Column of a table created after the tables scan ran
+    columns.insert(4, _col("S", "T1A", "X"))
+    _fake_catalog(monkeypatch, tables, columns)
+
+    chunks = list(CatalogScan(chunk_size=2, first_chunk_size=1))
+    assert [[t.name for t in ts] for ts, _ in chunks] == [["T0"], ["T1", "T2"], ["T3", "T4"]]
+    for ts, cols in chunks:
+        assert [c.table for c in cols] == [t.name for t in ts for _ in range(2)]
+
+
+def test_catalog_scan_keeps_tables_without_columns(monkeypatch):
+    tables = [("S", "A", ""), ("S", "B", ""), ("S", "C", "")]
+    _fake_catalog(monkeypatch, tables, [_col("S", "C", "ID")])
+
+    scan = CatalogScan(chunk_size=2)
+    chunks = list(scan)
+    assert [[t.name for t in ts] for ts, _ in chunks] == [["A", "B"], ["C"]]
+    assert [c.name for c in chunks[1][1]] == ["ID"]
+    assert scan.tables_loaded == 3
+
+
+def test_catalog_scan_skips_runs_of_tables_without_columns(monkeypatch):
+    tables = [("S", f"T{i}", "") for i in range(1, 5)]
+    _fake_catalog(monkeypatch, tables, [_col("S", "T3", "ID"), _col("S", "T4", "ID")])
+
+    chunks = list(CatalogScan(chunk_size=1))
+    assert [[t.name for t in ts] for ts, _ in chunks] == [["T1"], ["T2"], ["T3"], ["T4"]]
+    assert [[c.table for c in cols] for _, cols in chunks] == [[], [], ["T3"], ["T4"]]
+
+
+def test_catalog_scan_follows_database_collation(monkeypatch):
+    # EBCDIC sorts letters before digits, unlike Python string comparison
+    tables = [("LIB", "AB", ""), ("LIB", "A1", ""), ("LIB", "B", "")]
+    columns = [_col("LIB", "AB", "X"), _col("LIB", "A1", "Y"), _col("LIB", "A1", "Z"), _col("LIB", "B", "W")]
+    _fake_catalog(monkeypatch, tables, columns)
+
+    chunks = list(CatalogScan(chunk_size=1))
+    assert [[t.name for t in ts] for ts, _ in chunks] == [["AB"], ["A1"], ["B"]]
+    assert [[c.name for c in cols] for _, cols in chunks] == [["X"], ["Y", "Z"], ["W"]]
+
+
+def test_catalog_scan_resume_bounds_column_scan(monkeypatch):
+    seen = _fake_catalog(monkeypatch, [("S", "M", "")], [_col("S", "M", "ID")])
+    list(CatalogScan("s", offset=10))
+    tables_sql, columns_sql = seen
+    assert "OFFSET 10 ROWS" in tables_sql
+    assert "c.TABLE_NAME >= 'M'" in columns_sql
+    assert "t.TABLE_SCHEMA = 'S'" in columns_sql
+
+
+def test_catalog_scan_mock():
+    chunks = list(CatalogScan(chunk_size=3, use_mock=True))
+    tables = [t for ts, _ in chunks for t in ts]
+    assert len(tables) == len(mock_get_tables())
+    for ts, cols in chunks:
+        names = {(t.schema, t.name) for t in ts}
+        assert all((c.schema, c.table) in names for c in cols)
+
+
+def test_paged_columns_use_key_range(monkeypatch):
+    monkeypatch.setenv("DBUTILS_JDBC_PROVIDER", "X")
+    monkeypatch.setattr(
+        "dbutils.db_browser.query_runner",
+        lambda sql: [{"TABLE_SCHEMA": "S", "TABLE_NAME": n, "TABLE_TEXT": ""} for n in ("B", "D")],
+        raising=True,
+    )
+    seen = _fake_catalog(monkeypatch, [], [_col("S", "B", "ID"), _col("S", "C", "ID"), _col("S", "D", "ID")])
+
+    tables, columns = _get_all_tables_and_columns_sync(use_mock=False, use_cache=False, limit=2, offset=4)
+    assert [c.table for c in columns] == ["B", "D"]
+    assert " OR (c.TABLE_SCHEMA = 'S' AND c.TABLE_NAME >= 'B')" in seen[0]
+    assert " OR (c.TABLE_SCHEMA = 'S' AND c.TABLE_NAME <= 'D')" in seen[0]
+    assert "c.TABLE_NAME = 'B')" not in seen[0]
+
+
+@pytest.mark.asyncio
+async def test_async_loader_runs_tables_and_columns_concurrently(monkeypatch):
+    import threading
+
+    both_started = threading.Barrier(2, timeout=2)
+    seen = []
+
+    def fake_q(sql):
+        both_started.wait()
+        return [{"TABLE_SCHEMA": "S", "TABLE_NAME": "A", "TABLE_TEXT": ""}]
+
+    def fake_iter(sql, batch_size=1000):
+        seen.append(sql)
+        both_started.wait()
+        yield from [_col("S", "A", "ID"), _col("S", "NEW", "ID")]
+
+    monkeypatch.setattr("dbutils.db_browser.query_runner", fake_q, raising=True)
+    monkeypatch.setattr("dbutils.db_browser.iter_query_runner", fake_iter, raising=True)
+
+    tables, columns = await get_all_tables_and_columns_async(use_mock=False, use_cache=False, limit=1, offset=3)
+    assert [t.name for t in tables] == ["A"]
+    assert [(c.table, c.name) for c in columns] == [("A", "ID")]
+    # The column scan selects its own page of tables instead of waiting for them
+    assert "OFFSET 3 ROWS FETCH FIRST 1 ROWS ONLY" in seen[0]
+
+
+@pytest.mark.asyncio
+async def test_async_loader_reads_fingerprints_before_scans(monkeypatch):
+    order = []
+    saved = {}
+
+    def fake_fingerprints(schema_filter):
+        order.append("fingerprints")
+        return {("S", "A"): ("t1", 1)}
+
+    def fake_q(sql):
+        order.append("tables")
+        return [{"TABLE_SCHEMA": "S", "TABLE_NAME": "A", "TABLE_TEXT": ""}]
+
+    def fake_iter(sql, batch_size=1000):
+        order.append("columns")
+        yield _col("S", "A", "ID")
+
+    monkeypatch.setattr("dbutils.db_browser._catalog_fingerprints", fake_fingerprints, raising=True)
+    monkeypatch.setattr("dbutils.db_browser.query_runner", fake_q, raising=True)
+    monkeypatch.setattr("dbutils.db_browser.iter_query_runner", fake_iter, raising=True)
+    monkeypatch.setattr("dbutils.db_browser.load_from_cache", lambda *a, **k: None, raising=True)
+    monkeypatch.setattr("dbutils.db_browser._refresh_expired_cache", lambda schema_filter: None, raising=True)
+    monkeypatch.setattr(
+        "dbutils.db_browser.save_to_cache", lambda *a, fingerprints=None, **k: saved.update(fp=fingerprints)
+    )
+
+    tables, _columns = await get_all_tables_and_columns_async(use_mock=False, use_cache=True)
+    assert [t.name for t in tables] == ["A"]
+    assert order[0] == "fingerprints"
+    assert sorted(order[1:]) == ["columns", "tables"]
+    assert saved["fp"] == {("S", "A"): ("t1", 1)}
@@ -1,5 +1,3 @@
-import gzip
-import pickle
 import time
 from pathlib import Path
 
@@ -30,6 +28,7 @@ def test_save_and_load_cache(tmp_path, monkeypatch):
     # Use a temp cache dir
     monkeypatch.setenv("HOME", str(tmp_path))
     cache_dir = Path(str(tmp_path)) / ".cache" / "dbutils"
+    monkeypatch.setattr(db_browser, "CACHE_FILE", cache_dir / "schema_cache.pkl.gz")
     if cache_dir.exists():
         for p in cache_dir.iterdir():
             p.unlink()
@@ -48,19 +47,12 @@ def test_save_and_load_cache(tmp_path, monkeypatch):
     assert len(clist) == len(columns)
 
     # Ensure expired cache returns None
-    # Manipulate timestamp inside cache file
-    cache_file = db_browser.CACHE_FILE
-    assert cache_file.exists()
-
-    with gzip.open(cache_file, "rb") as f:
-        cache_data = pickle.load(f)
-
-    # Mark the cache as old
-    for k in cache_data.keys():
-        cache_data[k]["timestamp"] = time.time() - 3600 * 2
-
-    with gzip.open(cache_file, "wb", compresslevel=5) as f:
-        pickle.dump(cache_data, f)
+    # Age the stored entry for this page
+    store = db_browser._cache_store()
+    assert store.path.exists()
+    key = get_cache_key("TEST", 10, 0)
+    _timestamp, value = store.get(key)
+    store.put(key, value, timestamp=time.time() - 3600 * 2)
 
     assert load_from_cache("TEST", limit=10, offset=0) is None
 
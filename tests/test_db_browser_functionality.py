@@ -13,10 +13,14 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from dbutils.db_browser import (
+    MATCH_NAME,
+    MATCH_REMARKS,
+    MATCH_TYPE,
     ColumnInfo,
     SearchIndex,
     TableInfo,
     TrieNode,
+    TrigramIndex,
     get_all_tables_and_columns,
     get_all_tables_and_columns_async,
     get_available_schemas,
@@ -214,6 +218,122 @@ class TestSearchIndex:
         assert len(index.search_columns("")) == 1
 
 
+    def test_incremental_add_and_remove_schema(self):
+        """Test growing the index chunk by chunk and dropping a schema."""
+        from dbutils.db_browser import ColumnInfo, TableInfo
+
+        index = SearchIndex()
+        index.add_tables([TableInfo(schema="A", name="USERS", remarks="")])
+        index.add_tables([TableInfo(schema="B", name="USER_ROLES", remarks="Role table")])
+        index.add_columns(
+            [ColumnInfo(schema="B", table="USER_ROLES", name="ROLE_ID", typename="INTEGER",
+                        length=4, scale=0, nulls="N", remarks="")]
+        )
+        assert sorted(t.name for t in index.search_tables("user")) == ["USERS", "USER_ROLES"]
+        assert [c.name for c in index.search_columns("role")] == ["ROLE_ID"]
+
+        # Re-adding a table replaces its old words
+        index.add_tables([TableInfo(schema="B", name="USER_ROLES", remarks="")])
+        assert index.search_tables("table") == []
+
+        assert index.remove_schema("B") == 2
+        assert [t.name for t in index.search_tables("user")] == ["USERS"]
+        assert index.search_columns("role") == []
+        assert "r" not in index.table_trie.children
+
+    def test_remove_tables(self):
+        """Test dropping single tables with their columns."""
+        from dbutils.db_browser import ColumnInfo, TableInfo
+
+        index = SearchIndex()
+        index.build_index(
+            [TableInfo(schema="S", name="ORDERS", remarks=""), TableInfo(schema="S", name="ORDER_LINES", remarks="")],
+            [ColumnInfo(schema="S", table="ORDERS", name="ORDER_ID", typename="INTEGER",
+                        length=4, scale=0, nulls="N", remarks="")],
+        )
+        assert index.remove_tables([("S", "ORDERS"), ("S", "MISSING")]) == 2
+        assert [t.name for t in index.search_tables("order")] == ["ORDER_LINES"]
+        assert index.search_columns("order") == []
+        assert index.remove_tables([]) == 0
+
+
+class TestTrigramIndex:
+    """Test substring matching through TrigramIndex and SearchIndex."""
+
+    def test_infix_and_short_queries(self):
+        """Test infix, short and missing substrings with field masks."""
+        index = TrigramIndex()
+        index.add("a", ("CUSTOMER_ID", "INTEGER", ""))
+        index.add("b", ("ID", "VARCHAR", "The Id"))
+        index.add("c", ("X", "CHAR", None))
+
+        assert index.search("omer_i") == {"a": MATCH_NAME}
+        assert index.search("ID") == {"a": MATCH_NAME, "b": MATCH_NAME | MATCH_REMARKS}
+        assert index.search("x") == {"c": MATCH_NAME}
+        assert index.search("ar") == {"b": MATCH_TYPE, "c": MATCH_TYPE}
+        assert index.search("zzz") == {}
+        assert index.search("  ") == {}
+
+    def test_remove_and_replace(self):
+        """Test removing keys drops their trigrams and re-adding replaces text."""
+        index = TrigramIndex()
+        index.add("a", ("ORDERS", "S", ""))
+        index.add("a", ("INVOICES", "S", ""))
+        assert index.search("order") == {}
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        assert len(index) == 0 and index.search("inv") == {}
+
+    def test_lowered_text_stays_with_the_index(self):
+        """Test shared lowercase strings are freed with their documents, not interned globally."""
+        from dbutils import db_browser
+
+        index = TrigramIndex()
+        index.add("a", ("QX_UNIQUE_NAME", "DECIMAL", ""))
+        index.add("b", ("QX_OTHER", "DECIMAL", ""))
+        assert "qx_unique_name" not in db_browser._string_cache
+        assert index._texts[0][1] is index._texts[1][1]
+        index.remove("a")
+        assert "qx_unique_name" not in index._strings and "decimal" in index._strings
+        index.remove("b")
+        assert index._strings == {}
+
+    def test_search_index_substring_matches(self):
+        """Test SearchIndex answers infix queries the trie cannot."""
+        index = SearchIndex()
+        tables = [
+            TableInfo(schema="S", name="CUSTOMER_ORDERS", remarks=""),
+            TableInfo(schema="S", name="ITEMS", remarks=""),
+        ]
+        columns = [
+            ColumnInfo(schema="S", table="ITEMS", name="ITEM_ID", typename="INTEGER",
+                       length=4, scale=0, nulls="N", remarks="surrogate key"),
+        ]
+        index.build_index(tables, columns)
+
+        assert index.search_tables("tomer") == []
+        assert [(t.name, m) for t, m in index.substring_tables("tomer")] == [("CUSTOMER_ORDERS", MATCH_NAME)]
+        assert [(c.name, m) for c, m in index.substring_columns("rog")] == [("ITEM_ID", MATCH_REMARKS)]
+
+        index.remove_schema("S")
+        assert index.substring_tables("tomer") == []
+        assert index.substring_columns("item") == []
+
+    def test_matches_linear_scan(self):
+        """Test trigram candidates match a brute-force substring scan."""
+        columns = mock_get_columns()
+        index = SearchIndex()
+        index.add_columns(columns)
+        for query in ("id", "nam", "e", "user_", "date", "qq"):
+            expected = {
+                f"{c.schema}.{c.table}.{c.name}"
+                for c in columns
+                if any(query in (f or "").lower() for f in (c.name, c.typename, c.remarks))
+            }
+            found = {f"{c.schema}.{c.table}.{c.name}" for c, _mask in index.substring_columns(query)}
+            assert found == expected
+
+
 class TestQueryRunner:
     """Test the query_runner function."""
 
@@ -8,6 +8,7 @@ from dbutils.enhanced_jdbc_provider import (
     PredefinedProviderTemplates,
     QueryWorker,
 )
+from dbutils.result_set import ResultSet
 
 
 def test_predefined_provider_templates():
@@ -66,7 +67,8 @@ def test_query_worker_success_and_cancel(monkeypatch):
 
     # Run normal
     worker.run()
-    assert len(results) == 1 and isinstance(results[0], list)
+    assert len(results) == 1 and isinstance(results[0], ResultSet)
+    assert results[0] == [{"ID": 1, "NAME": "Alice"}, {"ID": 2, "NAME": "Bob"}]
 
     # Test cancel
     worker2 = QueryWorker(FakeConn(), "select *")
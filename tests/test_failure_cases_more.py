@@ -132,8 +132,26 @@ def test_db_browser_pagination_and_inconsistency(monkeypatch):
                 }
             ]
 
+    def fake_iter(sql, batch_size=1000):
+        # Column scans are streamed as tuples in SELECT order
+        for row in fake_q(sql):
+            yield tuple(
+                row.get(k)
+                for k in (
+                    "TABLE_SCHEMA",
+                    "TABLE_NAME",
+                    "COLUMN_NAME",
+                    "DATA_TYPE",
+                    "LENGTH",
+                    "NUMERIC_SCALE",
+                    "IS_NULLABLE",
+                    "COLUMN_TEXT",
+                )
+            )
+
     monkeypatch.setenv("DBUTILS_JDBC_PROVIDER", "X")
     monkeypatch.setattr("dbutils.db_browser.query_runner", fake_q, raising=True)
+    monkeypatch.setattr("dbutils.db_browser.iter_query_runner", fake_iter, raising=True)
 
     tables, columns = get_all_tables_and_columns(use_mock=False, use_cache=False)
     assert any(t.name == "T1" for t in tables)
@@ -0,0 +1,122 @@
+"""Unit tests for dbutils.gui.ingest_scheduler.
+
+Tests for:
+- Slice sizes following the measured cost per row
+- Inserting pending rows one slice per event loop iteration
+- Callbacks waiting for rows to be inserted, including after a reset or a failed insert
+"""
+
+from dbutils.gui.ingest_scheduler import FrameBudget, IngestScheduler
+
+
+class _Rows:
+    """Stand-in for DatabaseModel.show_more/pending_rows."""
+
+    def __init__(self, total=0):
+        self.total = total
+        self.shown = 0
+        self.slices = []
+
+    def show_more(self, limit):
+        count = min(limit, self.total - self.shown)
+        self.shown += count
+        self.slices.append(count)
+        return count
+
+    def pending(self):
+        return self.total - self.shown
+
+
+class _Loop:
+    """Collects deferred callbacks; each turn() is one event loop iteration."""
+
+    def __init__(self):
+        self.calls = []
+
+    def defer(self, fn):
+        self.calls.append(fn)
+
+    def turn(self):
+        calls, self.calls = self.calls, []
+        for fn in calls:
+            fn()
+        return len(calls)
+
+
+def test_frame_budget_sizes_slices_from_measured_cost():
+    budget = FrameBudget(budget_ms=8.0, initial_rows=100, min_rows=10, max_rows=1000)
+    assert budget.next_size() == 100
+    budget.record(100, 4.0)
+    assert budget.next_size() == 200
+    budget.record(0, 50.0)
+    assert budget.next_size() == 200
+    budget.record(10, 100.0)
+    assert budget.next_size() == 10
+    budget.row_ms = 0.0
+    assert budget.next_size() == 1000
+
+
+def test_scheduler_inserts_one_slice_per_iteration():
+    rows, loop = _Rows(1000), _Loop()
+    ticks = iter(range(0, 100000, 2))
+    # Every slice "takes" 2 ms, so slices grow towards budget / cost per row
+    scheduler = IngestScheduler(rows.show_more, rows.pending, loop.defer, FrameBudget(8.0, initial_rows=100),
+                                clock=lambda: next(ticks) / 1000)
+    scheduler.wake()
+    scheduler.wake()
+    assert len(loop.calls) == 1
+
+    turns = 0
+    while loop.turn():
+        turns += 1
+    assert rows.shown == 1000
+    assert rows.slices[0] == 100 and rows.slices[1] > 100
+    assert turns == len(rows.slices)
+
+
+def test_after_ingested_waits_for_pending_rows():
+    rows, loop = _Rows(300), _Loop()
+    budget = FrameBudget(initial_rows=100, min_rows=100, max_rows=100)
+    scheduler = IngestScheduler(rows.show_more, rows.pending, loop.defer, budget)
+    done = []
+    scheduler.after_ingested(lambda: done.append(rows.shown))
+    rows.total = 500
+    scheduler.after_ingested(lambda: done.append(rows.shown))
+
+    for _ in range(3):
+        loop.turn()
+    assert done == [300]
+    loop.turn()
+    assert done == [300]
+    loop.turn()
+    assert done == [300, 500]
+    assert not loop.calls
+
+
+def test_after_ingested_runs_once_nothing_is_pending():
+    rows, loop = _Rows(1000), _Loop()
+    scheduler = IngestScheduler(rows.show_more, rows.pending, loop.defer, FrameBudget(initial_rows=10))
+    done = []
+    scheduler.after_ingested(lambda: done.append(True))
+    # The model was reset meanwhile and shows every row already
+    rows.shown = rows.total
+    loop.turn()
+    assert done == [True]
+    assert not loop.calls
+
+
+def test_after_ingested_runs_when_insert_fails():
+    rows, loop = _Rows(1000), _Loop()
+
+    def broken(limit):
+        raise RuntimeError("view is gone")
+
+    scheduler = IngestScheduler(broken, rows.pending, loop.defer)
+    done = []
+    scheduler.after_ingested(lambda: done.append(True))
+    try:
+        loop.turn()
+    except RuntimeError:
+        pass
+    assert done == [True]
+    assert not loop.calls
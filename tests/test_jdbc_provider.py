@@ -442,6 +442,69 @@ class TestJDBCConnection:
         conn.close()
         assert conn._conn is None
 
+    @patch("dbutils.jdbc_provider.jpype")
+    @patch("dbutils.jdbc_provider.jaydebeapi")
+    def test_iter_query_streams_batches(self, mock_jaydebeapi, mock_jpype):
+        """Test iter_query pulls rows with fetchmany and closes the cursor."""
+        mock_cursor = MagicMock()
+        mock_cursor.description = [("ID",), ("NAME",)]
+        mock_cursor.fetchmany.side_effect = [[(1, "a"), (2, "b")], [(3, "c")], []]
+
+        provider = JDBCProvider(
+            name="Test Provider",
+            driver_class="com.test.Driver",
+            jar_path="/path/to/driver.jar",
+            url_template="jdbc:test://{host}",
+        )
+        conn = JDBCConnection(provider, {"host": "localhost"})
+        conn._conn = MagicMock()
+        conn._conn.cursor.return_value = mock_cursor
+
+        rows = conn.iter_query("SELECT * FROM users", batch_size=2)
+        assert next(rows) == (1, "a")
+        # Only the first batch has been fetched so far
+        assert mock_cursor.fetchmany.call_count == 1
+        assert list(rows) == [(2, "b"), (3, "c")]
+        mock_cursor.fetchmany.assert_called_with(2)
+        mock_cursor.close.assert_called_once()
+
+    @patch("dbutils.jdbc_provider.jpype")
+    @patch("dbutils.jdbc_provider.jaydebeapi")
+    def test_iter_query_as_dicts_and_early_close(self, mock_jaydebeapi, mock_jpype):
+        """Test iter_query dict rows and cursor cleanup when abandoned."""
+        mock_cursor = MagicMock()
+        mock_cursor.description = [("ID",)]
+        mock_cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+        provider = JDBCProvider(
+            name="Test Provider",
+            driver_class="com.test.Driver",
+            jar_path="/path/to/driver.jar",
+            url_template="jdbc:test://{host}",
+        )
+        conn = JDBCConnection(provider, {"host": "localhost"})
+        conn._conn = MagicMock()
+        conn._conn.cursor.return_value = mock_cursor
+
+        rows = conn.iter_query("SELECT ID FROM users", as_dicts=True)
+        assert next(rows) == {"ID": 1}
+        rows.close()
+        mock_cursor.close.assert_called_once()
+
+    @patch("dbutils.jdbc_provider.jpype")
+    @patch("dbutils.jdbc_provider.jaydebeapi")
+    def test_iter_query_requires_connection(self, mock_jaydebeapi, mock_jpype):
+        """Test iter_query raises when not connected."""
+        provider = JDBCProvider(
+            name="Test Provider",
+            driver_class="com.test.Driver",
+            jar_path="/path/to/driver.jar",
+            url_template="jdbc:test://{host}",
+        )
+        conn = JDBCConnection(provider, {"host": "localhost"})
+        with pytest.raises(RuntimeError, match="Connection not established"):
+            list(conn.iter_query("SELECT 1"))
+
     def test_jdbc_connection_without_libraries(self):
         """Test JDBC connection without required libraries."""
         # Temporarily remove the libraries to simulate missing dependencies
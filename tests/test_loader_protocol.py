@@ -0,0 +1,199 @@
+"""Unit tests for the data loader IPC framing (dbutils.gui.loader_protocol)."""
+
+import io
+import json
+import pickle
+import sys
+import threading
+
+import pytest
+
+from dbutils.gui import data_loader_process
+from dbutils.gui.loader_protocol import (
+    FRAMING_JSON,
+    FRAMING_PICKLE5,
+    ChunkSender,
+    CreditGate,
+    FrameDecoder,
+    available_framings,
+    encode_message,
+    negotiate_framing,
+)
+
+
+def test_negotiate_framing_prefers_first_supported():
+    assert negotiate_framing(["bogus", FRAMING_PICKLE5, FRAMING_JSON]) == FRAMING_PICKLE5
+    assert negotiate_framing(None) == FRAMING_JSON
+    assert negotiate_framing(["bogus"]) == FRAMING_JSON
+    assert FRAMING_JSON in available_framings()
+
+
+def test_json_lines_decoded_across_partial_feeds():
+    dec = FrameDecoder()
+    data = (
+        encode_message({"type": "progress", "n": 1}, FRAMING_JSON)
+        + b"noise\n"
+        + encode_message({"type": "done"}, FRAMING_JSON)
+    )
+    msgs = []
+    for i in range(0, len(data), 5):
+        msgs.extend(dec.feed(data[i : i + 5]))
+    assert msgs == [{"type": "progress", "n": 1}, {"type": "done"}]
+
+
+def test_hello_switches_to_binary_frames():
+    dec = FrameDecoder()
+    chunk = {"type": "chunk", "tables": [{"schema": "S", "name": "T"}], "loaded": 1}
+    data = (
+        encode_message({"type": "hello", "framing": FRAMING_PICKLE5}, FRAMING_JSON)
+        + encode_message(chunk, FRAMING_PICKLE5)
+        + encode_message({"type": "done"}, FRAMING_PICKLE5)
+    )
+    msgs = []
+    for i in range(0, len(data), 3):
+        msgs.extend(dec.feed(data[i : i + 3]))
+    assert dec.framing == FRAMING_PICKLE5
+    assert msgs[1:] == [chunk, {"type": "done"}]
+
+
+def test_pickle5_out_of_band_buffers_round_trip():
+    payload = {"type": "blob", "data": pickle.PickleBuffer(bytearray(b"x" * 1000))}
+    frame = encode_message(payload, FRAMING_PICKLE5)
+    dec = FrameDecoder()
+    dec.framing = FRAMING_PICKLE5
+    (msg,) = dec.feed(frame)
+    assert bytes(msg["data"]) == b"x" * 1000
+
+
+def test_loader_main_negotiates_binary_framing(monkeypatch):
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    tables = [{"schema": "S", "name": "T1", "remarks": ""}]
+    columns = [{"schema": "S", "table": "T1", "name": "C1"}]
+    monkeypatch.setattr(data_loader_process, "load_cached_data", lambda sf: (tables, columns))
+    monkeypatch.setattr(data_loader_process, "load_cached_schemas", lambda: ["S"])
+    cmd = {"cmd": "start", "framings": [FRAMING_PICKLE5, FRAMING_JSON]}
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(cmd) + "\n"))
+    monkeypatch.setattr("sys.stdout", out)
+    try:
+        assert data_loader_process.main() == 0
+    finally:
+        data_loader_process.set_framing(FRAMING_JSON)
+
+    msgs = FrameDecoder().feed(raw.getvalue())
+    assert msgs[0] == {"type": "hello", "framing": FRAMING_PICKLE5}
+    chunk = next(m for m in msgs if m["type"] == "chunk")
+    assert chunk["tables"] == tables and chunk["columns"] == columns
+    assert msgs[-1] == {"type": "done"}
+
+
+def test_binary_framing_sends_stray_output_to_stderr(monkeypatch):
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    err = io.StringIO()
+    monkeypatch.setattr("sys.stdout", out)
+    monkeypatch.setattr("sys.stderr", err)
+    data_loader_process.set_framing(FRAMING_PICKLE5)
+    try:
+        print("driver banner")
+        data_loader_process.jprint({"type": "done"})
+    finally:
+        data_loader_process.set_framing(FRAMING_JSON)
+
+    assert sys.stdout is out
+    assert err.getvalue() == "driver banner\n"
+    dec = FrameDecoder()
+    dec.framing = FRAMING_PICKLE5
+    assert dec.feed(raw.getvalue()) == [{"type": "done"}]
+
+
+def test_decode_worker_builds_infos():
+    pytest.importorskip("PySide6")
+    from dbutils.db_browser import ColumnInfo, TableInfo
+    from dbutils.gui.qt_app import LoaderDecodeWorker
+
+    worker = LoaderDecodeWorker()
+    got = []
+    worker.messages_decoded.connect(got.append)
+    msg = {
+        "type": "chunk",
+        "tables": [{"schema": "S", "name": "T"}],
+        "columns": [{"schema": "S", "table": "T", "name": "C", "nulls": "Y"}],
+    }
+    worker.feed(encode_message(msg, FRAMING_JSON))
+    tables, columns = got[0][0]["infos"]
+    assert isinstance(tables[0], TableInfo) and tables[0].name == "T"
+    assert isinstance(columns[0], ColumnInfo) and columns[0].name == "C"
+
+
+def _chunk(names, loaded, schema="S"):
+    return {"type": "chunk", "schema": schema, "tables": [{"name": n} for n in names], "columns": [], "loaded": loaded}
+
+
+def test_credit_gate_counts_and_averages_ingest_time():
+    gate = CreditGate(1)
+    assert gate.try_acquire()
+    assert not gate.try_acquire()
+    gate.grant(2, ingest_ms=100.0)
+    gate.grant(0, ingest_ms=200.0)
+    assert gate.available == 2
+    assert abs(gate.ingest_ms - 130.0) < 1e-9
+    gate.acquire()
+    gate.acquire()
+    gate.close()
+    assert gate.acquire(timeout=0)
+
+
+def test_chunk_sender_merges_while_out_of_credits():
+    sent = []
+    sender = ChunkSender(sent.append, CreditGate(1), max_pending_tables=100)
+    sender.send(_chunk(["A"], 1))
+    sender.send(_chunk(["B"], 2))
+    sender.send(_chunk(["C"], 3, schema="T"))
+    assert [m["loaded"] for m in sent] == [1]
+
+    sender.gate.grant()
+    sender.flush()
+    assert [t["name"] for t in sent[1]["tables"]] == ["B", "C"]
+    assert sent[1]["loaded"] == 3 and "schema" not in sent[1]
+
+
+def test_chunk_sender_sends_pending_chunk_when_credit_arrives():
+    sent = []
+    sender = ChunkSender(sent.append, CreditGate(0), max_pending_tables=100)
+    sender.send(_chunk(["A"], 1))
+    sender.send(_chunk(["B"], 2))
+    assert sent == []
+
+    # Granted from the command thread while the loader is still scanning
+    grant = threading.Thread(target=sender.gate.grant)
+    grant.start()
+    grant.join()
+    assert [t["name"] for t in sent[0]["tables"]] == ["A", "B"]
+    assert sender.gate.available == 0
+    sender.flush()
+    assert len(sent) == 1
+
+
+def test_chunk_sender_waits_when_merged_chunk_is_full():
+    sent = []
+    checks = []
+    gate = CreditGate(0)
+
+    def check():
+        checks.append(1)
+        gate.grant()
+
+    sender = ChunkSender(sent.append, gate, max_pending_tables=2, check=check)
+    sender.send(_chunk(["A"], 1))
+    assert sent == []
+    sender.send(_chunk(["B"], 2))
+    assert checks and [t["name"] for t in sent[0]["tables"]] == ["A", "B"]
+
+
+def test_chunk_sender_without_gate_sends_everything():
+    sent = []
+    sender = ChunkSender(sent.append)
+    sender.send(_chunk(["A"], 1))
+    sender.flush()
+    assert len(sent) == 1
@@ -0,0 +1,186 @@
+"""Tests for keyset pagination helpers."""
+
+import datetime
+
+import pytest
+
+from dbutils import pagination
+from dbutils.pagination import (
+    RowWindow,
+    build_page_sql,
+    get_key_columns,
+    get_row_estimate,
+    keyset_predicate,
+    last_key,
+    sql_literal,
+)
+from dbutils.result_set import ResultSet
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    pagination.clear_key_cache()
+    yield
+    pagination.clear_key_cache()
+
+
+def test_first_page_orders_by_key_without_offset():
+    sql = build_page_sql("S.T", limit=10, key_columns=("ID",))
+    assert sql == "SELECT * FROM S.T ORDER BY ID FETCH FIRST 10 ROWS ONLY"
+
+
+def test_next_page_seeks_past_last_key():
+    sql = build_page_sql("S.T", limit=10, offset=500, key_columns=("ID",), after_key=(42,))
+    assert sql == "SELECT * FROM S.T WHERE ID > 42 ORDER BY ID FETCH FIRST 10 ROWS ONLY"
+    assert "OFFSET" not in sql
+
+
+def test_composite_key_predicate_expands_row_comparison():
+    pred = keyset_predicate(("A", "B", "C"), (1, "x", 2))
+    assert pred == "(A > 1 OR (A = 1 AND B > 'x') OR (A = 1 AND B = 'x' AND C > 2))"
+
+
+def test_filter_is_combined_with_seek():
+    sql = build_page_sql("S.T", "NAME = 'a' OR NAME = 'b'", limit=5, offset=5, key_columns=("ID",), after_key=(7,))
+    assert "WHERE (NAME = 'a' OR NAME = 'b') AND ID > 7 ORDER BY ID" in sql
+
+
+def test_offset_fallback_without_key_or_last_key():
+    assert "ORDER BY 1 OFFSET 50 ROWS FETCH FIRST 10 ROWS ONLY" in build_page_sql("S.T", limit=10, offset=50)
+    sql = build_page_sql("S.T", limit=10, offset=50, key_columns=("ID",), after_key=None)
+    assert "ORDER BY ID OFFSET 50 ROWS" in sql
+
+
+def test_sql_literal_quoting():
+    assert sql_literal("o'reilly") == "'o''reilly'"
+    assert sql_literal(5) == "5"
+    assert sql_literal(b"\x01\xff") == "X'01FF'"
+    assert sql_literal(datetime.date(2024, 1, 2)) == "'2024-01-02'"
+    assert pagination.quote_identifier("Mixed Case") == '"Mixed Case"'
+
+
+def test_last_key_reads_dicts_and_result_sets_case_insensitively():
+    assert last_key([{"id": 1}, {"id": 2}], ("ID",)) == (2,)
+    rs = ResultSet(["A", "B"], [(1, "x"), (2, "y")])
+    assert last_key(rs, ("A", "B")) == (2, "y")
+    assert last_key([{"ID": None}], ("ID",)) is None
+    assert last_key([{"OTHER": 1}], ("ID",)) is None
+    assert last_key([], ("ID",)) is None
+
+
+def test_get_key_columns_prefers_primary_key_and_caches(monkeypatch):
+    calls = []
+
+    def fake_pks(schema):
+        calls.append(schema)
+        return [
+            {"TABSCHEMA": schema, "TABNAME": "ORDERS", "COLNAME": "ORDER_ID"},
+            {"TABSCHEMA": schema, "TABNAME": "ORDERS", "COLNAME": "LINE"},
+        ]
+
+    monkeypatch.setattr("dbutils.catalog.get_primary_keys", fake_pks)
+    monkeypatch.setattr("dbutils.catalog.get_indexes", lambda schema, table: pytest.fail("index lookup not needed"))
+
+    assert get_key_columns("S", "ORDERS") == ("ORDER_ID", "LINE")
+    assert get_key_columns("S", "ORDERS") == ("ORDER_ID", "LINE")
+    assert calls == ["S"]
+
+
+def test_get_key_columns_uses_narrowest_unique_index(monkeypatch):
+    monkeypatch.setattr("dbutils.catalog.get_primary_keys", lambda schema: [])
+    rows = [
+        {"INDEX_SCHEMA": "S", "INDEX_NAME": "WIDE", "COLUMN_NAME": "A", "IS_UNIQUE": "Y", "ORDINAL_POSITION": 1},
+        {"INDEX_SCHEMA": "S", "INDEX_NAME": "WIDE", "COLUMN_NAME": "B", "IS_UNIQUE": "Y", "ORDINAL_POSITION": 2},
+        {"INDEX_SCHEMA": "S", "INDEX_NAME": "NONUNIQ", "COLUMN_NAME": "C", "IS_UNIQUE": "N", "ORDINAL_POSITION": 1},
+        {"INDEX_SCHEMA": "S", "INDEX_NAME": "NARROW", "COLUMN_NAME": "K", "IS_UNIQUE": "Y", "ORDINAL_POSITION": 1},
+    ]
+    monkeypatch.setattr("dbutils.catalog.get_indexes", lambda schema, table: rows)
+    assert get_key_columns("S", "T") == ("K",)
+
+
+def test_get_key_columns_failure_is_not_cached(monkeypatch):
+    def boom(schema):
+        raise RuntimeError("no connection")
+
+    monkeypatch.setattr("dbutils.catalog.get_primary_keys", boom)
+    assert get_key_columns("S", "T") == ()
+
+    monkeypatch.setattr("dbutils.catalog.get_primary_keys", lambda schema: [{"TABNAME": "T", "COLNAME": "ID"}])
+    assert get_key_columns("S", "T") == ("ID",)
+
+
+def _block(first, count):
+    return [{"ID": i} for i in range(first, first + count)]
+
+
+def test_row_window_evicts_least_recently_used_blocks():
+    window = RowWindow(block_size=10, max_rows=30, key_columns=("ID",))
+    for block in range(3):
+        assert window.put(block, _block(block * 10, 10)) == []
+    # Touch block 0 so block 1 is the oldest
+    assert window.lookup(5)[0][5] == {"ID": 5}
+
+    assert window.put(3, _block(30, 10)) == [1]
+    assert window.resident_blocks == [2, 0, 3]
+    assert window.lookup(15) is None
+    assert window.row_count == 40
+    assert window.has_more
+
+
+def test_row_window_refetches_evicted_block_by_key():
+    window = RowWindow(block_size=10, max_rows=20, key_columns=("ID",))
+    for block in range(4):
+        window.put(block, _block(block * 10, 10))
+
+    assert 1 not in window.resident_blocks
+    assert window.fetch_args(1) == (10, (9,))
+    assert window.fetch_args(0) == (0, None)
+    # Blocks without a known predecessor key fall back to OFFSET
+    assert RowWindow(block_size=10).fetch_args(5) == (50, None)
+
+
+def test_row_window_short_block_fixes_total():
+    window = RowWindow(block_size=10)
+    window.put(0, _block(0, 10))
+    window.put(1, _block(10, 4))
+    assert window.row_count == 14
+    assert not window.has_more
+    assert window.lookup(13)[1] == 3
+    assert window.lookup(14) is None
+
+
+def test_row_window_reports_estimate_until_end_is_known():
+    window = RowWindow(block_size=10, estimate=35)
+    assert window.count_after(0, _block(0, 10)) == 35
+    window.put(0, _block(0, 10))
+    assert window.row_count == 35
+    assert window.fetched_rows == 10
+    assert window.has_more
+
+    # A stale estimate gives way to the rows actually fetched
+    assert window.count_after(4, _block(40, 10)) == 50
+    window.put(4, _block(40, 10))
+    assert window.row_count == 50
+    assert window.count_after(5, _block(50, 2)) == 52
+    window.put(5, _block(50, 2))
+    assert window.row_count == 52
+    assert not window.has_more
+
+
+def test_row_estimate_is_read_once_per_schema(monkeypatch):
+    calls = []
+
+    def sizes(schema):
+        calls.append(schema)
+        return [{"TABSCHEMA": schema, "TABNAME": "T", "ROWCOUNT": 1200}]
+
+    monkeypatch.setattr("dbutils.catalog.get_table_sizes", sizes)
+    assert get_row_estimate("S", "T") == 1200
+    assert get_row_estimate("S", "OTHER") is None
+    assert calls == ["S"]
+
+    # Schemas without statistics are asked again later
+    monkeypatch.setattr("dbutils.catalog.get_table_sizes", lambda schema: [])
+    assert get_row_estimate("EMPTY", "T") is None
+    monkeypatch.setattr("dbutils.catalog.get_table_sizes", sizes)
+    assert get_row_estimate("EMPTY", "T") == 1200
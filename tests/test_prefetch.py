@@ -0,0 +1,140 @@
+"""Unit tests for dbutils.prefetch.
+
+Tests for:
+- Background fetches handed over through take()
+- Budget limits and dropping queued speculative requests
+- clear() discarding a fetch that is still running
+- DBUTILS_PREFETCH_* configuration
+"""
+
+import threading
+
+import pytest
+
+from dbutils.prefetch import ContentsPrefetcher, PrefetchConfig
+
+
+def make_prefetcher(max_pages=4, gate=None):
+    calls = []
+    ready = []
+    done = threading.Semaphore(0)
+
+    def fetch(n):
+        if gate is not None:
+            gate.wait(2)
+        calls.append(n)
+        if n < 0:
+            raise RuntimeError("boom")
+        return n * 10
+
+    def on_ready(key):
+        ready.append(key)
+        done.release()
+
+    p = ContentsPrefetcher(fetch, PrefetchConfig(max_pages=max_pages), on_ready=on_ready)
+    return p, calls, ready, done
+
+
+def test_prefetched_page_is_taken_once():
+    p, calls, ready, done = make_prefetcher()
+    try:
+        assert p.prefetch("a", 1)
+        assert done.acquire(timeout=2)
+        assert ready == ["a"]
+        assert p.take("a") == 10
+        assert p.take("a") is None
+        assert p.get_stats()["prefetch_hits"] == 1
+    finally:
+        p.close()
+
+
+def test_duplicate_and_failed_requests():
+    p, calls, ready, done = make_prefetcher()
+    try:
+        gate = threading.Event()
+        p._fetch = lambda n: gate.wait(2) and n * 10
+        assert p.prefetch("a", 1)
+        assert not p.prefetch("a", 1)
+        assert p.is_pending("a")
+        gate.set()
+        assert done.acquire(timeout=2)
+        assert not p.is_pending("a")
+
+        p._fetch = lambda n: 1 / 0
+        assert p.prefetch("bad", 1)
+        assert done.acquire(timeout=2)
+        assert ready == ["a", "bad"]
+        assert p.take("bad") is None
+    finally:
+        p.close()
+
+
+def test_budget_and_speculative_cancel():
+    gate = threading.Event()
+    p, calls, ready, done = make_prefetcher(max_pages=3, gate=gate)
+    try:
+        assert p.prefetch("a", 1)
+        assert p.prefetch("b", 2, speculative=True)
+        assert p.prefetch("c", 3, speculative=True)
+        # Nothing held to make room for, so the budget refuses more
+        assert not p.prefetch("d", 4)
+
+        p.cancel_speculative()
+        gate.set()
+        assert done.acquire(timeout=2)
+        assert not done.acquire(timeout=0.2)
+        assert calls == [1]
+        assert p.get_stats()["prefetch_dropped"] == 2
+    finally:
+        p.close()
+
+
+def test_full_budget_evicts_oldest_held_page():
+    p, calls, ready, done = make_prefetcher(max_pages=2)
+    try:
+        for key, n in (("a", 1), ("b", 2), ("c", 3)):
+            assert p.prefetch(key, n)
+            assert done.acquire(timeout=2)
+        assert p.take("a") is None
+        assert p.take("b") == 20
+        assert p.take("c") == 30
+    finally:
+        p.close()
+
+
+def test_clear_discards_running_fetch():
+    started = threading.Event()
+    gate = threading.Event()
+    done = threading.Event()
+
+    def fetch():
+        started.set()
+        gate.wait(2)
+        return "page"
+
+    p = ContentsPrefetcher(fetch, on_ready=lambda key: done.set())
+    try:
+        assert p.prefetch("a")
+        assert started.wait(2)
+        p.clear()
+        gate.set()
+        assert done.wait(2)
+        assert p.take("a") is None
+    finally:
+        p.close()
+
+
+def test_disabled_prefetcher_queues_nothing():
+    p = ContentsPrefetcher(lambda: pytest.fail("should not fetch"), PrefetchConfig(max_pages=0))
+    assert not p.enabled
+    assert not p.prefetch("a")
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("DBUTILS_PREFETCH_PAGES", "10")
+    monkeypatch.setenv("DBUTILS_PREFETCH_NEIGHBORS", "2")
+    cfg = PrefetchConfig.from_env()
+    assert (cfg.max_pages, cfg.neighbors) == (10, 2)
+
+    monkeypatch.setenv("DBUTILS_PREFETCH_PAGES", "lots")
+    assert PrefetchConfig.from_env() == PrefetchConfig()
@@ -118,6 +118,66 @@ class TestQtDBBrowserMethods:
         assert humanize_schema_name("") == ""
 
 
+    def test_on_catalog_stale_marks_catalog(self):
+        """Test on_catalog_stale tracks whether the catalog shown is a stale copy."""
+        from types import SimpleNamespace
+
+        from dbutils.gui.qt_app import QtDBBrowser
+
+        obj = SimpleNamespace(catalog_stale=False, status_label=MagicMock())
+        QtDBBrowser.on_catalog_stale(obj, True)
+        assert obj.catalog_stale is True
+        obj.status_label.setText.assert_called_once()
+        QtDBBrowser.on_catalog_stale(obj, False)
+        assert obj.catalog_stale is False
+
+    def test_on_catalog_delta_patches_catalog(self):
+        """Test on_catalog_delta replaces changed tables, adds new ones and drops removed ones."""
+        import threading
+        from types import SimpleNamespace
+
+        from dbutils.catalog_store import CatalogStore
+        from dbutils.db_browser import SearchIndex
+        from dbutils.gui.qt_app import QtDBBrowser
+
+        def column(table, name):
+            return ColumnInfo(
+                schema="S", table=table, name=name, typename="INT", length=4, scale=0, nulls="N", remarks=""
+            )
+
+        catalog = CatalogStore(
+            [TableInfo(schema="S", name=n, remarks="old") for n in ("A", "B", "GONE")],
+            [column(n, "ID") for n in ("A", "B", "GONE")],
+        )
+        obj = SimpleNamespace(
+            catalog=catalog,
+            tables=catalog.tables,
+            columns=catalog.columns,
+            table_columns={f"S.{c.table}": [c] for c in catalog.columns},
+            search_index=SearchIndex(),
+            search_index_lock=threading.Lock(),
+            search_query="",
+            status_label=MagicMock(),
+            _model_update_timer=MagicMock(),
+        )
+        obj.search_index.build_index(obj.tables, obj.columns)
+
+        QtDBBrowser.on_catalog_delta(
+            obj,
+            [TableInfo(schema="S", name="B", remarks="new"), TableInfo(schema="S", name="C", remarks="")],
+            [column("B", "ID"), column("B", "X"), column("C", "ID")],
+            [("S", "GONE")],
+        )
+
+        assert [(t.name, t.remarks) for t in obj.tables] == [("A", "old"), ("B", "new"), ("C", "")]
+        assert [c.name for c in obj.table_columns["S.B"]] == ["ID", "X"]
+        assert "S.GONE" not in obj.table_columns
+        assert [t.name for t, _ in obj.search_index.substring_tables("gone")] == []
+        assert [t.name for t, _ in obj.search_index.substring_tables("c")] == ["C"]
+        obj._model_update_timer.start.assert_called_once_with(0)
+        obj.status_label.setText.assert_not_called()
+
+
 class TestSearchWorkerLogic:
     """Test SearchWorker without Qt event loop."""
 
@@ -155,6 +215,60 @@ class TestSearchWorkerLogic:
             # but we can verify the method completes without error
 
 
+    def test_search_worker_uses_index_candidates(self):
+        """Test perform_search scores only index candidates when an index is given."""
+        from dbutils.db_browser import SearchIndex
+        from dbutils.gui.qt_app import SearchWorker
+
+        worker = SearchWorker()
+        tables = [
+            TableInfo(schema="TEST", name="USERS", remarks=""),
+            TableInfo(schema="TEST", name="ORDERS", remarks=""),
+        ]
+        index = SearchIndex()
+        index.add_tables(tables[:1])
+
+        emitted = []
+        worker.results_ready.connect(emitted.append)
+        worker.perform_search(tables, [], "ord", "tables", index=index)
+        assert all(not r for r in emitted)
+
+        emitted.clear()
+        worker.perform_search(tables, [], "user", "tables", index=index)
+        assert [r.item.name for r in emitted[-1]] == ["USERS"]
+
+        # Infix queries are answered from the trigram index too
+        emitted.clear()
+        worker.perform_search(tables, [], "ser", "tables", index=index)
+        assert [r.item.name for r in emitted[-1]] == ["USERS"]
+
+    def test_search_worker_reads_index_under_lock(self):
+        """Test perform_search holds the index lock while it reads the index."""
+        import threading
+
+        from dbutils.db_browser import SearchIndex
+        from dbutils.gui.qt_app import SearchWorker
+
+        lock = threading.Lock()
+        tables = [TableInfo(schema="TEST", name="USERS", remarks="")]
+        held = []
+
+        class WatchedIndex(SearchIndex):
+            def substring_tables(self, query):
+                held.append(lock.locked())
+                return super().substring_tables(query)
+
+        index = WatchedIndex()
+        index.add_tables(tables)
+        worker = SearchWorker()
+        emitted = []
+        worker.results_ready.connect(emitted.append)
+        worker.perform_search(tables, [], "user", "tables", index=index, index_lock=lock)
+        assert held == [True]
+        assert not lock.locked()
+        assert [r.item.name for r in emitted[-1]] == ["USERS"]
+
+
 class TestTableContentsWorkerLogic:
     """Test TableContentsWorker without Qt event loop."""
 
@@ -4,6 +4,8 @@ from PySide6.QtCore import Qt
 
 from dbutils.db_browser import ColumnInfo
 from dbutils.gui.qt_app import TableContentsModel
+from dbutils.pagination import RowWindow
+from dbutils.result_set import ResultSet
 
 
 class TestTableContentsModel:
@@ -261,6 +263,66 @@ class TestTableContentsModel:
         assert model._rows[1]["name"] == "Jane"
         assert model._rows[2]["name"] == "Bob"
 
+    def test_table_contents_model_accepts_result_set(self):
+        """Test TableContentsModel reads values straight from a ResultSet."""
+        model = TableContentsModel()
+
+        rows = ResultSet(["id", "name"], [(1, "John"), (2, None)])
+        model.set_contents(["id", "name", "missing"], rows)
+
+        assert model.rowCount() == 2
+        assert model.data(model.index(0, 1), Qt.DisplayRole) == "John"
+        assert model.data(model.index(1, 1), Qt.DisplayRole) == ""
+        assert model.data(model.index(0, 2), Qt.DisplayRole) == ""
+        assert model.data(model.index(1, 0), Qt.ToolTipRole) == "2"
+
+    def test_table_contents_model_window_requests_evicted_blocks(self):
+        """Windowed rows keep a bounded cache and ask again for evicted blocks."""
+        model = TableContentsModel()
+        requested = []
+        model.block_requested.connect(requested.append)
+
+        window = RowWindow(block_size=2, max_rows=4)
+        window.put(0, ResultSet(["id"], [(0,), (1,)]))
+        model.set_window(["id"], window)
+        for block in (1, 2):
+            model.add_block(block, ResultSet(["id"], [(block * 2,), (block * 2 + 1,)]))
+
+        assert model.rowCount() == 6
+        assert window.resident_blocks == [1, 2]
+        assert model.data(model.index(5, 0), Qt.DisplayRole) == "5"
+
+        # Block 0 was evicted: blank cell, one request however often it is painted
+        assert model.data(model.index(0, 0), Qt.DisplayRole) == ""
+        assert model.data(model.index(1, 0), Qt.DisplayRole) == ""
+        assert requested == [0]
+
+        model.add_block(0, ResultSet(["id"], [(0,), (1,)]))
+        assert model.data(model.index(1, 0), Qt.DisplayRole) == "1"
+        assert model.rowCount() == 6
+
+        # A plain set_contents leaves windowed mode
+        model.set_contents(["id"], [{"id": 9}])
+        assert model.window is None
+        assert model.rowCount() == 1
+
+    def test_table_contents_model_window_counts_change_inside_insert(self):
+        """Views see the old row count until rows are inserted, and the estimate before the end is known."""
+        model = TableContentsModel()
+        window = RowWindow(block_size=2, estimate=5)
+        window.put(0, ResultSet(["id"], [(0,), (1,)]))
+        model.set_window(["id"], window)
+        assert model.rowCount() == 5
+
+        seen = []
+        model.rowsAboutToBeInserted.connect(lambda parent, first, last: seen.append(("insert", model.rowCount())))
+        model.rowsAboutToBeRemoved.connect(lambda parent, first, last: seen.append(("remove", model.rowCount())))
+        model.add_block(3, ResultSet(["id"], [(6,), (7,)]))
+        assert model.rowCount() == 8
+        model.add_block(1, ResultSet(["id"], [(2,)]))
+        assert model.rowCount() == 3
+        assert seen == [("insert", 5), ("remove", 8)]
+
     def test_table_contents_model_empty_content(self):
         """Test handling of empty content."""
         model = TableContentsModel()
@@ -164,6 +164,44 @@ class TestSearchWorker:
         assert worker._search_cancelled
         assert len(results_captured) >= 10
 
+    def test_search_worker_streams_deltas_and_bounds_results(self):
+        """Test that results are capped at max_results and deltas are not cumulative."""
+        worker = SearchWorker(max_results=40)
+        worker.DELTA_BATCH = 10
+        columns = [
+            ColumnInfo(
+                schema="TEST",
+                table=f"T{i % 5}",
+                name=f"ID_{i}" if i % 3 else f"X_{i}",
+                typename="INTEGER" if i % 3 else "VARCHAR",
+                length=10,
+                scale=0,
+                nulls="N",
+                remarks="id" if not i % 3 else "",
+            )
+            for i in range(300)
+        ]
+        tables = [TableInfo(schema="TEST", name=f"T{i}", remarks="") for i in range(5)]
+
+        deltas = []
+        finals = []
+        worker.results_delta.connect(deltas.append)
+        worker.results_ready.connect(finals.append)
+        worker.perform_search(tables, columns, "id", "columns")
+
+        assert deltas and all(len(d) <= 40 for d in deltas)
+        streamed = [r.item for d in deltas for r in d]
+        assert len(streamed) == len({id(c) for c in streamed})
+
+        assert len(finals) == 1
+        final = finals[0]
+        aggregates = [r for r in final if r.match_type == "column"]
+        cols = [r for r in final if isinstance(r.item, ColumnInfo)]
+        assert len(aggregates) == 5
+        assert sum(r.relevance_score for r in aggregates) == 300
+        assert len(cols) == 40
+        assert all(r.relevance_score == 1.0 for r in cols)
+
     def test_search_worker_error_handling(self):
         """Test error handling in SearchWorker."""
         worker = SearchWorker()
@@ -407,6 +445,50 @@ class TestDataLoaderWorker:
             assert len(tables) == 0  # Final signal only sends schemas
             assert len(columns) == 0
 
+    def test_data_loader_worker_paints_stale_cache_then_emits_delta(self, tmp_path):
+        """With stale_ok an expired cache is shown first, then only the changes."""
+        import json
+        import os
+
+        from dbutils.db_browser import mock_get_columns, mock_get_tables
+        from dbutils.gui.data_loader_process import to_column_dicts, to_table_dicts
+
+        tables = to_table_dicts(mock_get_tables())
+        columns = to_column_dicts(mock_get_columns())
+        stale_tables = [dict(t) for t in tables[1:]] + [{"schema": "TEST", "name": "DROPPED", "remarks": ""}]
+        stale_tables[0]["remarks"] = "old remarks"
+        cache_file = tmp_path / "data_all.json"
+        cache_file.write_text(json.dumps({"tables": stale_tables, "columns": columns, "cached_at": 0}))
+        os.utime(cache_file, (0, 0))
+
+        worker = DataLoaderWorker()
+        events = []
+        worker.catalog_stale.connect(lambda stale: events.append(("stale", stale)))
+        worker.chunk_loaded.connect(lambda t, c, loaded, est: events.append(("chunk", [x.name for x in t])))
+        worker.catalog_delta.connect(
+            lambda t, c, removed: events.append(("delta", [x.name for x in t], {x.table for x in c}, removed))
+        )
+        worker.data_loaded.connect(lambda t, c, schemas: events.append(("done", schemas)))
+
+        with patch("dbutils.gui.data_loader_process.get_data_cache_path", lambda sf: cache_file):
+            worker.load_data(schema_filter=None, use_mock=True, stale_ok=True)
+
+        assert events[0] == ("stale", True)
+        chunks = [e for e in events if e[0] == "chunk"]
+        assert sum(len(e[1]) for e in chunks) == len(stale_tables)
+        deltas = [e for e in events if e[0] == "delta"]
+        # Catalog scans return tables in (schema, table) order
+        changed = [tables[1]["name"], tables[0]["name"]]
+        assert [e[1] for e in deltas] == [changed]
+        assert deltas[0][2] <= set(changed)
+        assert deltas[0][3] == [("TEST", "DROPPED")]
+        assert events.index(deltas[0]) > events.index(chunks[-1])
+        assert events[-2:] == [("stale", False), ("done", sorted({t["schema"] for t in tables}))]
+
+        # The revalidated catalog replaced the stale cache
+        saved = json.loads(cache_file.read_text())
+        assert [(t["schema"], t["name"]) for t in saved["tables"]] == sorted((t["schema"], t["name"]) for t in tables)
+
     def test_data_loader_worker_error_handling(self):
         """Test error handling in DataLoaderWorker."""
         worker = DataLoaderWorker()
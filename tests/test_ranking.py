@@ -0,0 +1,56 @@
+"""Unit tests for dbutils.ranking module."""
+
+import random
+
+from dbutils.ranking import TopKCollector, top_k
+
+
+def test_collector_keeps_best_k_in_rank_order():
+    collector = TopKCollector(3)
+    for item, score in [("a", 0.5), ("b", 0.9), ("c", 0.1), ("d", 0.7), ("e", 0.8)]:
+        collector.offer(score, item)
+    assert collector.results() == [("b", 0.9), ("e", 0.8), ("d", 0.7)]
+    assert collector.total == 5
+    assert len(collector) == 3
+    assert collector.min_score() == 0.7
+
+
+def test_collector_ties_are_stable():
+    collector = TopKCollector(2)
+    assert collector.offer(1.0, "first")
+    assert collector.offer(1.0, "second")
+    # Equal score does not displace earlier entries
+    assert not collector.offer(1.0, "third")
+    assert collector.results() == [("first", 1.0), ("second", 1.0)]
+
+
+def test_collector_matches_full_sort():
+    rng = random.Random(42)
+    scored = [(i, rng.choice([0.5, 0.7, 1.0])) for i in range(5000)]
+    expected = sorted(scored, key=lambda x: x[1], reverse=True)[:100]
+    assert top_k(scored, 100) == expected
+
+
+def test_drain_delta_reports_only_new_live_entries():
+    collector = TopKCollector(2)
+    collector.offer(0.5, "a")
+    collector.offer(0.6, "b")
+    assert collector.drain_delta() == [("b", 0.6), ("a", 0.5)]
+    assert collector.drain_delta() == []
+
+    # "c" is admitted then evicted before the next drain; it is never reported
+    collector.offer(0.7, "c")
+    collector.offer(0.9, "d")
+    collector.offer(0.8, "e")
+    assert collector.drain_delta() == [("d", 0.9), ("e", 0.8)]
+
+
+def test_unorderable_items_and_zero_k():
+    collector = TopKCollector(2)
+    collector.offer(1.0, {"x": 1})
+    collector.offer(1.0, {"y": 2})
+    assert [item for item, _ in collector.results()] == [{"x": 1}, {"y": 2}]
+
+    empty = TopKCollector(0)
+    assert not empty.offer(1.0, "a")
+    assert empty.results() == [] and empty.total == 1
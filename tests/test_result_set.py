@@ -0,0 +1,71 @@
+"""Unit tests for dbutils.result_set module."""
+
+import json
+import pickle
+
+import pytest
+
+from dbutils.result_set import ResultSet, RowView
+
+
+def test_row_views_behave_like_dicts():
+    rs = ResultSet(["ID", "NAME"], [(1, "a"), (2, "b")])
+    assert len(rs) == 2
+    row = rs[1]
+    assert isinstance(row, RowView)
+    assert row["NAME"] == "b"
+    assert row.get("MISSING", "x") == "x"
+    assert "ID" in row and list(row) == ["ID", "NAME"]
+    assert row.copy() == {"ID": 2, "NAME": "b"}
+    assert rs[-1] == {"ID": 2, "NAME": "b"}
+    with pytest.raises(KeyError):
+        row["MISSING"]
+    with pytest.raises(IndexError):
+        rs[2]
+
+
+def test_equals_list_of_dicts():
+    rs = ResultSet(["ID"], [(1,), (2,)])
+    assert rs == [{"ID": 1}, {"ID": 2}]
+    assert rs != [{"ID": 1}]
+    assert rs.to_dicts() == [{"ID": 1}, {"ID": 2}]
+    # No description yields empty mappings, like dict(zip([], row))
+    assert ResultSet([], [(1,), (2,)]) == [{}, {}]
+
+
+def test_duplicate_columns_last_wins():
+    rs = ResultSet(["A", "A"], [(1, 2)])
+    assert rs[0]["A"] == 2
+    assert rs.to_dicts() == [{"A": 2}]
+
+
+def test_to_dicts_serializes_like_row_views():
+    rs = ResultSet(["ID", "NAME"], [(1, "a"), (2,)])
+    with pytest.raises(TypeError):
+        json.dumps(rs)
+    assert json.loads(json.dumps(rs.to_dicts())) == [{"ID": 1, "NAME": "a"}, {"ID": 2, "NAME": None}]
+    assert rs.to_dicts() == rs
+
+
+def test_column_major_storage():
+    rs = ResultSet.from_arrays(["ID", "NAME"], [[1, 2, 3], ["a", "b", "c"]])
+    assert len(rs) == 3
+    assert rs.value(2, "NAME") == "c"
+    assert rs.column("ID") == [1, 2, 3]
+    assert rs[1:] == [{"ID": 2, "NAME": "b"}, {"ID": 3, "NAME": "c"}]
+    assert rs.tuples()[0] == (1, "a")
+
+
+def test_extend_from_result_set_and_dicts():
+    rs = ResultSet(["ID", "NAME"], [(1, "a")])
+    rs.extend(ResultSet(["ID", "NAME"], [(2, "b")]))
+    rs.extend([{"NAME": "c", "ID": 3}, (4, "d")])
+    assert rs.column("ID") == [1, 2, 3, 4]
+    assert rs.value(2, "NAME") == "c"
+
+
+def test_from_dicts_and_pickle_round_trip():
+    rs = ResultSet.from_dicts([{"A": 1, "B": 2}, {"A": 3}])
+    assert rs.columns == ["A", "B"]
+    assert rs.tuples() == [(1, 2), (3, None)]
+    assert pickle.loads(pickle.dumps(rs)) == rs
@@ -0,0 +1,165 @@
+"""Unit tests for dbutils.schema_loader.
+
+Tests for:
+- Chunks streaming in completion order across schemas
+- Per-schema final states, progress and failures
+- Cancelling one schema or the whole load
+- DBUTILS_SCHEMA_WORKERS configuration
+- Worker count fitting the connection pool
+"""
+
+import re
+import threading
+import time
+
+from dbutils import connection_pool, schema_loader
+from dbutils.connection_pool import PoolConfig, close_all_pools, get_pool
+from dbutils.db_browser import TableInfo
+from dbutils.schema_loader import CANCELLED, DONE, FAILED, LOADING, ParallelSchemaLoader, SchemaLoadConfig
+
+
+class FakeScan:
+    """Stand-in for CatalogScan yielding ``sizes[schema]`` one-table chunks."""
+
+    sizes = {}
+    gates = {}
+
+    def __init__(self, schema, chunk_size=500, first_chunk_size=None, use_mock=False):
+        self.schema = schema
+
+    def __iter__(self):
+        if self.schema == "BROKEN":
+            raise RuntimeError("scan failed")
+        for i in range(self.sizes.get(self.schema, 1)):
+            gate = self.gates.get(self.schema)
+            if gate is not None:
+                assert gate.wait(2)
+            yield [TableInfo(schema=self.schema, name=f"T{i}", remarks="")], []
+
+
+def use_fake_scan(monkeypatch, sizes, gates=None):
+    FakeScan.sizes = sizes
+    FakeScan.gates = gates or {}
+    monkeypatch.setattr(schema_loader, "CatalogScan", FakeScan)
+
+
+def test_chunks_arrive_in_completion_order(monkeypatch):
+    slow_gate = threading.Event()
+    use_fake_scan(monkeypatch, {"SLOW": 2, "FAST": 3}, {"SLOW": slow_gate})
+    loader = ParallelSchemaLoader(["SLOW", "FAST"], workers=2)
+
+    seen = []
+    for chunk in loader:
+        seen.append((chunk.schema, chunk.state))
+        if chunk.schema == "FAST" and chunk.state == DONE:
+            # The slow schema has not produced anything yet
+            assert all(schema == "FAST" for schema, _ in seen)
+            slow_gate.set()
+
+    assert seen.count(("FAST", LOADING)) == 3
+    assert seen.count(("SLOW", LOADING)) == 2
+    assert seen[-1] == ("SLOW", DONE)
+    assert loader.progress() == {"SLOW": {"loaded": 2, "state": DONE}, "FAST": {"loaded": 3, "state": DONE}}
+
+
+def test_failed_schema_does_not_stop_others(monkeypatch):
+    use_fake_scan(monkeypatch, {"A": 2})
+    finals = {c.schema: c for c in ParallelSchemaLoader(["BROKEN", "A"], workers=1) if c.state != LOADING}
+    assert finals["BROKEN"].state == FAILED
+    assert "scan failed" in finals["BROKEN"].error
+    assert finals["A"].state == DONE and finals["A"].loaded == 2
+
+
+def test_cancel_one_schema(monkeypatch):
+    use_fake_scan(monkeypatch, {"A": 5, "B": 2})
+    loader = ParallelSchemaLoader(["A", "B"], workers=1, max_pending=1)
+    loaded = {"A": 0, "B": 0}
+    for chunk in loader:
+        if chunk.state == LOADING:
+            loaded[chunk.schema] += 1
+            if chunk.schema == "A":
+                loader.cancel("A")
+    assert loaded["A"] < 5
+    assert loaded["B"] == 2
+    assert loader.progress()["A"]["state"] == CANCELLED
+
+
+def test_cancel_all_and_early_exit(monkeypatch):
+    use_fake_scan(monkeypatch, {"A": 50, "B": 50, "C": 50})
+    loader = ParallelSchemaLoader(["A", "B", "C"], workers=2, max_pending=1)
+    for _chunk in loader:
+        loader.cancel()
+    states = {schema: info["state"] for schema, info in loader.progress().items()}
+    assert set(states.values()) == {CANCELLED}
+
+    # Abandoning the iterator stops the workers too
+    loader = ParallelSchemaLoader(["A", "B"], workers=2, max_pending=1)
+    next(iter(loader))
+    del loader
+
+
+def test_mock_schemas_load_through_catalog_scan():
+    chunks = list(ParallelSchemaLoader(["TEST", "DACDATA"], workers=2, use_mock=True))
+    tables = [t for c in chunks for t in c.tables]
+    assert {t.schema for t in tables} == {"TEST", "DACDATA"}
+    assert [c.state for c in chunks if not c.tables].count(DONE) == 2
+
+
+def test_config_from_env(monkeypatch):
+    assert SchemaLoadConfig.from_env().workers == 0
+    monkeypatch.setenv("DBUTILS_SCHEMA_WORKERS", "3")
+    assert SchemaLoadConfig.from_env().workers == 3
+    monkeypatch.setenv("DBUTILS_SCHEMA_WORKERS", "many")
+    assert SchemaLoadConfig.from_env() == SchemaLoadConfig()
+
+
+class PoolConn:
+    """Pooled connection streaming SYSTABLES/SYSCOLUMNS rows for one-table-per-chunk scans."""
+
+    in_use = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def iter_query(self, sql, batch_size=1000):
+        schema = re.search(r"TABLE_SCHEMA = '(\w+)'", sql).group(1)
+        with PoolConn.lock:
+            PoolConn.in_use += 1
+            PoolConn.peak = max(PoolConn.peak, PoolConn.in_use)
+        try:
+            for i in range(3):
+                time.sleep(0.01)
+                if "SYSCOLUMNS" in sql:
+                    yield (schema, f"T{i}", "ID", "INTEGER", 4, 0, "N", "")
+                else:
+                    yield (schema, f"T{i}", "")
+        finally:
+            with PoolConn.lock:
+                PoolConn.in_use -= 1
+
+    def close(self):
+        pass
+
+
+def test_workers_fit_the_connection_pool(monkeypatch):
+    monkeypatch.setenv("DBUTILS_JDBC_PROVIDER", "X")
+    monkeypatch.setenv("DBUTILS_JDBC_POOL", "1")
+    monkeypatch.delenv("DBUTILS_QUERY_CONCURRENCY", raising=False)
+    monkeypatch.delenv("DBUTILS_JDBC_POOL_MAX", raising=False)
+    monkeypatch.setattr("dbutils.jdbc_provider.connect", lambda *a, **k: PoolConn(), raising=True)
+    close_all_pools()
+    # Fail fast instead of waiting out the default borrow timeout
+    pool = get_pool("X", {}, config=PoolConfig(max_size=4, borrow_timeout=0.5))
+    try:
+        assert schema_loader.default_workers() == 2
+        assert schema_loader.default_workers(pinned=1) == 1
+
+        loader = ParallelSchemaLoader(["A", "B", "C", "D"], workers=4, chunk_size=1)
+        assert loader.workers == 2
+        chunks = list(loader)
+        assert {c.schema: c.state for c in chunks if c.state != LOADING} == dict.fromkeys("ABCD", DONE)
+        assert sum(len(c.columns) for c in chunks) == 12
+        assert PoolConn.peak <= 4
+        assert pool.stats()["in_use"] == 0
+    finally:
+        close_all_pools()
+        assert connection_pool._pools == {}
@@ -5,17 +5,22 @@ Tests for:
 - Query runner functionality
 """
 
+import random
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from dbutils import utils
 from dbutils.utils import (
     _has_exact_substring,
     _sequential_char_match,
     _word_prefix_or_edit,
+    batch_edit_distance,
     edit_distance,
     edit_distance_fast,
     fuzzy_match,
+    fuzzy_scores,
+    myers_distance,
     query_runner,
 )
 
@@ -188,3 +193,63 @@ class TestInternalFuzzyFunctions:
         assert _sequential_char_match("programming", "pram") is True  # p, r, a, m in sequence
         assert _sequential_char_match("hello", "xyz") is False  # x, y, z not in sequence
         assert _sequential_char_match("short", "verylongquery") is False  # query longer than text
+
+
+def _random_words(count, seed=7):
+    rng = random.Random(seed)
+    alphabet = "abcde_Xé"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 18))) for _ in range(count)]
+
+
+class TestBitParallelEditDistance:
+    """Test the Myers/Hyyro bit-parallel edit distance and its batch API."""
+
+    def test_myers_matches_dynamic_programming(self):
+        """Test bit-parallel distances equal the DP reference, including long patterns."""
+        words = _random_words(300)
+        for query in ["a", "abc", "é_x", "abcdeabcdeabcde", "y" * 70]:
+            assert [myers_distance(w, query) for w in words] == [edit_distance(w, query) for w in words]
+
+    def test_cutoff_reports_max_dist_plus_one(self):
+        """Test early termination never under-reports a distance."""
+        assert myers_distance("customer", "custer", 2) == 2
+        assert myers_distance("customer", "xyz", 2) == 3
+        assert edit_distance_fast("kitten", "sitting", 2) == 3
+        assert edit_distance_fast("kitten", "sitting", 3) == 3
+
+    @pytest.mark.parametrize("backend", ["python", "numpy", "cython"])
+    def test_batch_edit_distance(self, backend, monkeypatch):
+        """Test the batched distances on each backend agree with the DP reference."""
+        if backend == "cython":
+            if utils._fast_batch_edit_distance is None:
+                pytest.skip("fast_ops extension not built")
+        else:
+            monkeypatch.setattr(utils, "_fast_batch_edit_distance", None)
+        if backend == "numpy":
+            np = pytest.importorskip("numpy")
+            monkeypatch.setattr(utils, "np", np)
+        else:
+            monkeypatch.setattr(utils, "np", None)
+
+        words = _random_words(500) + [""]
+        # Non-ASCII characters at bit 31 and beyond the low 32 bits of the pattern masks
+        long_queries = ["a" * 31 + "é", "a" * 40 + "é" + "b" * 20]
+        words += long_queries + [q[:-1] for q in long_queries]
+        for query in ["abc", "x" * 64, "éa", *long_queries]:
+            expected = [edit_distance(w, query) for w in words]
+            assert batch_edit_distance(words, query) == expected
+            assert batch_edit_distance(words, query, 2) == [min(d, 3) for d in expected]
+        assert batch_edit_distance([], "abc") == []
+
+    def test_fuzzy_scores_agree_with_fuzzy_match(self):
+        """Test batch scores rank tiers and agree with fuzzy_match."""
+        names = ["CUSTOMER_ID", "ORDER_DATE", "CUSTOM_FIELD", "SHIP_ADDR", "", "STATUS"]
+        for query in ["custmer", "ordr", "cus", "id", "s", "zzz", "sdr"]:
+            scores = fuzzy_scores(names, query)
+            assert [s > 0 for s in scores] == [fuzzy_match(n, query) for n in names]
+
+        scores = fuzzy_scores(names, "custmer")
+        assert scores[0] > scores[3]
+        assert fuzzy_scores(names, "order")[1] == 1.0
+        assert fuzzy_scores(names, "") == [1.0] * len(names)
+